@@ -1,3 +1,8 @@
+import os
+
+import numpy as np
+
+from data.map_pack import MapPack
 from envs.maps import Maps
 
 
@@ -39,5 +44,35 @@ class Dataloader:
                         enemy_y = int(pos.split(',')[1])
                         enemy_positions.append((enemy_x, enemy_y))
 
-        return Maps(file, map_matrix, agent_positions, enemy_positions)
+        return Maps(file, np.array(map_matrix, dtype=np.int8), agent_positions, enemy_positions)
 
+    """
+    @param self:
+    @param playing_map: a Maps object
+    @param file: the path of the (textual) file in which the map is written, in the format read by load_map_from_file
+    @return:
+    """
+    def save_map_to_file(self, playing_map, file):
+        with open(file, 'w') as f:
+            for matrix_row in playing_map.initial_map:
+                f.write(','.join(str(num) for num in matrix_row) + '\n')
+            f.write('A:' + '|'.join(f'{x},{y}' for x, y in playing_map.agent_initial_position) + '\n')
+            f.write('E:' + '|'.join(f'{x},{y}' for x, y in playing_map.enemy_initial_position))
+
+    """
+    @param self:
+    @param directory: the path of a directory of (textual) map files
+    @return: the list of the Maps objects of every file of the directory, in the order of their names
+    """
+    def load_maps_from_directory(self, directory):
+        files = sorted(name for name in os.listdir(directory)
+                       if not name.startswith('.') and os.path.isfile(os.path.join(directory, name)))
+        return [self.load_map_from_file(os.path.join(directory, name)) for name in files]
+
+    """
+    @param self:
+    @param file: the path of a (binary) map pack, see data/map_pack.py
+    @return: a MapPack object, giving access to the maps of the pack by index or by content hash
+    """
+    def load_map_pack(self, file):
+        return MapPack(file)
@@ -0,0 +1,298 @@
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import threading
+from functools import partial
+
+import numpy as np
+
+from envs.maps import Maps
+from misc.interest_points import count_adjacent_blocks
+from misc.utils import EMPTY, BLOCK
+
+
+def connected(free):
+    """
+    Function checking that the free tiles of a layout form a single 4-connected region
+    The region is grown from one free tile by shifting it in the four directions, until it stops growing
+    @param free: boolean mask of the free tiles
+    @return: True if every free tile can be reached from every other one
+    """
+    nb_free = np.count_nonzero(free)
+    if nb_free == 0:
+        return True
+    reached = np.zeros_like(free)
+    reached.flat[np.flatnonzero(free)[0]] = True
+    nb_reached = 1
+    while True:
+        grown = reached.copy()
+        grown[1:, :] |= reached[:-1, :]
+        grown[:-1, :] |= reached[1:, :]
+        grown[:, 1:] |= reached[:, :-1]
+        grown[:, :-1] |= reached[:, 1:]
+        grown &= free
+        nb_grown = np.count_nonzero(grown)
+        if nb_grown == nb_reached:
+            return nb_reached == nb_free
+        reached, nb_reached = grown, nb_grown
+
+
+class MapGenerator:
+    """
+    This class generates maps procedurally, in the spirit of the hand-written ones: rectangles of blocks scattered over an empty field
+    Every map is drawn from its own random generator, seeded by the seed of the generator and the index of the map:
+    the i-th map of a seed is always the same, whichever process generates it and in whichever order
+    Blocks which would cut the empty tiles in several regions are not placed, so that every empty tile can be reached from any other
+    Layouts without any hiding spot (an empty tile adjacent to several blocks) are drawn again, up to MAX_LAYOUT_ATTEMPTS times
+    The starting positions are distinct empty tiles, the ones of the agent being at least min_distance tiles away (manhattan) from the ones of the enemy
+    """
+
+    MAX_LAYOUT_ATTEMPTS = 100
+
+    def __init__(self, height=12, width=12, seed=0, density=(0.05, 0.3), block_size=(3, 4),
+                 nb_agent_positions=1, nb_enemy_positions=4, min_distance=3):
+        super(MapGenerator, self).__init__()
+
+        if height * width < nb_agent_positions + nb_enemy_positions:
+            raise ValueError(f"A {height}x{width} map cannot hold {nb_agent_positions + nb_enemy_positions} starting positions")
+        self.height = height
+        self.width = width
+        self.seed = seed
+
+        # Range of the proportion of blocks on a map, drawn for every map
+        self.density = density
+
+        # Maximal size (rows, columns) of the rectangles of blocks
+        self.block_size = block_size
+
+        self.nb_agent_positions = nb_agent_positions
+        self.nb_enemy_positions = nb_enemy_positions
+        self.min_distance = min_distance
+
+    def scatter_blocks(self, rng):
+        """
+        Draws the density of a layout and scatters rectangles of blocks over an empty field until it is reached
+        @param self:
+        @param rng: random generator of the map
+        @return: the layout
+        """
+        layout = np.full((self.height, self.width), EMPTY, dtype=np.int8)
+        nb_free = layout.size - self.nb_agent_positions - self.nb_enemy_positions
+        target = min(int(rng.uniform(*self.density) * layout.size), nb_free)
+
+        # We scatter rectangles of blocks until the density of the map is reached, rejecting the ones which would disconnect the empty tiles
+        # The number of attempts is bounded: the last blocks of dense maps may not fit anywhere
+        nb_blocks = 0
+        for _ in range(4 * layout.size):
+            if nb_blocks >= target:
+                break
+            rows, columns = rng.integers(1, self.block_size[0] + 1), rng.integers(1, self.block_size[1] + 1)
+            x, y = rng.integers(self.height - rows + 1), rng.integers(self.width - columns + 1)
+            rectangle = layout[x:x + rows, y:y + columns]
+            nb_new = np.count_nonzero(rectangle == EMPTY)
+            if nb_new == 0 or nb_blocks + nb_new > nb_free:
+                continue
+            previous = rectangle.copy()
+            rectangle[:] = BLOCK
+            if connected(layout == EMPTY):
+                nb_blocks += nb_new
+            else:
+                rectangle[:] = previous
+        return layout
+
+    def generate_layout(self, index):
+        """
+        Generates the layout and the starting positions of a map
+        @param self:
+        @param index: index of the map in the sequence of maps of the seed
+        @return: a (layout, agent positions, enemy positions) tuple
+        """
+        rng = np.random.default_rng((self.seed, index))
+
+        # The agent would have nowhere to hide on a layout without hiding spots: we draw it again, from the same random generator
+        for _ in range(self.MAX_LAYOUT_ATTEMPTS):
+            layout = self.scatter_blocks(rng)
+            if (count_adjacent_blocks(layout)[layout == EMPTY] > 1).any():
+                break
+        else:
+            raise ValueError(f"No layout with a hiding spot was generated for map {index} in {self.MAX_LAYOUT_ATTEMPTS} attempts, "
+                             f"the density {self.density} may be too low")
+
+        # We pick the starting positions of the enemy first, then the ones of the agent far enough from them
+        free = np.argwhere(layout == EMPTY)
+        enemy_positions = free[rng.choice(len(free), self.nb_enemy_positions, replace=False)]
+        remaining = free[~(free[:, None, :] == enemy_positions[None, :, :]).all(axis=2).any(axis=1)]
+        distances = np.abs(remaining[:, None, :] - enemy_positions[None, :, :]).sum(axis=2).min(axis=1, initial=layout.size)
+        far = remaining[distances >= self.min_distance]
+        # On crowded maps, the agent starts on the farthest tiles instead
+        if len(far) < self.nb_agent_positions:
+            far = remaining[np.argsort(-distances, kind="stable")[:self.nb_agent_positions]]
+        agent_positions = far[rng.choice(len(far), self.nb_agent_positions, replace=False)]
+
+        return (layout, [(int(x), int(y)) for x, y in agent_positions],
+                [(int(x), int(y)) for x, y in enemy_positions])
+
+    def map_name(self, index):
+        """
+        Names a map after the shape and the seed of the generator, and its index
+        @param self:
+        @param index: index of the map in the sequence of maps of the seed
+        @return: a string
+        """
+        return f"generated_{self.height}x{self.width}_{self.seed}_{index}"
+
+    def generate(self, index):
+        """
+        Generates a map
+        @param self:
+        @param index: index of the map in the sequence of maps of the seed
+        @return: a Maps object
+        """
+        return Maps(self.map_name(index), *self.generate_layout(index))
+
+
+def generate_layout(generator, index):
+    """
+    Function generating the layout of a map in a worker process (the layouts are sent back, the Maps objects being built by the caller)
+    @param generator: MapGenerator
+    @param index: index of the map
+    @return: a (layout, agent positions, enemy positions) tuple
+    """
+    return generator.generate_layout(index)
+
+
+def generate_maps(generator, indices, nb_workers=None, chunksize=16, pool=None):
+    """
+    Function generating maps across a pool of processes, the maps being the same as the ones generated one after the other
+    @param generator: MapGenerator
+    @param indices: indices of the maps to generate
+    @param nb_workers: number of processes, the number of CPUs by default (0 generates the maps in the calling process)
+    @param chunksize: number of maps sent at once to a process
+    @param pool: optional pool of processes to use, created (and closed) by the function otherwise
+    @return: a list of Maps objects, in the order of the indices
+    """
+    indices = list(indices)
+    if pool is not None:
+        layouts = pool.map(partial(generate_layout, generator), indices, chunksize=chunksize)
+    elif nb_workers == 0:
+        layouts = [generator.generate_layout(index) for index in indices]
+    else:
+        with mp.Pool(nb_workers) as pool:
+            layouts = pool.map(partial(generate_layout, generator), indices, chunksize=chunksize)
+    return [Maps(generator.map_name(index), *layout) for index, layout in zip(indices, layouts)]
+
+
+class MapPrefetcher:
+    """
+    This class streams fresh maps from a background thread, generating them ahead of time into a bounded queue
+    The maps are the ones of a MapGenerator, in the order of their indices starting from first_index
+    With nb_workers > 0, the thread generates every batch of buffer_size maps across a pool of processes
+    Environments pull the maps with next_map (see HideSeekEnv.stream_maps)
+    """
+
+    def __init__(self, generator, buffer_size=64, first_index=0, nb_workers=0):
+        super(MapPrefetcher, self).__init__()
+
+        self.generator = generator
+        self.buffer_size = buffer_size
+        self.next_index = first_index
+        self.nb_workers = nb_workers
+        self.maps = queue.Queue(maxsize=buffer_size)
+        self.stopped = threading.Event()
+        # Error which stopped the generation of maps, raised again by every call to next_map
+        self.error = None
+
+        # The pool is created by the calling thread: forking processes from the background thread could copy locks held by the other threads
+        self.pool = mp.Pool(nb_workers) if nb_workers > 0 else None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Body of the background thread: generates maps until the prefetcher is closed, waiting while the queue is full
+        An error raised while generating maps stops the thread, it is queued after the maps generated before it and raised by next_map
+        @param self:
+        @return:
+        """
+        try:
+            while not self.stopped.is_set():
+                indices = range(self.next_index, self.next_index + (self.buffer_size if self.pool is not None else 1))
+                self.next_index = indices.stop
+                maps = generate_maps(self.generator, indices, nb_workers=self.nb_workers,
+                                     chunksize=max(len(indices) // max(self.nb_workers, 1), 1), pool=self.pool)
+                for playing_map in maps:
+                    self.put(playing_map)
+        except Exception as error:
+            self.put(error)
+
+    def put(self, item):
+        """
+        Queues a map (or an error) for next_map, waiting for room in the queue
+        @param self:
+        @param item: Maps object, or exception
+        @return:
+        """
+        # We check regularly whether the prefetcher was closed meanwhile
+        while not self.stopped.is_set():
+            try:
+                self.maps.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+
+    def next_map(self, wait=True):
+        """
+        Pulls the next generated map
+        @param self:
+        @param wait: True to wait for a map to be generated, False to return None if no map is ready
+        @return: a Maps object, or None
+        """
+        if self.error is not None:
+            raise self.error
+        while True:
+            try:
+                item = self.maps.get(timeout=0.1) if wait else self.maps.get(block=False)
+                break
+            except queue.Empty:
+                # No map will ever come once the background thread is over (closed, or stopped by an error already raised)
+                if not self.thread.is_alive() and self.maps.empty():
+                    raise RuntimeError("The map prefetcher does not generate maps anymore")
+                if not wait:
+                    return None
+
+        if isinstance(item, Exception):
+            self.error = item
+            raise item
+        return item
+
+    def close(self):
+        """
+        Stops the background thread
+        @param self:
+        @return:
+        """
+        self.stopped.set()
+        self.thread.join()
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+
+if __name__ == '__main__':
+    from data.dataloader import Dataloader
+
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-d", "--directory", type=str, help="Directory in which the map files are written", required=True)
+    argParser.add_argument("-n", "--nb_maps", type=int, help="Number of maps to generate", default=1000)
+    argParser.add_argument("-s", "--seed", type=int, help="Seed of the maps", default=0)
+    argParser.add_argument("-mh", "--height", type=int, help="Number of rows of the maps", default=12)
+    argParser.add_argument("-mw", "--width", type=int, help="Number of columns of the maps", default=12)
+    argParser.add_argument("-w", "--workers", type=int, help="Number of processes, the number of CPUs by default", default=None)
+    args = argParser.parse_args()
+
+    os.makedirs(args.directory, exist_ok=True)
+    dataloader = Dataloader()
+    for playing_map in generate_maps(MapGenerator(args.height, args.width, seed=args.seed), range(args.nb_maps), nb_workers=args.workers):
+        dataloader.save_map_to_file(playing_map, os.path.join(args.directory, playing_map.map_name))
+    print(f"{args.nb_maps} maps written in {args.directory}")
@@ -0,0 +1,239 @@
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from envs.maps import Maps
+
+"""
+A map pack is a binary file holding many maps of the same size, read through memory mapping (only the pages of the maps used are loaded)
+Layout of the file: the magic string, the length of the header (little-endian uint64), the JSON header, then the arrays, 64-byte aligned
+The header gives the number of maps, their size, and the dtype, shape and offset of every array:
+    layouts: (N, height, width) int8 stacked grids
+    agent_positions, enemy_positions: (*, 2) int32 concatenated starting positions of the maps
+    agent_offsets, enemy_offsets: (N + 1,) int64 offsets of the starting positions of every map in the concatenated arrays
+    hashes: (N, 20) uint8 content hashes of the maps (see map_hash)
+    hash_keys, hash_order: (N,) uint64 first 8 bytes of the hashes (big-endian) in increasing order, and the indices of the maps in that order
+    names: (*,) uint8 concatenated utf-8 names of the maps (the files they come from)
+    name_offsets: (N + 1,) int64 offsets of the name of every map in the concatenated names
+"""
+
+MAGIC = b"HSMPACK1"
+ALIGNMENT = 64
+
+
+def map_hash(layout, agent_positions, enemy_positions):
+    """
+    Function computing the content hash of a map: its layout and its starting positions, whatever the file it comes from
+    @param layout: matrix representation of the map
+    @param agent_positions: set of initial agent positions
+    @param enemy_positions: set of initial enemy positions
+    @return: a 20-byte sha1 digest
+    """
+    digest = hashlib.sha1()
+    layout = np.ascontiguousarray(layout, dtype=np.int8)
+    digest.update(str(layout.shape).encode())
+    digest.update(layout.tobytes())
+    digest.update(np.array(agent_positions, dtype=np.int32).tobytes())
+    digest.update(b"|")
+    digest.update(np.array(enemy_positions, dtype=np.int32).tobytes())
+    return digest.digest()
+
+
+def stack_maps(maps):
+    """
+    Function stacking maps of the same size into compact arrays: the layouts, and the ragged lists of starting positions (flat arrays with offsets)
+    @param maps: list of Maps objects
+    @return: a (names, layouts, agent offsets, agent positions, enemy offsets, enemy positions) tuple
+    """
+    if len(maps) == 0:
+        raise ValueError("At least one map is needed")
+    shapes = {playing_map.initial_map.shape for playing_map in maps}
+    if len(shapes) > 1:
+        raise ValueError(f"The maps must have the same size, got {sorted(shapes)}")
+
+    names = [playing_map.map_name for playing_map in maps]
+    layouts = np.stack([playing_map.initial_map for playing_map in maps]).astype(np.int8, copy=False)
+    agent_offsets = np.concatenate([[0], np.cumsum([len(playing_map.agent_initial_position) for playing_map in maps])])
+    agent_positions = np.array([position for playing_map in maps for position in playing_map.agent_initial_position],
+                               dtype=np.int32).reshape(-1, 2)
+    enemy_offsets = np.concatenate([[0], np.cumsum([len(playing_map.enemy_initial_position) for playing_map in maps])])
+    enemy_positions = np.array([position for playing_map in maps for position in playing_map.enemy_initial_position],
+                               dtype=np.int32).reshape(-1, 2)
+    return names, layouts, agent_offsets.astype(np.int64), agent_positions, enemy_offsets.astype(np.int64), enemy_positions
+
+
+def hash_sort_keys(hashes):
+    """
+    Function computing the sort keys of content hashes: their first 8 bytes, as big-endian integers
+    @param hashes: (N, 20) uint8 array of hashes
+    @return: a (N,) uint64 array
+    """
+    return np.ascontiguousarray(hashes[:, :8]).view(">u8").ravel().astype(np.uint64)
+
+
+def write_map_pack(file, maps):
+    """
+    Function writing maps of the same size into a map pack
+    The file is written under a temporary name first, then renamed: readers never see a partial pack
+    @param file: path of the map pack
+    @param maps: list of Maps objects
+    @return:
+    """
+    names, layouts, agent_offsets, agent_positions, enemy_offsets, enemy_positions = stack_maps(maps)
+    hashes = np.array([np.frombuffer(map_hash(layouts[k], agent_positions[agent_offsets[k]:agent_offsets[k + 1]],
+                                              enemy_positions[enemy_offsets[k]:enemy_offsets[k + 1]]), dtype=np.uint8)
+                       for k in range(len(layouts))])
+    keys = hash_sort_keys(hashes)
+    hash_order = np.argsort(keys, kind="stable")
+    encoded_names = [name.encode() for name in names]
+    arrays = {"layouts": layouts,
+              "agent_offsets": agent_offsets, "agent_positions": agent_positions,
+              "enemy_offsets": enemy_offsets, "enemy_positions": enemy_positions,
+              "hashes": hashes, "hash_keys": keys[hash_order], "hash_order": hash_order.astype(np.int64),
+              "name_offsets": np.concatenate([[0], np.cumsum([len(name) for name in encoded_names])]).astype(np.int64),
+              "names": np.frombuffer(b"".join(encoded_names), dtype=np.uint8)}
+
+    # We place the arrays one after the other, each at an aligned offset relative to the end of the header
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    header = {"version": 1, "count": len(layouts), "height": int(layouts.shape[1]), "width": int(layouts.shape[2]), "arrays": entries}
+    header = json.dumps(header).encode()
+    # The header is padded so that the arrays start at an aligned offset of the file
+    start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+    header += b" " * (start - len(MAGIC) - 8 - len(header))
+
+    temporary_file = f"{file}.{os.getpid()}.tmp"
+    with open(temporary_file, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.array(len(header), dtype="<u8").tobytes())
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(start + entries[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(start + offset)
+    os.replace(temporary_file, file)
+
+
+def is_map_pack(file):
+    """
+    Function checking whether a file is a map pack, from its first bytes
+    @param file: path of the file
+    @return: a boolean
+    """
+    if not os.path.isfile(file):
+        return False
+    with open(file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class MapPack:
+    """
+    This class gives a random access to the maps of a map pack, by index or by content hash, through memory mapping
+    The arrays of the pack are read-only views on the mapped file
+    """
+
+    def __init__(self, file):
+        super(MapPack, self).__init__()
+
+        self.file = file
+        with open(file, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{file} is not a map pack")
+            header_length = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            header = json.loads(f.read(header_length))
+        start = len(MAGIC) + 8 + header_length
+
+        self.count = header["count"]
+        self.height = header["height"]
+        self.width = header["width"]
+        self.data = np.memmap(file, dtype=np.uint8, mode="r")
+        for name, entry in header["arrays"].items():
+            setattr(self, name, np.ndarray(entry["shape"], dtype=np.dtype(entry["dtype"]), buffer=self.data,
+                                           offset=start + entry["offset"]))
+
+    def __len__(self):
+        return self.count
+
+    def name(self, index):
+        """
+        Retrieves the name of a map (the file it comes from)
+        @param self:
+        @param index: index of the map
+        @return: a string
+        """
+        return self.names[self.name_offsets[index]:self.name_offsets[index + 1]].tobytes().decode()
+
+    def hash(self, index):
+        """
+        Retrieves the content hash of a map
+        @param self:
+        @param index: index of the map
+        @return: a hexadecimal string
+        """
+        return self.hashes[index].tobytes().hex()
+
+    def index(self, content_hash):
+        """
+        Looks up a map by content hash, with a binary search on the sorted keys of the hashes
+        @param self:
+        @param content_hash: hexadecimal string (as returned by hash) or 20-byte digest
+        @return: the index of the first map of the pack with this content
+        """
+        digest = bytes.fromhex(content_hash) if isinstance(content_hash, str) else bytes(content_hash)
+        key = np.uint64(int.from_bytes(digest[:8], "big"))
+        first, last = np.searchsorted(self.hash_keys, key, side="left"), np.searchsorted(self.hash_keys, key, side="right")
+        matches = [int(index) for index in self.hash_order[first:last] if self.hashes[index].tobytes() == digest]
+        if len(matches) == 0:
+            raise KeyError(f"No map with hash {digest.hex()} in {self.file}")
+        return min(matches)
+
+    def starting_positions(self, index):
+        """
+        Retrieves the starting positions of the units on a map
+        @param self:
+        @param index: index of the map
+        @return: the lists of the agent and of the enemy starting positions (pairs of coordinates)
+        """
+        agent_positions = self.agent_positions[self.agent_offsets[index]:self.agent_offsets[index + 1]]
+        enemy_positions = self.enemy_positions[self.enemy_offsets[index]:self.enemy_offsets[index + 1]]
+        return [(int(x), int(y)) for x, y in agent_positions], [(int(x), int(y)) for x, y in enemy_positions]
+
+    def map(self, index):
+        """
+        Builds the Maps object of a map
+        @param self:
+        @param index: index of the map
+        @return: a Maps object
+        """
+        return Maps(self.name(index), np.array(self.layouts[index]), *self.starting_positions(index))
+
+    def map_by_hash(self, content_hash):
+        """
+        Builds the Maps object of a map, looked up by content hash
+        @param self:
+        @param content_hash: hexadecimal string or 20-byte digest
+        @return: a Maps object
+        """
+        return self.map(self.index(content_hash))
+
+
+if __name__ == '__main__':
+    from data.dataloader import Dataloader
+
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-i", "--inputs", type=str, nargs="+", help="Map files, or directories of map files, to pack", required=True)
+    argParser.add_argument("-o", "--output", type=str, help="Path of the map pack", required=True)
+    args = argParser.parse_args()
+
+    dataloader = Dataloader()
+    maps = []
+    for path in args.inputs:
+        maps += dataloader.load_maps_from_directory(path) if os.path.isdir(path) else [dataloader.load_map_from_file(path)]
+    write_map_pack(args.output, maps)
+    print(f"{len(maps)} maps packed in {args.output} ({os.path.getsize(args.output)} bytes)")
@@ -1,39 +0,0 @@
-"""
-This file contains enemy visions precomputed at different positions for different map, for training optimisation purposes
-"""
-
-map_v6_ennemy_vision_1 = map_v6_ennemy_vision_2 = map_v6_ennemy_vision_3 = map_v6_ennemy_vision_4 = [(9,2),(9,3),(9,4),(8,2),(8,3),(8,4),(7,2),(6,2),(5,2),(4,2),(3,2)]
-
-map_v5_ennemy_vision_1 = map_v5_ennemy_vision_2 = map_v5_ennemy_vision_3 = map_v5_ennemy_vision_4 = [(4, 4),(4, 5),(4,6),(5, 4),(5, 5),(5,6),(6, 4),(6, 5),(6,6),(7, 5),(8, 5),(9,5),(10, 5),(11,5)]
-
-map_v1_ennemy_vision_1 = [(5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (4, 0), (5, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (6, 0), (5, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (5, 1), (5, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (4, 1), (5, 1), (5, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (4, 1), (5, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (6, 1), (5, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (5, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 2), (5, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 7), (5, 6), (5, 5), (5, 4), (5, 7), (5, 6), (5, 5), (5, 4), (5, 7), (5, 6), (5, 5), (5, 7), (5, 6), (5, 5), (4, 5), (5, 5), (5, 7), (5, 6), (5, 5), (6, 5), (5, 5), (5, 7), (5, 6), (5, 5), (5, 4), (5, 5), (5, 7), (5, 6), (5, 5), (5, 6), (5, 5), (5, 7), (5, 6), (5, 7), (5, 6), (4, 6), (5, 6), (5, 7), (5, 6), (6, 6), (5, 6), (5, 7), (5, 6), (5, 5), (5, 6), (5, 7), (5, 6), (5, 7), (5, 6), (5, 7), (5, 7), (5, 7), (5, 8), (5, 7), (5, 8), (5, 7), (5, 8), (5, 9), (5, 7), (5, 8), (5, 9), (4, 9), (5, 9), (5, 7), (5, 8), (5, 9), (6, 9), (5, 9), (5, 7), (5, 8), (5, 9), (5, 8), (5, 9), (5, 7), (5, 8), (5, 9), (5, 10), (5, 9), (5, 7), (5, 8), (5, 9), (5, 10), (5, 7), (5, 8), (5, 9), (5, 10), (4, 10), (5, 10), (5, 7), (5, 8), (5, 9), (5, 10), (6, 10), (5, 10), (5, 7), (5, 8), (5, 9), (5, 10), (5, 9), (5, 10), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (5, 10), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (4, 11), (5, 11), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 11), (5, 11), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (5, 10), (5, 11), (5, 7), (5, 8), (5, 9), (5, 10), (4, 10), (5, 10), (5, 11), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (6, 1), (6, 0), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (6, 1), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (6, 1), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (6, 3), (6, 2), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (6, 3), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (6, 3), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (6, 3), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (6, 3), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (5, 4), (6, 4), (5, 7), (6, 7), (6, 6), (6, 5), (5, 7), (5, 6), (6, 6), (6, 5), (5, 7), (5, 6), (5, 5), (6, 5), (5, 7), (6, 7), (6, 6), (6, 5), (5, 5), (6, 5), (5, 7), (6, 7), (6, 6), (6, 5), (7, 5), (6, 5), (5, 7), (6, 7), (6, 6), (5, 7), (5, 6), (6, 6), (5, 7), (6, 7), (6, 6), (5, 6), (6, 6), (5, 7), (6, 7), (6, 6), (7, 6), (6, 6), (5, 7), (6, 7), (6, 6), (6, 5), (6, 6), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (6, 8), (5, 7), (5, 8), (6, 8), (5, 7), (6, 7), (6, 8), (5, 8), (6, 8), (5, 7), (6, 7), (6, 8), (5, 7), (6, 7), (6, 8), (6, 9), (5, 7), (5, 8), (6, 8), (6, 9), (5, 7), (5, 8), (5, 9), (6, 9), (5, 7), (6, 7), (6, 8), (6, 9), (5, 9), (6, 9), (5, 7), (6, 7), (6, 8), (6, 9), (5, 7), (6, 7), (6, 8), (6, 9), (6, 10), (5, 7), (5, 8), (6, 8), (6, 9), (6, 10), (5, 7), (5, 8), (5, 9), (6, 9), (6, 10), (5, 7), (5, 8), (5, 9), (5, 10), (6, 10), (5, 7), (6, 7), (6, 8), (6, 9), (6, 10), (5, 10), (6, 10), (5, 7), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (5, 7), (5, 8), (6, 8), (6, 9), (6, 10), (6, 11), (5, 7), (5, 8), (5, 9), (6, 9), (6, 10), (6, 11), (5, 7), (5, 8), (5, 9), (5, 10), (6, 10), (6, 11), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 11), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7), (5, 7), (6, 7)]
-
-map_v1_ennemy_vision_2 = [(6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (5, 1), (5, 0), (6, 2), (6, 1), (5, 1), (5, 0), (6, 2), (6, 1), (6, 0), (5, 0), (6, 2), (5, 2), (5, 1), (5, 0), (4, 0), (5, 0), (6, 2), (5, 2), (5, 1), (5, 0), (6, 0), (5, 0), (6, 2), (5, 2), (5, 1), (6, 2), (6, 1), (5, 1), (6, 2), (5, 2), (5, 1), (4, 1), (5, 1), (6, 2), (5, 2), (5, 1), (6, 1), (5, 1), (6, 2), (5, 2), (5, 1), (5, 0), (5, 1), (6, 2), (5, 2), (6, 2), (5, 2), (6, 2), (5, 2), (5, 3), (6, 2), (6, 3), (5, 3), (6, 2), (5, 2), (5, 3), (6, 2), (5, 2), (5, 3), (5, 4), (6, 2), (6, 3), (5, 3), (5, 4), (6, 2), (6, 3), (6, 4), (5, 4), (6, 2), (5, 2), (5, 3), (5, 4), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (4, 5), (5, 5), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (6, 2), (5, 2), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 2), (6, 3), (5, 3), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 2), (6, 3), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (6, 2), (6, 1), (6, 0), (6, 2), (6, 1), (6, 0), (5, 0), (6, 0), (6, 2), (6, 1), (6, 0), (7, 0), (6, 0), (6, 2), (6, 1), (6, 0), (6, 1), (6, 0), (6, 2), (6, 1), (5, 1), (6, 1), (6, 0), (6, 2), (6, 1), (6, 2), (6, 1), (5, 1), (6, 1), (6, 2), (6, 1), (7, 1), (6, 1), (6, 2), (6, 1), (6, 0), (6, 1), (6, 2), (6, 1), (6, 2), (6, 1), (6, 2), (6, 2), (5, 2), (6, 2), (6, 2), (7, 2), (6, 2), (6, 2), (6, 1), (6, 2), (6, 2), (6, 3), (6, 2), (6, 2), (6, 3), (6, 2), (6, 3), (5, 3), (6, 3), (6, 2), (6, 3), (6, 2), (6, 3), (6, 4), (6, 2), (6, 3), (6, 4), (5, 4), (6, 4), (6, 2), (6, 3), (6, 4), (6, 2), (6, 3), (6, 4), (6, 5), (6, 2), (6, 3), (6, 4), (6, 5), (5, 5), (6, 5), (6, 2), (6, 3), (6, 4), (6, 5), (7, 5), (6, 5), (6, 2), (6, 3), (6, 4), (6, 5), (6, 4), (6, 5), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 5), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (5, 6), (6, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (7, 6), (6, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 5), (6, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 6), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (5, 7), (6, 7), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (6, 8), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (5, 9), (6, 9), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (5, 10), (6, 10), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (5, 11), (6, 11), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (7, 11), (6, 11), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (6, 10), (6, 11), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (5, 10), (6, 10), (6, 11), (6, 2), (7, 2), (7, 1), (7, 0), (6, 2), (6, 1), (7, 1), (7, 0), (6, 2), (6, 1), (6, 0), (7, 0), (6, 2), (7, 2), (7, 1), (7, 0), (6, 0), (7, 0), (6, 2), (7, 2), (7, 1), (7, 0), (8, 0), (7, 0), (6, 2), (7, 2), (7, 1), (6, 2), (6, 1), (7, 1), (6, 2), (7, 2), (7, 1), (6, 1), (7, 1), (6, 2), (7, 2), (7, 1), (8, 1), (7, 1), (6, 2), (7, 2), (7, 1), (7, 0), (7, 1), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2), (6, 2), (7, 2)]
-
-map_v1_ennemy_vision_3 = [(0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 0), (0, 0), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (0, 1), (0, 0), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 1), (0, 1), (0, 0), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 1), (1, 0), (0, 0), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 1), (0, 1), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (0, 1), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 2), (0, 1), (0, 5), (0, 4), (0, 3), (0, 2), (0, 5), (0, 4), (0, 3), (0, 2), (0, 5), (0, 4), (0, 3), (0, 2), (0, 5), (0, 4), (0, 3), (0, 5), (0, 4), (0, 3), (1, 3), (0, 3), (0, 5), (0, 4), (0, 3), (0, 2), (0, 3), (0, 5), (0, 4), (0, 3), (0, 4), (0, 3), (0, 5), (0, 4), (1, 4), (0, 4), (0, 3), (0, 5), (0, 4), (0, 5), (0, 4), (1, 4), (0, 4), (0, 5), (0, 4), (0, 3), (0, 4), (0, 5), (0, 4), (0, 5), (0, 4), (0, 5), (1, 5), (0, 5), (0, 4), (0, 5), (0, 5), (1, 5), (0, 5), (0, 5), (0, 4), (0, 5), (0, 5), (0, 6), (0, 5), (0, 5), (1, 5), (0, 5), (1, 5), (0, 5), (0, 5), (0, 6), (0, 5), (0, 6), (1, 6), (0, 6), (0, 5), (0, 6), (0, 5), (0, 6), (0, 5), (0, 6), (0, 7), (0, 6), (0, 5), (1, 5), (0, 5), (0, 6), (0, 5), (0, 6), (0, 7), (0, 5), (0, 6), (0, 7), (0, 5), (0, 6), (0, 7), (0, 8), (0, 5), (0, 6), (0, 7), (0, 8), (1, 8), (0, 8), (0, 5), (0, 6), (0, 7), (0, 8), (0, 7), (0, 8), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 8), (0, 5), (0, 6), (0, 7), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (1, 9), (0, 9), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 8), (0, 9), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 9), (0, 5), (0, 6), (0, 7), (0, 8), (1, 8), (0, 8), (0, 9), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (1, 10), (0, 10), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 9), (0, 10), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (0, 10), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (1, 9), (0, 9), (0, 10), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (1, 11), (0, 11), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (0, 10), (0, 11), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (1, 10), (0, 10), (0, 11), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (1, 10), (1, 11), (0, 11), (0, 5), (1, 5), (1, 4), (1, 3), (0, 5), (1, 5), (1, 4), (1, 3), (0, 5), (1, 5), (1, 4), (1, 3), (0, 5), (1, 5), (1, 4), (1, 3), (0, 5), (0, 4), (1, 4), (1, 3), (0, 5), (0, 4), (0, 3), (1, 3), (0, 5), (1, 5), (1, 4), (1, 3), (0, 3), (1, 3), (0, 5), (1, 5), (1, 4), (1, 3), (0, 5), (1, 5), (1, 4), (0, 5), (0, 4), (1, 4), (0, 5), (1, 5), (1, 4), (0, 4), (1, 4), (0, 5), (1, 5), (1, 4), (0, 5), (1, 5), (0, 5), (1, 5), (0, 5), (1, 5), (0, 5), (1, 5), (2, 5), (1, 5), (0, 5), (1, 5), (1, 4), (1, 5), (0, 5), (1, 5), (1, 6), (1, 5), (0, 5), (1, 5), (1, 6), (0, 5), (0, 6), (1, 6), (0, 5), (1, 5), (1, 6), (0, 6), (1, 6), (0, 5), (1, 5), (1, 6), (2, 6), (1, 6), (0, 5), (1, 5), (1, 6), (1, 5), (1, 6), (0, 5), (1, 5), (1, 6), (0, 5), (1, 5), (1, 6), (0, 5), (1, 5), (1, 6), (0, 5), (1, 5), (1, 6), (0, 5), (1, 5), (1, 6), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (3, 5), (2, 5), (0, 5), (1, 5), (2, 5), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (1, 6), (2, 6), (0, 5), (0, 6), (1, 6), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (1, 6), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (3, 6), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (2, 5), (2, 6), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (2, 6), (3, 6), (0, 5), (1, 5), (1, 6), (2, 6), (3, 6), (0, 5), (0, 6), (1, 6), (2, 6), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (2, 6), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (4, 6), (0, 5), (1, 5), (2, 5), (2, 6), (3, 6), (4, 6), (0, 5), (1, 5), (1, 6), (2, 6), (3, 6), (4, 6), (0, 5), (0, 6), (1, 6), (2, 6), (3, 6), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (4, 5), (5, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (5, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (4, 6), (5, 6), (0, 5), (1, 5), (2, 5), (2, 6), (3, 6), (4, 6), (5, 6), (0, 5), (1, 5), (1, 6), (2, 6), (3, 6), (4, 6), (5, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (5, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (5, 8), (5, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (6, 1), (6, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (6, 2), (6, 1), (6, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (6, 1), (6, 0), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (6, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (6, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (6, 2), (6, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (6, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (6, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (6, 3), (6, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (5, 2), (6, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (6, 3), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (5, 5), (6, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (6, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (4, 6), (5, 6), (6, 6), (0, 5), (1, 5), (2, 5), (2, 6), (3, 6), (4, 6), (5, 6), (6, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (6, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (6, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (6, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (6, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (6, 7), (6, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (6, 8), (6, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (6, 8), (6, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 8), (6, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (6, 8), (6, 9), (6, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 8), (6, 9), (6, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 9), (6, 10), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 8), (6, 9), (6, 10), (6, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (6, 9), (6, 10), (6, 11), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (3, 6), (4, 6), (5, 6), (6, 6), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (7, 6), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (8, 6), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (9, 6), (10, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (11, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (11, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (11, 6), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (11, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7)]
-
-map_v1_ennemy_vision_4 = [(9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (0, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (0, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (1, 6), (0, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (2, 5), (1, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (2, 6), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (3, 6), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (3, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (4, 6), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (4, 6), (9, 5), (8, 5), (8, 6), (7, 6), (6, 6), (5, 6), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (5, 2), (5, 1), (5, 0), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (5, 2), (5, 1), (5, 0), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (5, 2), (5, 1), (5, 0), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (5, 1), (5, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (5, 2), (5, 1), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (5, 2), (5, 1), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (5, 2), (5, 1), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (5, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (5, 2), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (5, 2), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (5, 2), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (5, 2), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (6, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (9, 5), (8, 5), (8, 6), (7, 6), (6, 6), (5, 6), (9, 5), (9, 6), (8, 6), (7, 6), (6, 6), (5, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (5, 7), (5, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (5, 9), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (5, 9), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (5, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (5, 9), (5, 10), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (5, 9), (5, 10), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (5, 9), (5, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (5, 9), (5, 10), (5, 11), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (5, 9), (5, 10), (5, 11), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (5, 9), (5, 10), (5, 11), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (6, 0), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (6, 1), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (6, 2), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (7, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (9, 5), (8, 5), (8, 6), (7, 6), (6, 6), (9, 5), (9, 6), (8, 6), (7, 6), (6, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (6, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (6, 9), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (6, 9), (6, 10), (6, 11), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (7, 5), (9, 5), (8, 5), (7, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (8, 6), (7, 6), (9, 5), (9, 6), (8, 6), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (8, 6), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (8, 6), (9, 5), (9, 6), (8, 6), (9, 5), (8, 5), (8, 6), (7, 6), (8, 6), (9, 5), (8, 5), (8, 6), (9, 6), (8, 6), (9, 5), (8, 5), (8, 6), (8, 5), (8, 6), (9, 5), (8, 5), (8, 6), (9, 5), (8, 5), (8, 6), (9, 5), (8, 5), (8, 6), (9, 5), (8, 5), (8, 6), (9, 5), (8, 5), (8, 6), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (8, 5), (9, 5), (9, 5), (10, 5), (9, 5), (9, 5), (9, 5), (9, 6), (9, 5), (9, 6), (8, 6), (9, 6), (9, 5), (9, 6), (10, 6), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (9, 6), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (10, 6), (9, 5), (9, 6), (10, 6), (9, 5), (10, 5), (10, 6), (9, 6), (10, 6), (9, 5), (10, 5), (10, 6), (11, 6), (10, 6), (9, 5), (10, 5), (10, 6), (10, 5), (10, 6), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (9, 6), (10, 6), (10, 7), (9, 5), (9, 6), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (11, 4), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (9, 5), (10, 5), (11, 5), (10, 5), (11, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (11, 6), (9, 5), (10, 5), (10, 6), (11, 6), (9, 5), (9, 6), (10, 6), (11, 6), (9, 5), (10, 5), (11, 5), (11, 6), (10, 6), (11, 6), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (11, 6), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (9, 5), (9, 6), (10, 6), (10, 7), (11, 7), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (10, 7)]
-
-map_v2_ennemy_vision_1 = [(7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (0, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (0, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (0, 3), (0, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (0, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (0, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (1, 4), (0, 4), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (0, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (0, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (1, 6), (0, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (0, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (0, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (0, 7), (0, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (0, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (0, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (1, 4), (1, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (2, 3), (1, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (1, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (1, 4), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (2, 4), (1, 4), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (2, 5), (1, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (1, 6), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (2, 6), (1, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (1, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (2, 7), (1, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (1, 6), (1, 7), (1, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (1, 10), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (1, 10), (1, 11), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 3), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (2, 4), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (3, 3), (2, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (2, 4), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (2, 4), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (3, 4), (2, 4), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (2, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (3, 5), (2, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 4), (2, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (2, 6), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (3, 6), (2, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (2, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (2, 7), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (2, 7), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (3, 7), (2, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (3, 3), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (3, 4), (3, 3), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (3, 3), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (3, 4), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (3, 4), (7, 5), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (3, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (4, 5), (3, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 4), (3, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (3, 6), (7, 5), (7, 6), (6, 6), (5, 6), (4, 6), (3, 6), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (3, 7), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (3, 7), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (3, 7), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (3, 7), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 8), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (4, 3), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (4, 3), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (4, 3), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (7, 5), (7, 4), (6, 4), (5, 4), (4, 4), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (3, 4), (4, 4), (7, 5), (6, 5), (5, 5), (4, 5), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (4, 5), (7, 5), (6, 5), (5, 5), (4, 5), (5, 5), (4, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (7, 5), (7, 6), (6, 6), (5, 6), (4, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (3, 6), (4, 6), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (4, 7), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (4, 7), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (4, 8), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (7, 5), (7, 4), (6, 4), (5, 4), (5, 3), (7, 5), (7, 4), (6, 4), (6, 3), (5, 3), (7, 5), (6, 5), (5, 5), (5, 4), (7, 5), (6, 5), (6, 4), (5, 4), (7, 5), (7, 4), (6, 4), (5, 4), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (5, 4), (7, 5), (6, 5), (5, 5), (5, 4), (6, 4), (5, 4), (7, 5), (6, 5), (5, 5), (7, 5), (6, 5), (5, 5), (4, 5), (5, 5), (7, 5), (6, 5), (5, 5), (6, 5), (5, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 5), (7, 5), (6, 5), (5, 5), (5, 6), (7, 5), (6, 5), (6, 6), (5, 6), (7, 5), (7, 6), (6, 6), (5, 6), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (5, 6), (7, 5), (6, 5), (5, 5), (5, 6), (6, 6), (5, 6), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (7, 5), (7, 6), (6, 6), (5, 6), (5, 7), (7, 5), (7, 6), (6, 6), (6, 7), (5, 7), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (7, 5), (7, 6), (6, 6), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (7, 5), (6, 5), (6, 4), (6, 3), (7, 5), (6, 5), (6, 4), (6, 3), (7, 5), (6, 5), (6, 4), (6, 3), (7, 5), (6, 5), (6, 4), (6, 3), (7, 5), (7, 4), (6, 4), (6, 3), (7, 5), (7, 4), (7, 3), (6, 3), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (6, 3), (7, 5), (6, 5), (6, 4), (6, 3), (7, 3), (6, 3), (7, 5), (6, 5), (6, 4), (7, 5), (7, 4), (6, 4), (7, 5), (6, 5), (6, 4), (5, 4), (6, 4), (7, 5), (6, 5), (6, 4), (7, 4), (6, 4), (7, 5), (6, 5), (6, 4), (6, 3), (6, 4), (7, 5), (6, 5), (7, 5), (6, 5), (5, 5), (6, 5), (7, 5), (6, 5), (7, 5), (6, 5), (7, 5), (6, 5), (6, 4), (6, 5), (7, 5), (6, 5), (6, 6), (6, 5), (7, 5), (6, 5), (6, 6), (7, 5), (7, 6), (6, 6), (7, 5), (6, 5), (6, 6), (5, 6), (6, 6), (7, 5), (6, 5), (6, 6), (7, 6), (6, 6), (7, 5), (6, 5), (6, 6), (6, 5), (6, 6), (7, 5), (6, 5), (6, 6), (6, 7), (7, 5), (7, 6), (6, 6), (6, 7), (7, 5), (7, 6), (7, 7), (6, 7), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (6, 7), (7, 5), (6, 5), (6, 6), (6, 7), (7, 7), (6, 7), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (7, 5), (7, 6), (7, 7), (6, 7), (6, 8), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (6, 8), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (7, 5), (7, 4), (7, 3), (7, 5), (7, 4), (7, 3), (7, 5), (7, 4), (7, 3), (7, 5), (7, 4), (7, 3), (7, 5), (7, 4), (7, 3), (6, 3), (7, 3), (7, 5), (7, 4), (7, 3), (8, 3), (7, 3), (7, 5), (7, 4), (7, 3), (7, 5), (7, 4), (7, 5), (7, 4), (6, 4), (7, 4), (7, 5), (7, 4), (8, 4), (7, 4), (7, 5), (7, 4), (7, 3), (7, 4), (7, 5), (7, 4), (7, 5), (7, 4), (7, 5), (7, 5), (6, 5), (7, 5), (7, 5), (8, 5), (7, 5), (7, 5), (7, 4), (7, 5), (7, 5), (7, 6), (7, 5), (7, 5), (7, 6), (7, 5), (7, 6), (6, 6), (7, 6), (7, 5), (7, 6), (8, 6), (7, 6), (7, 5), (7, 6), (7, 5), (7, 6), (7, 5), (7, 6), (7, 7), (7, 6), (7, 5), (7, 6), (7, 7), (7, 5), (7, 6), (7, 7), (6, 7), (7, 7), (7, 5), (7, 6), (7, 7), (8, 7), (7, 7), (7, 5), (7, 6), (7, 7), (7, 6), (7, 7), (7, 5), (7, 6), (7, 7), (7, 8), (7, 7), (7, 5), (7, 6), (7, 7), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (8, 8), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (7, 7), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (7, 5), (7, 6), (7, 7), (7, 8), (7, 5), (8, 5), (8, 4), (8, 3), (7, 5), (8, 5), (8, 4), (8, 3), (7, 5), (8, 5), (8, 4), (8, 3), (7, 5), (8, 5), (8, 4), (8, 3), (7, 5), (7, 4), (8, 4), (8, 3), (7, 5), (7, 4), (7, 3), (8, 3), (7, 5), (8, 5), (8, 4), (8, 3), (7, 3), (8, 3), (7, 5), (8, 5), (8, 4), (8, 3), (9, 3), (8, 3), (7, 5), (8, 5), (8, 4), (7, 5), (7, 4), (8, 4), (7, 5), (8, 5), (8, 4), (7, 4), (8, 4), (7, 5), (8, 5), (8, 4), (9, 4), (8, 4), (7, 5), (8, 5), (8, 4), (8, 3), (8, 4), (7, 5), (8, 5), (7, 5), (8, 5), (7, 5), (8, 5), (7, 5), (8, 5), (9, 5), (8, 5), (7, 5), (8, 5), (8, 4), (8, 5), (7, 5), (8, 5), (8, 6), (8, 5), (7, 5), (8, 5), (8, 6), (7, 5), (7, 6), (8, 6), (7, 5), (8, 5), (8, 6), (7, 6), (8, 6), (7, 5), (8, 5), (8, 6), (9, 6), (8, 6), (7, 5), (8, 5), (8, 6), (8, 5), (8, 6), (7, 5), (8, 5), (8, 6), (8, 7), (7, 5), (7, 6), (8, 6), (8, 7), (7, 5), (7, 6), (7, 7), (8, 7), (7, 5), (8, 5), (8, 6), (8, 7), (7, 7), (8, 7), (7, 5), (8, 5), (8, 6), (8, 7), (9, 7), (8, 7), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (7, 5), (7, 6), (8, 6), (8, 7), (8, 8), (7, 5), (7, 6), (7, 7), (8, 7), (8, 8), (7, 5), (7, 6), (7, 7), (7, 8), (8, 8), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (7, 8), (8, 8), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (8, 4), (9, 4), (9, 3), (7, 5), (8, 5), (8, 4), (8, 3), (9, 3), (7, 5), (7, 4), (8, 4), (9, 4), (9, 3), (7, 5), (7, 4), (8, 4), (8, 3), (9, 3), (7, 5), (8, 5), (9, 5), (9, 4), (7, 5), (8, 5), (8, 4), (9, 4), (7, 5), (7, 4), (8, 4), (9, 4), (7, 5), (8, 5), (9, 5), (9, 4), (8, 4), (9, 4), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (9, 4), (7, 5), (8, 5), (9, 5), (7, 5), (8, 5), (9, 5), (8, 5), (9, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 5), (7, 5), (8, 5), (9, 5), (9, 6), (7, 5), (8, 5), (8, 6), (9, 6), (7, 5), (7, 6), (8, 6), (9, 6), (7, 5), (8, 5), (9, 5), (9, 6), (8, 6), (9, 6), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (9, 6), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (7, 5), (8, 5), (8, 6), (8, 7), (9, 7), (7, 5), (7, 6), (8, 6), (9, 6), (9, 7), (7, 5), (7, 6), (8, 6), (8, 7), (9, 7), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (9, 8), (7, 5), (7, 6), (8, 6), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (10, 0), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (10, 3), (7, 5), (8, 5), (8, 4), (9, 4), (9, 3), (10, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (7, 5), (7, 4), (8, 4), (9, 4), (10, 4), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (9, 4), (10, 4), (7, 5), (8, 5), (9, 5), (10, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (10, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (9, 6), (10, 6), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (10, 7), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (10, 7), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (10, 7), (10, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (10, 10), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (10, 10), (10, 11), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (11, 0), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (11, 0), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (11, 0), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (11, 2), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (11, 3), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (11, 4), (7, 5), (7, 4), (8, 4), (9, 4), (10, 4), (11, 4), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (11, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (11, 6), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (11, 6), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (11, 7), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (11, 8), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (11, 11), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (11, 11)]
-
-map_v2_ennemy_vision_2 = [(10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (0, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (0, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (0, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (0, 3), (0, 2), (0, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 3), (0, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (0, 3), (0, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (0, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (0, 3), (0, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (1, 2), (0, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (0, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (0, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (2, 3), (1, 3), (0, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (3, 3), (2, 3), (1, 3), (0, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (1, 4), (0, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 3), (0, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (0, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (0, 3), (0, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (0, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (0, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (1, 5), (0, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (2, 5), (1, 5), (0, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (0, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (0, 5), (0, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (0, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (0, 5), (0, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (1, 6), (0, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (1, 2), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (1, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (2, 3), (1, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (3, 3), (2, 3), (1, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (4, 3), (3, 3), (2, 3), (1, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (0, 4), (1, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (2, 4), (1, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 3), (1, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (1, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (2, 5), (1, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (3, 5), (2, 5), (1, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (1, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (1, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (1, 5), (1, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (2, 6), (1, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (3, 3), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (4, 3), (3, 3), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (5, 3), (4, 3), (3, 3), (2, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (1, 4), (2, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (3, 4), (2, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 3), (2, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (2, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (3, 5), (2, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (4, 5), (3, 5), (2, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (2, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (2, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (2, 5), (2, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (3, 6), (2, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (2, 6), (2, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (2, 6), (2, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (2, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (2, 5), (2, 6), (2, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (2, 6), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (4, 3), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (5, 3), (4, 3), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (6, 3), (5, 3), (4, 3), (3, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (2, 4), (3, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (4, 4), (3, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 3), (3, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (3, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (4, 5), (3, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (5, 5), (4, 5), (3, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (3, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (3, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (3, 5), (3, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (4, 6), (3, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (3, 6), (3, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (3, 6), (3, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (3, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (3, 5), (3, 6), (3, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (3, 5), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (5, 3), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (6, 3), (5, 3), (4, 3), (10, 4), (9, 4), (8, 4), (8, 3), (7, 3), (6, 3), (5, 3), (4, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (3, 4), (4, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (5, 4), (4, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 3), (4, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (4, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (5, 5), (4, 5), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (4, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (4, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (4, 5), (4, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (5, 6), (4, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (4, 6), (4, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (4, 6), (4, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (4, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (4, 5), (4, 6), (4, 7), (4, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (6, 3), (5, 3), (10, 4), (9, 4), (8, 4), (8, 3), (7, 3), (6, 3), (5, 3), (10, 4), (9, 4), (9, 3), (8, 3), (7, 3), (6, 3), (5, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (5, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (6, 4), (5, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 3), (5, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (5, 5), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (6, 5), (5, 5), (10, 4), (9, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (5, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (5, 6), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (5, 5), (5, 6), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (6, 6), (5, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (5, 7), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (5, 5), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (5, 5), (5, 6), (5, 7), (5, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (6, 3), (10, 4), (9, 4), (8, 4), (8, 3), (7, 3), (6, 3), (10, 4), (9, 4), (9, 3), (8, 3), (7, 3), (6, 3), (10, 4), (10, 3), (9, 3), (8, 3), (7, 3), (6, 3), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (6, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (7, 4), (6, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 3), (6, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (6, 5), (10, 4), (9, 4), (9, 5), (8, 5), (7, 5), (6, 5), (10, 4), (10, 5), (9, 5), (8, 5), (7, 5), (6, 5), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (6, 6), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (6, 6), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (6, 5), (6, 6), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (7, 6), (6, 6), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (6, 6), (6, 7), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (6, 6), (6, 7), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (6, 7), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (10, 4), (9, 4), (8, 4), (8, 3), (7, 3), (10, 4), (9, 4), (9, 3), (8, 3), (7, 3), (10, 4), (10, 3), (9, 3), (8, 3), (7, 3), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (6, 3), (7, 3), (10, 4), (9, 4), (8, 4), (7, 4), (10, 4), (9, 4), (8, 4), (7, 4), (6, 4), (7, 4), (10, 4), (9, 4), (8, 4), (7, 4), (8, 4), (7, 4), (10, 4), (9, 4), (8, 4), (7, 4), (7, 3), (7, 4), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 4), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (10, 4), (9, 4), (9, 5), (8, 5), (7, 5), (10, 4), (10, 5), (9, 5), (8, 5), (7, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (6, 5), (7, 5), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (7, 6), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (7, 6), (10, 4), (9, 4), (9, 5), (8, 5), (7, 5), (7, 6), (10, 4), (9, 4), (9, 5), (8, 5), (8, 6), (7, 6), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (7, 6), (7, 7), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (7, 6), (7, 7), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (7, 7), (10, 4), (9, 4), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (7, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (10, 4), (9, 4), (8, 4), (8, 3), (10, 4), (9, 4), (8, 4), (8, 3), (10, 4), (9, 4), (8, 4), (8, 3), (10, 4), (9, 4), (8, 4), (8, 3), (10, 4), (9, 4), (9, 3), (8, 3), (10, 4), (10, 3), (9, 3), (8, 3), (10, 4), (9, 4), (8, 4), (8, 3), (7, 3), (8, 3), (10, 4), (9, 4), (8, 4), (8, 3), (9, 3), (8, 3), (10, 4), (9, 4), (8, 4), (10, 4), (9, 4), (8, 4), (7, 4), (8, 4), (10, 4), (9, 4), (8, 4), (9, 4), (8, 4), (10, 4), (9, 4), (8, 4), (8, 3), (8, 4), (10, 4), (9, 4), (8, 4), (8, 5), (8, 4), (10, 4), (9, 4), (8, 4), (8, 5), (10, 4), (9, 4), (9, 5), (8, 5), (10, 4), (10, 5), (9, 5), (8, 5), (10, 4), (9, 4), (8, 4), (8, 5), (7, 5), (8, 5), (10, 4), (9, 4), (8, 4), (8, 5), (9, 5), (8, 5), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (10, 4), (9, 4), (9, 5), (8, 5), (8, 6), (10, 4), (9, 4), (9, 5), (9, 6), (8, 6), (10, 4), (10, 5), (9, 5), (8, 5), (8, 6), (10, 4), (10, 5), (9, 5), (9, 6), (8, 6), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (10, 4), (9, 4), (9, 5), (8, 5), (8, 6), (8, 7), (10, 4), (9, 4), (9, 5), (9, 6), (8, 6), (8, 7), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (8, 7), (10, 4), (10, 5), (9, 5), (8, 5), (8, 6), (8, 7), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (9, 5), (8, 5), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (9, 5), (9, 6), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (8, 7), (8, 8), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (8, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (10, 4), (9, 4), (9, 3), (10, 4), (9, 4), (9, 3), (10, 4), (9, 4), (9, 3), (10, 4), (9, 4), (9, 3), (10, 4), (10, 3), (9, 3), (10, 4), (9, 4), (9, 3), (8, 3), (9, 3), (10, 4), (9, 4), (9, 3), (10, 3), (9, 3), (10, 4), (9, 4), (9, 3), (10, 4), (9, 4), (10, 4), (9, 4), (8, 4), (9, 4), (10, 4), (9, 4), (10, 4), (9, 4), (10, 4), (9, 4), (9, 3), (9, 4), (10, 4), (9, 4), (9, 5), (9, 4), (10, 4), (9, 4), (9, 5), (10, 4), (10, 5), (9, 5), (10, 4), (9, 4), (9, 5), (8, 5), (9, 5), (10, 4), (9, 4), (9, 5), (10, 5), (9, 5), (10, 4), (9, 4), (9, 5), (9, 4), (9, 5), (10, 4), (9, 4), (9, 5), (9, 6), (10, 4), (10, 5), (9, 5), (9, 6), (10, 4), (10, 5), (10, 6), (9, 6), (10, 4), (9, 4), (9, 5), (9, 6), (8, 6), (9, 6), (10, 4), (9, 4), (9, 5), (9, 6), (10, 6), (9, 6), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (10, 4), (10, 5), (9, 5), (9, 6), (9, 7), (10, 4), (10, 5), (10, 6), (9, 6), (9, 7), (10, 4), (10, 5), (10, 6), (10, 7), (9, 7), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (8, 7), (9, 7), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (10, 4), (10, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 4), (10, 5), (10, 6), (9, 6), (9, 7), (9, 8), (10, 4), (10, 5), (10, 6), (10, 7), (9, 7), (9, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (9, 8), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (10, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 0), (10, 0), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (11, 0), (10, 0), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (10, 1), (10, 0), (10, 4), (10, 3), (10, 2), (10, 1), (9, 1), (10, 1), (10, 0), (10, 4), (10, 3), (10, 2), (10, 1), (10, 4), (10, 3), (10, 2), (10, 1), (9, 1), (10, 1), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (10, 1), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (10, 1), (10, 4), (10, 3), (10, 2), (10, 1), (10, 2), (10, 1), (10, 4), (10, 3), (10, 2), (10, 4), (10, 3), (10, 2), (10, 4), (10, 3), (10, 4), (10, 3), (9, 3), (10, 3), (10, 4), (10, 3), (11, 3), (10, 3), (10, 4), (10, 3), (10, 2), (10, 3), (10, 4), (10, 3), (10, 4), (10, 3), (10, 4), (10, 4), (9, 4), (10, 4), (10, 4), (11, 4), (10, 4), (10, 4), (10, 3), (10, 4), (10, 4), (10, 5), (10, 4), (10, 4), (10, 5), (10, 4), (10, 5), (9, 5), (10, 5), (10, 4), (10, 5), (11, 5), (10, 5), (10, 4), (10, 5), (10, 4), (10, 5), (10, 4), (10, 5), (10, 6), (10, 5), (10, 4), (10, 5), (10, 6), (10, 4), (10, 5), (10, 6), (9, 6), (10, 6), (10, 4), (10, 5), (10, 6), (11, 6), (10, 6), (10, 4), (10, 5), (10, 6), (10, 5), (10, 6), (10, 4), (10, 5), (10, 6), (10, 7), (10, 6), (10, 4), (10, 5), (10, 6), (10, 7), (10, 4), (10, 5), (10, 6), (10, 7), (9, 7), (10, 7), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (10, 7), (10, 4), (10, 5), (10, 6), (10, 7), (10, 6), (10, 7), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 7), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (9, 8), (10, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (10, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 7), (10, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (9, 10), (10, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (11, 10), (10, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 9), (10, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (10, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (9, 11), (10, 11), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (11, 11), (10, 11), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (10, 10), (10, 11), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (9, 10), (10, 10), (10, 11), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (11, 0), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (11, 0), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (11, 0), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (11, 0), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (10, 1), (11, 1), (10, 4), (11, 4), (11, 3), (11, 2), (10, 4), (10, 3), (11, 3), (11, 2), (10, 4), (10, 3), (10, 2), (11, 2), (10, 4), (11, 4), (11, 3), (11, 2), (10, 2), (11, 2), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (11, 2), (10, 4), (11, 4), (11, 3), (10, 4), (10, 3), (11, 3), (10, 4), (11, 4), (11, 3), (10, 3), (11, 3), (10, 4), (11, 4), (11, 3), (11, 2), (11, 3), (10, 4), (11, 4), (11, 3), (11, 4), (11, 3), (10, 4), (11, 4), (10, 4), (11, 4), (10, 4), (11, 4), (10, 4), (11, 4), (11, 3), (11, 4), (10, 4), (11, 4), (11, 5), (11, 4), (10, 4), (10, 3), (11, 3), (11, 4), (10, 4), (11, 4), (11, 5), (10, 4), (10, 5), (11, 5), (10, 4), (11, 4), (11, 5), (10, 5), (11, 5), (10, 4), (11, 4), (11, 5), (11, 4), (11, 5), (10, 4), (11, 4), (11, 5), (11, 6), (11, 5), (10, 4), (11, 4), (11, 5), (11, 6), (10, 4), (10, 5), (11, 5), (11, 6), (10, 4), (10, 5), (10, 6), (11, 6), (10, 4), (11, 4), (11, 5), (11, 6), (10, 6), (11, 6), (10, 4), (11, 4), (11, 5), (11, 6), (11, 5), (11, 6), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (10, 7), (11, 7), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (11, 11)]
-
-map_v2_ennemy_vision_3 = [(3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (0, 0), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (0, 0), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (0, 3), (0, 2), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 3), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 3), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (0, 3), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (0, 3), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (0, 3), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (3, 5), (2, 5), (2, 4), (1, 4), (0, 4), (3, 5), (3, 4), (2, 4), (1, 4), (0, 4), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (1, 4), (0, 4), (3, 5), (2, 5), (1, 5), (0, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (0, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 4), (0, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 5), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (0, 5), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (3, 5), (3, 6), (2, 6), (1, 6), (0, 6), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (1, 6), (0, 6), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (0, 7), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (0, 7), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (3, 5), (2, 5), (2, 6), (1, 6), (0, 6), (0, 7), (0, 8), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (3, 5), (2, 5), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (0, 11), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (0, 11), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (1, 1), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (1, 1), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (1, 2), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (1, 2), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (1, 2), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (1, 5), (1, 4), (1, 3), (3, 5), (2, 5), (2, 4), (1, 4), (1, 3), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (3, 5), (3, 4), (2, 4), (1, 4), (1, 3), (3, 5), (3, 4), (2, 4), (2, 3), (1, 3), (3, 5), (2, 5), (1, 5), (1, 4), (3, 5), (2, 5), (2, 4), (1, 4), (3, 5), (3, 4), (2, 4), (1, 4), (3, 5), (2, 5), (1, 5), (1, 4), (0, 4), (1, 4), (3, 5), (2, 5), (1, 5), (1, 4), (2, 4), (1, 4), (3, 5), (2, 5), (1, 5), (3, 5), (2, 5), (1, 5), (0, 5), (1, 5), (3, 5), (2, 5), (1, 5), (2, 5), (1, 5), (3, 5), (2, 5), (1, 5), (1, 4), (1, 5), (3, 5), (2, 5), (1, 5), (1, 6), (1, 5), (3, 5), (2, 5), (1, 5), (1, 6), (3, 5), (2, 5), (2, 6), (1, 6), (3, 5), (3, 6), (2, 6), (1, 6), (3, 5), (2, 5), (1, 5), (1, 6), (0, 6), (1, 6), (3, 5), (2, 5), (1, 5), (1, 6), (2, 6), (1, 6), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (3, 5), (3, 6), (2, 6), (1, 6), (1, 7), (3, 5), (3, 6), (2, 6), (2, 7), (1, 7), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (3, 5), (3, 6), (2, 6), (1, 6), (1, 7), (1, 8), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (1, 10), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (3, 5), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (1, 9), (1, 10), (1, 11), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (2, 5), (2, 4), (2, 3), (3, 5), (3, 4), (2, 4), (2, 3), (3, 5), (3, 4), (3, 3), (2, 3), (3, 5), (2, 5), (2, 4), (2, 3), (1, 3), (2, 3), (3, 5), (2, 5), (2, 4), (2, 3), (3, 3), (2, 3), (3, 5), (2, 5), (2, 4), (3, 5), (3, 4), (2, 4), (3, 5), (2, 5), (2, 4), (1, 4), (2, 4), (3, 5), (2, 5), (2, 4), (3, 4), (2, 4), (3, 5), (2, 5), (2, 4), (2, 3), (2, 4), (3, 5), (2, 5), (3, 5), (2, 5), (1, 5), (2, 5), (3, 5), (2, 5), (3, 5), (2, 5), (3, 5), (2, 5), (2, 4), (2, 5), (3, 5), (2, 5), (2, 6), (2, 5), (3, 5), (2, 5), (2, 6), (3, 5), (3, 6), (2, 6), (3, 5), (2, 5), (2, 6), (1, 6), (2, 6), (3, 5), (2, 5), (2, 6), (3, 6), (2, 6), (3, 5), (2, 5), (2, 6), (2, 5), (2, 6), (3, 5), (2, 5), (2, 6), (2, 7), (3, 5), (3, 6), (2, 6), (2, 7), (3, 5), (3, 6), (3, 7), (2, 7), (3, 5), (2, 5), (2, 6), (2, 7), (1, 7), (2, 7), (3, 5), (2, 5), (2, 6), (2, 7), (3, 7), (2, 7), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (3, 6), (2, 6), (2, 7), (2, 8), (3, 5), (3, 6), (3, 7), (2, 7), (2, 8), (3, 5), (3, 6), (3, 7), (3, 8), (2, 8), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (2, 8), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (2, 5), (2, 6), (2, 7), (2, 8), (3, 5), (3, 4), (3, 3), (3, 5), (3, 4), (3, 3), (3, 5), (3, 4), (3, 3), (3, 5), (3, 4), (3, 3), (3, 5), (3, 4), (3, 3), (2, 3), (3, 3), (3, 5), (3, 4), (3, 3), (4, 3), (3, 3), (3, 5), (3, 4), (3, 3), (3, 5), (3, 4), (3, 5), (3, 4), (2, 4), (3, 4), (3, 5), (3, 4), (4, 4), (3, 4), (3, 5), (3, 4), (3, 3), (3, 4), (3, 5), (3, 4), (3, 5), (3, 4), (3, 5), (3, 5), (2, 5), (3, 5), (3, 5), (4, 5), (3, 5), (3, 5), (3, 4), (3, 5), (3, 5), (3, 6), (3, 5), (3, 5), (3, 6), (3, 5), (3, 6), (2, 6), (3, 6), (3, 5), (3, 6), (4, 6), (3, 6), (3, 5), (3, 6), (3, 5), (3, 6), (3, 5), (3, 6), (3, 7), (3, 6), (3, 5), (3, 6), (3, 7), (3, 5), (3, 6), (3, 7), (2, 7), (3, 7), (3, 5), (3, 6), (3, 7), (4, 7), (3, 7), (3, 5), (3, 6), (3, 7), (3, 6), (3, 7), (3, 5), (3, 6), (3, 7), (3, 8), (3, 7), (3, 5), (3, 6), (3, 7), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (2, 8), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (4, 8), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (3, 7), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (3, 5), (3, 6), (3, 7), (3, 8), (3, 5), (4, 5), (4, 4), (4, 3), (3, 5), (4, 5), (4, 4), (4, 3), (3, 5), (4, 5), (4, 4), (4, 3), (3, 5), (4, 5), (4, 4), (4, 3), (3, 5), (3, 4), (4, 4), (4, 3), (3, 5), (3, 4), (3, 3), (4, 3), (3, 5), (4, 5), (4, 4), (4, 3), (3, 3), (4, 3), (3, 5), (4, 5), (4, 4), (4, 3), (5, 3), (4, 3), (3, 5), (4, 5), (4, 4), (3, 5), (3, 4), (4, 4), (3, 5), (4, 5), (4, 4), (3, 4), (4, 4), (3, 5), (4, 5), (4, 4), (5, 4), (4, 4), (3, 5), (4, 5), (4, 4), (4, 3), (4, 4), (3, 5), (4, 5), (3, 5), (4, 5), (3, 5), (4, 5), (3, 5), (4, 5), (5, 5), (4, 5), (3, 5), (4, 5), (4, 4), (4, 5), (3, 5), (4, 5), (4, 6), (4, 5), (3, 5), (4, 5), (4, 6), (3, 5), (3, 6), (4, 6), (3, 5), (4, 5), (4, 6), (3, 6), (4, 6), (3, 5), (4, 5), (4, 6), (5, 6), (4, 6), (3, 5), (4, 5), (4, 6), (4, 5), (4, 6), (3, 5), (4, 5), (4, 6), (4, 7), (3, 5), (3, 6), (4, 6), (4, 7), (3, 5), (3, 6), (3, 7), (4, 7), (3, 5), (4, 5), (4, 6), (4, 7), (3, 7), (4, 7), (3, 5), (4, 5), (4, 6), (4, 7), (5, 7), (4, 7), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 5), (3, 6), (4, 6), (4, 7), (4, 8), (3, 5), (3, 6), (3, 7), (4, 7), (4, 8), (3, 5), (3, 6), (3, 7), (3, 8), (4, 8), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 8), (4, 8), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (3, 5), (4, 5), (4, 4), (5, 4), (5, 3), (3, 5), (4, 5), (4, 4), (4, 3), (5, 3), (3, 5), (3, 4), (4, 4), (5, 4), (5, 3), (3, 5), (3, 4), (4, 4), (4, 3), (5, 3), (3, 5), (4, 5), (5, 5), (5, 4), (3, 5), (4, 5), (4, 4), (5, 4), (3, 5), (3, 4), (4, 4), (5, 4), (3, 5), (4, 5), (5, 5), (5, 4), (4, 4), (5, 4), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (5, 4), (3, 5), (4, 5), (5, 5), (3, 5), (4, 5), (5, 5), (4, 5), (5, 5), (3, 5), (4, 5), (5, 5), (6, 5), (5, 5), (3, 5), (4, 5), (5, 5), (5, 4), (5, 5), (3, 5), (4, 5), (5, 5), (5, 6), (5, 5), (3, 5), (4, 5), (5, 5), (5, 6), (3, 5), (4, 5), (4, 6), (5, 6), (3, 5), (3, 6), (4, 6), (5, 6), (3, 5), (4, 5), (5, 5), (5, 6), (4, 6), (5, 6), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (5, 6), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (3, 5), (4, 5), (4, 6), (4, 7), (5, 7), (3, 5), (3, 6), (4, 6), (5, 6), (5, 7), (3, 5), (3, 6), (4, 6), (4, 7), (5, 7), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (4, 6), (4, 7), (5, 7), (5, 8), (3, 5), (4, 5), (4, 6), (4, 7), (4, 8), (5, 8), (3, 5), (3, 6), (4, 6), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (3, 5), (4, 5), (5, 5), (5, 4), (5, 3), (6, 3), (3, 5), (4, 5), (4, 4), (5, 4), (6, 4), (6, 3), (3, 5), (4, 5), (4, 4), (5, 4), (5, 3), (6, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (3, 5), (4, 5), (4, 4), (5, 4), (6, 4), (3, 5), (3, 4), (4, 4), (5, 4), (6, 4), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (5, 4), (6, 4), (3, 5), (4, 5), (5, 5), (6, 5), (3, 5), (4, 5), (5, 5), (6, 5), (5, 5), (6, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (6, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 5), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (3, 5), (3, 6), (4, 6), (5, 6), (6, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (5, 6), (6, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (6, 7), (3, 5), (4, 5), (4, 6), (5, 6), (5, 7), (6, 7), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (5, 6), (5, 7), (5, 8), (6, 8), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (6, 3), (7, 3), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (7, 4), (7, 3), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (6, 3), (7, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (7, 4), (3, 5), (4, 5), (4, 4), (5, 4), (6, 4), (7, 4), (3, 5), (3, 4), (4, 4), (5, 4), (6, 4), (7, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (6, 5), (7, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (7, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (7, 6), (3, 5), (3, 6), (4, 6), (5, 6), (6, 6), (7, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (7, 7), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (7, 7), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (7, 7), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (6, 7), (7, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (6, 7), (6, 8), (7, 8), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (7, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (7, 3), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (8, 4), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (7, 3), (8, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (8, 4), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (7, 4), (8, 4), (3, 5), (4, 5), (4, 4), (5, 4), (6, 4), (7, 4), (8, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (7, 5), (8, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (8, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (8, 6), (3, 5), (4, 5), (4, 6), (5, 6), (6, 6), (7, 6), (8, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (8, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (8, 7), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (8, 7), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (7, 7), (8, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (7, 8), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (8, 3), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (8, 3), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (9, 4), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (8, 4), (9, 4), (3, 5), (4, 5), (5, 5), (5, 4), (6, 4), (7, 4), (8, 4), (9, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (8, 5), (9, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (9, 6), (3, 5), (4, 5), (5, 5), (5, 6), (6, 6), (7, 6), (8, 6), (9, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (9, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (9, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (8, 7), (9, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (8, 7), (8, 8), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (10, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (9, 3), (10, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (10, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (9, 3), (10, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (9, 4), (10, 4), (3, 5), (4, 5), (5, 5), (6, 5), (6, 4), (7, 4), (8, 4), (9, 4), (10, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (9, 5), (10, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (3, 5), (4, 5), (5, 5), (6, 5), (6, 6), (7, 6), (8, 6), (9, 6), (10, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (10, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (9, 7), (10, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (10, 7), (10, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (10, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (10, 8), (10, 9), (10, 10), (10, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (11, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (11, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (11, 0), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (11, 2), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (10, 3), (11, 3), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 4), (10, 4), (11, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 4), (9, 4), (10, 4), (11, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 4), (8, 4), (9, 4), (10, 4), (11, 4), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (10, 5), (11, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 5), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (8, 6), (9, 6), (10, 6), (11, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (7, 6), (8, 6), (9, 6), (10, 6), (11, 6), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (10, 7), (11, 7), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (9, 6), (10, 6), (11, 6), (11, 7), (11, 8), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (11, 11), (3, 5), (4, 5), (5, 5), (6, 5), (7, 5), (8, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (11, 11)]
-
-map_v2_ennemy_vision_4 = [(5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (1, 0), (0, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 0), (0, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (0, 1), (5, 0), (4, 0), (3, 0), (3, 1), (2, 1), (1, 1), (0, 1), (5, 0), (4, 0), (4, 1), (3, 1), (2, 1), (1, 1), (0, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (0, 1), (0, 2), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (0, 1), (0, 2), (0, 3), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (0, 0), (1, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (2, 0), (1, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 0), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (5, 0), (4, 0), (3, 0), (3, 1), (2, 1), (1, 1), (5, 0), (4, 0), (4, 1), (3, 1), (2, 1), (1, 1), (5, 0), (5, 1), (4, 1), (3, 1), (2, 1), (1, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (5, 0), (4, 0), (3, 0), (2, 0), (1, 0), (2, 0), (5, 0), (4, 0), (3, 0), (2, 0), (3, 0), (2, 0), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (2, 0), (5, 0), (4, 0), (3, 0), (3, 1), (2, 1), (2, 0), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (3, 1), (2, 1), (5, 0), (4, 0), (4, 1), (3, 1), (2, 1), (5, 0), (5, 1), (4, 1), (3, 1), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (1, 1), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (2, 0), (2, 1), (5, 0), (4, 0), (3, 0), (5, 0), (4, 0), (3, 0), (2, 0), (3, 0), (5, 0), (4, 0), (3, 0), (4, 0), (3, 0), (5, 0), (4, 0), (3, 0), (3, 1), (3, 0), (5, 0), (4, 0), (4, 1), (3, 1), (3, 0), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (4, 1), (3, 1), (5, 0), (5, 1), (4, 1), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (2, 1), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (4, 1), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (3, 0), (3, 1), (5, 0), (4, 0), (5, 0), (4, 0), (3, 0), (4, 0), (5, 0), (4, 0), (5, 0), (4, 0), (5, 0), (4, 0), (4, 1), (4, 0), (5, 0), (5, 1), (4, 1), (4, 0), (5, 0), (4, 0), (4, 1), (5, 0), (5, 1), (4, 1), (5, 0), (4, 0), (4, 1), (3, 1), (4, 1), (5, 0), (4, 0), (4, 1), (5, 1), (4, 1), (5, 0), (4, 0), (4, 1), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (4, 0), (4, 1), (5, 0), (5, 0), (4, 0), (5, 0), (5, 0), (6, 0), (5, 0), (5, 0), (5, 1), (5, 0), (5, 0), (4, 0), (5, 0), (4, 0), (5, 0), (5, 0), (5, 1), (5, 0), (5, 1), (4, 1), (5, 1), (5, 0), (5, 1), (6, 1), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (5, 1), (5, 0), (6, 0), (5, 0), (6, 0), (5, 0), (6, 0), (5, 0), (6, 0), (7, 0), (6, 0), (5, 0), (6, 0), (6, 1), (6, 0), (5, 0), (5, 1), (6, 1), (6, 0), (5, 0), (6, 0), (6, 1), (5, 0), (5, 1), (6, 1), (5, 0), (6, 0), (6, 1), (5, 1), (6, 1), (5, 0), (6, 0), (6, 1), (7, 1), (6, 1), (5, 0), (6, 0), (6, 1), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (6, 1), (5, 0), (6, 0), (7, 0), (5, 0), (6, 0), (7, 0), (6, 0), (7, 0), (5, 0), (6, 0), (7, 0), (8, 0), (7, 0), (5, 0), (6, 0), (7, 0), (7, 1), (7, 0), (5, 0), (6, 0), (6, 1), (7, 1), (7, 0), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (6, 1), (7, 1), (5, 0), (5, 1), (6, 1), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (6, 1), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (7, 1), (5, 0), (6, 0), (7, 0), (8, 0), (5, 0), (6, 0), (7, 0), (8, 0), (7, 0), (8, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (8, 0), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (8, 0), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (8, 0), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (5, 0), (6, 0), (6, 1), (7, 1), (8, 1), (5, 0), (5, 1), (6, 1), (7, 1), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (7, 1), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (8, 0), (9, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (9, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (9, 0), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (9, 1), (9, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (9, 1), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (9, 1), (5, 0), (6, 0), (6, 1), (7, 1), (8, 1), (9, 1), (5, 0), (5, 1), (6, 1), (7, 1), (8, 1), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (9, 0), (10, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (10, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (9, 1), (10, 1), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (9, 1), (10, 1), (5, 0), (6, 0), (6, 1), (7, 1), (8, 1), (9, 1), (10, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (10, 0), (11, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 0), (11, 0), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (11, 1), (5, 0), (6, 0), (7, 0), (8, 0), (8, 1), (9, 1), (10, 1), (11, 1), (5, 0), (6, 0), (7, 0), (7, 1), (8, 1), (9, 1), (10, 1), (11, 1), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (11, 1), (11, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (10, 2), (11, 2), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (9, 1), (10, 1), (11, 1), (11, 2), (11, 3), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (11, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (11, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (11, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (11, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (11, 4), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (11, 4), (11, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (11, 4), (11, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (11, 4), (11, 5), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (11, 0), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (11, 1), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (11, 2), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (5, 0), (6, 0), (7, 0), (8, 0), (9, 0), (10, 0), (10, 1), (10, 2), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8)]
-
-map_v3_ennemy_vision_1 = [(2, 3), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (2, 3), (1, 3), (1, 2), (0, 2), (0, 1), (0, 0), (2, 3), (1, 3), (1, 2), (1, 1), (0, 1), (0, 0), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (0, 0), (2, 3), (2, 2), (1, 2), (0, 2), (0, 1), (0, 0), (2, 3), (1, 3), (0, 3), (0, 2), (0, 1), (2, 3), (1, 3), (1, 2), (0, 2), (0, 1), (2, 3), (1, 3), (1, 2), (1, 1), (0, 1), (2, 3), (2, 2), (1, 2), (0, 2), (0, 1), (2, 3), (2, 2), (1, 2), (1, 1), (0, 1), (2, 3), (1, 3), (0, 3), (0, 2), (2, 3), (1, 3), (1, 2), (0, 2), (2, 3), (2, 2), (1, 2), (0, 2), (2, 3), (1, 3), (0, 3), (0, 2), (1, 2), (0, 2), (2, 3), (1, 3), (0, 3), (0, 2), (0, 1), (0, 2), (2, 3), (1, 3), (0, 3), (2, 3), (1, 3), (0, 3), (1, 3), (0, 3), (2, 3), (1, 3), (0, 3), (0, 2), (0, 3), (2, 3), (1, 3), (0, 3), (0, 4), (0, 3), (2, 3), (1, 3), (1, 2), (0, 2), (0, 3), (2, 3), (1, 3), (0, 3), (0, 4), (2, 3), (1, 3), (1, 4), (0, 4), (2, 3), (2, 4), (1, 4), (0, 4), (2, 3), (1, 3), (0, 3), (0, 4), (1, 4), (0, 4), (2, 3), (1, 3), (0, 3), (0, 4), (0, 3), (0, 4), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (2, 3), (2, 4), (1, 4), (0, 4), (0, 5), (2, 3), (2, 4), (1, 4), (1, 5), (0, 5), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (2, 3), (2, 4), (1, 4), (0, 4), (0, 5), (0, 6), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (2, 3), (1, 3), (0, 3), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (2, 3), (1, 3), (1, 4), (0, 4), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (2, 3), (2, 2), (1, 2), (1, 1), (1, 0), (2, 3), (2, 2), (2, 1), (1, 1), (1, 0), (2, 3), (2, 2), (2, 1), (2, 0), (1, 0), (2, 3), (1, 3), (1, 2), (1, 1), (1, 0), (0, 0), (1, 0), (2, 3), (1, 3), (1, 2), (1, 1), (2, 3), (2, 2), (1, 2), (1, 1), (2, 3), (2, 2), (2, 1), (1, 1), (2, 3), (1, 3), (1, 2), (1, 1), (0, 1), (1, 1), (2, 3), (1, 3), (1, 2), (1, 1), (2, 1), (1, 1), (2, 3), (1, 3), (1, 2), (2, 3), (2, 2), (1, 2), (2, 3), (1, 3), (1, 2), (0, 2), (1, 2), (2, 3), (1, 3), (1, 2), (2, 2), (1, 2), (2, 3), (1, 3), (1, 2), (1, 1), (1, 2), (2, 3), (1, 3), (2, 3), (1, 3), (0, 3), (1, 3), (2, 3), (1, 3), (2, 3), (1, 3), (2, 3), (1, 3), (1, 2), (1, 3), (2, 3), (1, 3), (1, 4), (1, 3), (2, 3), (1, 3), (1, 4), (2, 3), (2, 4), (1, 4), (2, 3), (1, 3), (1, 4), (0, 4), (1, 4), (2, 3), (1, 3), (1, 4), (2, 4), (1, 4), (2, 3), (1, 3), (1, 4), (1, 3), (1, 4), (2, 3), (1, 3), (1, 4), (1, 5), (2, 3), (2, 4), (1, 4), (1, 5), (2, 3), (2, 4), (2, 5), (1, 5), (2, 3), (1, 3), (1, 4), (1, 5), (0, 5), (1, 5), (2, 3), (1, 3), (1, 4), (1, 5), (2, 5), (1, 5), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (0, 6), (1, 6), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (2, 3), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 3), (2, 4), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 3), (2, 4), (2, 5), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 3), (2, 2), (2, 1), (2, 0), (2, 3), (2, 2), (2, 1), (2, 0), (1, 0), (2, 0), (2, 3), (2, 2), (2, 1), (2, 0), (3, 0), (2, 0), (2, 3), (2, 2), (2, 1), (2, 0), (2, 1), (2, 0), (2, 3), (2, 2), (2, 1), (1, 1), (2, 1), (2, 0), (2, 3), (2, 2), (2, 1), (2, 3), (2, 2), (2, 1), (1, 1), (2, 1), (2, 3), (2, 2), (2, 1), (3, 1), (2, 1), (2, 3), (2, 2), (2, 1), (2, 0), (2, 1), (2, 3), (2, 2), (2, 1), (2, 2), (2, 1), (2, 3), (2, 2), (2, 3), (2, 2), (1, 2), (2, 2), (2, 3), (2, 2), (3, 2), (2, 2), (2, 3), (2, 2), (2, 1), (2, 2), (2, 3), (2, 2), (2, 3), (2, 2), (2, 3), (2, 3), (1, 3), (2, 3), (2, 3), (3, 3), (2, 3), (2, 3), (2, 2), (2, 3), (2, 3), (2, 4), (2, 3), (2, 3), (2, 4), (2, 3), (2, 4), (1, 4), (2, 4), (2, 3), (2, 4), (3, 4), (2, 4), (2, 3), (2, 4), (2, 3), (2, 4), (2, 3), (2, 4), (2, 5), (2, 4), (2, 3), (2, 4), (2, 5), (2, 3), (2, 4), (2, 5), (1, 5), (2, 5), (2, 3), (2, 4), (2, 5), (3, 5), (2, 5), (2, 3), (2, 4), (2, 5), (2, 4), (2, 5), (2, 3), (2, 4), (2, 5), (2, 6), (2, 5), (2, 3), (2, 4), (2, 5), (2, 6), (2, 3), (2, 4), (2, 5), (2, 6), (1, 6), (2, 6), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (2, 6), (2, 3), (2, 4), (2, 5), (2, 6), (2, 5), (2, 6), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 6), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (1, 7), (2, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (2, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 6), (2, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (1, 8), (2, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (3, 8), (2, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 7), (2, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (1, 9), (2, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (3, 9), (2, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 8), (2, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (1, 10), (2, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (3, 10), (2, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 9), (2, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 11), (2, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 11), (1, 11), (2, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 11), (3, 11), (2, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (2, 11), (2, 10), (2, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9), (2, 10), (1, 10), (2, 10), (2, 11), (2, 3), (3, 3), (3, 2), (3, 1), (3, 0), (2, 3), (2, 2), (3, 2), (3, 1), (3, 0), (2, 3), (2, 2), (2, 1), (3, 1), (3, 0), (2, 3), (2, 2), (2, 1), (2, 0), (3, 0), (2, 3), (3, 3), (3, 2), (3, 1), (3, 0), (2, 0), (3, 0), (2, 3), (3, 3), (3, 2), (3, 1), (2, 3), (2, 2), (3, 2), (3, 1), (2, 3), (2, 2), (2, 1), (3, 1), (2, 3), (3, 3), (3, 2), (3, 1), (2, 1), (3, 1), (2, 3), (3, 3), (3, 2), (3, 1), (4, 1), (3, 1), (2, 3), (3, 3), (3, 2), (2, 3), (2, 2), (3, 2), (2, 3), (3, 3), (3, 2), (2, 2), (3, 2), (2, 3), (3, 3), (3, 2), (4, 2), (3, 2), (2, 3), (3, 3), (3, 2), (3, 1), (3, 2), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (3, 4), (2, 3), (2, 4), (3, 4), (2, 3), (3, 3), (3, 4), (2, 4), (3, 4), (2, 3), (3, 3), (3, 4), (2, 3), (3, 3), (3, 4), (3, 5), (2, 3), (2, 4), (3, 4), (3, 5), (2, 3), (2, 4), (2, 5), (3, 5), (2, 3), (3, 3), (3, 4), (3, 5), (2, 5), (3, 5), (2, 3), (3, 3), (3, 4), (3, 5), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (2, 6), (3, 6), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (3, 7), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (3, 7), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (3, 7), (3, 8), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7), (3, 8), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (3, 8), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7), (3, 8), (3, 9), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (3, 8), (3, 9), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (3, 8), (3, 9), (3, 10), (2, 3), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (3, 11), (2, 3), (2, 4), (3, 4), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (3, 11), (2, 3), (2, 4), (2, 5), (3, 5), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (3, 11), (2, 3), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7), (3, 8), (3, 9), (3, 10), (3, 11), (2, 3), (2, 4), (2, 5), (2, 6), (2, 7), (3, 7), (3, 8), (3, 9), (3, 10), (3, 11), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3), (2, 3), (3, 3)]
-
-map_v3_ennemy_vision_2 = [(9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (0, 7), (0, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (0, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (0, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (0, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (2, 8), (1, 8), (0, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (1, 9), (0, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (0, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (0, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (0, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (0, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (2, 10), (1, 10), (0, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (0, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (0, 10), (0, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 11), (0, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (0, 10), (0, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (1, 11), (0, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (1, 6), (1, 5), (1, 4), (1, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (1, 5), (1, 4), (1, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (1, 6), (1, 5), (1, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (1, 5), (1, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (1, 6), (1, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (1, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (1, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (1, 7), (1, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (1, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (1, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (2, 8), (1, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (3, 8), (2, 8), (1, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (1, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (2, 9), (1, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (2, 10), (1, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (3, 10), (2, 10), (1, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (1, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (2, 11), (1, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (1, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (2, 11), (1, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (2, 5), (2, 4), (2, 3), (2, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (2, 6), (2, 5), (2, 4), (2, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (2, 5), (2, 4), (2, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (2, 6), (2, 5), (2, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (2, 6), (2, 5), (2, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (2, 5), (2, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (2, 6), (2, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (2, 6), (2, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (2, 6), (2, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (2, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (2, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (2, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (2, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (2, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (2, 8), (2, 7), (2, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (2, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (2, 8), (2, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (2, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (2, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (2, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (3, 8), (2, 8), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (4, 8), (3, 8), (2, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (1, 9), (2, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (3, 9), (2, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (2, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (2, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (3, 10), (2, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (4, 10), (3, 10), (2, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (2, 10), (2, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (2, 10), (2, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (3, 11), (2, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (2, 10), (2, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (3, 11), (2, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (3, 5), (3, 4), (3, 3), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (3, 5), (3, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (3, 5), (3, 4), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (3, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (3, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (3, 5), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (3, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (3, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (3, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (3, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (3, 8), (3, 7), (3, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (3, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (3, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (3, 8), (3, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (4, 7), (3, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (3, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (3, 8), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (4, 8), (3, 8), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (5, 8), (4, 8), (3, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (2, 9), (3, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (4, 9), (3, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 8), (3, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (3, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (3, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (4, 10), (3, 10), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (5, 10), (4, 10), (3, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (3, 10), (3, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (3, 10), (3, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (4, 11), (3, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (3, 10), (3, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (4, 11), (3, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (4, 8), (4, 7), (4, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (4, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (4, 7), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (4, 8), (4, 7), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (5, 7), (4, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (4, 8), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (4, 8), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (5, 8), (4, 8), (9, 9), (8, 9), (8, 8), (7, 8), (6, 8), (5, 8), (4, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (3, 9), (4, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (5, 9), (4, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 8), (4, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (4, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (4, 10), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (5, 10), (4, 10), (9, 9), (8, 9), (8, 10), (7, 10), (6, 10), (5, 10), (4, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (4, 10), (4, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (4, 10), (4, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (5, 11), (4, 11), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (4, 10), (4, 11), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (5, 11), (4, 11), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (5, 6), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (5, 8), (5, 7), (5, 6), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 7), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (5, 7), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (5, 7), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (5, 8), (5, 7), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (6, 7), (5, 7), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (5, 8), (9, 9), (8, 9), (8, 8), (7, 8), (6, 8), (5, 8), (9, 9), (9, 8), (8, 8), (7, 8), (6, 8), (5, 8), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (4, 9), (5, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (6, 9), (5, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 8), (5, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (5, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (5, 10), (9, 9), (8, 9), (8, 10), (7, 10), (6, 10), (5, 10), (9, 9), (9, 10), (8, 10), (7, 10), (6, 10), (5, 10), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (5, 10), (5, 11), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (5, 11), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (6, 11), (5, 11), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (5, 10), (5, 11), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (6, 11), (5, 11), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (6, 6), (9, 9), (8, 9), (8, 8), (7, 8), (6, 8), (6, 7), (6, 6), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 7), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (6, 7), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (6, 7), (9, 9), (8, 9), (8, 8), (7, 8), (6, 8), (6, 7), (9, 9), (8, 9), (8, 8), (7, 8), (7, 7), (6, 7), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (9, 9), (8, 9), (8, 8), (7, 8), (6, 8), (9, 9), (9, 8), (8, 8), (7, 8), (6, 8), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (5, 8), (6, 8), (9, 9), (8, 9), (7, 9), (6, 9), (9, 9), (8, 9), (7, 9), (6, 9), (5, 9), (6, 9), (9, 9), (8, 9), (7, 9), (6, 9), (7, 9), (6, 9), (9, 9), (8, 9), (7, 9), (6, 9), (6, 8), (6, 9), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (6, 9), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (9, 9), (8, 9), (8, 10), (7, 10), (6, 10), (9, 9), (9, 10), (8, 10), (7, 10), (6, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (5, 10), (6, 10), (9, 9), (8, 9), (7, 9), (6, 9), (6, 10), (6, 11), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (6, 11), (9, 9), (8, 9), (7, 9), (7, 10), (7, 11), (6, 11), (9, 9), (8, 9), (8, 10), (7, 10), (6, 10), (6, 11), (9, 9), (8, 9), (8, 10), (7, 10), (7, 11), (6, 11), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (8, 8), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (8, 8), (8, 7), (7, 7), (7, 6), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (7, 6), (9, 9), (9, 8), (8, 8), (7, 8), (7, 7), (7, 6), (9, 9), (8, 9), (7, 9), (7, 8), (7, 7), (9, 9), (8, 9), (8, 8), (7, 8), (7, 7), (9, 9), (8, 9), (8, 8), (8, 7), (7, 7), (9, 9), (9, 8), (8, 8), (7, 8), (7, 7), (9, 9), (9, 8), (8, 8), (8, 7), (7, 7), (9, 9), (8, 9), (7, 9), (7, 8), (9, 9), (8, 9), (8, 8), (7, 8), (9, 9), (9, 8), (8, 8), (7, 8), (9, 9), (8, 9), (7, 9), (7, 8), (6, 8), (7, 8), (9, 9), (8, 9), (7, 9), (7, 8), (8, 8), (7, 8), (9, 9), (8, 9), (7, 9), (9, 9), (8, 9), (7, 9), (6, 9), (7, 9), (9, 9), (8, 9), (7, 9), (8, 9), (7, 9), (9, 9), (8, 9), (7, 9), (7, 8), (7, 9), (9, 9), (8, 9), (7, 9), (7, 10), (7, 9), (9, 9), (8, 9), (7, 9), (7, 10), (9, 9), (8, 9), (8, 10), (7, 10), (9, 9), (9, 10), (8, 10), (7, 10), (9, 9), (8, 9), (7, 9), (7, 10), (6, 10), (7, 10), (9, 9), (8, 9), (7, 9), (7, 10), (8, 10), (7, 10), (9, 9), (8, 9), (7, 9), (7, 10), (7, 11), (9, 9), (8, 9), (8, 10), (7, 10), (7, 11), (9, 9), (8, 9), (8, 10), (8, 11), (7, 11), (9, 9), (9, 10), (8, 10), (7, 10), (7, 11), (9, 9), (9, 10), (8, 10), (8, 11), (7, 11), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (8, 0), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (8, 0), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (8, 0), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (8, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (8, 0), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (8, 4), (8, 3), (8, 2), (8, 1), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (8, 4), (8, 3), (8, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (8, 4), (8, 3), (8, 2), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (8, 4), (8, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (8, 4), (8, 3), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (8, 4), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (8, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (8, 4), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (8, 5), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (8, 5), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (8, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (9, 9), (9, 8), (8, 8), (8, 7), (8, 6), (9, 9), (9, 8), (9, 7), (8, 7), (8, 6), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (9, 9), (8, 9), (8, 8), (8, 7), (8, 6), (7, 6), (8, 6), (9, 9), (8, 9), (8, 8), (8, 7), (9, 9), (9, 8), (8, 8), (8, 7), (9, 9), (9, 8), (9, 7), (8, 7), (9, 9), (8, 9), (8, 8), (8, 7), (7, 7), (8, 7), (9, 9), (8, 9), (8, 8), (8, 7), (9, 7), (8, 7), (9, 9), (8, 9), (8, 8), (9, 9), (9, 8), (8, 8), (9, 9), (8, 9), (8, 8), (7, 8), (8, 8), (9, 9), (8, 9), (8, 8), (9, 8), (8, 8), (9, 9), (8, 9), (8, 8), (8, 7), (8, 8), (9, 9), (8, 9), (9, 9), (8, 9), (7, 9), (8, 9), (9, 9), (8, 9), (9, 9), (8, 9), (9, 9), (8, 9), (8, 8), (8, 9), (9, 9), (8, 9), (8, 10), (8, 9), (9, 9), (8, 9), (8, 10), (9, 9), (9, 10), (8, 10), (9, 9), (8, 9), (8, 10), (7, 10), (8, 10), (9, 9), (8, 9), (8, 10), (9, 10), (8, 10), (9, 9), (8, 9), (8, 10), (8, 9), (8, 10), (9, 9), (8, 9), (8, 10), (8, 11), (9, 9), (9, 10), (8, 10), (8, 11), (9, 9), (9, 10), (9, 11), (8, 11), (9, 9), (8, 9), (8, 10), (8, 11), (7, 11), (8, 11), (9, 9), (8, 9), (8, 10), (8, 11), (9, 11), (8, 11), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (8, 0), (9, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (10, 0), (9, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 1), (9, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (8, 1), (9, 1), (9, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (8, 1), (9, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (10, 1), (9, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 2), (9, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (8, 2), (9, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (10, 2), (9, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 3), (9, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (8, 3), (9, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (10, 3), (9, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 2), (9, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 4), (9, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (8, 4), (9, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (10, 4), (9, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 3), (9, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 5), (9, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (8, 5), (9, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (9, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (9, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 6), (9, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 9), (9, 8), (9, 7), (9, 6), (8, 6), (9, 6), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (9, 6), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 6), (9, 9), (9, 8), (9, 7), (9, 6), (9, 7), (9, 6), (9, 9), (9, 8), (9, 7), (9, 9), (9, 8), (9, 7), (8, 7), (9, 7), (9, 9), (9, 8), (9, 7), (10, 7), (9, 7), (9, 9), (9, 8), (9, 7), (9, 6), (9, 7), (9, 9), (9, 8), (9, 7), (9, 8), (9, 7), (9, 9), (9, 8), (9, 9), (9, 8), (8, 8), (9, 8), (9, 9), (9, 8), (10, 8), (9, 8), (9, 9), (9, 8), (9, 7), (9, 8), (9, 9), (9, 8), (9, 9), (9, 8), (9, 9), (9, 9), (8, 9), (9, 9), (9, 9), (10, 9), (9, 9), (9, 9), (9, 8), (9, 9), (9, 9), (9, 10), (9, 9), (9, 9), (9, 10), (9, 9), (9, 10), (8, 10), (9, 10), (9, 9), (9, 10), (10, 10), (9, 10), (9, 9), (9, 10), (9, 9), (9, 10), (9, 9), (9, 10), (9, 11), (9, 10), (9, 9), (9, 10), (9, 11), (9, 9), (9, 10), (9, 11), (8, 11), (9, 11), (9, 9), (9, 10), (9, 11), (10, 11), (9, 11), (9, 9), (9, 10), (9, 11), (9, 10), (9, 11), (9, 9), (9, 10), (8, 10), (9, 10), (9, 11), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (10, 4), (10, 3), (10, 2), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (10, 4), (10, 3), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (10, 4), (10, 3), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (10, 4), (10, 3), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (10, 4), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (10, 4), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (10, 4), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (10, 4), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (10, 5), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (9, 6), (10, 6), (9, 9), (10, 9), (10, 8), (10, 7), (9, 9), (9, 8), (10, 8), (10, 7), (9, 9), (9, 8), (9, 7), (10, 7), (9, 9), (10, 9), (10, 8), (10, 7), (9, 7), (10, 7), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (10, 7), (9, 9), (10, 9), (10, 8), (9, 9), (9, 8), (10, 8), (9, 9), (10, 9), (10, 8), (9, 8), (10, 8), (9, 9), (10, 9), (10, 8), (11, 8), (10, 8), (9, 9), (10, 9), (10, 8), (10, 7), (10, 8), (9, 9), (10, 9), (9, 9), (10, 9), (9, 9), (10, 9), (9, 9), (10, 9), (11, 9), (10, 9), (9, 9), (10, 9), (10, 8), (10, 9), (9, 9), (10, 9), (10, 10), (10, 9), (9, 9), (10, 9), (10, 10), (9, 9), (9, 10), (10, 10), (9, 9), (10, 9), (10, 10), (9, 10), (10, 10), (9, 9), (10, 9), (10, 10), (11, 10), (10, 10), (9, 9), (10, 9), (10, 10), (10, 9), (10, 10), (9, 9), (10, 9), (10, 10), (10, 11), (9, 9), (9, 10), (10, 10), (10, 11), (9, 9), (9, 10), (9, 11), (10, 11), (9, 9), (10, 9), (10, 10), (10, 11), (9, 11), (10, 11), (9, 9), (10, 9), (10, 10), (10, 11), (11, 11), (10, 11), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (11, 4), (11, 3), (11, 2), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (11, 4), (11, 3), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (11, 4), (11, 3), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (11, 4), (11, 3), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (11, 4), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (11, 4), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (11, 4), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (11, 4), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (11, 5), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (9, 9), (9, 8), (10, 8), (11, 8), (11, 7), (11, 6), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (9, 9), (10, 9), (10, 8), (11, 8), (11, 7), (9, 9), (10, 9), (10, 8), (10, 7), (11, 7), (9, 9), (9, 8), (10, 8), (11, 8), (11, 7), (9, 9), (9, 8), (10, 8), (10, 7), (11, 7), (9, 9), (10, 9), (11, 9), (11, 8), (9, 9), (10, 9), (10, 8), (11, 8), (9, 9), (9, 8), (10, 8), (11, 8), (9, 9), (10, 9), (11, 9), (11, 8), (10, 8), (11, 8), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (11, 8), (9, 9), (10, 9), (11, 9), (9, 9), (10, 9), (11, 9), (10, 9), (11, 9), (9, 9), (10, 9), (11, 9), (11, 8), (11, 9), (9, 9), (10, 9), (11, 9), (11, 10), (11, 9), (9, 9), (10, 9), (10, 8), (11, 8), (11, 9), (9, 9), (10, 9), (11, 9), (11, 10), (9, 9), (10, 9), (10, 10), (11, 10), (9, 9), (9, 10), (10, 10), (11, 10), (9, 9), (10, 9), (11, 9), (11, 10), (10, 10), (11, 10), (9, 9), (10, 9), (11, 9), (11, 10), (11, 9), (11, 10), (9, 9), (10, 9), (11, 9), (11, 10), (11, 11), (9, 9), (10, 9), (10, 10), (11, 10), (11, 11), (9, 9), (10, 9), (10, 10), (10, 11), (11, 11), (9, 9), (9, 10), (10, 10), (11, 10), (11, 11), (9, 9), (9, 10), (10, 10), (10, 11), (11, 11)]
-
-map_v3_ennemy_vision_3 = [(8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 3), (8, 2), (8, 1), (8, 0), (8, 3), (8, 2), (8, 1), (8, 0), (7, 0), (8, 0), (8, 3), (8, 2), (8, 1), (8, 0), (9, 0), (8, 0), (8, 3), (8, 2), (8, 1), (8, 0), (8, 1), (8, 0), (8, 3), (8, 2), (8, 1), (7, 1), (8, 1), (8, 0), (8, 3), (8, 2), (8, 1), (8, 3), (8, 2), (8, 1), (7, 1), (8, 1), (8, 3), (8, 2), (8, 1), (9, 1), (8, 1), (8, 3), (8, 2), (8, 1), (8, 0), (8, 1), (8, 3), (8, 2), (8, 1), (8, 2), (8, 1), (8, 3), (8, 2), (8, 3), (8, 2), (7, 2), (8, 2), (8, 3), (8, 2), (9, 2), (8, 2), (8, 3), (8, 2), (8, 1), (8, 2), (8, 3), (8, 2), (8, 3), (8, 2), (8, 3), (8, 3), (8, 3), (8, 4), (8, 3), (8, 4), (8, 3), (8, 4), (8, 5), (8, 3), (8, 4), (8, 5), (8, 3), (8, 4), (8, 5), (8, 6), (8, 3), (8, 4), (8, 5), (8, 6), (7, 6), (8, 6), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (8, 6), (8, 3), (8, 4), (8, 5), (8, 6), (8, 5), (8, 6), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 6), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (7, 7), (8, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (8, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 6), (8, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (7, 8), (8, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (9, 8), (8, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 7), (8, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (7, 9), (8, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (9, 9), (8, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 8), (8, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (7, 10), (8, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (9, 10), (8, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 9), (8, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 11), (8, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 11), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 11), (7, 11), (8, 11), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 11), (9, 11), (8, 11), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (8, 11), (8, 10), (8, 11), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8), (8, 9), (8, 10), (7, 10), (8, 10), (8, 11), (8, 3), (9, 3), (9, 2), (9, 1), (9, 0), (8, 3), (8, 2), (9, 2), (9, 1), (9, 0), (8, 3), (8, 2), (8, 1), (9, 1), (9, 0), (8, 3), (8, 2), (8, 1), (8, 0), (9, 0), (8, 3), (9, 3), (9, 2), (9, 1), (9, 0), (8, 0), (9, 0), (8, 3), (9, 3), (9, 2), (9, 1), (8, 3), (8, 2), (9, 2), (9, 1), (8, 3), (8, 2), (8, 1), (9, 1), (8, 3), (9, 3), (9, 2), (9, 1), (8, 1), (9, 1), (8, 3), (9, 3), (9, 2), (9, 1), (10, 1), (9, 1), (8, 3), (9, 3), (9, 2), (8, 3), (8, 2), (9, 2), (8, 3), (9, 3), (9, 2), (8, 2), (9, 2), (8, 3), (9, 3), (9, 2), (10, 2), (9, 2), (8, 3), (9, 3), (9, 2), (9, 1), (9, 2), (8, 3), (9, 3), (8, 3), (9, 3), (8, 3), (9, 3), (8, 3), (9, 3), (10, 3), (9, 3), (8, 3), (9, 3), (9, 2), (9, 3), (8, 3), (9, 3), (9, 4), (9, 3), (8, 3), (9, 3), (9, 4), (8, 3), (8, 4), (9, 4), (8, 3), (9, 3), (9, 4), (8, 4), (9, 4), (8, 3), (9, 3), (9, 4), (10, 4), (9, 4), (8, 3), (9, 3), (9, 4), (9, 3), (9, 4), (8, 3), (9, 3), (9, 4), (9, 5), (8, 3), (8, 4), (9, 4), (9, 5), (8, 3), (8, 4), (8, 5), (9, 5), (8, 3), (9, 3), (9, 4), (9, 5), (8, 5), (9, 5), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (9, 5), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (8, 6), (9, 6), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (9, 7), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (9, 7), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (9, 7), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (9, 9), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (9, 9), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (9, 9), (9, 10), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (9, 11), (8, 3), (8, 4), (9, 4), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (9, 11), (8, 3), (8, 4), (8, 5), (9, 5), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (9, 11), (8, 3), (8, 4), (8, 5), (8, 6), (9, 6), (9, 7), (9, 8), (9, 9), (9, 10), (9, 11), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (9, 7), (9, 8), (9, 9), (9, 10), (9, 11), (8, 3), (9, 3), (10, 3), (10, 2), (10, 1), (10, 0), (8, 3), (9, 3), (9, 2), (10, 2), (10, 1), (10, 0), (8, 3), (9, 3), (9, 2), (9, 1), (10, 1), (10, 0), (8, 3), (9, 3), (9, 2), (9, 1), (9, 0), (10, 0), (8, 3), (8, 2), (9, 2), (10, 2), (10, 1), (10, 0), (8, 3), (9, 3), (10, 3), (10, 2), (10, 1), (8, 3), (9, 3), (9, 2), (10, 2), (10, 1), (8, 3), (9, 3), (9, 2), (9, 1), (10, 1), (8, 3), (8, 2), (9, 2), (10, 2), (10, 1), (8, 3), (8, 2), (9, 2), (9, 1), (10, 1), (8, 3), (9, 3), (10, 3), (10, 2), (8, 3), (9, 3), (9, 2), (10, 2), (8, 3), (8, 2), (9, 2), (10, 2), (8, 3), (9, 3), (10, 3), (10, 2), (9, 2), (10, 2), (8, 3), (9, 3), (10, 3), (10, 2), (11, 2), (10, 2), (8, 3), (9, 3), (10, 3), (8, 3), (9, 3), (10, 3), (9, 3), (10, 3), (8, 3), (9, 3), (10, 3), (11, 3), (10, 3), (8, 3), (9, 3), (10, 3), (10, 2), (10, 3), (8, 3), (9, 3), (10, 3), (10, 4), (10, 3), (8, 3), (9, 3), (10, 3), (10, 4), (8, 3), (9, 3), (9, 4), (10, 4), (8, 3), (8, 4), (9, 4), (10, 4), (8, 3), (9, 3), (10, 3), (10, 4), (9, 4), (10, 4), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (10, 4), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (8, 3), (8, 4), (9, 4), (10, 4), (10, 5), (8, 3), (8, 4), (9, 4), (9, 5), (10, 5), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (8, 3), (8, 4), (9, 4), (10, 4), (10, 5), (10, 6), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (10, 7), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (10, 7), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (10, 7), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (10, 7), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (8, 3), (9, 3), (9, 4), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (8, 3), (9, 3), (9, 4), (9, 5), (9, 6), (9, 7), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (8, 3), (9, 3), (10, 3), (11, 3), (11, 2), (11, 1), (11, 0), (8, 3), (9, 3), (10, 3), (10, 2), (11, 2), (11, 1), (11, 0), (8, 3), (9, 3), (10, 3), (10, 2), (10, 1), (11, 1), (11, 0), (8, 3), (9, 3), (10, 3), (10, 2), (10, 1), (10, 0), (11, 0), (8, 3), (9, 3), (9, 2), (10, 2), (11, 2), (11, 1), (11, 0), (8, 3), (9, 3), (10, 3), (11, 3), (11, 2), (11, 1), (8, 3), (9, 3), (10, 3), (10, 2), (11, 2), (11, 1), (8, 3), (9, 3), (10, 3), (10, 2), (10, 1), (11, 1), (8, 3), (9, 3), (9, 2), (10, 2), (11, 2), (11, 1), (8, 3), (9, 3), (9, 2), (10, 2), (10, 1), (11, 1), (8, 3), (9, 3), (10, 3), (11, 3), (11, 2), (8, 3), (9, 3), (10, 3), (10, 2), (11, 2), (8, 3), (9, 3), (9, 2), (10, 2), (11, 2), (8, 3), (8, 2), (9, 2), (10, 2), (11, 2), (8, 3), (9, 3), (10, 3), (11, 3), (11, 2), (10, 2), (11, 2), (8, 3), (9, 3), (10, 3), (11, 3), (8, 3), (9, 3), (10, 3), (11, 3), (10, 3), (11, 3), (8, 3), (9, 3), (10, 3), (11, 3), (11, 2), (11, 3), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 3), (8, 3), (9, 3), (10, 3), (10, 2), (11, 2), (11, 3), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (8, 3), (9, 3), (9, 4), (10, 4), (11, 4), (8, 3), (8, 4), (9, 4), (10, 4), (11, 4), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (10, 4), (11, 4), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (8, 3), (9, 3), (9, 4), (10, 4), (11, 4), (11, 5), (8, 3), (9, 3), (9, 4), (10, 4), (10, 5), (11, 5), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (8, 3), (9, 3), (9, 4), (10, 4), (11, 4), (11, 5), (11, 6), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (8, 3), (9, 3), (10, 3), (11, 3), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (8, 3), (9, 3), (10, 3), (10, 4), (11, 4), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (8, 3), (9, 3), (10, 3), (10, 4), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11)]
-
-map_v3_ennemy_vision_4 = [(1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 6), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (1, 10), (1, 9), (0, 9), (0, 8), (0, 7), (1, 10), (1, 9), (1, 8), (0, 8), (0, 7), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (1, 7), (0, 7), (1, 10), (0, 10), (0, 9), (0, 8), (1, 10), (1, 9), (0, 9), (0, 8), (1, 10), (1, 9), (1, 8), (0, 8), (1, 10), (0, 10), (0, 9), (0, 8), (1, 8), (0, 8), (1, 10), (0, 10), (0, 9), (0, 8), (0, 7), (0, 8), (1, 10), (0, 10), (0, 9), (1, 10), (1, 9), (0, 9), (1, 10), (0, 10), (0, 9), (1, 9), (0, 9), (1, 10), (0, 10), (0, 9), (0, 8), (0, 9), (1, 10), (0, 10), (0, 9), (0, 10), (0, 9), (1, 10), (0, 10), (1, 10), (0, 10), (1, 10), (0, 10), (1, 10), (0, 10), (0, 9), (0, 10), (1, 10), (0, 10), (0, 11), (0, 10), (1, 10), (1, 9), (0, 9), (0, 10), (1, 10), (0, 10), (0, 11), (1, 10), (1, 11), (0, 11), (1, 10), (0, 10), (0, 11), (1, 11), (0, 11), (1, 10), (0, 10), (0, 11), (0, 10), (0, 11), (1, 10), (1, 11), (0, 11), (1, 11), (0, 11), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (0, 0), (1, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (2, 0), (1, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 1), (1, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (1, 1), (1, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (1, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (2, 1), (1, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 2), (1, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (1, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (2, 2), (1, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 3), (1, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (0, 3), (1, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (2, 3), (1, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 4), (1, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (0, 4), (1, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (2, 4), (1, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 5), (1, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (1, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (2, 5), (1, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 6), (1, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (1, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (1, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 7), (1, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 10), (1, 9), (1, 8), (1, 7), (0, 7), (1, 7), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (1, 7), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (1, 7), (1, 10), (1, 9), (1, 8), (1, 7), (1, 8), (1, 7), (1, 10), (1, 9), (1, 8), (1, 10), (1, 9), (1, 8), (0, 8), (1, 8), (1, 10), (1, 9), (1, 8), (2, 8), (1, 8), (1, 10), (1, 9), (1, 8), (1, 7), (1, 8), (1, 10), (1, 9), (1, 8), (1, 9), (1, 8), (1, 10), (1, 9), (1, 10), (1, 9), (0, 9), (1, 9), (1, 10), (1, 9), (2, 9), (1, 9), (1, 10), (1, 9), (1, 8), (1, 9), (1, 10), (1, 9), (1, 10), (1, 9), (1, 10), (1, 10), (0, 10), (1, 10), (1, 10), (2, 10), (1, 10), (1, 10), (1, 9), (1, 10), (1, 10), (1, 11), (1, 10), (1, 10), (1, 11), (1, 10), (1, 11), (0, 11), (1, 11), (1, 10), (1, 11), (2, 11), (1, 11), (1, 10), (1, 11), (1, 10), (1, 11), (1, 10), (0, 10), (1, 10), (1, 11), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (2, 0), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (2, 0), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (2, 0), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (2, 0), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (2, 0), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (2, 1), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (2, 4), (2, 3), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (2, 4), (2, 3), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (2, 4), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (2, 4), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (2, 4), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (2, 5), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (2, 5), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (2, 5), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (2, 5), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (2, 6), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (2, 6), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (2, 6), (1, 10), (1, 9), (1, 8), (1, 7), (1, 6), (2, 6), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (1, 10), (1, 9), (2, 9), (2, 8), (2, 7), (1, 10), (1, 9), (1, 8), (2, 8), (2, 7), (1, 10), (1, 9), (1, 8), (1, 7), (2, 7), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (1, 7), (2, 7), (1, 10), (2, 10), (2, 9), (2, 8), (1, 10), (1, 9), (2, 9), (2, 8), (1, 10), (1, 9), (1, 8), (2, 8), (1, 10), (2, 10), (2, 9), (2, 8), (1, 8), (2, 8), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (2, 8), (1, 10), (2, 10), (2, 9), (1, 10), (1, 9), (2, 9), (1, 10), (2, 10), (2, 9), (1, 9), (2, 9), (1, 10), (2, 10), (2, 9), (3, 9), (2, 9), (1, 10), (2, 10), (2, 9), (2, 8), (2, 9), (1, 10), (2, 10), (1, 10), (2, 10), (1, 10), (2, 10), (1, 10), (2, 10), (3, 10), (2, 10), (1, 10), (2, 10), (2, 9), (2, 10), (1, 10), (2, 10), (2, 11), (2, 10), (1, 10), (2, 10), (2, 11), (1, 10), (1, 11), (2, 11), (1, 10), (2, 10), (2, 11), (1, 11), (2, 11), (1, 10), (2, 10), (2, 11), (3, 11), (2, 11), (1, 10), (2, 10), (2, 11), (2, 10), (2, 11), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (3, 0), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (3, 0), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (3, 0), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (3, 0), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (3, 0), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (3, 1), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (3, 4), (3, 3), (3, 2), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (3, 4), (3, 3), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (3, 4), (3, 3), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (3, 4), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (3, 4), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (3, 4), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (3, 5), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (3, 5), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (3, 5), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (3, 5), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (3, 6), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (3, 6), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (3, 6), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (2, 6), (3, 6), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (3, 7), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (3, 7), (1, 10), (2, 10), (2, 9), (2, 8), (2, 7), (3, 7), (1, 10), (1, 9), (2, 9), (3, 9), (3, 8), (3, 7), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (1, 10), (2, 10), (2, 9), (2, 8), (3, 8), (1, 10), (1, 9), (2, 9), (3, 9), (3, 8), (1, 10), (1, 9), (2, 9), (2, 8), (3, 8), (1, 10), (2, 10), (3, 10), (3, 9), (1, 10), (2, 10), (2, 9), (3, 9), (1, 10), (1, 9), (2, 9), (3, 9), (1, 10), (2, 10), (3, 10), (3, 9), (2, 9), (3, 9), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (3, 9), (1, 10), (2, 10), (3, 10), (1, 10), (2, 10), (3, 10), (2, 10), (3, 10), (1, 10), (2, 10), (3, 10), (4, 10), (3, 10), (1, 10), (2, 10), (3, 10), (3, 9), (3, 10), (1, 10), (2, 10), (3, 10), (3, 11), (3, 10), (1, 10), (2, 10), (3, 10), (3, 11), (1, 10), (2, 10), (2, 11), (3, 11), (1, 10), (1, 11), (2, 11), (3, 11), (1, 10), (2, 10), (3, 10), (3, 11), (2, 11), (3, 11), (1, 10), (2, 10), (3, 10), (3, 11), (4, 11), (3, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (4, 8), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (4, 7), (4, 6), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (3, 6), (4, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (4, 8), (4, 7), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (4, 8), (4, 7), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (3, 7), (4, 7), (1, 10), (2, 10), (2, 9), (3, 9), (4, 9), (4, 8), (4, 7), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (4, 8), (1, 10), (2, 10), (3, 10), (3, 9), (3, 8), (4, 8), (1, 10), (2, 10), (2, 9), (3, 9), (4, 9), (4, 8), (1, 10), (2, 10), (2, 9), (3, 9), (3, 8), (4, 8), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (1, 10), (2, 10), (2, 9), (3, 9), (4, 9), (1, 10), (1, 9), (2, 9), (3, 9), (4, 9), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (3, 9), (4, 9), (1, 10), (2, 10), (3, 10), (4, 10), (1, 10), (2, 10), (3, 10), (4, 10), (3, 10), (4, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (4, 10), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 10), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (4, 10), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (1, 10), (2, 10), (3, 10), (3, 11), (4, 11), (1, 10), (2, 10), (2, 11), (3, 11), (4, 11), (1, 10), (1, 11), (2, 11), (3, 11), (4, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (3, 11), (4, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (5, 8), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (5, 7), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (4, 6), (5, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (5, 8), (5, 7), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (5, 8), (5, 7), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (4, 7), (5, 7), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (5, 9), (5, 8), (5, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (5, 8), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (4, 8), (5, 8), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (5, 9), (5, 8), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (4, 8), (5, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (5, 9), (1, 10), (2, 10), (2, 9), (3, 9), (4, 9), (5, 9), (1, 10), (1, 9), (2, 9), (3, 9), (4, 9), (5, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (4, 10), (5, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (5, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (5, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (5, 11), (1, 10), (2, 10), (3, 10), (3, 11), (4, 11), (5, 11), (1, 10), (2, 10), (2, 11), (3, 11), (4, 11), (5, 11), (1, 10), (1, 11), (2, 11), (3, 11), (4, 11), (5, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (6, 8), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (6, 7), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (5, 6), (6, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (6, 8), (6, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (6, 8), (6, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (5, 7), (6, 7), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (6, 9), (6, 8), (6, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (6, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (5, 8), (6, 8), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (6, 9), (6, 8), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (5, 8), (6, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (6, 9), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (5, 9), (6, 9), (1, 10), (2, 10), (2, 9), (3, 9), (4, 9), (5, 9), (6, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (5, 10), (6, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (6, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (6, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (6, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (5, 11), (6, 11), (1, 10), (2, 10), (3, 10), (3, 11), (4, 11), (5, 11), (6, 11), (1, 10), (2, 10), (2, 11), (3, 11), (4, 11), (5, 11), (6, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (7, 8), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (7, 7), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (6, 6), (7, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (7, 8), (7, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (7, 8), (7, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (6, 7), (7, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (7, 9), (7, 8), (7, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (7, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (6, 8), (7, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (7, 9), (7, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (6, 8), (7, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (7, 9), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (6, 9), (7, 9), (1, 10), (2, 10), (3, 10), (3, 9), (4, 9), (5, 9), (6, 9), (7, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (6, 10), (7, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (7, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (7, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (7, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (6, 11), (7, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (5, 11), (6, 11), (7, 11), (1, 10), (2, 10), (3, 10), (3, 11), (4, 11), (5, 11), (6, 11), (7, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (8, 7), (8, 6), (8, 5), (8, 4), (8, 3), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (8, 6), (8, 5), (8, 4), (8, 3), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (8, 7), (8, 6), (8, 5), (8, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (8, 7), (8, 6), (8, 5), (8, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (8, 6), (8, 5), (8, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (8, 7), (8, 6), (8, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (8, 7), (8, 6), (8, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (8, 7), (8, 6), (8, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (8, 6), (8, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (8, 7), (8, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (8, 7), (8, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (8, 7), (8, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (7, 6), (8, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (8, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (8, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (7, 7), (8, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (8, 9), (8, 8), (8, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (7, 8), (8, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (8, 9), (8, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (7, 8), (8, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (8, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (7, 9), (8, 9), (1, 10), (2, 10), (3, 10), (4, 10), (4, 9), (5, 9), (6, 9), (7, 9), (8, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (7, 10), (8, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (8, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 11), (8, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (8, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (7, 11), (8, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (6, 11), (7, 11), (8, 11), (1, 10), (2, 10), (3, 10), (4, 10), (4, 11), (5, 11), (6, 11), (7, 11), (8, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (9, 8), (9, 7), (9, 6), (9, 5), (9, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (9, 7), (9, 6), (9, 5), (9, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (9, 6), (9, 5), (9, 4), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (9, 7), (9, 6), (9, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (9, 8), (9, 7), (9, 6), (9, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (9, 7), (9, 6), (9, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (9, 6), (9, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (9, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (9, 7), (9, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (9, 8), (9, 7), (9, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (9, 7), (9, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (8, 6), (9, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (9, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (9, 8), (9, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (8, 7), (9, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (9, 9), (9, 8), (9, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (8, 8), (9, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (9, 9), (9, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (8, 8), (9, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (9, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (8, 9), (9, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 9), (6, 9), (7, 9), (8, 9), (9, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (8, 10), (9, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (9, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 11), (9, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 11), (9, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (8, 11), (9, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (7, 11), (8, 11), (9, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (5, 11), (6, 11), (7, 11), (8, 11), (9, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (10, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (10, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (10, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (10, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (10, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (10, 8), (10, 7), (10, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (10, 8), (10, 7), (10, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (10, 7), (10, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (9, 6), (10, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (10, 8), (10, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (10, 8), (10, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (9, 7), (10, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (10, 9), (10, 8), (10, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (10, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (9, 8), (10, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (10, 9), (10, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (9, 8), (10, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (10, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (9, 9), (10, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 9), (7, 9), (8, 9), (9, 9), (10, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (9, 10), (10, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (10, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 11), (10, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 11), (10, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 11), (9, 11), (10, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (8, 11), (9, 11), (10, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (6, 11), (7, 11), (8, 11), (9, 11), (10, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (11, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (11, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (11, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (11, 5), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (11, 8), (11, 7), (11, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (11, 8), (11, 7), (11, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (11, 8), (11, 7), (11, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (11, 7), (11, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (10, 6), (11, 6), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (11, 8), (11, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (11, 8), (11, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (11, 8), (11, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (10, 7), (11, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (11, 9), (11, 8), (11, 7), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (11, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (11, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (10, 8), (11, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (11, 9), (11, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (10, 8), (11, 8), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 9), (10, 9), (11, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 9), (9, 9), (10, 9), (11, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 9), (8, 9), (9, 9), (10, 9), (11, 9), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (10, 10), (11, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 9), (11, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 11), (11, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 9), (11, 9), (11, 10), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (11, 10), (11, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (10, 10), (10, 11), (11, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (9, 10), (9, 11), (10, 11), (11, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (8, 10), (8, 11), (9, 11), (10, 11), (11, 11), (1, 10), (2, 10), (3, 10), (4, 10), (5, 10), (6, 10), (7, 10), (7, 11), (8, 11), (9, 11), (10, 11), (11, 11)]
-
-map_v4_ennemy_vision_1 = [(4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (3, 0), (4, 0), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (5, 0), (4, 0), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (4, 1), (4, 0), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (3, 1), (4, 1), (4, 0), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (3, 1), (4, 1), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (3, 2), (4, 2), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (3, 3), (4, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (5, 3), (4, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 4), (4, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 7), (4, 6), (4, 5), (4, 4), (4, 7), (4, 6), (4, 5), (4, 7), (4, 6), (4, 5), (4, 7), (4, 6), (4, 7), (4, 6), (4, 7), (4, 7), (4, 7), (4, 8), (4, 7), (4, 8), (3, 8), (4, 8), (4, 7), (4, 8), (4, 7), (4, 8), (4, 9), (4, 7), (4, 8), (4, 9), (3, 9), (4, 9), (4, 7), (4, 8), (4, 9), (4, 7), (4, 8), (4, 9), (4, 10), (4, 7), (4, 8), (4, 9), (4, 10), (3, 10), (4, 10), (4, 7), (4, 8), (4, 9), (4, 10), (5, 10), (4, 10), (4, 7), (4, 8), (4, 9), (4, 10), (4, 9), (4, 10), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (4, 10), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (3, 11), (4, 11), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (5, 11), (4, 11), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (4, 10), (4, 11), (4, 7), (4, 8), (4, 9), (4, 10), (3, 10), (4, 10), (4, 11), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (4, 7), (4, 6), (5, 6), (5, 5), (5, 4), (5, 3), (4, 7), (4, 6), (4, 5), (5, 5), (5, 4), (5, 3), (4, 7), (4, 6), (4, 5), (4, 4), (5, 4), (5, 3), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (5, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (4, 7), (4, 6), (5, 6), (5, 5), (5, 4), (4, 7), (4, 6), (4, 5), (5, 5), (5, 4), (4, 7), (4, 6), (4, 5), (4, 4), (5, 4), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (4, 4), (5, 4), (4, 7), (5, 7), (5, 6), (5, 5), (4, 7), (4, 6), (5, 6), (5, 5), (4, 7), (4, 6), (4, 5), (5, 5), (4, 7), (5, 7), (5, 6), (5, 5), (4, 5), (5, 5), (4, 7), (5, 7), (5, 6), (5, 5), (6, 5), (5, 5), (4, 7), (5, 7), (5, 6), (4, 7), (4, 6), (5, 6), (4, 7), (5, 7), (5, 6), (4, 6), (5, 6), (4, 7), (5, 7), (5, 6), (6, 6), (5, 6), (4, 7), (5, 7), (5, 6), (5, 5), (5, 6), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (6, 7), (5, 7), (4, 7), (5, 7), (5, 6), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (6, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (6, 3), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (5, 3), (6, 3), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (4, 7), (5, 7), (5, 6), (6, 6), (6, 5), (6, 4), (4, 7), (5, 7), (5, 6), (5, 5), (6, 5), (6, 4), (4, 7), (5, 7), (5, 6), (5, 5), (5, 4), (6, 4), (4, 7), (4, 6), (5, 6), (6, 6), (6, 5), (6, 4), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (4, 7), (5, 7), (5, 6), (6, 6), (6, 5), (4, 7), (5, 7), (5, 6), (5, 5), (6, 5), (4, 7), (4, 6), (5, 6), (6, 6), (6, 5), (4, 7), (4, 6), (5, 6), (5, 5), (6, 5), (4, 7), (5, 7), (6, 7), (6, 6), (4, 7), (5, 7), (5, 6), (6, 6), (4, 7), (4, 6), (5, 6), (6, 6), (4, 7), (5, 7), (6, 7), (6, 6), (5, 6), (6, 6), (4, 7), (5, 7), (6, 7), (6, 6), (7, 6), (6, 6), (4, 7), (5, 7), (6, 7), (4, 7), (5, 7), (6, 7), (5, 7), (6, 7), (4, 7), (5, 7), (6, 7), (7, 7), (6, 7), (4, 7), (5, 7), (6, 7), (6, 6), (6, 7), (4, 7), (5, 7), (6, 7), (6, 8), (6, 7), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (6, 6), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (6, 4), (7, 4), (4, 7), (5, 7), (5, 6), (6, 6), (7, 6), (7, 5), (7, 4), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (7, 5), (4, 7), (5, 7), (6, 7), (6, 6), (7, 6), (7, 5), (4, 7), (5, 7), (6, 7), (6, 6), (6, 5), (7, 5), (4, 7), (5, 7), (5, 6), (6, 6), (7, 6), (7, 5), (4, 7), (5, 7), (5, 6), (6, 6), (6, 5), (7, 5), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (4, 7), (5, 7), (6, 7), (6, 6), (7, 6), (4, 7), (5, 7), (5, 6), (6, 6), (7, 6), (4, 7), (4, 6), (5, 6), (6, 6), (7, 6), (4, 7), (5, 7), (6, 7), (7, 7), (7, 6), (6, 6), (7, 6), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (7, 8), (4, 7), (5, 7), (6, 7), (6, 8), (7, 8), (4, 7), (5, 7), (4, 7), (5, 7), (6, 7), (7, 7), (7, 8), (7, 9), (4, 7), (5, 7), (6, 7), (6, 8), (7, 8), (7, 9), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (7, 7), (7, 8), (7, 9), (7, 10), (4, 7), (5, 7), (6, 7), (6, 8), (7, 8), (7, 9), (7, 10), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (7, 7), (7, 8), (7, 9), (7, 10), (7, 11), (4, 7), (5, 7), (6, 7), (6, 8), (7, 8), (7, 9), (7, 10), (7, 11), (4, 7), (5, 7), (6, 7), (6, 8), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7), (4, 7), (5, 7), (6, 7), (7, 7)]
-
-map_v4_ennemy_vision_2 = [(9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (4, 3), (4, 2), (4, 1), (4, 0), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (4, 2), (4, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (4, 3), (4, 2), (4, 1), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (4, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (4, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (4, 3), (4, 2), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (4, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (4, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (4, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (4, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (4, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (4, 4), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (4, 4), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (5, 4), (4, 4), (9, 5), (8, 5), (8, 4), (7, 4), (6, 4), (5, 4), (4, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (4, 6), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (4, 6), (4, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (4, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (4, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (4, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (4, 9), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (4, 9), (4, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (4, 9), (4, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (4, 9), (4, 10), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (4, 6), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (4, 6), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (4, 7), (4, 8), (4, 9), (4, 10), (4, 11), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (5, 3), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (5, 4), (5, 3), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (6, 3), (5, 3), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (5, 4), (9, 5), (8, 5), (8, 4), (7, 4), (6, 4), (5, 4), (9, 5), (9, 4), (8, 4), (7, 4), (6, 4), (5, 4), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (4, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (6, 5), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 4), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (5, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (5, 6), (5, 7), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (6, 3), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (9, 5), (8, 5), (8, 4), (7, 4), (6, 4), (9, 5), (9, 4), (8, 4), (7, 4), (6, 4), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (5, 4), (6, 4), (9, 5), (8, 5), (7, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (5, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (7, 5), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 4), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (6, 7), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 6), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (6, 5), (6, 6), (6, 7), (6, 8), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (9, 5), (8, 5), (8, 4), (7, 4), (9, 5), (9, 4), (8, 4), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (6, 4), (7, 4), (9, 5), (8, 5), (7, 5), (7, 4), (8, 4), (7, 4), (9, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (6, 5), (7, 5), (9, 5), (8, 5), (7, 5), (8, 5), (7, 5), (9, 5), (8, 5), (7, 5), (7, 4), (7, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 5), (9, 5), (8, 5), (7, 5), (7, 6), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (7, 9), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (7, 9), (7, 10), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (7, 6), (7, 7), (7, 8), (7, 9), (7, 10), (7, 11), (9, 5), (8, 5), (9, 5), (8, 5), (8, 4), (9, 5), (8, 5), (8, 4), (9, 5), (8, 5), (8, 4), (9, 5), (8, 5), (8, 4), (9, 5), (8, 5), (8, 4), (9, 5), (9, 4), (8, 4), (9, 5), (8, 5), (8, 4), (7, 4), (8, 4), (9, 5), (8, 5), (8, 4), (9, 4), (8, 4), (9, 5), (8, 5), (8, 4), (9, 5), (8, 5), (9, 5), (8, 5), (7, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (8, 4), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (8, 5), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (8, 0), (9, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (10, 0), (9, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 1), (9, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (8, 1), (9, 1), (9, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (8, 1), (9, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (10, 1), (9, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 0), (9, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 2), (9, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 5), (9, 4), (9, 3), (9, 2), (8, 2), (9, 2), (9, 5), (9, 4), (9, 3), (9, 2), (10, 2), (9, 2), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (9, 2), (9, 5), (9, 4), (9, 3), (9, 2), (9, 3), (9, 2), (9, 5), (9, 4), (9, 3), (9, 5), (9, 4), (9, 3), (9, 5), (9, 4), (9, 5), (9, 4), (8, 4), (9, 4), (9, 5), (9, 4), (10, 4), (9, 4), (9, 5), (9, 4), (9, 3), (9, 4), (9, 5), (9, 4), (9, 5), (9, 4), (9, 5), (9, 5), (8, 5), (9, 5), (9, 5), (10, 5), (9, 5), (9, 5), (9, 4), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (10, 0), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (10, 0), (9, 5), (9, 4), (9, 3), (9, 2), (10, 2), (10, 1), (10, 0), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (10, 1), (10, 0), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (10, 1), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (10, 1), (9, 5), (9, 4), (9, 3), (9, 2), (10, 2), (10, 1), (9, 5), (9, 4), (9, 3), (9, 2), (9, 1), (10, 1), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (9, 5), (9, 4), (10, 4), (10, 3), (10, 2), (9, 5), (9, 4), (9, 3), (10, 3), (10, 2), (9, 5), (9, 4), (9, 3), (9, 2), (10, 2), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (9, 2), (10, 2), (9, 5), (10, 5), (10, 4), (10, 3), (9, 5), (9, 4), (10, 4), (10, 3), (9, 5), (9, 4), (9, 3), (10, 3), (9, 5), (10, 5), (10, 4), (10, 3), (9, 3), (10, 3), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (10, 3), (9, 5), (10, 5), (10, 4), (9, 5), (9, 4), (10, 4), (9, 5), (10, 5), (10, 4), (9, 4), (10, 4), (9, 5), (10, 5), (10, 4), (11, 4), (10, 4), (9, 5), (10, 5), (10, 4), (10, 3), (10, 4), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (9, 5), (10, 5), (11, 5), (10, 5), (9, 5), (10, 5), (10, 4), (10, 5), (9, 5), (10, 5), (10, 6), (10, 5), (9, 5), (10, 5), (10, 6), (9, 5), (9, 5), (10, 5), (10, 6), (10, 7), (9, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (9, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (9, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (9, 5), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (10, 10), (10, 11), (9, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (11, 0), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (11, 0), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (11, 0), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (11, 0), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (11, 1), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (11, 1), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (11, 1), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (11, 1), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (10, 1), (11, 1), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 2), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (11, 2), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (11, 2), (9, 5), (10, 5), (10, 4), (10, 3), (10, 2), (11, 2), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (11, 2), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (9, 5), (10, 5), (10, 4), (11, 4), (11, 3), (9, 5), (10, 5), (10, 4), (10, 3), (11, 3), (9, 5), (9, 4), (10, 4), (11, 4), (11, 3), (9, 5), (9, 4), (10, 4), (10, 3), (11, 3), (9, 5), (10, 5), (11, 5), (11, 4), (9, 5), (10, 5), (10, 4), (11, 4), (9, 5), (9, 4), (10, 4), (11, 4), (9, 5), (10, 5), (11, 5), (11, 4), (10, 4), (11, 4), (9, 5), (10, 5), (11, 5), (11, 4), (11, 3), (11, 4), (9, 5), (10, 5), (11, 5), (9, 5), (10, 5), (11, 5), (10, 5), (11, 5), (9, 5), (10, 5), (11, 5), (11, 4), (11, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 5), (9, 5), (10, 5), (10, 4), (11, 4), (11, 5), (9, 5), (10, 5), (11, 5), (11, 6), (9, 5), (10, 5), (10, 6), (11, 6), (9, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (9, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (9, 5), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (9, 5), (10, 5), (11, 5), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (11, 6), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (10, 7), (11, 7), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (11, 8), (11, 9), (11, 10), (11, 11), (9, 5), (10, 5), (10, 6), (10, 7), (10, 8), (10, 9), (11, 9), (11, 10), (11, 11)]
-
-map_v4_ennemy_vision_3 = [(4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (0, 3), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (0, 3), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (0, 4), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (0, 4), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (0, 4), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (0, 5), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (0, 5), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (0, 5), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (0, 5), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (0, 6), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (0, 6), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (0, 6), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (0, 6), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (0, 7), (0, 6), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (0, 7), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (0, 7), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (0, 7), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (0, 8), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (0, 8), (4, 9), (4, 8), (3, 8), (2, 8), (1, 8), (0, 8), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (1, 9), (0, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 8), (0, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (0, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (0, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (0, 10), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (0, 10), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (0, 10), (4, 9), (4, 10), (3, 10), (2, 10), (1, 10), (0, 10), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (0, 10), (0, 11), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (0, 10), (0, 11), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 11), (0, 11), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (0, 10), (0, 11), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (1, 11), (0, 11), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (1, 4), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (1, 5), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (1, 5), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (1, 5), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (1, 6), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (1, 6), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (1, 6), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 7), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (1, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (1, 7), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (1, 7), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (1, 7), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (4, 9), (3, 9), (3, 8), (2, 8), (1, 8), (4, 9), (4, 8), (3, 8), (2, 8), (1, 8), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (0, 8), (1, 8), (4, 9), (3, 9), (2, 9), (1, 9), (4, 9), (3, 9), (2, 9), (1, 9), (0, 9), (1, 9), (4, 9), (3, 9), (2, 9), (1, 9), (2, 9), (1, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 8), (1, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 9), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (4, 9), (4, 10), (3, 10), (2, 10), (1, 10), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (0, 10), (1, 10), (4, 9), (3, 9), (2, 9), (1, 9), (1, 10), (1, 11), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (1, 11), (4, 9), (3, 9), (2, 9), (2, 10), (2, 11), (1, 11), (4, 9), (3, 9), (3, 10), (2, 10), (1, 10), (1, 11), (4, 9), (3, 9), (3, 10), (2, 10), (2, 11), (1, 11), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (2, 9), (2, 8), (2, 7), (4, 9), (3, 9), (3, 8), (2, 8), (2, 7), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (2, 9), (2, 8), (4, 9), (3, 9), (3, 8), (2, 8), (4, 9), (4, 8), (3, 8), (2, 8), (4, 9), (3, 9), (2, 9), (2, 8), (1, 8), (2, 8), (4, 9), (3, 9), (2, 9), (2, 8), (3, 8), (2, 8), (4, 9), (3, 9), (2, 9), (4, 9), (3, 9), (2, 9), (1, 9), (2, 9), (4, 9), (3, 9), (2, 9), (3, 9), (2, 9), (4, 9), (3, 9), (2, 9), (2, 8), (2, 9), (4, 9), (3, 9), (2, 9), (2, 10), (2, 9), (4, 9), (3, 9), (2, 9), (2, 10), (4, 9), (3, 9), (3, 10), (2, 10), (4, 9), (4, 10), (3, 10), (2, 10), (4, 9), (3, 9), (2, 9), (2, 10), (1, 10), (2, 10), (4, 9), (3, 9), (2, 9), (2, 10), (3, 10), (2, 10), (4, 9), (3, 9), (2, 9), (2, 10), (2, 11), (4, 9), (3, 9), (3, 10), (2, 10), (2, 11), (4, 9), (3, 9), (3, 10), (3, 11), (2, 11), (4, 9), (4, 10), (3, 10), (2, 10), (2, 11), (4, 9), (4, 10), (3, 10), (3, 11), (2, 11), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (4, 8), (3, 8), (4, 9), (3, 9), (3, 8), (2, 8), (3, 8), (4, 9), (3, 9), (3, 8), (4, 8), (3, 8), (4, 9), (3, 9), (3, 8), (4, 9), (3, 9), (4, 9), (3, 9), (2, 9), (3, 9), (4, 9), (3, 9), (4, 9), (3, 9), (4, 9), (3, 9), (3, 8), (3, 9), (4, 9), (3, 9), (3, 10), (3, 9), (4, 9), (3, 9), (3, 10), (4, 9), (4, 10), (3, 10), (4, 9), (3, 9), (3, 10), (2, 10), (3, 10), (4, 9), (3, 9), (3, 10), (4, 10), (3, 10), (4, 9), (3, 9), (3, 10), (3, 9), (3, 10), (4, 9), (3, 9), (3, 10), (3, 11), (4, 9), (4, 10), (3, 10), (3, 11), (4, 9), (4, 10), (4, 11), (3, 11), (4, 9), (3, 9), (3, 10), (3, 11), (2, 11), (3, 11), (4, 9), (3, 9), (3, 10), (3, 11), (4, 11), (3, 11), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (3, 0), (4, 0), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (5, 0), (4, 0), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 0), (4, 1), (4, 0), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (3, 1), (4, 1), (4, 0), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (3, 1), (4, 1), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 1), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (3, 2), (4, 2), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (3, 3), (4, 3), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (5, 3), (4, 3), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 2), (4, 3), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 3), (4, 4), (4, 3), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 4), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 9), (4, 8), (4, 7), (4, 6), (4, 5), (4, 9), (4, 8), (4, 7), (4, 6), (4, 9), (4, 8), (4, 7), (4, 6), (4, 9), (4, 8), (4, 7), (4, 9), (4, 8), (4, 7), (4, 9), (4, 8), (4, 9), (4, 8), (3, 8), (4, 8), (4, 9), (4, 8), (4, 9), (4, 9), (3, 9), (4, 9), (4, 9), (4, 9), (4, 10), (4, 9), (4, 10), (3, 10), (4, 10), (4, 9), (4, 10), (5, 10), (4, 10), (4, 9), (4, 10), (4, 9), (4, 10), (4, 9), (4, 10), (4, 11), (4, 10), (4, 9), (4, 10), (4, 11), (4, 9), (4, 10), (4, 11), (3, 11), (4, 11), (4, 9), (4, 10), (4, 11), (5, 11), (4, 11), (4, 9), (4, 10), (4, 11), (4, 10), (4, 11), (4, 9), (4, 10), (3, 10), (4, 10), (4, 11), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9), (4, 9)]
-
-map_v4_ennemy_vision_4 = [(1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (0, 0), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (0, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (0, 0), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 1), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (0, 1), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (0, 1), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (0, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (1, 5), (1, 4), (0, 4), (0, 3), (0, 2), (1, 5), (1, 4), (1, 3), (0, 3), (0, 2), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (1, 2), (0, 2), (1, 5), (0, 5), (0, 4), (0, 3), (1, 5), (1, 4), (0, 4), (0, 3), (1, 5), (1, 4), (1, 3), (0, 3), (1, 5), (0, 5), (0, 4), (0, 3), (1, 3), (0, 3), (1, 5), (0, 5), (0, 4), (0, 3), (0, 2), (0, 3), (1, 5), (0, 5), (0, 4), (1, 5), (1, 4), (0, 4), (1, 5), (0, 5), (0, 4), (1, 4), (0, 4), (1, 5), (0, 5), (0, 4), (0, 3), (0, 4), (1, 5), (0, 5), (0, 4), (0, 5), (0, 4), (1, 5), (0, 5), (1, 5), (0, 5), (1, 5), (0, 5), (1, 5), (0, 5), (0, 4), (0, 5), (1, 5), (0, 5), (0, 6), (0, 5), (1, 5), (1, 4), (0, 4), (0, 5), (1, 5), (0, 5), (0, 6), (1, 5), (1, 6), (0, 6), (1, 5), (0, 5), (0, 6), (1, 6), (0, 6), (1, 5), (0, 5), (0, 6), (0, 5), (0, 6), (1, 5), (0, 5), (0, 6), (0, 7), (0, 6), (1, 5), (0, 5), (0, 6), (0, 7), (1, 5), (1, 6), (0, 6), (0, 7), (1, 5), (1, 6), (1, 7), (0, 7), (1, 5), (0, 5), (0, 6), (0, 7), (1, 7), (0, 7), (1, 5), (0, 5), (0, 6), (0, 7), (0, 6), (0, 7), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (1, 8), (0, 8), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (1, 5), (0, 5), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (1, 5), (1, 6), (0, 6), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (1, 5), (1, 6), (1, 7), (0, 7), (0, 8), (0, 9), (0, 10), (0, 11), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (0, 9), (0, 10), (0, 11), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (0, 10), (0, 11), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (0, 0), (1, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (2, 0), (1, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 1), (1, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (1, 1), (1, 0), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (0, 1), (1, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (2, 1), (1, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (1, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 2), (1, 1), (1, 5), (1, 4), (1, 3), (1, 2), (1, 5), (1, 4), (1, 3), (1, 2), (0, 2), (1, 2), (1, 5), (1, 4), (1, 3), (1, 2), (2, 2), (1, 2), (1, 5), (1, 4), (1, 3), (1, 2), (1, 1), (1, 2), (1, 5), (1, 4), (1, 3), (1, 2), (1, 3), (1, 2), (1, 5), (1, 4), (1, 3), (1, 5), (1, 4), (1, 3), (0, 3), (1, 3), (1, 5), (1, 4), (1, 3), (2, 3), (1, 3), (1, 5), (1, 4), (1, 3), (1, 2), (1, 3), (1, 5), (1, 4), (1, 3), (1, 4), (1, 3), (1, 5), (1, 4), (1, 5), (1, 4), (0, 4), (1, 4), (1, 5), (1, 4), (2, 4), (1, 4), (1, 5), (1, 4), (1, 3), (1, 4), (1, 5), (1, 4), (1, 5), (1, 4), (1, 5), (1, 5), (0, 5), (1, 5), (1, 5), (1, 5), (1, 6), (1, 5), (1, 6), (0, 6), (1, 6), (1, 5), (1, 6), (1, 5), (1, 6), (1, 7), (1, 5), (1, 6), (1, 7), (0, 7), (1, 7), (1, 5), (1, 6), (1, 7), (2, 7), (1, 7), (1, 5), (1, 6), (1, 7), (1, 6), (1, 7), (1, 5), (1, 6), (1, 7), (1, 8), (1, 7), (1, 5), (1, 6), (1, 7), (1, 8), (1, 5), (1, 6), (1, 7), (1, 8), (0, 8), (1, 8), (1, 5), (1, 6), (1, 7), (1, 8), (2, 8), (1, 8), (1, 5), (1, 6), (1, 7), (1, 8), (1, 7), (1, 8), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 8), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (0, 9), (1, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (2, 9), (1, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 8), (1, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 9), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (0, 10), (1, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (2, 10), (1, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 9), (1, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (1, 10), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (0, 11), (1, 11), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (2, 11), (1, 11), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (1, 11), (1, 10), (1, 11), (1, 5), (1, 6), (1, 7), (1, 8), (1, 9), (1, 10), (0, 10), (1, 10), (1, 11), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5), (1, 5)]
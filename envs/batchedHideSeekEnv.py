@@ -0,0 +1,693 @@
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from data.dataloader import Dataloader
+from envs.custom_envs.coordFieldVision import coord_observation_high
+from envs.custom_envs.spiralFieldVision import spiral_offsets
+from envs.mapPool import holds_map_pool
+from envs.visibility import VisibilityEngine, compute_rays
+from misc.interest_points import count_adjacent_blocks
+from misc.path_table import PathTable
+from misc.utils import EMPTY, BLOCK, OUTSIDE, AGENT, ENEMY, ENEMY_vision, INTEREST_POINT, LEFT, RIGHT, UP, DOWN, STOP
+
+
+class BatchedHideSeekEnv(VecEnv):
+    """
+    This class represents a batch of hide & seek games played on the same map, stepped all at once with NumPy
+    Every game follows the same rules as the corresponding HideSeekEnv subclass, the state of the B games being stored as stacked arrays:
+                        the maps (B, H, W), the positions of the units (B, 2), their visions and the agent's memory (B, H, W), the interest points (B, 2)
+    It is built using : a textual map filename
+                        a number of games
+                        an observation type, either "spiral", "coord", "field" or "direction"
+                        an enemy_placement mode, either "static", "moves", or "random"
+                        a player_placement mode, either "static", "moves", or "random"
+                        a mode_vision, either "static" or "dynamic", for the field observation
+                        a spiral_radius, number of tiles seen on each side of the agent, for the spiral observation
+                        an upscale factor, number of pixels on each side of a tile, for the field observation
+    It implements the stable baselines 3 VecEnv interface: finished games are automatically reset
+    The ray trees and the path table of the map are precomputed for every pair of tiles: their size grows with the square of the number of tiles,
+    which restricts this class to maps of at most MAX_TILES tiles (HideSeekEnv computes them lazily and is meant for the larger ones)
+    """
+
+    # Largest number of tiles of a map: building the ray trees of a 24x24 map already takes several seconds, and their size grows quickly beyond
+    # (it also keeps the path table under its max_eager_tiles, so that its tables can be indexed directly)
+    MAX_TILES = 576
+
+    # Constant used as a separator in the coord observation
+    SEP = -1
+
+    # RGB colors of the tiles for the field observation, indexed by tile value
+    PALETTE = np.array([(0, 0, 0), (255, 255, 255), (150, 150, 0), (1, 1, 1), (0, 250, 0), (255, 0, 0), (255, 0, 255),
+                        (255, 200, 0)], dtype=np.uint8)
+
+    # Moves of the agent, indexed by action
+    MOVES = np.array([(0, -1), (0, 1), (-1, 0), (1, 0), (0, 0)], dtype=np.int64)
+
+    def __init__(self, map_file="", n_envs=8, env_type="field",
+                 enemy_placement="static", player_placement="static", mode_vision="static", spiral_radius=4, upscale=3, seed=None):
+        self.dataloader = Dataloader()
+        if map_file != "" and holds_map_pool(map_file):
+            raise ValueError(f"The batched environment plays on a single map, {map_file} holds several maps")
+        if map_file != "":
+            self.playing_map = self.dataloader.load_map_from_file(map_file)
+        else:
+            self.playing_map = self.dataloader.load_map_from_file("map_v1")
+
+        self.env_type = env_type
+        self.mode_vision = mode_vision
+        self.upscale = upscale
+        self.player_placement = player_placement
+        self.enemy_placement = enemy_placement
+        self.layout = self.playing_map.initial_map
+        self.height, self.width = self.layout.shape
+        self.nb_tiles = self.height * self.width
+        if self.nb_tiles > self.MAX_TILES:
+            raise ValueError(f"The batched environment plays on maps of at most {self.MAX_TILES} tiles, the map is {self.height}x{self.width}: "
+                             f"use the single environments (with several processes) on larger maps")
+        self.bounds = np.array(self.layout.shape, dtype=np.int64)
+        self.np_random = np.random.default_rng(seed)
+
+        # Static information about the map, shared by every game
+        self.enemy_visibility = VisibilityEngine(self.layout, mode="clever")
+        # The tables of the path table are indexed directly: on maps of at most MAX_TILES tiles, they are computed for every pair of tiles
+        self.path_table = PathTable(self.layout, to_avoid=BLOCK)
+        self.blocks = np.argwhere(self.layout == BLOCK)
+        self.nb_next_to_block = count_adjacent_blocks(self.layout)
+        self.hiding_spot_indices = np.flatnonzero(self.nb_next_to_block > 1)
+        self.build_ray_trees()
+        self.spiral = spiral_offsets(spiral_radius)
+
+        if env_type == "spiral":
+            observation_space = spaces.Box(low=0, high=7, shape=(len(self.spiral),), dtype=np.int32)
+        elif env_type == "coord":
+            observation_space = spaces.Box(low=-1, high=coord_observation_high(self.height, self.width), shape=(7,), dtype=np.int32)
+        elif env_type == "field":
+            observation_space = spaces.Box(low=0, high=255, shape=(3, self.width * upscale, self.height * upscale), dtype=np.uint8)
+        elif env_type == "direction":
+            observation_space = spaces.Box(low=0, high=1, shape=(5,), dtype=np.int32)
+        else:
+            raise ValueError(f"Unknown env_type={env_type}, expected spiral, coord, field or direction")
+        self.render_mode = None
+        super(BatchedHideSeekEnv, self).__init__(n_envs, observation_space, spaces.Discrete(5))
+
+        # State of the games
+        shape = (n_envs, self.height, self.width)
+        self.maps = np.empty(shape, dtype=np.int8)
+        self.agent_pos = np.zeros((n_envs, 2), dtype=np.int64)
+        self.previous_agent_pos = np.zeros((n_envs, 2), dtype=np.int64)
+        self.enemy_pos = np.zeros((n_envs, 2), dtype=np.int64)
+        self.enemy_vision = np.zeros(shape, dtype=bool)
+        self.agent_vision = np.zeros(shape, dtype=bool)
+        self.previously_viewed = np.zeros(shape, dtype=bool)
+        self.viewed_order = np.zeros(shape, dtype=np.int64)
+        self.nb_viewed = np.zeros(n_envs, dtype=np.int64)
+        self.nb_vision_updates = np.zeros(n_envs, dtype=np.int64)
+        self.interest_points = np.zeros((n_envs, 2), dtype=np.int64)
+        self.has_interest_point = np.zeros(n_envs, dtype=bool)
+        self.previous_interest_points = np.zeros((n_envs, 2), dtype=np.int64)
+        self.has_previous_interest_point = np.zeros(n_envs, dtype=bool)
+        self.n_step = np.zeros(n_envs, dtype=np.int64)
+        self.actions = np.full(n_envs, STOP, dtype=np.int64)
+
+    ############################################
+    # Precomputations
+
+    def build_ray_trees(self):
+        """
+        Merges the naive lines of sight of every tile into prefix trees: rays sharing their first tiles share their first nodes
+        A node is seen if its tile and all the tiles of its ancestors do not block the vision
+        Nodes are stored depth by depth (each depth padded to the same width for every source), so that parents always come before their children
+        @param self:
+        @return:
+        """
+        trees = []
+        for i in range(self.height):
+            for j in range(self.width):
+                rays = compute_rays(i, j, self.layout.shape, "naive")
+                nodes = {}
+                levels = []
+                for ray_index, ray in enumerate(rays):
+                    parent = -1
+                    for entry, tile in enumerate(ray):
+                        if tile >= self.nb_tiles:
+                            break
+                        key = (parent, int(tile))
+                        if key not in nodes:
+                            # We keep the position of the first ray entry of every node, i.e the order in which Unit.compute_vision sees it
+                            nodes[key] = (entry, len(levels[entry]) if entry < len(levels) else 0, ray_index * rays.shape[1] + entry)
+                            if entry == len(levels):
+                                levels.append([])
+                            levels[entry].append(key)
+                        parent = nodes[key]
+                trees.append((nodes, levels, rays.size))
+
+        depth = max(len(levels) for _, levels, _ in trees)
+        widths = [max(len(levels[d]) if d < len(levels) else 0 for _, levels, _ in trees) for d in range(depth)]
+        offsets = np.concatenate(([0], np.cumsum(widths)))
+        nb_nodes = int(offsets[-1])
+
+        # Two extra columns: a root that is always seen, and a padding node that is never seen
+        self.root_node, self.missing_node = nb_nodes, nb_nodes + 1
+        self.node_tiles = np.full((self.nb_tiles, nb_nodes), self.nb_tiles, dtype=np.int64)
+        self.node_parents = np.full((self.nb_tiles, nb_nodes), self.root_node, dtype=np.int64)
+        self.node_positions = np.zeros((self.nb_tiles, nb_nodes + 2), dtype=np.int64)
+        self.depth_slices = [slice(offsets[d], offsets[d + 1]) for d in range(depth)]
+        self.source_positions = np.array([size for _, _, size in trees], dtype=np.int64)
+        self.order_stride = int(self.source_positions.max()) + 1
+
+        tile_nodes = [[[] for _ in range(self.nb_tiles)] for _ in range(self.nb_tiles)]
+        for source, (nodes, levels, _) in enumerate(trees):
+            for (parent, tile), (entry, rank, position) in nodes.items():
+                column = offsets[entry] + rank
+                self.node_tiles[source, column] = tile
+                if parent != -1:
+                    self.node_parents[source, column] = offsets[parent[0]] + parent[1]
+                self.node_positions[source, column] = position
+                tile_nodes[source][tile].append(column)
+
+        # Nodes of every tile, padded with the node that is never seen
+        nb_copies = max(len(columns) for per_source in tile_nodes for columns in per_source)
+        self.tile_nodes = np.full((self.nb_tiles, self.nb_tiles, nb_copies), self.missing_node, dtype=np.int64)
+        for source in range(self.nb_tiles):
+            for tile in range(self.nb_tiles):
+                columns = tile_nodes[source][tile]
+                self.tile_nodes[source, tile, :len(columns)] = columns
+
+    ############################################
+    # Game logic
+
+    def sample_positions(self, games):
+        """
+        Picks the initial positions of the units of some games, depending on the placement modes
+        @param self:
+        @param games: indices of the games to place units in
+        @return: the agent positions and enemy positions, as (len(games), 2) arrays
+        """
+        nb_games = len(games)
+        agent_positions = np.zeros((nb_games, 2), dtype=np.int64)
+        enemy_positions = np.zeros((nb_games, 2), dtype=np.int64)
+
+        # As in HideSeekEnv.initialize_pos, random positions are picked among every free tile, but the one of the other unit
+        free_tiles = np.argwhere(self.layout == EMPTY)
+
+        def draw_free_tile(excluded):
+            if excluded is None:
+                return free_tiles[self.np_random.integers(len(free_tiles))]
+            candidates = free_tiles[(free_tiles != excluded).any(axis=1)]
+            return candidates[self.np_random.integers(len(candidates))]
+
+        for k in range(nb_games):
+            agent_position = enemy_position = None
+            if self.player_placement == "static":
+                agent_position = self.playing_map.agent_initial_position[0]
+            elif self.player_placement != "random":
+                options = self.playing_map.agent_initial_position
+                agent_position = options[self.np_random.integers(len(options))]
+
+            if self.enemy_placement == "static":
+                enemy_position = self.playing_map.enemy_initial_position[0]
+            elif self.enemy_placement != "random":
+                options = self.playing_map.enemy_initial_position
+                enemy_position = options[self.np_random.integers(len(options))]
+
+            if agent_position is None:
+                agent_position = draw_free_tile(enemy_position)
+            if enemy_position is None:
+                enemy_position = draw_free_tile(agent_position)
+            agent_positions[k] = agent_position
+            enemy_positions[k] = enemy_position
+
+        return agent_positions, enemy_positions
+
+    def start_games(self, games, agent_positions, enemy_positions):
+        """
+        Starts new rounds of gameplay in some games, with given unit positions
+        @param self:
+        @param games: indices of the games to start
+        @param agent_positions: (len(games), 2) array of agent positions
+        @param enemy_positions: (len(games), 2) array of enemy positions
+        @return: the observations of the started games
+        """
+        games = np.asarray(games)
+        self.maps[games] = self.layout
+        self.agent_pos[games] = agent_positions
+        self.previous_agent_pos[games] = agent_positions
+        self.enemy_pos[games] = enemy_positions
+        self.maps[games, agent_positions[:, 0], agent_positions[:, 1]] = AGENT
+        self.maps[games, enemy_positions[:, 0], enemy_positions[:, 1]] = ENEMY
+
+        # Only blocks stop the enemy's vision at this point: it is looked up in the visibility table of the map
+        for k, game in enumerate(games):
+            self.enemy_vision[game] = self.enemy_visibility.vision_mask(enemy_positions[k, 0], enemy_positions[k, 1])
+
+        self.previously_viewed[games] = False
+        self.viewed_order[games] = 0
+        self.nb_viewed[games] = 0
+        self.n_step[games] = 0
+
+        self.update_agent_vision(games)
+        self.paint_enemy_vision_overlap(games)
+        self.compute_interest_points(games)
+        self.paint_interest_points(games)
+        return self.observe(games)
+
+    def move_agents(self, games, actions):
+        """
+        Moves the agents of some games, moves into a block, the enemy or outside of the map are ignored
+        @param self:
+        @param games: indices of the games
+        @param actions: actions of the agents
+        @return:
+        """
+        targets = self.agent_pos[games] + self.MOVES[actions]
+        inside = np.all((targets >= 0) & (targets < self.bounds), axis=1)
+        clipped = np.clip(targets, 0, self.bounds - 1)
+        tiles = self.maps[games, clipped[:, 0], clipped[:, 1]]
+        valid = inside & (tiles != BLOCK) & (tiles != ENEMY) & (actions != STOP)
+
+        moving = games[valid]
+        self.maps[moving, self.agent_pos[moving, 0], self.agent_pos[moving, 1]] = EMPTY
+        self.maps[moving, targets[valid, 0], targets[valid, 1]] = AGENT
+        self.agent_pos[moving] = targets[valid]
+
+    def update_agent_vision(self, games):
+        """
+        Computes the naive vision of the agents of some games, and adds it to their memory
+        @param self:
+        @param games: indices of the games
+        @return:
+        """
+        nb_games = len(games)
+        game_index = np.arange(nb_games)[:, None]
+        sources = self.agent_pos[games, 0] * self.width + self.agent_pos[games, 1]
+
+        see_through = np.ones((nb_games, self.nb_tiles + 1), dtype=bool)
+        maps = self.maps[games].reshape(nb_games, self.nb_tiles)
+        see_through[:, :-1] = (maps == EMPTY) | (maps == AGENT)
+
+        # The ray trees are walked depth by depth
+        seen = np.zeros((nb_games, self.missing_node + 1), dtype=bool)
+        seen[:, self.root_node] = True
+        tiles = self.node_tiles[sources]
+        parents = self.node_parents[sources]
+        for depth in self.depth_slices:
+            seen[:, depth] = see_through[game_index, tiles[:, depth]] & seen[game_index, parents[:, depth]]
+
+        # Position of the first seen entry of every tile along the rays, the agent's tile being seen last
+        nodes = self.tile_nodes[sources]
+        positions = self.node_positions[sources[:, None, None], nodes]
+        first_seen = np.where(seen[game_index[:, :, None], nodes], positions, self.order_stride).min(axis=2)
+        first_seen[game_index[:, 0], sources] = np.minimum(first_seen[game_index[:, 0], sources], self.source_positions[sources])
+
+        vision = (first_seen < self.order_stride).reshape(nb_games, self.height, self.width)
+        self.agent_vision[games] = vision
+
+        # New tiles are stored in the memory along with the order in which they are seen
+        new = vision & ~self.previously_viewed[games]
+        order = (self.nb_vision_updates[games, None] * self.order_stride + first_seen).reshape(vision.shape)
+        self.viewed_order[games] = np.where(new, order, self.viewed_order[games])
+        self.previously_viewed[games] |= new
+        self.nb_viewed[games] += new.reshape(nb_games, -1).sum(axis=1)
+        self.nb_vision_updates[games] += 1
+
+    def paint_enemy_vision_overlap(self, games):
+        """
+        Clears the previous interest points and paints the intersection of the agent's and enemy's visions on the maps of some games
+        @param self:
+        @param games: indices of the games
+        @return:
+        """
+        maps = self.maps[games]
+        maps[maps == INTEREST_POINT] = EMPTY
+        maps[self.enemy_vision[games] & self.agent_vision[games] & (maps != AGENT)] = ENEMY_vision
+        self.maps[games] = maps
+
+    def first_target_in_bfs(self, games, targets):
+        """
+        Searches, in some games, the first target tile met by the breadth-first search of find_path_to_nearest (or find_path_to_not_yet_seen) from the agent
+        Tiles are processed level by level, in the order in which they are discovered, their neighbors being checked in the order top, bottom, left, right
+        @param self:
+        @param games: indices of the games
+        @param targets: (len(games), H, W) boolean mask of the target tiles
+        @return: a (len(games), 2) array of target coordinates, and a boolean array indicating if a target was found
+        """
+        nb_games = len(games)
+        shape = (nb_games, self.height, self.width)
+        walkable = (self.maps[games] != BLOCK)
+        targets = targets & walkable
+        unreached = np.iinfo(np.int64).max
+
+        # rank of the tiles of the current level in the processing order, -1 for other tiles
+        rank = np.full(shape, -1, dtype=np.int64)
+        rank[np.arange(nb_games), self.agent_pos[games, 0], self.agent_pos[games, 1]] = 0
+        visited = rank >= 0
+
+        found = np.zeros((nb_games, 2), dtype=np.int64)
+        success = np.zeros(nb_games, dtype=bool)
+        searching = np.ones(nb_games, dtype=bool)
+
+        while searching.any():
+            # Smallest (rank of the processed tile, direction) from which every tile is reached
+            key = np.full(shape, unreached, dtype=np.int64)
+            for direction, (source, destination) in enumerate((
+                    ((slice(1, None), slice(None)), (slice(None, -1), slice(None))),  # top
+                    ((slice(None, -1), slice(None)), (slice(1, None), slice(None))),  # bottom
+                    ((slice(None), slice(1, None)), (slice(None), slice(None, -1))),  # left
+                    ((slice(None), slice(None, -1)), (slice(None), slice(1, None))))):  # right
+                origin = rank[(slice(None),) + source]
+                candidate = np.where(origin >= 0, origin * 4 + direction, unreached)
+                key[(slice(None),) + destination] = np.minimum(key[(slice(None),) + destination], candidate)
+
+            reached = key < unreached
+            target_keys = np.where(targets & reached, key, unreached).reshape(nb_games, -1)
+            best = np.argmin(target_keys, axis=1)
+            hit = searching & (target_keys[np.arange(nb_games), best] < unreached)
+            found[hit, 0], found[hit, 1] = np.divmod(best[hit], self.width)
+            success |= hit
+            searching &= ~hit
+
+            # The next level is composed of the newly reached tiles, ordered by key
+            level = reached & walkable & ~targets & ~visited & searching[:, None, None]
+            searching &= level.reshape(nb_games, -1).any(axis=1)
+            level_keys = np.where(level, key, unreached).reshape(nb_games, -1)
+            order = np.argsort(level_keys, axis=1, kind="stable")
+            ranks = np.empty_like(order)
+            np.put_along_axis(ranks, order, np.arange(self.nb_tiles)[None, :], axis=1)
+            rank = np.where(level, ranks.reshape(level.shape), -1)
+            visited |= level
+
+        return found, success
+
+    def appropriate_tiles_next_to_blocks(self, games, closest_blocks):
+        """
+        Vectorized HideSeekEnv.find_appropriate_tile_next_to_block: the block-adjacent tile deemed the most appropriate according to the position of the enemy
+        @param self:
+        @param games: indices of the games
+        @param closest_blocks: (len(games), 2) array of block coordinates
+        @return: a (len(games), 2) array of tile coordinates, (0, 0) if no tile is appropriate
+        """
+        maps = self.maps[games]
+        game_index = np.arange(len(games))
+        ax, ay = self.agent_pos[games, 0], self.agent_pos[games, 1]
+        ex, ey = self.enemy_pos[games, 0], self.enemy_pos[games, 1]
+        bx, by = closest_blocks[:, 0], closest_blocks[:, 1]
+
+        def empty(x, y, inside):
+            return inside & (maps[game_index, np.clip(x, 0, self.height - 1), np.clip(y, 0, self.width - 1)] == EMPTY)
+
+        below = empty(bx + 1, by, bx + 1 < self.height)
+        right = empty(bx, by + 1, by + 1 < self.width)
+        left_strict = empty(bx, by - 1, by - 1 > 0)
+        left = empty(bx, by - 1, by > 0)
+        above_strict = empty(bx - 1, by, bx - 1 > 0)
+        above = empty(bx - 1, by, bx > 0)
+
+        below_tile = np.stack((bx + 1, by), axis=1)
+        right_tile = np.stack((bx, by + 1), axis=1)
+        left_tile = np.stack((bx, by - 1), axis=1)
+        above_tile = np.stack((bx - 1, by), axis=1)
+        none = np.zeros_like(closest_blocks)
+
+        def pick(condition, tile, otherwise):
+            return np.where(condition[:, None], tile, otherwise)
+
+        # The enemy is farther on the x axis
+        side_y = np.where((ay > ey)[:, None], pick(right, right_tile, none), pick(left_strict, left_tile, none))
+        x_axis = np.where((ax > ex)[:, None], pick(below, below_tile, side_y), pick(above, above_tile, side_y))
+
+        # The enemy is farther on the y axis
+        side_x = np.where((ax > ex)[:, None], pick(below, below_tile, none), pick(above_strict, above_tile, none))
+        y_axis = np.where((ay > ey)[:, None], pick(right, right_tile, side_x), pick(left, left_tile, side_x))
+
+        return np.where((np.abs(ax - ex) > np.abs(ay - ey))[:, None], x_axis, y_axis)
+
+    def compute_interest_points(self, games):
+        """
+        Vectorized HideSeekEnv.compute_interest_points: computes the interest point of the agents of some games with the same four heuristics
+        @param self:
+        @param games: indices of the games
+        @return:
+        """
+        nb_games = len(games)
+        game_index = np.arange(nb_games)
+        self.previous_interest_points[games] = self.interest_points[games]
+        self.has_previous_interest_point[games] = self.has_interest_point[games]
+
+        maps = self.maps[games]
+        ax, ay = self.agent_pos[games, 0], self.agent_pos[games, 1]
+        points = np.zeros((nb_games, 2), dtype=np.int64)
+        has_point = np.zeros(nb_games, dtype=bool)
+
+        # First heuristic : the agent is seen by the enemy, the nearest empty tile is his interest point
+        seen = self.enemy_vision[games, ax, ay]
+        if seen.any():
+            tiles, success = self.first_target_in_bfs(games[seen], maps[seen] == EMPTY)
+            points[seen] = tiles
+            has_point[seen] = success
+
+        # Second heuristic : a previously viewed empty tile adjacent to several blocks
+        not_hidden = ~seen & (self.nb_next_to_block[ax, ay] <= 1)
+        # Only the hiding spots of the map are intersected with the memory of the agents
+        hiding_spots = self.hiding_spot_indices
+        spots = (self.previously_viewed[games].reshape(nb_games, -1)[:, hiding_spots] &
+                 (maps.reshape(nb_games, -1)[:, hiding_spots] == EMPTY))
+        spots_order = np.where(spots, self.viewed_order[games].reshape(nb_games, -1)[:, hiding_spots], np.iinfo(np.int64).max)
+        first_spot = hiding_spots[np.argmin(spots_order, axis=1)] if len(hiding_spots) > 0 else np.zeros(nb_games, dtype=np.int64)
+        has_spot = not_hidden & spots.any(axis=1)
+        points[has_spot, 0], points[has_spot, 1] = np.divmod(first_spot[has_spot], self.width)
+        has_point |= has_spot
+
+        # Third heuristic : the agent has not seen enough of the map, the nearest unseen tile is his interest point
+        exploring = not_hidden & ~has_point & (self.nb_viewed[games] < self.nb_tiles / 1.5)
+        if exploring.any():
+            tiles, success = self.first_target_in_bfs(games[exploring], ~self.previously_viewed[games[exploring]])
+            points[exploring] = tiles
+            has_point[exploring] = success
+
+        # Fourth heuristic : the agent is not next to any block, the nearest block is his interest point
+        approaching = not_hidden & ~has_point & (self.nb_next_to_block[ax, ay] == 0)
+        if approaching.any() and len(self.blocks) > 0:
+            distances = (ax[approaching, None] - self.blocks[None, :, 0]) ** 2 + (ay[approaching, None] - self.blocks[None, :, 1]) ** 2
+            closest_blocks = self.blocks[np.argmin(distances, axis=1)]
+            tiles = self.appropriate_tiles_next_to_blocks(games[approaching], closest_blocks)
+            valid = (tiles[:, 0] != 0) & (tiles[:, 1] != 0)
+            points[approaching] = tiles
+            has_point[game_index[approaching][valid]] = True
+
+        self.interest_points[games] = points
+        self.has_interest_point[games] = has_point
+
+    def paint_interest_points(self, games):
+        """
+        Paints the interest points on the maps of some games, but on the tiles of the units like HideSeekEnv.paint_interest_point
+        @param self:
+        @param games: indices of the games
+        @return:
+        """
+        painted = games[self.has_interest_point[games]]
+        tiles = self.maps[painted, self.interest_points[painted, 0], self.interest_points[painted, 1]]
+        painted = painted[(tiles != AGENT) & (tiles != ENEMY)]
+        self.maps[painted, self.interest_points[painted, 0], self.interest_points[painted, 1]] = INTEREST_POINT
+
+    def compute_rewards(self, games):
+        """
+        Vectorized HideSeekEnv.compute_rewards
+        @param self:
+        @param games: indices of the games
+        @return: a float32 array of rewards
+        """
+        previous = self.previous_interest_points[games]
+        distance_previous = np.sqrt(((self.previous_agent_pos[games] - previous) ** 2).sum(axis=1))
+        distance_present = np.sqrt(((self.agent_pos[games] - previous) ** 2).sum(axis=1))
+        closer = np.where(distance_previous > distance_present, 20.0, -100.0)
+        with_point = np.where(self.has_previous_interest_point[games], closer, -400.0)
+        return np.where(self.has_interest_point[games], with_point, 200.0).astype(np.float32)
+
+    ############################################
+    # Observations
+
+    def next_tiles(self, games):
+        """
+        Looks up the first tile of the shortest path from the agents of some games toward their interest point
+        @param self:
+        @param games: indices of the games
+        @return: a (len(games), 2) array of tiles, the path lengths (both ends included), and a boolean array indicating if there is such a path
+        """
+        starts = self.agent_pos[games, 0] * self.width + self.agent_pos[games, 1]
+        ends = self.interest_points[games, 0] * self.width + self.interest_points[games, 1]
+
+        # Ties between equally short paths are resolved when the path table is built
+        hops = self.path_table.next_hop[starts, ends]
+        valid = self.has_interest_point[games] & (hops >= 0)
+        tiles = np.stack(np.divmod(hops, self.width), axis=1)
+        return tiles, self.path_table.distance[starts, ends].astype(np.int64) + 1, valid
+
+    def observe(self, games):
+        """
+        Builds the observations of some games, depending on the observation type
+        @param self:
+        @param games: indices of the games
+        @return: a batch of observations
+        """
+        if self.env_type == "spiral":
+            return self.observe_spiral(games)
+        elif self.env_type == "coord":
+            return self.observe_coord(games)
+        elif self.env_type == "direction":
+            return self.observe_direction(games)
+        else:
+            return self.observe_field(games)
+
+    def observe_spiral(self, games):
+        """
+        Vectorized SpiralFieldVisionEnv.find_blocks_near_me_spiral, including its painting of the enemy's vision on the maps
+        @param self:
+        @param games: indices of the games
+        @return: a (len(games), (2 * spiral_radius + 1) ** 2) int32 array
+        """
+        tiles = self.agent_pos[games, None, :] + self.spiral[None, :, :]
+        inside = np.all((tiles >= 0) & (tiles < self.bounds), axis=2)
+        clipped = np.clip(tiles, 0, self.bounds - 1)
+        game_index = np.broadcast_to(games[:, None], inside.shape)
+
+        seen_by_enemy = inside & self.enemy_vision[game_index, clipped[..., 0], clipped[..., 1]]
+        self.maps[game_index[seen_by_enemy], clipped[seen_by_enemy][:, 0], clipped[seen_by_enemy][:, 1]] = ENEMY_vision
+
+        observations = np.where(inside, self.maps[game_index, clipped[..., 0], clipped[..., 1]], OUTSIDE).astype(np.int32)
+        observations[observations[:, 0] == AGENT, 0] = EMPTY
+
+        # We check that units are still on the map
+        self.maps[games, self.agent_pos[games, 0], self.agent_pos[games, 1]] = AGENT
+        self.maps[games, self.enemy_pos[games, 0], self.enemy_pos[games, 1]] = ENEMY
+        return observations
+
+    def observe_coord(self, games):
+        """
+        Vectorized CoordFieldVisionEnv observation: the agent, the next tile toward his interest point and the length of the path
+        @param self:
+        @param games: indices of the games
+        @return: a (len(games), 7) int32 array
+        """
+        tiles, lengths, valid = self.next_tiles(games)
+        agent = self.agent_pos[games]
+        observations = np.empty((len(games), 7), dtype=np.int32)
+        observations[:, 0:2] = agent
+        observations[:, 2] = self.SEP
+        observations[:, 3:5] = np.where(valid[:, None], tiles, agent)
+        observations[:, 5] = self.SEP
+        observations[:, 6] = np.where(valid, lengths, -1)
+        return observations
+
+    def observe_direction(self, games):
+        """
+        Vectorized FullDirectionOnFieldEnv observation: the direction toward the interest point, as (left, right, up, down, stop)
+        @param self:
+        @param games: indices of the games
+        @return: a (len(games), 5) int32 array
+        """
+        tiles, _, valid = self.next_tiles(games)
+        agent = self.agent_pos[games]
+        directions = np.full(len(games), STOP, dtype=np.int64)
+        directions = np.where(tiles[:, 1] < agent[:, 1], LEFT, directions)
+        directions = np.where(tiles[:, 1] > agent[:, 1], RIGHT, directions)
+        directions = np.where(tiles[:, 0] > agent[:, 0], DOWN, directions)
+        directions = np.where(tiles[:, 0] < agent[:, 0], UP, directions)
+        directions = np.where(valid, directions, STOP)
+
+        observations = np.zeros((len(games), 5), dtype=np.int32)
+        observations[np.arange(len(games)), directions] = 1
+        return observations
+
+    def observe_field(self, games):
+        """
+        Vectorized FullFieldVisionEnv observation: the map (static) or the map centered around the agent (dynamic), as an RGB image
+        @param self:
+        @param games: indices of the games
+        @return: a (len(games), 3, upscale * W, upscale * H) uint8 array
+        """
+        maps = self.maps[games]
+        if self.mode_vision == "dynamic":
+            padding_x, padding_y = self.height // 2, self.width // 2
+            padded = np.pad(maps, ((0, 0), (padding_x, padding_x), (padding_y, padding_y)), constant_values=OUTSIDE)
+            rows = self.agent_pos[games, 0, None] + np.arange(self.height)[None, :]
+            columns = self.agent_pos[games, 1, None] + np.arange(self.width)[None, :]
+            maps = padded[np.arange(len(games))[:, None, None], rows[:, :, None], columns[:, None, :]]
+
+        # As in FullFieldVisionEnv.prepare_map_img_CNN, the rows of the image are the columns of the map
+        images = self.PALETTE[maps].transpose(0, 3, 2, 1)
+        return images.repeat(self.upscale, axis=2).repeat(self.upscale, axis=3)
+
+    ############################################
+    # VecEnv interface
+
+    def reset(self):
+        """
+        Function inherited from the VecEnv interface: starts a new round of gameplay in every game
+        @param self:
+        @return: the batch of observations
+        """
+        if self._seeds[0] is not None:
+            self.np_random = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+
+        games = np.arange(self.num_envs)
+        agent_positions, enemy_positions = self.sample_positions(games)
+        self.reset_infos = [{} for _ in games]
+        return self.start_games(games, agent_positions, enemy_positions)
+
+    def step_async(self, actions):
+        self.actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+
+    def step_wait(self):
+        """
+        Function inherited from the VecEnv interface: applies the actions to every game, finished games are reset
+        @param self:
+        @return: observations, rewards, dones and infos of the batch
+        """
+        actions = self.actions
+        if np.any((actions < 0) | (actions > STOP)):
+            raise ValueError(f"Received invalid actions={actions} which are not part of the action space")
+
+        games = np.arange(self.num_envs)
+        terminated = actions == STOP
+        self.previous_agent_pos[:] = self.agent_pos
+        self.move_agents(games, actions)
+
+        truncated = self.n_step > 50
+        self.n_step[truncated] = 0
+
+        self.update_agent_vision(games)
+        self.paint_enemy_vision_overlap(games)
+        self.compute_interest_points(games)
+        rewards = self.compute_rewards(games)
+        self.n_step += 1
+        self.paint_interest_points(games)
+        observations = self.observe(games)
+
+        dones = terminated | truncated
+        infos = [{} for _ in games]
+        finished = np.flatnonzero(dones)
+        if len(finished) > 0:
+            for game in finished:
+                infos[game]["terminal_observation"] = observations[game].copy()
+                infos[game]["TimeLimit.truncated"] = bool(truncated[game] and not terminated[game])
+            agent_positions, enemy_positions = self.sample_positions(finished)
+            observations[finished] = self.start_games(finished, agent_positions, enemy_positions)
+
+        return observations, rewards, dones, infos
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name) for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return [getattr(self, method_name)(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
@@ -2,7 +2,19 @@ import math
 import numpy as np
 from gymnasium import spaces
 from envs.hideSeekEnv import HideSeekEnv
-from misc.utils import shortest_paths_expensive
+
+
+def coord_observation_high(height, width):
+    """
+    Function computing the upper bound of the coord observations on a map: coordinates are bounded by the size of the map, and the length of a path by its number of tiles
+    Maps of up to 12 * 12 tiles keep the bound the trained models were built with (30)
+    @param height: number of rows of the map
+    @param width: number of columns of the map
+    @return: an integer
+    """
+    if height * width <= 144:
+        return 30
+    return height * width
 
 
 class CoordFieldVisionEnv(HideSeekEnv):
@@ -13,17 +25,20 @@ class CoordFieldVisionEnv(HideSeekEnv):
 
     # Constant
     SEP = -1
+
+    PROFILED_PHASES = dict(HideSeekEnv.PROFILED_PHASES, observation=["path_towards_interest_point"])
+
     def __init__(self, map_file="",
-                 enemy_placement="static", player_placement="static", opti="False"):
+                 enemy_placement="static", player_placement="static", opti="False", enemy_behavior="static"):
         super(CoordFieldVisionEnv, self).__init__(map_file,
-                                                   enemy_placement, player_placement, opti)
+                                                   enemy_placement, player_placement, opti, enemy_behavior)
 
         # The observation space is a composed of 7 values, as such:
         # (Agent_x,Agent_y,SEP,Point_of_interest_x,Point_of_interest_y,SEP,distance)
         # SEP being a special separator
         self.size_obs = 7
         self.observation_space = spaces.Box(
-            low=-1, high=30, shape=(self.size_obs,), dtype=np.int32
+            low=-1, high=coord_observation_high(self.height, self.width), shape=(self.size_obs,), dtype=np.int32
         )
 
     def reset(self, seed=None, options=None):
@@ -39,15 +54,7 @@ class CoordFieldVisionEnv(HideSeekEnv):
         self.initialize_map_pos_vision()
 
         # We compute the intersection of the agent's and enemy's visions and update the map accordingly: the agent does not have a complete view of the enemy's vision
-        intersect_vision = list(set(self.enemy.vision) & set(self.agent.vision))
-
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    self.playing_map.current_map[i][j] = self.EMPTY
-
-                if (i, j) in intersect_vision and self.playing_map.current_map[i][j] != self.AGENT:
-                    self.playing_map.current_map[i][j] = self.ENEMY_vision
+        self.paint_enemy_vision_overlap()
 
         self.reward = 0.0
         self.prev_reward = 0.0
@@ -56,14 +63,11 @@ class CoordFieldVisionEnv(HideSeekEnv):
         # We compute the agent's interest points
         self.compute_interest_points()
 
-        # We update the map accordingly, and compute the path from the agent toward his point of interest
+        # We update the map accordingly, and look up the path from the agent toward his point of interest
         path_to_interest_tile = None
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
-            path_to_interest_tile = shortest_paths_expensive((self.agent.xcoord, self.agent.ycoord),
-                                                             (self.agent.interest_points[0][0],
-                                                              self.agent.interest_points[0][1]),
-                                                             self.playing_map.current_map, 1, to_avoid=self.BLOCK)
+            self.paint_interest_point()
+            path_to_interest_tile = self.path_towards_interest_point()
 
 
         # We only consider the coordinates of the agent, the first tile in the path and the total length of the path
@@ -71,8 +75,8 @@ class CoordFieldVisionEnv(HideSeekEnv):
             vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, self.agent.xcoord,
                                 self.agent.ycoord, -1, -1]
         else:
-            length_path = len(path_to_interest_tile[0])
-            vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, path_to_interest_tile[0][1][0], path_to_interest_tile[0][1][1], self.SEP, length_path]
+            next_tile, length_path = path_to_interest_tile
+            vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, next_tile[0], next_tile[1], self.SEP, length_path]
 
         return np.array(vector_to_return, dtype=np.int32), {}
 
@@ -123,6 +127,9 @@ class CoordFieldVisionEnv(HideSeekEnv):
 
         self.n_step += 1
 
+        # A patrolling or chasing enemy moves after the agent (also updates his vision and the map accordingly)
+        self.move_enemy()
+
         # Update the agent's vision again after he moved (also updates the map accordingly)
         self.update_agent_vison_and_map()
 
@@ -132,22 +139,19 @@ class CoordFieldVisionEnv(HideSeekEnv):
         # Compute and update the rewards
         self.compute_rewards()
 
-        # We update the map accordingly, and compute the path from the agent toward his point of interest
+        # We update the map accordingly, and look up the path from the agent toward his point of interest
         path_to_interest_tile = None
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
-            path_to_interest_tile = shortest_paths_expensive((self.agent.xcoord, self.agent.ycoord),
-                                                             (self.agent.interest_points[0][0],
-                                                              self.agent.interest_points[0][1]),
-                                                             self.playing_map.current_map, 1, to_avoid=self.BLOCK)
+            self.paint_interest_point()
+            path_to_interest_tile = self.path_towards_interest_point()
 
         # We only consider the coordinates of the agent, the first tile in the path and the total length of the path
         if path_to_interest_tile is None:
             vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, self.agent.xcoord,
                                 self.agent.ycoord, -1, -1]
         else:
-            length_path = len(path_to_interest_tile[0])
-            vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, path_to_interest_tile[0][1][0], path_to_interest_tile[0][1][1], self.SEP, length_path]
+            next_tile, length_path = path_to_interest_tile
+            vector_to_return = [self.agent.xcoord, self.agent.ycoord, self.SEP, next_tile[0], next_tile[1], self.SEP, length_path]
 
         vector_to_return = np.array(vector_to_return, dtype=np.int32)
 
@@ -165,23 +169,6 @@ class CoordFieldVisionEnv(HideSeekEnv):
         @param self:
         @return:
         """
-        for i in range(0, self.grid_size):
-            print('\n', end="")
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.BLOCK:
-                    print("O ", end="")
-                elif self.playing_map.current_map[i][j] == self.EMPTY:
-                    print(". ", end="")
-                elif self.playing_map.current_map[i][j] == self.AGENT:
-                    print("X ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY:
-                    print("Y ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY_vision:
-                    print("- ", end="")
-                elif self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    print(". ", end="")
-
-        print('')
-        print('_' * 12)
+        self.render_console()
 
 
@@ -4,7 +4,6 @@ import numpy as np
 from gymnasium import spaces
 
 from envs.hideSeekEnv import HideSeekEnv
-from misc.utils import shortest_paths_expensive
 
 
 class FullDirectionOnFieldEnv(HideSeekEnv):
@@ -13,12 +12,13 @@ class FullDirectionOnFieldEnv(HideSeekEnv):
     It defines an environment where the observation is a vector of five values, representing the direction towards the agent's point of interest
     """
 
+    PROFILED_PHASES = dict(HideSeekEnv.PROFILED_PHASES, observation=["direction_towards_interest_point"])
 
     def __init__(self, map_file="",
-                 enemy_placement="static", player_placement="static", opti=False):
+                 enemy_placement="static", player_placement="static", opti=False, enemy_behavior="static"):
         super(FullDirectionOnFieldEnv, self).__init__(map_file=map_file,
                                                   enemy_placement=enemy_placement, player_placement=player_placement,
-                                                  opti=opti)
+                                                  opti=opti, enemy_behavior=enemy_behavior)
 
 
 
@@ -44,50 +44,17 @@ class FullDirectionOnFieldEnv(HideSeekEnv):
         self.initialize_map_pos_vision()
 
         # We compute the intersection of the agent's and enemy's visions and update the map accordingly: the agent does not have a complete view of the enemy's vision
-        intersect_vision = list(set(self.enemy.vision) & set(self.agent.vision))
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    self.playing_map.current_map[i][j] = self.EMPTY
-
-                if (i, j) in intersect_vision and self.playing_map.current_map[i][j] != self.AGENT:
-                    self.playing_map.current_map[i][j] = self.ENEMY_vision
+        self.paint_enemy_vision_overlap()
 
         self.reward = 0.0
         self.prev_reward = 0.0
         self.n_step = 0
 
-        # defined for observations
-        left = right = down = up = stop = 0
-
         # We compute the agent's interest points
         self.compute_interest_points()
-        # We update the map accordingly, and compute the path from the agent toward his point of interest
-        if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
-
-            path_to_interest_tile = shortest_paths_expensive((self.agent.xcoord, self.agent.ycoord),
-                                                          (self.agent.interest_points[0][0], self.agent.interest_points[0][1]),
-                                                          self.playing_map.current_map, 1, to_avoid=self.BLOCK)
 
-            full_directions = self.full_direction_towards_tile(path_to_interest_tile)
-
-            final_direction = full_directions[0]
-            if final_direction == 0:
-                left = 1
-            elif final_direction == 1:
-                right = 1
-            elif final_direction == 2:
-                up = 1
-            elif final_direction == 3:
-                down = 1
-        else:
-            # if the agent has no point of interest, the direction stop is set to 1
-            stop = 1
-
-        final_direction = [left, right, up, down, stop]
-
-        return np.array(final_direction, dtype=np.int32), {}
+        # We compute the direction toward his point of interest
+        return self.direction_towards_interest_point(), {}
 
     def step(self, action):
         """
@@ -133,6 +100,9 @@ class FullDirectionOnFieldEnv(HideSeekEnv):
             self.n_step = 0
             truncated = True
 
+        # A patrolling or chasing enemy moves after the agent (also updates his vision and the map accordingly)
+        self.move_enemy()
+
         # Update the agent's vision again after he moved (also updates the map accordingly)
         self.update_agent_vison_and_map()
 
@@ -146,21 +116,43 @@ class FullDirectionOnFieldEnv(HideSeekEnv):
         self.n_step += 1
 
 
+        # We compute the direction toward his point of interest
+        list_block_in_vision = self.direction_towards_interest_point()
+
+        return (
+            list_block_in_vision,
+            self.reward, # step_reward,
+            terminated,
+            truncated,
+            {},
+        )
+
+    def render(self):
+        """
+        Function inherited from the gym environment, subclasses have to implement this
+        @param self:
+        @return:
+        """
+        self.render_console()
+
+    def direction_towards_interest_point(self):
+        """
+        Function computing the observation, i.e the direction the agent has to go in order to get closer to its point of interest
+        @param self:
+        @return: a numpy array of five binary values (left, right, up, down, stop)
+        """
         # defined for observations
         left = right = down = up = stop = 0
 
-        # We update the map accordingly, and compute the path from the agent toward his point of interest
+        # We update the map accordingly, and look up the path from the agent toward his point of interest
+        path_to_interest_tile = None
         if len(self.agent.interest_points) > 0:
-            path_to_interest_tile = shortest_paths_expensive((self.agent.xcoord, self.agent.ycoord),
-                                                             (self.agent.interest_points[0][0],
-                                                              self.agent.interest_points[0][1]),
-                                                             self.playing_map.current_map, 1, to_avoid=self.BLOCK)
+            self.paint_interest_point()
+            path_to_interest_tile = self.path_towards_interest_point()
 
-            full_directions = self.full_direction_towards_tile(path_to_interest_tile)
-
-
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
-            final_direction = full_directions[0]
+        if path_to_interest_tile is not None:
+            final_direction = self.direction_towards_tile(self.agent.xcoord, self.agent.ycoord,
+                                                          [[(self.agent.xcoord, self.agent.ycoord), path_to_interest_tile[0]]])
             if final_direction == 0:
                 left = 1
             elif final_direction == 1:
@@ -170,44 +162,12 @@ class FullDirectionOnFieldEnv(HideSeekEnv):
             elif final_direction == 3:
                 down = 1
         else:
-            # if the agent has no point of interest, the direction stop is set to 1
+            # if the agent has no (reachable) point of interest, the direction stop is set to 1
             stop = 1
 
         final_direction = [left, right, up, down, stop]
 
-        list_block_in_vision = np.array(final_direction, dtype=np.int32)
-
-        return (
-            list_block_in_vision,
-            self.reward, # step_reward,
-            terminated,
-            truncated,
-            {},
-        )
-
-    def render(self):
-        """
-        Function inherited from the gym environment, subclasses have to implement this
-        @param self:
-        @return:
-        """
-        for i in range(0, self.grid_size):
-            print('\n', end="")
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.BLOCK:
-                    print("O ", end="")
-                elif self.playing_map.current_map[i][j] == self.EMPTY:
-                    print(". ", end="")
-                elif self.playing_map.current_map[i][j] == self.AGENT:
-                    print("X ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY:
-                    print("Y ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY_vision:
-                    print("- ", end="")
-                elif self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    print(". ", end="")
-        print('')
-        print('_' * 12)
+        return np.array(final_direction, dtype=np.int32)
 
     def direction_towards_tile(self, starting_x, starting_y, path_to_tile=None):
         """
@@ -7,7 +7,7 @@ from envs.hideSeekEnv import HideSeekEnv
 class FullFieldVisionEnv(HideSeekEnv):
     """
     This class represents a concrete hide & seek environment
-    It defines an environment where the observations are an RGB 32x32 image representing the map.
+    It defines an environment where the observations are an RGB image representing the map (its rows being the columns of the map).
     This environment proposes either a "static/fixed" image representing the map, or a "dynamic" image which is centered around and follows the agent
     """
 
@@ -20,17 +20,39 @@ class FullFieldVisionEnv(HideSeekEnv):
     ENEMY_vision_img = (255, 0, 255)
     INTEREST_POINT_img = (255, 200, 0)
 
+    PROFILED_PHASES = dict(HideSeekEnv.PROFILED_PHASES, observation=["center_map_around_player", "prepare_map_img_CNN"])
+
     def __init__(self, map_file="",
-                  enemy_placement="static", player_placement="static", opti=False, mode_vision="static"):
+                  enemy_placement="static", player_placement="static", opti=False, mode_vision="static", upscale=3,
+                  enemy_behavior="static"):
         super(FullFieldVisionEnv, self).__init__(map_file=map_file,
-                                                   enemy_placement=enemy_placement, player_placement=player_placement, opti=opti)
+                                                   enemy_placement=enemy_placement, player_placement=player_placement, opti=opti,
+                                                   enemy_behavior=enemy_behavior)
 
 
-        # The observation space is an RGB 32*32 image:
+        # The observation space is an RGB image, each tile being represented by upscale * upscale pixels (36*36 by default, for a 12*12 map):
+        self.upscale = upscale
         self.observation_space = spaces.Box(
-            low=0, high=255, shape=(3, self.grid_size * 3, self.grid_size * 3), dtype=np.uint8
+            low=0, high=255, shape=(3, self.width * upscale, self.height * upscale), dtype=np.uint8
         )
 
+        # Lookup table of the colors of the tiles, one row per channel, indexed by tile value
+        self.palette = np.zeros((3, self.INTEREST_POINT + 1), dtype=np.uint8)
+        for tile, color in ((self.EMPTY, self.EMPTY_img), (self.BLOCK, self.BLOCK_img), (self.OUTSIDE, self.OUTSIDE_img),
+                            (self.AGENT, self.AGENT_img), (self.ENEMY, self.ENEMY_img),
+                            (self.ENEMY_vision, self.ENEMY_vision_img), (self.INTEREST_POINT, self.INTEREST_POINT_img)):
+            self.palette[:, tile] = color
+
+        # Preallocated buffers: the tile indices and the colors of the tiles
+        # (the image itself is a new array at every call, since users keep the observations returned to them)
+        self.tile_indices = np.zeros((self.width, self.height), dtype=np.intp)
+        self.tile_colors = np.zeros((3, self.width, self.height), dtype=np.uint8)
+
+        # The current map lives at the center of a persistent padded grid, kept up to date in place by every change of the map
+        # The agent-centered view is a slice of this grid (half the size of the map on each side, 6 tiles for a 12*12 map)
+        self.padding = (self.height // 2, self.width // 2)
+        self.padded_map = self.playing_map.pad_current_map(self.padding, self.OUTSIDE)
+
 
         # This defines whether or not the image is "static" or if its is centered around the player
         self.mode_vision = mode_vision
@@ -47,14 +69,7 @@ class FullFieldVisionEnv(HideSeekEnv):
         self.initialize_map_pos_vision()
 
         # We compute the intersection of the agent's and enemy's visions and update the map accordingly: the agent does not have a complete view of the enemy's vision
-        intersect_vision = list(set(self.enemy.vision) & set(self.agent.vision))
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    self.playing_map.current_map[i][j] = self.EMPTY
-
-                if (i, j) in intersect_vision and self.playing_map.current_map[i][j] != self.AGENT:
-                    self.playing_map.current_map[i][j] = self.ENEMY_vision
+        self.paint_enemy_vision_overlap()
 
         self.reward = 0.0
         self.prev_reward = 0.0
@@ -65,7 +80,7 @@ class FullFieldVisionEnv(HideSeekEnv):
 
         # We update the map accordingly
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
+            self.paint_interest_point()
 
         # These function turn a matrix-based map into a 32*32 image
         if self.mode_vision == "static":
@@ -120,6 +135,9 @@ class FullFieldVisionEnv(HideSeekEnv):
             self.n_step = 0
             truncated = True
 
+        # A patrolling or chasing enemy moves after the agent (also updates his vision and the map accordingly)
+        self.move_enemy()
+
         # Update the agent's vision again after he moved (also updates the map accordingly)
         self.update_agent_vison_and_map()
 
@@ -133,7 +151,7 @@ class FullFieldVisionEnv(HideSeekEnv):
 
         # We update the map accordingly
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
+            self.paint_interest_point()
 
         # These function turn a matrix-based map into a 32*32 image
         if self.mode_vision == "static":
@@ -162,23 +180,7 @@ class FullFieldVisionEnv(HideSeekEnv):
         @param self:
         @return:
         """
-        for i in range(0, self.grid_size):
-            print('\n', end="")
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.BLOCK:
-                    print("O ", end="")
-                elif self.playing_map.current_map[i][j] == self.EMPTY:
-                    print(". ", end="")
-                elif self.playing_map.current_map[i][j] == self.AGENT:
-                    print("X ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY:
-                    print("Y ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY_vision:
-                    print("- ", end="")
-                elif self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    print(". ", end="")
-        print('')
-        print('_' * 12)
+        self.render_console()
 
     def close(self):
         pass
@@ -186,58 +188,20 @@ class FullFieldVisionEnv(HideSeekEnv):
 
     def prepare_map_img_CNN(self, current_map):
         """
-        Function computing the direction from a specific position to the first tile in a path of tiles
+        Function turning a matrix representation of the map into an RGB image, each tile being represented by upscale * upscale pixels
+        As in previous versions of the environment, the rows of the image correspond to the columns of the map
         @param self:
         @param current_map: current matrix representation of the map
-        @return: a new 3*32*32 numpy array, representing the map as a RGB image
+        @return: a 3*(width*upscale)*(height*upscale) numpy array, representing the map as a RGB image
         """
+        # The colors of the tiles are looked up in the palette
+        np.copyto(self.tile_indices, current_map.T, casting="unsafe")
+        np.take(self.palette, self.tile_indices, axis=1, out=self.tile_colors, mode="clip")
 
-        # Since the current matrix is 12*12, we need to expand it to 32*32 by "tripling" its content
-
-        # We triple the rows
-        first_new_map = np.zeros((self.grid_size * 3, self.grid_size))
-        for i in range(0, self.grid_size):
-            first_new_map[3 * i] = current_map[i]
-            first_new_map[3 * i + 1] = current_map[i]
-            first_new_map[3 * i + 2] = current_map[i]
-
-        # We triple the columns
-        second_new_map = np.zeros((self.grid_size * 3, self.grid_size * 3))
-        for i in range(0, self.grid_size):
-            second_new_map[3 * i] = first_new_map[:, i]
-            second_new_map[3 * i + 1] = first_new_map[:, i]
-            second_new_map[3 * i + 2] = first_new_map[:, i]
-
-        # We create three version of the 32*32 matrix, corresponding to the three RGB channels
-        first_channel = np.array(second_new_map, dtype=np.uint8)
-        first_channel[first_channel == self.EMPTY] = self.EMPTY_img[0]
-        first_channel[first_channel == self.OUTSIDE] = self.OUTSIDE_img[0]
-        first_channel[first_channel == self.BLOCK] = self.BLOCK_img[0]
-        first_channel[first_channel == self.AGENT] = self.AGENT_img[0]
-        first_channel[first_channel == self.ENEMY] = self.ENEMY_img[0]
-        first_channel[first_channel == self.ENEMY_vision] = self.ENEMY_vision_img[0]
-        first_channel[first_channel == self.INTEREST_POINT] = self.INTEREST_POINT_img[0]
-
-        second_channel = np.array(second_new_map, dtype=np.uint8)
-        second_channel[second_channel == self.EMPTY] = self.EMPTY_img[1]
-        second_channel[second_channel == self.OUTSIDE] = self.OUTSIDE_img[1]
-        second_channel[second_channel == self.BLOCK] = self.BLOCK_img[1]
-        second_channel[second_channel == self.AGENT] = self.AGENT_img[1]
-        second_channel[second_channel == self.ENEMY] = self.ENEMY_img[1]
-        second_channel[second_channel == self.ENEMY_vision] = self.ENEMY_vision_img[1]
-        second_channel[second_channel == self.INTEREST_POINT] = self.INTEREST_POINT_img[1]
-
-        third_channel = np.array(second_new_map, dtype=np.uint8)
-        third_channel[third_channel == self.EMPTY] = self.EMPTY_img[2]
-        third_channel[third_channel == self.OUTSIDE] = self.OUTSIDE_img[2]
-        third_channel[third_channel == self.BLOCK] = self.BLOCK_img[2]
-        third_channel[third_channel == self.AGENT] = self.AGENT_img[2]
-        third_channel[third_channel == self.ENEMY] = self.ENEMY_img[2]
-        third_channel[third_channel == self.ENEMY_vision] = self.ENEMY_vision_img[2]
-        third_channel[third_channel == self.INTEREST_POINT] = self.INTEREST_POINT_img[2]
-
-        # We stack the three channels, yielding a 3*32*32 image
-        new_map = np.stack((first_channel, second_channel, third_channel), axis=0)
+        # And written upscale * upscale times in the image, seen as a (3, width, upscale, height, upscale) array
+        new_map = np.empty(self.observation_space.shape, dtype=np.uint8)
+        np.copyto(new_map.reshape(3, self.width, self.upscale, self.height, self.upscale),
+                  self.tile_colors[:, :, None, :, None])
 
         return new_map
 
@@ -246,23 +210,18 @@ class FullFieldVisionEnv(HideSeekEnv):
         """
         Function computing an agent-centered version of the current map
         @param self:
-        @return: a new 12*12 matrix representing the current map centered around the agent
+        @return: a height*width view of the padded map, centered around the agent
         """
+        # In the padded grid, the window centered around the agent starts at the agent's coordinates
         agent_x = self.agent.xcoord
         agent_y = self.agent.ycoord
-
-        NO = (agent_x - 6 + 6, agent_y - 6 + 6)
-        NE = (agent_x - 6 + 6, agent_y + 6 + 6)
-        SO = (agent_x + 6 + 6, agent_y - 6 + 6)
-
-        vision_map = self.augment_current_map()[np.ix_(list(range(NO[0], SO[0])), list(range(NO[1], NE[1])))]
-        return vision_map
+        return self.padded_map[agent_x:agent_x + self.height, agent_y:agent_y + self.width]
 
     def augment_current_map(self):
         """
-        Augment the current map by adding a padding of 6 on each side (so that when the agent stand near the border of the map, the game still allows for an agent-centered 12*12 matrix)
+        Augmented version of the current map, with a padding of half the size of the map on each side (so that when the agent stand near the border of the map, the game still allows for an agent-centered matrix)
         @param self:
-        @return: a new padded matrix map representation
+        @return: the padded matrix map representation, updated in place along with the current map
         """
-        return np.pad(np.array(self.playing_map.current_map, dtype=np.uint8), 6, constant_values=self.OUTSIDE)
+        return self.padded_map
 
@@ -5,6 +5,39 @@ from gymnasium import spaces
 
 from envs.hideSeekEnv import HideSeekEnv
 
+
+def spiral_offsets(radius=4):
+    """
+    Function computing the spiraling order of the tiles around the agent, used by the spiral observations
+    @param radius: number of tiles seen on each side of the agent
+    @return: a ((2 * radius + 1) ** 2, 2) integer array of (dx, dy) offsets, starting with the agent's tile
+    """
+    left, right, top, bottom = -radius, radius, -radius, radius
+    offsets = []
+    while left <= right and top <= bottom:
+        # First row from the remaining rows
+        for i in range(left, right + 1):
+            offsets.append((top, i))
+        top += 1
+        # Last column from the remaining columns
+        for i in range(top, bottom + 1):
+            offsets.append((i, right))
+        right -= 1
+        # Last row from the remaining rows
+        if top <= bottom:
+            for i in range(right, left - 1, -1):
+                offsets.append((bottom, i))
+            bottom -= 1
+        # First column from the remaining columns
+        if left <= right:
+            for i in range(bottom, top - 1, -1):
+                offsets.append((i, left))
+            left += 1
+    # The spiral is walked from the outside, the observation starts from the agent
+    offsets.reverse()
+    return np.array(offsets, dtype=np.int64)
+
+
 class SpiralFieldVisionEnv(HideSeekEnv):
     """
     This class represents a concrete hide & seek environment
@@ -24,18 +57,28 @@ class SpiralFieldVisionEnv(HideSeekEnv):
 
     """
 
+    PROFILED_PHASES = dict(HideSeekEnv.PROFILED_PHASES, observation=["find_blocks_near_me_spiral"])
+
     def __init__(self, map_file="",
-                 enemy_placement="static", player_placement="static", opti=False):
+                 enemy_placement="static", player_placement="static", opti=False, radius=4, enemy_behavior="static"):
         super(SpiralFieldVisionEnv, self).__init__(map_file=map_file,
-                                                   enemy_placement=enemy_placement, player_placement=player_placement, opti=opti)
+                                                   enemy_placement=enemy_placement, player_placement=player_placement, opti=opti,
+                                                   enemy_behavior=enemy_behavior)
 
 
-        # As explained above, the observation is a serialized spiral vector corresponding to a square of 9 * 9 tiles centered around the agent.
-        self.size_obs = 9 * 9
+        # As explained above, the observation is a serialized spiral vector corresponding to a square of (2 * radius + 1) * (2 * radius + 1) tiles centered around the agent (9 * 9 by default).
+        self.radius = radius
+        self.size_obs = (2 * radius + 1) * (2 * radius + 1)
         self.observation_space = spaces.Box(
             low=0, high=7, shape=(self.size_obs,), dtype=np.int32
         )
 
+        # The spiraling order is fixed: it is precomputed as offsets around the agent, and as flat offsets in a copy of the map padded with "outside" tiles
+        self.spiral = spiral_offsets(radius)
+        self.padded_map = np.full((self.height + 2 * radius, self.width + 2 * radius), self.OUTSIDE, dtype=np.int8)
+        self.padded_vision = np.zeros(self.padded_map.shape, dtype=bool)
+        self.spiral_indices = self.spiral[:, 0] * self.padded_map.shape[1] + self.spiral[:, 1]
+
     def reset(self, seed=None, options=None):
         """
         Function inherited from the gym environment, subclasses have to implement this
@@ -48,14 +91,7 @@ class SpiralFieldVisionEnv(HideSeekEnv):
         self.initialize_map_pos_vision()
 
         # We compute the intersection of the agent's and enemy's visions and update the map accordingly: the agent does not have a complete view of the enemy's vision
-        intersect_vision = list(set(self.enemy.vision) & set(self.agent.vision))
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    self.playing_map.current_map[i][j] = self.EMPTY
-
-                if (i, j) in intersect_vision and self.playing_map.current_map[i][j] != self.AGENT:
-                    self.playing_map.current_map[i][j] = self.ENEMY_vision
+        self.paint_enemy_vision_overlap()
 
         self.reward = 0.0
         self.prev_reward = 0.0
@@ -65,11 +101,11 @@ class SpiralFieldVisionEnv(HideSeekEnv):
         self.compute_interest_points()
         # And update the map accordingly
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
+            self.paint_interest_point()
 
         # We compute the agent's spiral observations
         list_block_in_vision = self.find_blocks_near_me_spiral()
-        return np.array(list_block_in_vision, dtype=np.int32), {}
+        return list_block_in_vision, {}
 
     def step(self, action):
         """
@@ -116,6 +152,9 @@ class SpiralFieldVisionEnv(HideSeekEnv):
             truncated = True
 
 
+        # A patrolling or chasing enemy moves after the agent (also updates his vision and the map accordingly)
+        self.move_enemy()
+
         # Update the agent's vision again after he moved (also updates the map accordingly)
         self.update_agent_vison_and_map()
 
@@ -129,11 +168,10 @@ class SpiralFieldVisionEnv(HideSeekEnv):
 
         # And update the map accordingly
         if len(self.agent.interest_points) > 0:
-            self.playing_map.current_map[self.agent.interest_points[0][0]][self.agent.interest_points[0][1]] = self.INTEREST_POINT
+            self.paint_interest_point()
 
         # We compute the agent's spiral observations
         list_block_in_vision = self.find_blocks_near_me_spiral()
-        list_block_in_vision = np.array(list_block_in_vision, dtype=np.int32)
 
         return (
             list_block_in_vision,
@@ -149,104 +187,33 @@ class SpiralFieldVisionEnv(HideSeekEnv):
         @param self:
         @return:
         """
-        for i in range(0, self.grid_size):
-            print('\n', end="")
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.BLOCK:
-                    print("O ", end="")
-                elif self.playing_map.current_map[i][j] == self.EMPTY:
-                    print(". ", end="")
-                elif self.playing_map.current_map[i][j] == self.AGENT:
-                    print("X ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY:
-                    print("Y ", end="")
-                elif self.playing_map.current_map[i][j] == self.ENEMY_vision:
-                    print("- ", end="")
-                elif self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    print("$ ", end="")
-        print('')
-        print('_' * 12)
+        self.render_console(interest_point_symbol="$ ")
 
     def find_blocks_near_me_spiral(self):
         """
-        This function computes a serialized vector of 9 by 9 in the order of a spiral starting from the center (i.e the agent's positionà
+        This function computes a serialized vector of (2 * radius + 1) by (2 * radius + 1) tiles in the order of a spiral starting from the center (i.e the agent's position)
+        The tiles are gathered at once from a padded copy of the map, the enemy's vision being painted over them (and on the current map)
         @param self:
-        @return: a list of tiles
+        @return: a numpy array of tiles
         """
-        left = self.agent.ycoord - 4
-        right = self.agent.ycoord + 4
-        top = self.agent.xcoord - 4
-        bottom = self.agent.xcoord + 4
-        list_blocks = []
-
-        while left <= right and top <= bottom:
-
-            #Process the first row from the remaining rows
-            for i in range(left, right + 1):
-                if 0 <= top < self.grid_size and 0 <= i < self.grid_size:
-                    if (top, i) in self.enemy.vision:
-                        list_blocks.append(self.ENEMY_vision)
-                        self.playing_map.current_map[top][i] = self.ENEMY_vision
-                    else:
-                        list_blocks.append(self.playing_map.current_map[top][i])
-                    # list_blocks.append((top, i))
-                else:
-                    list_blocks.append(self.OUTSIDE)
-            top += 1
-
-            #Process the last column from the remaining columns
-            for i in range(top, bottom + 1):
-                if 0 <= right < self.grid_size and 0 <= i < self.grid_size:
-                    if (i, right) in self.enemy.vision:
-                        list_blocks.append(self.ENEMY_vision)
-                        self.playing_map.current_map[i][right] = self.ENEMY_vision
-                    else:
-                        list_blocks.append(self.playing_map.current_map[i][right])
-                    # list_blocks.append((i, right))
-                else:
-                    list_blocks.append(self.OUTSIDE)
-            right -= 1
-
-            #Print the last row from the remaining rows
-            if top <= bottom:
-                for i in range(right, left - 1, -1):
-                    if 0 <= bottom < self.grid_size and 0 <= i < self.grid_size:
-                        if (bottom, i) in self.enemy.vision:
-                            list_blocks.append(self.ENEMY_vision)
-                            self.playing_map.current_map[bottom][i] = self.ENEMY_vision
-                        else:
-                            list_blocks.append(self.playing_map.current_map[bottom][i])
-                        # list_blocks.append((bottom, i))
-                    else:
-                        list_blocks.append(self.OUTSIDE)
-                bottom -= 1
-
-            #Print the first column from the remaining columns
-            if left <= right:
-                for i in range(bottom, top - 1, -1):
-                    if 0 <= left < self.grid_size and 0 <= i < self.grid_size:
-                        if (i, left) in self.enemy.vision:
-                            list_blocks.append(self.ENEMY_vision)
-                            self.playing_map.current_map[i][left] = self.ENEMY_vision
-                        else:
-                            list_blocks.append(self.playing_map.current_map[i][left])
-                        # list_blocks.append((i, left))
-                    else:
-                        list_blocks.append(self.OUTSIDE)
-                left += 1
-
-        list_blocks.reverse()
+        current_map = self.playing_map.current_map
+        radius = self.radius
+        self.padded_map[radius:radius + self.height, radius:radius + self.width] = current_map
+        self.padded_vision[radius:radius + self.height, radius:radius + self.width] = self.enemy.vision
+
+        # Flat indices of the spiral in the padded map
+        indices = (self.agent.xcoord + radius) * self.padded_map.shape[1] + (self.agent.ycoord + radius) + self.spiral_indices
+        list_blocks = self.padded_map.ravel()[indices].astype(np.int32)
+        seen_by_enemy = self.padded_vision.ravel()[indices]
+        list_blocks[seen_by_enemy] = self.ENEMY_vision
+        current_map[self.agent.xcoord + self.spiral[seen_by_enemy, 0], self.agent.ycoord + self.spiral[seen_by_enemy, 1]] = self.ENEMY_vision
 
         # We consider that the tile the agent is on is "empty"
         if list_blocks[0] == self.AGENT:
             list_blocks[0] = self.EMPTY
 
         # We check that units are still on the map
-        self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord] = self.AGENT
-        self.playing_map.current_map[self.enemy.xcoord][self.enemy.ycoord] = self.ENEMY
+        current_map[self.agent.xcoord, self.agent.ycoord] = self.AGENT
+        current_map[self.enemy.xcoord, self.enemy.ycoord] = self.ENEMY
 
         return list_blocks
-
-
-
-
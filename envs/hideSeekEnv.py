@@ -8,13 +8,17 @@ import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.utils import seeding
-from numpy import int64
-from copy import deepcopy
 
 from data.dataloader import Dataloader
+from envs.mapPool import holds_map_pool, load_map_pool
+from envs.maps import Maps
 from envs.unit import Unit
-from misc.utils import compute_optimized_training_maps, shortest_paths_naive, find_path_to_nearest, \
-    find_path_to_not_yet_seen, shortest_paths_expensive
+from envs.visibility import VisibilityEngine
+from misc.interest_points import InterestPointEngine
+from misc.path_table import PathTable
+from misc.profiler import StepProfiler
+from misc.utils import shortest_paths_naive, BoundedCache
+from misc.vision_cache import VisionCache, layout_hash
 
 
 class HideSeekEnv(gym.Env):
@@ -26,6 +30,7 @@ class HideSeekEnv(gym.Env):
                         an enemy_placement mode, either "static", "moves", or "random" representing how the enemy is initially placed on the map
                         a player_placement mode, either "static", "moves", or "random" representing how the player is initially placed on the map
                         an optimisation boolean, useful fo training purposes only
+                        an enemy_behavior mode, either "static", "patrol", or "chase" representing how the enemy moves during a round of gameplay
     """
 
     metadata = {"render_modes": ["console"]}
@@ -46,13 +51,29 @@ class HideSeekEnv(gym.Env):
     ENEMY_vision = 6
     INTEREST_POINT = 7
 
+    # Behaviors of the enemy: he stays in place, walks along the enemy positions of the map, or also chases the agent once he saw him
+    ENEMY_BEHAVIORS = ["static", "patrol", "chase"]
+
+    # Bytes of memory (256 MiB) kept for the structures (lines of sight, shortest paths, ...) of the layouts of a pool of maps, the least recently played layouts being dropped beyond
+    LAYOUT_CACHE_BYTES = 2 ** 28
+
+    # Methods timed by the step profiler, by phase (subclasses add the methods building their observations)
+    PROFILED_PHASES = {"reset": ["reset"], "movement": ["move_agent", "move_enemy"], "vision": ["update_agent_vison_and_map"],
+                       "interest_points": ["compute_interest_points"], "rewards": ["compute_rewards"]}
+
     def __init__(self, map_file="",
-                 enemy_placement="static", player_placement="static", opti=False):
+                 enemy_placement="static", player_placement="static", opti=False, enemy_behavior="static"):
         super(HideSeekEnv, self).__init__()
 
+        if enemy_behavior not in self.ENEMY_BEHAVIORS:
+            raise ValueError(f"Unknown enemy behavior {enemy_behavior}, expected one of {self.ENEMY_BEHAVIORS}")
+
         # Dataloader to load the maps from textual files
         self.dataloader = Dataloader()
-        if map_file != "":
+        if map_file != "" and holds_map_pool(map_file):
+            map_pool = load_map_pool(map_file)
+            self.playing_map = Maps(map_pool.names[0], map_pool.layouts[0], *map_pool.starting_positions(0))
+        elif map_file != "":
             self.playing_map = self.dataloader.load_map_from_file(map_file)
         else:
             self.playing_map = self.dataloader.load_map_from_file("map_v1")
@@ -61,13 +82,38 @@ class HideSeekEnv(gym.Env):
         self.player_placement = player_placement
         self.enemy_placement = enemy_placement
 
-        # Size of the map
-        self.grid_size = len(self.playing_map.current_map)
+        # Size of the map, which can be rectangular
+        self.height, self.width = self.playing_map.current_map.shape
+
+        # Structures computed once per layout (lines of sight, shortest paths, searches of the interest points)
+        self.build_layout_engines()
 
-        # Two units are created, one for the agent (hides) and one for the enemy (stays in place)
+        # Flat indices of the free tiles of the layout, where units are placed at random
+        self.free_cells = np.flatnonzero(self.playing_map.initial_map == self.EMPTY)
+
+        # Optional stream of fresh maps (MapPrefetcher), a new map being pulled at every reset
+        self.map_stream = None
+        self.wait_for_maps = True
+
+        # Optional pool of maps, a layout being drawn at every reset (a directory of maps or a map pack given as map file is loaded as a pool)
+        self.map_pool = None
+        self.layout_index = None
+        self.layout_engines = None
+        if map_file != "" and holds_map_pool(map_file):
+            self.use_map_pool(map_pool)
+
+        # Two units are created, one for the agent (hides) and one for the enemy (seeks)
         self.agent = Unit()
         self.enemy = Unit()
 
+        # Movements of the enemy: the route of a patrolling enemy (his waypoints, and the next one to head for),
+        # and the last position where a chasing enemy saw the agent
+        self.enemy_behavior = enemy_behavior
+        self.patrol_route = []
+        self.patrol_index = 0
+        self.patrol_waypoint = None
+        self.last_seen_agent = None
+
         # In this game, the agent (player) moves to hide himself. His actions are to move 1 tile at a time through the matrix map representation
         # The five actions of the agent are UP, DOWN, LEFT, RIGHT, STOP
         n_actions = 5
@@ -81,10 +127,13 @@ class HideSeekEnv(gym.Env):
         self.reward = 0.0
         self.prev_reward = 0.0
 
-        # Defines if optimization learning is activated
-        self.optimized_maps = None
+        # Defines if optimization learning is activated: enemy visions are then loaded from an on-disk cache, filled on first use
+        self.vision_cache = None
         if opti:
-            self.optimized_maps = compute_optimized_training_maps()
+            self.vision_cache = VisionCache()
+
+        # Step profiler, only created when profiling is enabled
+        self.profiler = None
 
     #Function inherited from the gym environment, subclasses have to implement this
     def step(
@@ -106,94 +155,188 @@ class HideSeekEnv(gym.Env):
     def render(self) -> RenderFrame | list[RenderFrame] | None:
         raise NotImplementedError
 
+    def render_console(self, interest_point_symbol=". "):
+        """
+        Prints the current map in the console, one symbol per tile
+        @param self:
+        @param interest_point_symbol: symbol used to print the agent's point of interest
+        @return:
+        """
+        symbols = np.array(["", ". ", "O ", "", "X ", "Y ", "- ", interest_point_symbol])
+        rows = ["".join(row) for row in symbols[self.playing_map.current_map]]
+        print("\n" + "\n".join(rows))
+        print('_' * self.width)
 
     #Function inherited from the gym environment, subclasses have to implement this
     def close(self):
         pass
 
-    def move_agent_left(self):
+    def enable_profiling(self, trace_start=0, trace_steps=0):
         """
-        Moves the agent left on the current map
+        Starts recording the time spent in every phase of the steps: the methods of the phases are wrapped on this instance only
+        The running aggregates are added to the info dictionary returned by every step, under the "profile" key
+        Timings differ from one run to the other: gymnasium's check_env has to be run before profiling is enabled
         @param self:
-        @return:
+        @param trace_start: index of the first step whose phases are kept for the Chrome trace
+        @param trace_steps: number of steps kept for the Chrome trace
+        @return: the StepProfiler of the environment
         """
-        if self.agent.ycoord - 1 >= 0:
-            if self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord - 1] != self.BLOCK and \
-                    self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord - 1] != self.ENEMY:
+        if self.profiler is None:
+            self.profiler = StepProfiler(trace_start, trace_steps)
+            for phase, methods in self.PROFILED_PHASES.items():
+                for method in methods:
+                    setattr(self, method, self.profiler.wrap(phase, getattr(self, method)))
+            self.step = self.profiler.wrap_step(self.step)
+        return self.profiler
 
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord] = self.EMPTY
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord - 1] = self.AGENT
+    def disable_profiling(self):
+        """
+        Stops recording the phases of the steps, the methods of the class being used again
+        @param self:
+        @return: the StepProfiler of the environment, None if profiling was not enabled
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            for methods in self.PROFILED_PHASES.values():
+                for method in methods:
+                    delattr(self, method)
+            del self.step
+            self.profiler = None
+        return profiler
 
-                # Update the agent position
-                self.agent.set_coord(self.agent.xcoord, self.agent.ycoord - 1)
+    def build_layout_engines(self):
+        """
+        Builds the structures which only depend on the layout of the playing map
+        @param self:
+        @return:
+        """
+        # Line-of-sight engines of the map, computed once per layout: a naive one for the agent and a clever one for the enemy
+        self.agent_visibility = VisibilityEngine(self.playing_map.initial_map, mode="naive")
+        self.enemy_visibility = VisibilityEngine(self.playing_map.initial_map, mode="clever")
 
-            else:  # The agent tried to move into a block or the enemy
-                self.reward = self.reward - 50
-        else:  # The agent tried to move outside of the map
-            self.reward = self.reward - 50
+        # Shortest paths between every pair of tiles, blocks never move during a game
+        self.path_table = PathTable(self.playing_map.initial_map, to_avoid=self.BLOCK)
 
-    def move_agent_right(self):
+        # Searches of the interest point heuristics, whose order of discovery of the tiles only depends on the layout
+        self.interest_point_engine = InterestPointEngine(self.playing_map.initial_map, to_avoid=self.BLOCK)
+
+    def load_map(self, playing_map):
         """
-        Moves the agent right on the current map
+        Replaces the playing map by another one of the same size (the observation space depends on it), for the next rounds of gameplay
         @param self:
+        @param playing_map: Maps object
         @return:
         """
-        if self.agent.ycoord + 1 < self.grid_size:
-            if self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord + 1] != self.BLOCK and \
-                    self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord + 1] != self.ENEMY:
+        self.playing_map.switch_layout(playing_map.map_name, playing_map.initial_map,
+                                       playing_map.agent_initial_position, playing_map.enemy_initial_position)
+        self.build_layout_engines()
+        self.free_cells = np.flatnonzero(self.playing_map.initial_map == self.EMPTY)
+        self.layout_index = None
 
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord] = self.EMPTY
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord + 1] = self.AGENT
+    def stream_maps(self, map_stream, wait=True):
+        """
+        Plays every round of gameplay on a fresh map, pulled from a stream of maps at every reset
+        @param self:
+        @param map_stream: object whose next_map(wait) method returns a Maps object or None (e.g. a MapPrefetcher), None to stop streaming
+        @param wait: True to wait for the next map at every reset (reproducible sequence of maps), False to keep the current map if none is ready
+        @return:
+        """
+        self.map_stream = map_stream
+        self.wait_for_maps = wait
 
-                # update agent position
-                self.agent.set_coord(self.agent.xcoord, self.agent.ycoord + 1)
+    def use_map_pool(self, map_pool, max_cache_bytes=None):
+        """
+        Plays every round of gameplay on a layout drawn at random from a pool of maps of the same size, None to stop drawing layouts
+        The structures of the layouts played on are kept up to max_cache_bytes, switching to one of them only costs the copy of the layout:
+        the least recently played layouts are dropped beyond, and their structures built again when they are drawn
+        @param self:
+        @param map_pool: MapPool object
+        @param max_cache_bytes: memory kept for the structures of the layouts, LAYOUT_CACHE_BYTES if None
+        @return:
+        """
+        if map_pool is not None and (map_pool.height, map_pool.width) != (self.height, self.width):
+            raise ValueError(f"The maps of the pool are {map_pool.height}x{map_pool.width}, expected {self.height}x{self.width}")
+        self.map_pool = map_pool
+        self.layout_index = None
+        self.layout_engines = BoundedCache(self.LAYOUT_CACHE_BYTES if max_cache_bytes is None else max_cache_bytes)
 
-            else:  # The agent tried to move into a block or the enemy
-                self.reward = self.reward - 50
-        else:  # The agent tried to move outside of the map
-            self.reward = self.reward - 50
+    def switch_layout(self, index):
+        """
+        Switches to a layout of the pool of maps, for the next round of gameplay
+        The current map is restored from it by reset_current_map: the map arrays are not reallocated
+        @param self:
+        @param index: index of the layout in the pool
+        @return:
+        """
+        if index == self.layout_index:
+            return
+        if self.layout_index is not None:
+            # The structures of the layout being left are measured again: their lazily computed parts have grown while it was played on
+            self.layout_engines[self.layout_index] = (self.agent_visibility, self.enemy_visibility, self.path_table, self.interest_point_engine)
+        self.playing_map.switch_layout(self.map_pool.names[index], self.map_pool.layouts[index], *self.map_pool.starting_positions(index))
+        if index in self.layout_engines:
+            self.agent_visibility, self.enemy_visibility, self.path_table, self.interest_point_engine = self.layout_engines[index]
+        else:
+            self.build_layout_engines()
+            self.layout_engines[index] = (self.agent_visibility, self.enemy_visibility, self.path_table, self.interest_point_engine)
+        self.free_cells = self.map_pool.free_tiles(index)
+        self.layout_index = index
 
-    def move_agent_up(self):
+    def move_agent(self, dx, dy):
         """
-        Moves the agent up on the current map
+        Moves the agent by (dx, dy) on the current map, penalizing moves into a block, the enemy or outside of the map
         @param self:
+        @param dx: offset to apply on the x coordinate of the agent (-1, 0 or 1)
+        @param dy: offset to apply on the y coordinate of the agent (-1, 0 or 1)
         @return:
         """
-        if self.agent.xcoord - 1 >= 0:
-            if self.playing_map.current_map[self.agent.xcoord - 1][self.agent.ycoord] != self.BLOCK and \
-                    self.playing_map.current_map[self.agent.xcoord - 1][self.agent.ycoord] != self.ENEMY:
+        x, y = self.agent.xcoord + dx, self.agent.ycoord + dy
+        current_map = self.playing_map.current_map
+        if 0 <= x < self.height and 0 <= y < self.width:
+            if current_map[x, y] != self.BLOCK and current_map[x, y] != self.ENEMY:
 
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord] = self.EMPTY
-                self.playing_map.current_map[self.agent.xcoord - 1][self.agent.ycoord] = self.AGENT
+                current_map[self.agent.xcoord, self.agent.ycoord] = self.EMPTY
+                current_map[x, y] = self.AGENT
 
-                # update agent position
-                self.agent.set_coord(self.agent.xcoord - 1, self.agent.ycoord)
+                # Update the agent position
+                self.agent.set_coord(x, y)
 
             else:  # The agent tried to move into a block or the enemy
                 self.reward = self.reward - 50
         else:  # The agent tried to move outside of the map
             self.reward = self.reward - 50
 
-    def move_agent_down(self):
+    def move_agent_left(self):
         """
-        Moves the agent down on the current map
+        Moves the agent left on the current map
         @param self:
         @return:
         """
-        if self.agent.xcoord + 1 < self.grid_size:
-            if self.playing_map.current_map[self.agent.xcoord + 1][self.agent.ycoord] != self.BLOCK and \
-                    self.playing_map.current_map[self.agent.xcoord + 1][self.agent.ycoord] != self.ENEMY:
+        self.move_agent(0, -1)
 
-                self.playing_map.current_map[self.agent.xcoord][self.agent.ycoord] = self.EMPTY
-                self.playing_map.current_map[self.agent.xcoord + 1][self.agent.ycoord] = self.AGENT
+    def move_agent_right(self):
+        """
+        Moves the agent right on the current map
+        @param self:
+        @return:
+        """
+        self.move_agent(0, 1)
 
-                # update agent position
-                self.agent.set_coord(self.agent.xcoord + 1, self.agent.ycoord)
+    def move_agent_up(self):
+        """
+        Moves the agent up on the current map
+        @param self:
+        @return:
+        """
+        self.move_agent(-1, 0)
 
-            else:  # The agent tried to move into a block or the enemy
-                self.reward = self.reward - 50
-        else:  # The agent tried to move outside of the map
-            self.reward = self.reward - 50
+    def move_agent_down(self):
+        """
+        Moves the agent down on the current map
+        @param self:
+        @return:
+        """
+        self.move_agent(1, 0)
 
     def compute_rewards(self):
         """
@@ -228,13 +371,8 @@ class HideSeekEnv(gym.Env):
         # Fifth reward, penalizes the agent if he moves away from his point of interest
         distance_poi = 0
         if len(self.agent.interest_points) > 0:
-            path_to_interest_tile = shortest_paths_expensive((self.agent.xcoord, self.agent.ycoord),
-                                                             (self.agent.interest_points[0][0],
-                                                              self.agent.interest_points[0][1]),
-                                                             self.playing_map.current_map, 1, to_avoid=self.BLOCK)
-
-            if len(path_to_interest_tile[0]) > 1:
-                distance_poi = len(path_to_interest_tile[0])
+            distance_poi = self.path_table.path_distance((self.agent.xcoord, self.agent.ycoord),
+                                                         self.agent.interest_points[0]) + 1
 
         self.reward = self.reward - distance_poi * 20
         """
@@ -266,18 +404,55 @@ class HideSeekEnv(gym.Env):
         @return:
         """
         # We compute the agent's vision
-        self.agent.compute_vision(self.playing_map.current_map, mode="naive")
+        self.agent.compute_vision(self.playing_map.current_map, mode="naive", visibility=self.agent_visibility)
+
+        # We update the map according to the intersection of his vision with the enemy's vision
+        self.paint_enemy_vision_overlap()
+
+    def paint_enemy_vision_overlap(self):
+        """
+        Clears the previous interest points from the map and paints the intersection of the agent's and enemy's visions on it: the agent does not have a complete view of the enemy's vision
+        @param self:
+        @return:
+        """
+        current_map = self.playing_map.current_map
 
-        # We compute the intersection of his vision with the enemy's vision
-        intersect_vision = list(set(self.enemy.vision) & set(self.agent.vision))
-        # And update the map accordingly
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.INTEREST_POINT:
-                    self.playing_map.current_map[i][j] = self.EMPTY
+        # The only interest point painted on the map is the current point of interest of the agent
+        if len(self.agent.interest_points) > 0:
+            x, y = self.agent.interest_points[0]
+            if current_map[x, y] == self.INTEREST_POINT:
+                current_map[x, y] = self.EMPTY
 
-                if (i, j) in intersect_vision and self.playing_map.current_map[i][j] != self.AGENT:
-                    self.playing_map.current_map[i][j] = self.ENEMY_vision
+        # We only go through the tiles seen by the agent, instead of the whole map
+        rows, columns = np.divmod(self.agent.seen[self.enemy.vision.flat[self.agent.seen]], current_map.shape[1])
+        overlap = current_map[rows, columns] != self.AGENT
+        current_map[rows[overlap], columns[overlap]] = self.ENEMY_vision
+
+    def paint_interest_point(self):
+        """
+        Paints the current point of interest of the agent on the current map
+        The tiles of the units are not painted: a unit standing on the point of interest (e.g. a moving enemy) stays on the map
+        @param self:
+        @return:
+        """
+        x, y = self.agent.interest_points[0]
+        if self.playing_map.current_map[x, y] not in (self.AGENT, self.ENEMY):
+            self.playing_map.current_map[x, y] = self.INTEREST_POINT
+
+    def path_towards_interest_point(self):
+        """
+        Looks up, in the path table of the map, the shortest path from the agent toward his point of interest
+        @param self:
+        @return: the first tile to move to and the length of the path (both ends included), or None if the agent has no reachable point of interest
+        """
+        if len(self.agent.interest_points) == 0:
+            return None
+
+        agent_position = (self.agent.xcoord, self.agent.ycoord)
+        next_tile = self.path_table.next_step(agent_position, self.agent.interest_points[0])
+        if next_tile is None:
+            return None
+        return next_tile, self.path_table.path_distance(agent_position, self.agent.interest_points[0]) + 1
 
     def place_npcs(self, coord_agent=(6, 7), coord_enemy=(6, 5)):
         """
@@ -288,8 +463,8 @@ class HideSeekEnv(gym.Env):
         @return:
         """
         # Places the units on the map
-        self.playing_map.current_map[coord_agent[0]][coord_agent[1]] = self.AGENT
-        self.playing_map.current_map[coord_enemy[0]][coord_enemy[1]] = self.ENEMY
+        self.playing_map.current_map[coord_agent[0], coord_agent[1]] = self.AGENT
+        self.playing_map.current_map[coord_enemy[0], coord_enemy[1]] = self.ENEMY
 
         # Modifies the coordinates of the units
         self.agent.xcoord = coord_agent[0]
@@ -298,55 +473,64 @@ class HideSeekEnv(gym.Env):
         self.enemy.ycoord = coord_enemy[1]
 
 
+    def draw_free_tile(self, excluded=None):
+        """
+        Draws a free tile of the layout uniformly at random, in any row and column, from the precomputed free tiles
+        @param self:
+        @param excluded: optional pair of coordinates of a tile which cannot be drawn (the one of the other unit)
+        @return: a pair of coordinates
+        """
+        nb_free = len(self.free_cells)
+        rank = nb_free
+        if excluded is not None:
+            excluded_cell = excluded[0] * self.width + excluded[1]
+            rank = np.searchsorted(self.free_cells, excluded_cell)
+            if rank < nb_free and self.free_cells[rank] == excluded_cell:
+                nb_free -= 1
+            else:
+                rank = nb_free
+
+        # The excluded tile is skipped by shifting the draws of the tiles after it
+        index = np.random.randint(nb_free)
+        if index >= rank:
+            index += 1
+        cell = self.free_cells[index]
+        return int(cell // self.width), int(cell % self.width)
+
     def initialize_pos(self):
         """
         Initialize the position of the units for a new round of hide & seek gameplay
+        Units placed at random are never placed on the tile of the other unit
         @param self:
         @return: an integer representing which enemy position has been chosen if it has been chosen randomly
         """
         rand_pos = None
         coord_agent = None
         coord_enemy = None
-        agent_no_placed = True
-        enemy_no_placed = True
 
         # We pick position coordinates for the agent first, depending on the player_placement mode
-        if self.player_placement == "random":
-            while agent_no_placed:
-                i, j = np.random.randint(self.grid_size - 1, dtype=int64), np.random.randint(self.grid_size - 1,
-                                                                                             dtype=int64)
-                if self.playing_map.current_map[i][j] != self.EMPTY and self.playing_map.current_map[i][j] != self.AGENT:
-                    pass
-                else:
-                    coord_agent = (i, j)
-                    self.playing_map.current_map[i][j] = self.AGENT
-                    agent_no_placed = False
-
-        elif self.player_placement == "static":
+        # (a random position is only picked once the enemy position is known, so that the agent is not placed on it)
+        if self.player_placement == "static":
             coord_agent = self.playing_map.agent_initial_position[0]
 
-        else:
+        elif self.player_placement != "random":
             coord_agent = random.choice(self.playing_map.agent_initial_position)
 
         # We pick position coordinates for the enemy second, depending on the enemy_placement mode
-        if self.enemy_placement == "random":
-            while enemy_no_placed:
-                i, j = np.random.randint(self.grid_size - 1, dtype=int64), np.random.randint(self.grid_size - 1,
-                                                                                             dtype=int64)
-                if self.playing_map.current_map[i][j] != self.EMPTY and self.playing_map.current_map[i][j] != self.AGENT:
-                    pass
-                else:
-                    coord_enemy = (i, j)
-                    self.playing_map.current_map[i][j] = self.ENEMY
-                    enemy_no_placed = False
-
-        elif self.enemy_placement == "static":
+        if self.enemy_placement == "static":
             coord_enemy = self.playing_map.enemy_initial_position[0]
 
-        else:
+        elif self.enemy_placement != "random":
             rand_pos = random.randint(0,len(self.playing_map.enemy_initial_position)-1)
             coord_enemy = self.playing_map.enemy_initial_position[rand_pos]
 
+        # Random positions are drawn among the free tiles, the agent's first
+        if self.player_placement == "random":
+            coord_agent = self.draw_free_tile(excluded=coord_enemy)
+
+        if self.enemy_placement == "random":
+            coord_enemy = self.draw_free_tile(excluded=coord_agent)
+
         # Actual placement of the nits depending on their picked coordinates
         self.place_npcs(coord_agent, coord_enemy)
 
@@ -359,40 +543,121 @@ class HideSeekEnv(gym.Env):
         @param self:
         @return:
         """
-        #self.initialize_map()
-        self.playing_map.current_map = deepcopy(self.playing_map.initial_map)
+        # If maps are streamed, the round is played on the next one, else on a layout drawn from the pool of maps if any
+        if self.map_stream is not None:
+            playing_map = self.map_stream.next_map(self.wait_for_maps)
+            if playing_map is not None:
+                self.load_map(playing_map)
+        elif self.map_pool is not None:
+            self.switch_layout(np.random.randint(len(self.map_pool)))
+
+        # The current map is restored in place from the initial map template
+        self.playing_map.reset_current_map()
         random_enemy_pos = self.initialize_pos()
         self.initialize_vision(random_enemy_pos)
+        if self.enemy_behavior != "static":
+            self.initialize_patrol()
 
 
     def initialize_vision(self, random_enemy_pos):
         """
         Initialize the vision of the units for a new round of hide & seek gameplay
         @param self:
-        @param random_enemy_pos: integer representing which enemy position has been chosen IF chosen at random, useful for optimisation during training
+        @param random_enemy_pos: integer representing which enemy position has been chosen IF chosen at random (the vision cache is keyed by position, so it is not needed anymore)
         @return:
         """
         # We compute the vision of the enemy first
-        # If optimization is activated, we load enemy vision from precomputed sources
-        if self.optimized_maps is not None:
-            if self.enemy_placement == "static":
-                self.enemy.vision = self.optimized_maps[int(self.playing_map.map_name[-1]) - 1][0]
+        # At this point only blocks stop the enemy's vision, so the vision on the static layout is exact
+        # If optimization is activated, we load it from the vision cache (computed and stored if needed)
+        if self.vision_cache is not None:
+            self.enemy.vision = self.vision_cache.vision(self.playing_map.initial_map, self.enemy.xcoord, self.enemy.ycoord,
+                                                         self.enemy_visibility.vision_mask)
 
-            else:
-                if random_enemy_pos is not None:
-                    self.enemy.vision = self.optimized_maps[int(self.playing_map.map_name[-1]) - 1][random_enemy_pos]
-                else:
-                    print("Error, random_enemy_pos should not be None")
-
-        # Else, we compute it from scratch
+        # Else, we look it up in the visibility table of the map
         else:
-            self.enemy.compute_vision(self.playing_map.current_map, mode="clever")
+            self.enemy.vision = self.enemy_visibility.vision_mask(self.enemy.xcoord, self.enemy.ycoord)
 
         # We compute the vision of the player second
         # Since the player is moving, his vision needs to be computed at every movement which is why we use a more naive (and quicker) method
-        self.agent.previously_viewed = []
-        self.agent.compute_vision(self.playing_map.current_map, mode="naive")
+        self.agent.reset_memory(self.playing_map.current_map.shape)
+        self.agent.compute_vision(self.playing_map.current_map, mode="naive", visibility=self.agent_visibility)
+
+
+    def initialize_patrol(self):
+        """
+        Initialize the movements of a patrolling or chasing enemy for a new round of hide & seek gameplay
+        The patrol route goes through the enemy positions of the map in turn, starting with the one after the enemy's start
+        The visions precomputed in the vision cache (if optimization is activated) are read into the visibility table of the enemy once per layout:
+        the vision of the moving enemy is then looked up in it at every step
+        @param self:
+        @return:
+        """
+        self.patrol_route = list(dict.fromkeys((int(x), int(y)) for x, y in self.playing_map.enemy_initial_position))
+        start = (self.enemy.xcoord, self.enemy.ycoord)
+        self.patrol_index = (self.patrol_route.index(start) + 1) % len(self.patrol_route) if start in self.patrol_route else 0
+        self.patrol_waypoint = None
+        self.last_seen_agent = None
 
+        if self.vision_cache is not None and not self.enemy_visibility.computed[self.free_cells].all():
+            table = self.vision_cache.table(layout_hash(self.playing_map.initial_map), "clever")
+            if table is not None:
+                self.enemy_visibility.load_rows(table, self.free_cells)
+
+    def next_waypoint(self):
+        """
+        Retrieves the tile a patrolling enemy heads for, moving on to the next waypoint of his route once he reached it
+        With fewer than two waypoints, the enemy wanders between free tiles drawn at random
+        @param self:
+        @return: a pair of coordinates
+        """
+        enemy_position = (self.enemy.xcoord, self.enemy.ycoord)
+        if self.patrol_waypoint is None or self.patrol_waypoint == enemy_position:
+            if len(self.patrol_route) > 1:
+                self.patrol_waypoint = self.patrol_route[self.patrol_index]
+                self.patrol_index = (self.patrol_index + 1) % len(self.patrol_route)
+            else:
+                self.patrol_waypoint = self.draw_free_tile(excluded=enemy_position)
+        return self.patrol_waypoint
+
+    def move_enemy(self):
+        """
+        Moves a patrolling or chasing enemy by one tile along a shortest path, and updates his vision from his new position
+        A chasing enemy heads for the last position where he saw the agent, and resumes his patrol once there
+        The enemy does not move onto the agent, and a static enemy does not move at all
+        @param self:
+        @return:
+        """
+        if self.enemy_behavior == "static":
+            return
+
+        agent_position = (self.agent.xcoord, self.agent.ycoord)
+        enemy_position = (self.enemy.xcoord, self.enemy.ycoord)
+        if self.enemy_behavior == "chase" and self.enemy.vision[agent_position]:
+            self.last_seen_agent = agent_position
+        if self.last_seen_agent == enemy_position:
+            self.last_seen_agent = None
+
+        # The first tile of the path is looked up in the path table of the map
+        target = self.last_seen_agent if self.last_seen_agent is not None else self.next_waypoint()
+        next_tile = self.path_table.next_step(enemy_position, target)
+        if next_tile is None:  # The target cannot be reached, another one is picked at the next step
+            if target == self.last_seen_agent:
+                self.last_seen_agent = None
+            else:
+                self.patrol_waypoint = None
+            return
+        if next_tile == agent_position:
+            return
+
+        # The painted vision of the enemy is cleared from the map: it is painted again from his new vision
+        current_map = self.playing_map.current_map
+        current_map[current_map == self.ENEMY_vision] = self.EMPTY
+        current_map[enemy_position] = self.EMPTY
+        current_map[next_tile] = self.ENEMY
+        self.enemy.set_coord(*next_tile)
+
+        # Only blocks stop the enemy's vision: it is looked up in the visibility table of the layout (computed once per tile)
+        self.enemy.vision = self.enemy_visibility.row(*next_tile)
 
     def nb_block_in_line_of_sight(self, start, end):
         """
@@ -406,7 +671,7 @@ class HideSeekEnv(gym.Env):
         # Compute the path between the two positions and check the number of block tiles in that path
         nb_blocks = 0
         for p in path:
-            if self.playing_map.current_map[p[0]][p[1]] == self.BLOCK:
+            if self.playing_map.current_map[p[0], p[1]] == self.BLOCK:
                 nb_blocks += 1
         return nb_blocks
 
@@ -419,20 +684,8 @@ class HideSeekEnv(gym.Env):
         @param y: Y coordinate of the specific position
         @return: Number of block tiles adjacent to the specific position
         """
-        nb_next_to_block = 0
-        if x > 0:
-            if self.playing_map.current_map[x - 1][y] == self.BLOCK:
-                nb_next_to_block += 1
-        if x + 1 < self.grid_size:
-            if self.playing_map.current_map[x + 1][y] == self.BLOCK:
-                nb_next_to_block += 1
-        if y > 0:
-            if self.playing_map.current_map[x][y - 1] == self.BLOCK:
-                nb_next_to_block += 1
-        if y + 1 < self.grid_size:
-            if self.playing_map.current_map[x][y + 1] == self.BLOCK:
-                nb_next_to_block += 1
-        return nb_next_to_block
+        # Blocks never move, the count is looked up in the block adjacency grid of the map
+        return int(self.interest_point_engine.adjacent_blocks[x, y])
 
 
     def look_for_nearest_block(self, mode="distance"):
@@ -442,18 +695,8 @@ class HideSeekEnv(gym.Env):
         @param mode: Mode specifying the return value of the function, either the distance to the agent, or the coordinate of the block
         @return: Either the distance between the Agent and the nearest block,or the coordinate of the nearest block
         """
-        nearest_value = 100
-        nearest_x = None
-        nearest_y = None
-        # We process the whole matrix map representation
-        for i in range(0, self.grid_size):
-            for j in range(0, self.grid_size):
-                if self.playing_map.current_map[i][j] == self.BLOCK: # If a tile is a block
-                    temp = math.sqrt((self.agent.xcoord - i) ** 2 + (self.agent.ycoord - j) ** 2)
-                    if temp < nearest_value:
-                        nearest_value = temp
-                        nearest_x = i
-                        nearest_y = j
+        # The nearest block of every tile is looked up in the distance transform of the map
+        nearest_value, (nearest_x, nearest_y) = self.interest_point_engine.nearest_block(self.agent.xcoord, self.agent.ycoord)
 
         if mode == "distance":
             return nearest_value
@@ -475,34 +718,36 @@ class HideSeekEnv(gym.Env):
 
         # First heuristic : if the agent is seen by the enemy, his interest point will be the closest tile that he thinks is not seen by the enemy
         # This is a priority heuristic
-        if (self.agent.xcoord, self.agent.ycoord) in self.enemy.vision:
-            nearest_empty_tile_x, nearest_empty_tile_y = find_path_to_nearest(self.playing_map.current_map, self.agent.xcoord,
-                                                                              self.agent.ycoord, self.EMPTY, self.BLOCK)
-            self.agent.interest_points.append((nearest_empty_tile_x, nearest_empty_tile_y))
+        if self.enemy.vision[self.agent.xcoord, self.agent.ycoord]:
+            # There may be no empty tile left to reach (e.g. the enemy sees the whole map), in which case the agent has no interest point
+            nearest_empty_tile = self.interest_point_engine.nearest_tile(self.agent.xcoord, self.agent.ycoord,
+                                                                         self.playing_map.current_map, self.EMPTY)
+            if nearest_empty_tile is not None:
+                self.agent.interest_points.append(nearest_empty_tile)
 
         else: # If we are not seen by the enemy
 
             # Second heuristic : if the agent notices a spot that is adjacent to several blocks (in his vision field), or "a good place to hide", he will consider it as an interest point
             if self.nb_next_to_block(self.agent.xcoord, self.agent.ycoord) <= 1: # If we are not in a perfect spot already
-                for (i, j) in self.agent.previously_viewed:
-                    if self.playing_map.current_map[i][j] == self.EMPTY:
-                        if self.nb_next_to_block(i, j) > 1:
-                            if (i, j) not in self.agent.interest_points:
-                                self.agent.interest_points.append((i, j))
-                                break
+                # The previously viewed tiles are processed in the order the agent first saw them
+                hiding_spot = self.interest_point_engine.first_viewed_hiding_spot(self.agent, self.playing_map.current_map, self.EMPTY)
+                if hiding_spot is not None:
+                    self.agent.interest_points.append(hiding_spot)
 
                 # Third heuristic : if the agent considers he has not see enough of the map, he will keep exploring the nearest. The nearest "unseen" tile is its interest point
-                if len(self.agent.interest_points) == 0 and len(self.agent.previously_viewed) < (
-                        (self.grid_size * self.grid_size) / 1.5):
-                    nearest_empty_tile_x, nearest_empty_tile_y = find_path_to_not_yet_seen(self.playing_map.current_map, self.agent.xcoord,
-                                                                                           self.agent.ycoord,
-                                                                                           self.agent.previously_viewed,
-                                                                                           self.BLOCK)
-                    self.agent.interest_points.append((nearest_empty_tile_x, nearest_empty_tile_y))
+                if len(self.agent.interest_points) == 0 and self.agent.nb_viewed < (
+                        (self.height * self.width) / 1.5):
+                    nearest_unseen_tile = self.interest_point_engine.nearest_not_yet_seen(self.agent.xcoord, self.agent.ycoord,
+                                                                                          self.agent.previously_viewed)
+                    if nearest_unseen_tile is not None:
+                        self.agent.interest_points.append(nearest_unseen_tile)
 
                 # Fourth heuristic : if the agent is not next to any block, his interest point will be the closest block in order to be better hidden
                 if len(self.agent.interest_points) == 0 and self.nb_next_to_block(self.agent.xcoord, self.agent.ycoord) == 0:
                     closest_block = self.look_for_nearest_block(mode="coord")
+                    # A map without any block has no block to move next to
+                    if closest_block[0] is None:
+                        return
                     next_to_nearest_x, next_to_nearest_y = self.find_appropriate_tile_next_to_block(closest_block)
 
                     if next_to_nearest_x != 0 and next_to_nearest_y != 0:
@@ -522,59 +767,10 @@ class HideSeekEnv(gym.Env):
 
         # The search for the most appropriate tile is done as such:
         # We try to move to the block-adjacent tile that is the farthest from the enemy
-        # If this tile is not available, we try with the second farthest, etc.
-        next_to_nearest_x, next_to_nearest_y = 0, 0
-        if abs(self.agent.xcoord - self.enemy.xcoord) > abs(self.agent.ycoord - self.enemy.ycoord):
-            if self.agent.xcoord > self.enemy.xcoord:
-                if closest_block[0] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0] + 1][
-                    closest_block[1]] == self.EMPTY:
-                    next_to_nearest_x, next_to_nearest_y = closest_block[0] + 1, closest_block[1]
-                else:
-                    if self.agent.ycoord > self.enemy.ycoord:
-                        if closest_block[1] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0]][
-                            closest_block[1] + 1] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] + 1
-                    else:
-                        if closest_block[1] - 1 > 0 and self.playing_map.current_map[closest_block[0]][
-                            closest_block[1] - 1] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] - 1
-            else:
-                if closest_block[0] > 0 and self.playing_map.current_map[closest_block[0] - 1][closest_block[1]] == self.EMPTY:
-                    next_to_nearest_x, next_to_nearest_y = closest_block[0] - 1, closest_block[1]
-                else:
-                    if self.agent.ycoord > self.enemy.ycoord:
-                        if closest_block[1] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0]][
-                            closest_block[1] + 1] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] + 1
-                    else:
-                        if closest_block[1] - 1 > 0 and self.playing_map.current_map[closest_block[0]][
-                            closest_block[1] - 1] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] - 1
-        else:
-            if self.agent.ycoord > self.enemy.ycoord:
-                if closest_block[1] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0]][
-                    closest_block[1] + 1] == self.EMPTY:
-                    next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] + 1
-                else:
-                    if self.agent.xcoord > self.enemy.xcoord:
-                        if closest_block[0] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0] + 1][
-                            closest_block[1]] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0] + 1, closest_block[1]
-                    else:
-                        if closest_block[0] - 1 > 0 and self.playing_map.current_map[closest_block[0] - 1][
-                            closest_block[1]] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0] - 1, closest_block[1]
-            else:
-                if closest_block[1] > 0 and self.playing_map.current_map[closest_block[0]][closest_block[1] - 1] == self.EMPTY:
-                    next_to_nearest_x, next_to_nearest_y = closest_block[0], closest_block[1] - 1
-                else:
-                    if self.agent.xcoord > self.enemy.xcoord:
-                        if closest_block[0] + 1 < self.grid_size and self.playing_map.current_map[closest_block[0] + 1][
-                            closest_block[1]] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0] + 1, closest_block[1]
-                    else:
-                        if closest_block[0] - 1 > 0 and self.playing_map.current_map[closest_block[0] - 1][
-                            closest_block[1]] == self.EMPTY:
-                            next_to_nearest_x, next_to_nearest_y = closest_block[0] - 1, closest_block[1]
+        # If this tile is not available, we try with the second farthest
+        # Both tiles are looked up in the table of preferred tiles of the map, according to the position of the enemy
+        next_to_nearest_x, next_to_nearest_y = self.interest_point_engine.appropriate_tile_next_to_block(closest_block, self.agent, self.enemy,
+                                                                                                      self.playing_map.current_map,
+                                                                                                      self.EMPTY)
 
         return next_to_nearest_x, next_to_nearest_y
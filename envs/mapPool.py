@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+
+from data.dataloader import Dataloader
+from data.map_pack import is_map_pack, stack_maps
+from misc.utils import EMPTY
+
+
+class MapPool:
+    """
+    This class represents a pool of maps of the same size, on which rounds of gameplay are played in turn
+    The maps are stored as compact arrays: the stacked layouts (read-only int8 array, possibly memory-mapped from a map pack),
+    and the ragged lists of the free tiles and of the starting positions of every layout (concatenated flat arrays, with offsets)
+    The free tiles are computed once, when the pool is built
+    """
+
+    def __init__(self, names, layouts, agent_offsets, agent_positions, enemy_offsets, enemy_positions):
+        super(MapPool, self).__init__()
+
+        if len(layouts) == 0:
+            raise ValueError("A pool of maps needs at least one map")
+        self.names = names
+        self.layouts = layouts
+        if self.layouts.flags.writeable:
+            self.layouts.setflags(write=False)
+        self.height, self.width = self.layouts.shape[1:]
+
+        # Flat indices of the free tiles of every layout, where units are placed at random
+        free = self.layouts.reshape(len(layouts), -1) == EMPTY
+        self.free_offsets = np.concatenate([[0], np.cumsum(np.count_nonzero(free, axis=1))])
+        self.free_cells = np.nonzero(free)[1].astype(np.int16 if self.height * self.width <= np.iinfo(np.int16).max else np.int32)
+
+        # Starting positions of the units of every layout
+        self.agent_offsets = agent_offsets
+        self.agent_positions = agent_positions
+        self.enemy_offsets = enemy_offsets
+        self.enemy_positions = enemy_positions
+
+    def __len__(self):
+        return len(self.layouts)
+
+    def free_tiles(self, index):
+        """
+        Retrieves the free tiles of a layout
+        @param self:
+        @param index: index of the layout
+        @return: the sorted flat indices of the free tiles (a view on the pool)
+        """
+        return self.free_cells[self.free_offsets[index]:self.free_offsets[index + 1]]
+
+    def starting_positions(self, index):
+        """
+        Retrieves the starting positions of the units on a layout
+        @param self:
+        @param index: index of the layout
+        @return: the lists of the agent and of the enemy starting positions (pairs of coordinates)
+        """
+        agent_positions = self.agent_positions[self.agent_offsets[index]:self.agent_offsets[index + 1]]
+        enemy_positions = self.enemy_positions[self.enemy_offsets[index]:self.enemy_offsets[index + 1]]
+        return [(int(x), int(y)) for x, y in agent_positions], [(int(x), int(y)) for x, y in enemy_positions]
+
+
+def map_pool_from_maps(maps):
+    """
+    Function building a pool from maps of the same size
+    @param maps: list of Maps objects
+    @return: a MapPool object
+    """
+    return MapPool(*stack_maps(maps))
+
+
+def map_pool_from_pack(pack):
+    """
+    Function building a pool from a map pack, whose layouts stay memory-mapped
+    @param pack: MapPack object
+    @return: a MapPool object
+    """
+    return MapPool([pack.name(index) for index in range(len(pack))], pack.layouts,
+                   pack.agent_offsets, pack.agent_positions, pack.enemy_offsets, pack.enemy_positions)
+
+
+def holds_map_pool(path):
+    """
+    Function checking whether a path holds several maps to build a pool from: a directory of map files, or a map pack
+    @param path: path of a file or of a directory
+    @return: a boolean
+    """
+    return os.path.isdir(path) or is_map_pack(path)
+
+
+def load_map_pool(path):
+    """
+    Function loading a pool of maps: from a map pack, or by parsing every map file of a directory (in the order of their names)
+    @param path: path of a map pack or of a directory
+    @return: a MapPool object
+    """
+    dataloader = Dataloader()
+    if os.path.isdir(path):
+        return map_pool_from_maps(dataloader.load_maps_from_directory(path))
+    return map_pool_from_pack(dataloader.load_map_pack(path))
@@ -1,11 +1,12 @@
+import numpy as np
 
 
 class Maps:
     """
     This class represents a map on which a game of hide & seek takes place
     It contains: a map filename
-                 a representation of the initial, unchanged map
-                 a representation of the current in-game map
+                 a representation of the initial, unchanged map (contiguous int8 numpy array, used as a template)
+                 a representation of the current in-game map (int8 numpy array, possibly a view on the center of a padded array)
                  a set of initial agent positions
                  a set of initial enemy positions
 
@@ -14,8 +15,54 @@ class Maps:
         super(Maps, self).__init__()
 
         self.map_name = map_name
-        self.initial_map = initial_map
-        self.current_map = initial_map
+        self.initial_map = np.ascontiguousarray(initial_map, dtype=np.int8)
+        self.initial_map.setflags(write=False)
+        self.current_map = self.initial_map.copy()
         self.agent_initial_position = agent_positions
         self.enemy_initial_position = enemy_positions
 
+    def switch_layout(self, map_name, initial_map, agent_positions, enemy_positions):
+        """
+        Replaces the map by another one of the same size, keeping the current map array (and the padded array it may be a view on)
+        The current map is restored from the new initial map by the next call to reset_current_map
+        @param self:
+        @param map_name: name of the new map
+        @param initial_map: matrix representation of the new map (kept as is if it is a contiguous int8 array, e.g. a layout of a MapPool)
+        @param agent_positions: set of initial agent positions
+        @param enemy_positions: set of initial enemy positions
+        @return:
+        """
+        if initial_map.shape != self.initial_map.shape:
+            raise ValueError(f"The map {map_name} is {initial_map.shape[0]}x{initial_map.shape[1]}, "
+                             f"expected {self.initial_map.shape[0]}x{self.initial_map.shape[1]}")
+        self.map_name = map_name
+        self.initial_map = np.ascontiguousarray(initial_map, dtype=np.int8)
+        if self.initial_map.flags.writeable:
+            self.initial_map = self.initial_map.view()
+            self.initial_map.setflags(write=False)
+        self.agent_initial_position = agent_positions
+        self.enemy_initial_position = enemy_positions
+
+    def reset_current_map(self):
+        """
+        Restores the current map from the initial map template, in place (no new allocation)
+        @param self:
+        @return: the current map
+        """
+        np.copyto(self.current_map, self.initial_map)
+        return self.current_map
+
+    def pad_current_map(self, padding, value):
+        """
+        Moves the current map to the center of a padded array: the current map becomes a view on it, so that the padded array is updated in place along with it
+        @param self:
+        @param padding: number of tiles added on each side of the map, either a single number or a (rows, columns) pair
+        @param value: value of the added tiles
+        @return: the padded array
+        """
+        height, width = self.initial_map.shape
+        padding_x, padding_y = (padding, padding) if np.ndim(padding) == 0 else padding
+        padded_map = np.full((height + 2 * padding_x, width + 2 * padding_y), value, dtype=np.int8)
+        padded_map[padding_x:padding_x + height, padding_y:padding_y + width] = self.current_map
+        self.current_map = padded_map[padding_x:padding_x + height, padding_y:padding_y + width]
+        return padded_map
@@ -0,0 +1,389 @@
+import numpy as np
+from gymnasium import spaces
+
+from data.dataloader import Dataloader
+from envs.custom_envs.spiralFieldVision import spiral_offsets
+from envs.mapPool import holds_map_pool
+from envs.visibility import VisibilityEngine
+from misc.path_table import PathTable
+from misc.utils import EMPTY, BLOCK, OUTSIDE, AGENT, ENEMY, ENEMY_vision, STOP
+from misc.vision_cache import VisionCache, layout_hash
+
+
+class MultiUnitHideSeekEnv:
+    """
+    This class represents a game of hide & seek played by several hiders against several seekers on the same map
+    The state of the units is stored as arrays indexed by unit id (the hiders first, then the seekers):
+                        their positions (N, 2), their visions and their memories of previously seen tiles (N, H * W)
+    Only blocks stop the visions: every vision is looked up in the visibility tables of the layout, all the units being updated at once
+    It is built using : a textual map filename
+                        a number of hiders and a number of seekers
+                        a player_placement mode, either "static", "moves", or "random" representing how the hiders are initially placed on the map
+                        an enemy_placement mode, either "static", "moves", or "random" representing how the seekers are initially placed on the map
+                        an enemy_behavior mode, either "static", "patrol", or "chase" representing how the seekers move (see HideSeekEnv.move_enemy)
+                        a radius, number of tiles seen on each side of a hider in its observation (in the spiraling order of SpiralFieldVisionEnv)
+                        an optimisation boolean: the visions precomputed in the vision cache are read once, when the environment is built
+    It implements the PettingZoo parallel API: the hiders are the agents ("hider_0", "hider_1", ...), acting all at once, the seekers being driven
+    by the environment. A hider which stops (or whose round is truncated) leaves the agents, and keeps its tile until the end of the round
+    """
+
+    metadata = {"render_modes": ["console"], "name": "hide_seek_multi_units_v0"}
+
+    # Moves of the hiders, indexed by action
+    MOVES = np.array([(0, -1), (0, 1), (-1, 0), (1, 0), (0, 0)], dtype=np.int64)
+
+    # Rewards of a hider, depending on whether a seeker sees it at the end of the step
+    HIDDEN_REWARD = 200.0
+    SEEN_REWARD = -100.0
+
+    def __init__(self, map_file="", n_hiders=2, n_seekers=2, player_placement="random", enemy_placement="static",
+                 enemy_behavior="static", radius=4, opti=False, seed=None):
+        super(MultiUnitHideSeekEnv, self).__init__()
+
+        self.dataloader = Dataloader()
+        if map_file != "" and holds_map_pool(map_file):
+            raise ValueError(f"The multi-unit environment plays on a single map, {map_file} holds several maps")
+        if map_file != "":
+            self.playing_map = self.dataloader.load_map_from_file(map_file)
+        else:
+            self.playing_map = self.dataloader.load_map_from_file("map_v1")
+        if n_hiders < 1:
+            raise ValueError("The multi-unit environment needs at least one hider")
+        if enemy_behavior not in ["static", "patrol", "chase"]:
+            raise ValueError(f"Unknown enemy behavior {enemy_behavior}, expected static, patrol or chase")
+
+        self.player_placement = player_placement
+        self.enemy_placement = enemy_placement
+        self.enemy_behavior = enemy_behavior
+        self.layout = self.playing_map.initial_map
+        self.height, self.width = self.layout.shape
+        self.nb_tiles = self.height * self.width
+        self.bounds = np.array(self.layout.shape, dtype=np.int64)
+        self.free_cells = np.flatnonzero(self.layout == EMPTY)
+        self.np_random = np.random.default_rng(seed)
+
+        # Units: the hiders are the units [0, n_hiders), the seekers the units [n_hiders, n_hiders + n_seekers)
+        self.n_hiders = n_hiders
+        self.n_seekers = n_seekers
+        self.n_units = n_hiders + n_seekers
+        if self.n_units > len(self.free_cells):
+            raise ValueError(f"{self.n_units} units cannot be placed on the {len(self.free_cells)} free tiles of the map")
+        self.hiders = slice(0, n_hiders)
+        self.seekers = slice(n_hiders, self.n_units)
+
+        # Static information about the map: the lines of sight of the hiders (naive) and of the seekers (clever), and the shortest paths
+        # Ties between equally short paths are broken in a fixed order, so that the paths of every seeker are looked up at once
+        self.hider_visibility = VisibilityEngine(self.layout, mode="naive")
+        self.seeker_visibility = VisibilityEngine(self.layout, mode="clever")
+        self.path_table = PathTable(self.layout, to_avoid=BLOCK, exact_ties=False)
+        if opti:
+            vision_cache = VisionCache()
+            for engine in (self.hider_visibility, self.seeker_visibility):
+                table = vision_cache.table(layout_hash(self.layout), engine.mode)
+                if table is not None:
+                    engine.load_rows(table, self.free_cells)
+
+        # The observation of a hider is the spiral of tiles around it, gathered from the current map padded with "outside" tiles
+        self.radius = radius
+        self.spiral = spiral_offsets(radius)
+        self.padded_map = np.full((self.height + 2 * radius, self.width + 2 * radius), OUTSIDE, dtype=np.int8)
+        self.current_map = self.padded_map[radius:radius + self.height, radius:radius + self.width]
+        self.spiral_indices = self.spiral[:, 0] * self.padded_map.shape[1] + self.spiral[:, 1]
+
+        # PettingZoo parallel API
+        self.possible_agents = [f"hider_{k}" for k in range(n_hiders)]
+        self.agent_ids = {agent: k for k, agent in enumerate(self.possible_agents)}
+        self.agents = []
+        self.observation_spaces = {agent: spaces.Box(low=0, high=7, shape=(len(self.spiral),), dtype=np.int32)
+                                   for agent in self.possible_agents}
+        self.action_spaces = {agent: spaces.Discrete(5) for agent in self.possible_agents}
+        self.render_mode = None
+
+        # State of the units
+        self.positions = np.zeros((self.n_units, 2), dtype=np.int64)
+        self.visions = np.zeros((self.n_units, self.nb_tiles), dtype=bool)
+        self.memories = np.zeros((self.n_units, self.nb_tiles), dtype=bool)
+        self.nb_viewed = np.zeros(self.n_units, dtype=np.int64)
+        self.active = np.zeros(n_hiders, dtype=bool)
+
+        # Vision of the seekers as a whole, and number of seekers seeing every hider
+        self.seekers_vision = np.zeros(self.nb_tiles, dtype=bool)
+        self.seen_by = np.zeros(n_hiders, dtype=np.int64)
+
+        # Movements of the seekers: the waypoints of their patrol route (flat indices, -1 when a new one is needed),
+        # and the last tile where a chasing seeker saw a hider (-1 if none)
+        self.patrol_route = np.array([x * self.width + y for x, y in dict.fromkeys(
+            (int(x), int(y)) for x, y in self.playing_map.enemy_initial_position)], dtype=np.int64)
+        self.patrol_index = np.zeros(n_seekers, dtype=np.int64)
+        self.waypoints = np.full(n_seekers, -1, dtype=np.int64)
+        self.last_seen = np.full(n_seekers, -1, dtype=np.int64)
+        self.n_step = 0
+
+    def observation_space(self, agent):
+        return self.observation_spaces[agent]
+
+    def action_space(self, agent):
+        return self.action_spaces[agent]
+
+    ############################################
+    # Placement
+
+    def pick_cells(self, starting_positions, placement, count, taken):
+        """
+        Picks the initial tiles of some units: the starting positions of the map first (in order if the placement is "static", in a random order
+        if it "moves"), then free tiles drawn at random once they are all taken. The units never share a tile
+        @param self:
+        @param starting_positions: list of starting positions of the map for these units
+        @param placement: placement mode, "static", "moves" or "random"
+        @param count: number of units to place
+        @param taken: flat indices of the tiles already taken by other units
+        @return: a list of flat indices
+        """
+        cells = []
+        if placement != "random":
+            candidates = list(dict.fromkeys(x * self.width + y for x, y in starting_positions))
+            if placement == "moves":
+                candidates = [candidates[k] for k in self.np_random.permutation(len(candidates))]
+            cells = [cell for cell in candidates if cell not in taken][:count]
+
+        if len(cells) < count:
+            available = np.setdiff1d(self.free_cells, list(taken) + cells)
+            cells += [int(cell) for cell in self.np_random.choice(available, count - len(cells), replace=False)]
+        return cells
+
+    def place_units(self):
+        """
+        Places every unit on the map for a new round of gameplay, the hiders first
+        @param self:
+        @return:
+        """
+        hider_cells = self.pick_cells(self.playing_map.agent_initial_position, self.player_placement, self.n_hiders, [])
+        seeker_cells = self.pick_cells(self.playing_map.enemy_initial_position, self.enemy_placement, self.n_seekers, hider_cells)
+        cells = np.array(hider_cells + seeker_cells, dtype=np.int64)
+        self.positions[:, 0], self.positions[:, 1] = np.divmod(cells, self.width)
+
+        np.copyto(self.current_map, self.layout)
+        self.current_map.flat[cells[self.hiders]] = AGENT
+        self.current_map.flat[cells[self.seekers]] = ENEMY
+
+        # A patrolling seeker heads for the waypoint following its start on the route, the seekers being spread along the route
+        route_index = np.zeros(self.n_seekers, dtype=np.int64)
+        if len(self.patrol_route) > 0:
+            on_route = self.patrol_route[None, :] == cells[self.seekers, None]
+            route_index = np.where(on_route.any(axis=1), on_route.argmax(axis=1) + 1, np.arange(self.n_seekers))
+        self.patrol_index = route_index % max(len(self.patrol_route), 1)
+        self.waypoints[:] = -1
+        self.last_seen[:] = -1
+
+    ############################################
+    # Movements
+
+    def cells(self, units=slice(None)):
+        """
+        Computes the flat indices of the tiles of some units
+        @param self:
+        @param units: indices (or slice) of the units
+        @return: an array of flat indices
+        """
+        return self.positions[units, 0] * self.width + self.positions[units, 1]
+
+    def claim_tiles(self, units, targets, valid):
+        """
+        Moves some units to their target tiles: when several units move to the same tile, the one with the lowest id gets it
+        @param self:
+        @param units: ids of the units
+        @param targets: flat indices of their target tiles
+        @param valid: boolean array of the units allowed to move
+        @return: the boolean array of the units which moved
+        """
+        moved = np.zeros(len(units), dtype=bool)
+        candidates = np.flatnonzero(valid)
+        _, first = np.unique(targets[candidates], return_index=True)
+        moved[candidates[first]] = True
+
+        tiles = self.current_map.flat[self.cells(units[moved])]
+        self.current_map.flat[self.cells(units[moved])] = EMPTY
+        self.current_map.flat[targets[moved]] = tiles
+        self.positions[units[moved]] = np.stack(np.divmod(targets[moved], self.width), axis=1)
+        return moved
+
+    def move_hiders(self, actions):
+        """
+        Moves the active hiders, moves into a block, another unit or outside of the map are ignored
+        @param self:
+        @param actions: actions of every hider
+        @return:
+        """
+        targets = self.positions[self.hiders] + self.MOVES[actions]
+        inside = np.all((targets >= 0) & (targets < self.bounds), axis=1)
+        clipped = np.clip(targets, 0, self.bounds - 1)
+        target_cells = clipped[:, 0] * self.width + clipped[:, 1]
+        valid = inside & (self.current_map.flat[target_cells] == EMPTY) & (actions != STOP) & self.active
+        self.claim_tiles(np.arange(self.n_hiders), target_cells, valid)
+
+    def move_seekers(self):
+        """
+        Moves the patrolling or chasing seekers by one tile along a shortest path, with the rules of HideSeekEnv.move_enemy
+        A chasing seeker heads for the nearest hider it sees, else for the last tile where it saw one
+        @param self:
+        @return:
+        """
+        if self.enemy_behavior == "static":
+            return
+
+        seeker_cells = self.cells(self.seekers)
+        if self.enemy_behavior == "chase":
+            hider_cells = self.cells(self.hiders)
+            sees = self.visions[self.seekers][:, hider_cells]
+            distance = np.abs(self.positions[self.seekers, None, :] - self.positions[None, self.hiders, :]).sum(axis=2)
+            nearest = np.where(sees, distance, np.iinfo(np.int64).max).argmin(axis=1)
+            self.last_seen = np.where(sees.any(axis=1), hider_cells[nearest], self.last_seen)
+        self.last_seen[self.last_seen == seeker_cells] = -1
+
+        # The patrolling seekers which reached their waypoint head for the next one on the route (or for a random free tile)
+        reached = (self.waypoints < 0) | (self.waypoints == seeker_cells)
+        if len(self.patrol_route) > 1:
+            self.waypoints[reached] = self.patrol_route[self.patrol_index[reached]]
+            self.patrol_index[reached] = (self.patrol_index[reached] + 1) % len(self.patrol_route)
+        else:
+            self.waypoints[reached] = self.np_random.choice(self.free_cells, np.count_nonzero(reached))
+
+        # The first tiles of the paths are looked up in the path table of the map, for every seeker at once
+        chasing = self.last_seen >= 0
+        targets = np.where(chasing, self.last_seen, self.waypoints)
+        next_cells = self.path_table.next_steps(seeker_cells, targets)
+        unreachable = (next_cells < 0) & (targets != seeker_cells)
+        self.last_seen[unreachable & chasing] = -1
+        self.waypoints[unreachable & ~chasing] = -1
+
+        valid = next_cells >= 0
+        valid[valid] = self.current_map.flat[next_cells[valid]] == EMPTY
+        self.claim_tiles(np.arange(self.n_hiders, self.n_units), next_cells, valid)
+
+    ############################################
+    # Visions
+
+    def update_visions(self):
+        """
+        Looks up the visions of every unit in the visibility tables, and updates the memories of the units, the vision of the seekers
+        as a whole and the number of seekers seeing every hider, in one pass over the units
+        @param self:
+        @return:
+        """
+        cells = self.cells()
+        self.visions[self.hiders] = self.hider_visibility.rows(cells[self.hiders])
+        self.visions[self.seekers] = self.seeker_visibility.rows(cells[self.seekers])
+
+        self.memories |= self.visions
+        self.nb_viewed = np.count_nonzero(self.memories, axis=1)
+        self.seekers_vision = np.any(self.visions[self.seekers], axis=0)
+        self.seen_by = np.count_nonzero(self.visions[self.seekers][:, cells[self.hiders]], axis=0)
+
+    def observe(self):
+        """
+        Builds the observations of every hider: the spiral of tiles around it, the tiles it sees in the vision of the seekers being painted
+        as enemy vision (the hider does not have a complete view of the vision of the seekers), and its own tile being empty or seen
+        @param self:
+        @return: a (n_hiders, (2 * radius + 1) ** 2) int32 array
+        """
+        tiles = self.positions[self.hiders, None, :] + self.spiral[None, :, :]
+        inside = np.all((tiles >= 0) & (tiles < self.bounds), axis=2)
+        clipped = np.clip(tiles, 0, self.bounds - 1)
+        cells = clipped[..., 0] * self.width + clipped[..., 1]
+
+        centers = (self.positions[self.hiders, 0] + self.radius) * self.padded_map.shape[1] + self.positions[self.hiders, 1] + self.radius
+        observations = self.padded_map.ravel()[centers[:, None] + self.spiral_indices].astype(np.int32)
+        observations[:, 0] = EMPTY
+        seen_by_seekers = inside & np.take_along_axis(self.visions[self.hiders], cells, axis=1) & self.seekers_vision[cells]
+        observations[seen_by_seekers & (observations == EMPTY)] = ENEMY_vision
+        return observations
+
+    ############################################
+    # PettingZoo parallel API
+
+    def reset(self, seed=None, options=None):
+        """
+        Starts a new round of gameplay
+        @param self:
+        @param seed: optional seed of the placements and movements of the units
+        @param options: unused
+        @return: the observations and infos of the agents, as dictionaries
+        """
+        if seed is not None:
+            self.np_random = np.random.default_rng(seed)
+        self.agents = list(self.possible_agents)
+        self.active[:] = True
+        self.n_step = 0
+
+        self.place_units()
+        self.memories[:] = False
+        self.update_visions()
+        observations = self.observe()
+        return ({agent: observations[k] for k, agent in enumerate(self.agents)},
+                {agent: self.info(k) for k, agent in enumerate(self.agents)})
+
+    def step(self, actions):
+        """
+        Applies the actions of the agents, then moves the seekers
+        @param self:
+        @param actions: dictionary of the actions of the agents, missing agents stop
+        @return: observations, rewards, terminations, truncations and infos of the agents of the step, as dictionaries
+        """
+        hider_actions = np.full(self.n_hiders, STOP, dtype=np.int64)
+        for agent, action in actions.items():
+            if not 0 <= action <= STOP:
+                raise ValueError(f"Received invalid action={action} for {agent} which is not part of the action space")
+            hider_actions[self.agent_ids[agent]] = action
+
+        agents = self.agents
+        ids = np.array([self.agent_ids[agent] for agent in agents], dtype=np.int64)
+        terminated = (hider_actions == STOP) & self.active
+        truncated = self.n_step > 50
+
+        self.move_hiders(hider_actions)
+        self.move_seekers()
+        self.update_visions()
+        self.n_step += 1
+        rewards = np.where(self.seen_by > 0, self.SEEN_REWARD, self.HIDDEN_REWARD)
+        observations = self.observe()
+
+        self.active &= ~terminated & (not truncated)
+        self.agents = [agent for agent in agents if self.active[self.agent_ids[agent]]]
+        return ({agent: observations[k] for agent, k in zip(agents, ids)},
+                {agent: float(rewards[k]) for agent, k in zip(agents, ids)},
+                {agent: bool(terminated[k]) for agent, k in zip(agents, ids)},
+                {agent: bool(truncated) for agent in agents},
+                {agent: self.info(k) for agent, k in zip(agents, ids)})
+
+    def info(self, hider):
+        """
+        Builds the info dictionary of a hider
+        @param self:
+        @param hider: id of the hider
+        @return: the number of seekers seeing the hider, and the number of tiles it has seen since the start of the round
+        """
+        return {"seen_by": int(self.seen_by[hider]), "nb_viewed": int(self.nb_viewed[hider])}
+
+    def state(self):
+        """
+        Global state of the game
+        @param self:
+        @return: a copy of the current map, with every unit
+        """
+        return self.current_map.copy()
+
+    def render(self):
+        """
+        Prints the current map in the console, one symbol per tile, the tiles seen by the seekers being marked
+        @param self:
+        @return:
+        """
+        symbols = np.array(["", ". ", "O ", "", "X ", "Y ", "- ", ""])
+        current_map = np.where((self.current_map == EMPTY) & self.seekers_vision.reshape(self.height, self.width), ENEMY_vision,
+                               self.current_map)
+        rows = ["".join(row) for row in symbols[current_map]]
+        print("\n" + "\n".join(rows))
+        print('_' * self.width)
+
+    def close(self):
+        pass
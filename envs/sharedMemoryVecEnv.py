@@ -0,0 +1,140 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+from stable_baselines3.common.env_util import is_wrapped
+from stable_baselines3.common.vec_env import SubprocVecEnv, VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper
+
+
+def shared_memory_worker(remote, parent_remote, env_fn_wrapper, index):
+    """
+    Function run by every worker process of a SharedMemoryVecEnv: it steps one environment and writes its observations in the shared buffer
+    @param remote: end of the pipe used by the worker
+    @param parent_remote: end of the pipe used by the main process
+    @param env_fn_wrapper: wrapped function building the environment
+    @param index: index of the environment, i.e of its slot in the shared buffer
+    @return:
+    """
+    parent_remote.close()
+    env = env_fn_wrapper.var()
+    buffer = None
+    observations = None
+    while True:
+        try:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                observation, reward, terminated, truncated, info = env.step(data)
+                done = terminated or truncated
+                info["TimeLimit.truncated"] = truncated and not terminated
+                reset_info = {}
+                if done:
+                    # The final observation is sent through the pipe, the first observation of the new round goes to the buffer
+                    info["terminal_observation"] = observation
+                    observation, reset_info = env.reset()
+                observations[index] = observation
+                remote.send((reward, done, info, reset_info))
+            elif cmd == "reset":
+                maybe_options = {"options": data[1]} if data[1] else {}
+                observation, reset_info = env.reset(seed=data[0], **maybe_options)
+                observations[index] = observation
+                remote.send(reset_info)
+            elif cmd == "attach":
+                buffer = shared_memory.SharedMemory(name=data[0])
+                observations = np.ndarray(data[1], dtype=data[2], buffer=buffer.buf)
+                remote.send(None)
+            elif cmd == "render":
+                remote.send(env.render())
+            elif cmd == "close":
+                env.close()
+                observations = None
+                if buffer is not None:
+                    buffer.close()
+                remote.close()
+                break
+            elif cmd == "get_spaces":
+                remote.send((env.observation_space, env.action_space))
+            elif cmd == "env_method":
+                method = env.get_wrapper_attr(data[0])
+                remote.send(method(*data[1], **data[2]))
+            elif cmd == "get_attr":
+                remote.send(env.get_wrapper_attr(data))
+            elif cmd == "has_attr":
+                try:
+                    env.get_wrapper_attr(data)
+                    remote.send(True)
+                except AttributeError:
+                    remote.send(False)
+            elif cmd == "set_attr":
+                remote.send(setattr(env, data[0], data[1]))
+            elif cmd == "is_wrapped":
+                remote.send(is_wrapped(env, data))
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+        except (EOFError, KeyboardInterrupt):
+            break
+
+
+class SharedMemoryVecEnv(SubprocVecEnv):
+    """
+    This class is a multiprocess vectorized environment, with one environment per worker process (like SubprocVecEnv)
+    The observations are not sent through the pipes: every worker writes them in its slot of a buffer shared with the main process,
+    only rewards, dones and infos are pickled
+    It is built using : a list of functions building the environments
+                        a start method for the worker processes, "forkserver" by default when available, "spawn" otherwise
+    """
+
+    def __init__(self, env_fns, start_method=None):
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.processes = []
+        for index, (work_remote, remote, env_fn) in enumerate(zip(self.work_remotes, self.remotes, env_fns)):
+            args = (work_remote, remote, CloudpickleWrapper(env_fn), index)
+            process = ctx.Process(target=shared_memory_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.remotes[0].send(("get_spaces", None))
+        observation_space, action_space = self.remotes[0].recv()
+
+        # The shared buffer holds the last observation of every environment
+        shape = (n_envs,) + observation_space.shape
+        dtype = np.dtype(observation_space.dtype)
+        self.buffer = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        self.observations = np.ndarray(shape, dtype=dtype, buffer=self.buffer.buf)
+        for remote in self.remotes:
+            remote.send(("attach", (self.buffer.name, shape, dtype)))
+        for remote in self.remotes:
+            remote.recv()
+
+        VecEnv.__init__(self, n_envs, observation_space, action_space)
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        rewards, dones, infos, self.reset_infos = zip(*results)
+        return self.observations.copy(), np.stack(rewards), np.stack(dones), infos
+
+    def reset(self):
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(("reset", (self._seeds[env_idx], self._options[env_idx])))
+        self.reset_infos = [remote.recv() for remote in self.remotes]
+        self._reset_seeds()
+        self._reset_options()
+        return self.observations.copy()
+
+    def close(self):
+        if self.closed:
+            return
+        super(SharedMemoryVecEnv, self).close()
+        self.observations = None
+        self.buffer.close()
+        self.buffer.unlink()
@@ -1,3 +1,5 @@
+import numpy as np
+
 from misc.utils import shortest_paths, EMPTY, AGENT, ENEMY, shortest_paths_naive
 
 
@@ -5,8 +7,9 @@ class Unit:
     """
     This class represents a unit (either agent or enemy) playing the game of hide & seek
     It contains: a set of coordinates (x, y)
-                 a vision space represented as a list of tiles coordinates
-                 a "memory" of previously seen tiles represented as a list of tiles coordinates
+                 a vision space represented as a boolean mask over the map, along with the flat indices of the seen tiles
+                 a "memory" of previously seen tiles represented as a boolean mask over the map, along with the order in which the tiles were first seen
+                 (both as the rank of every tile and as the sequence of the tiles)
                  a set of points of interest to the unit
                  a variable storing the previous point of interest
                  two variables storing the previous coordinates of the unit
@@ -17,8 +20,13 @@ class Unit:
 
         self.xcoord = None
         self.ycoord = None
-        self.vision = []
-        self.previously_viewed = []
+        self.vision = np.zeros((0, 0), dtype=bool)
+        self.seen = np.zeros(0, dtype=np.int64)
+        self.vision_buffer = self.vision
+        self.previously_viewed = np.zeros((0, 0), dtype=bool)
+        self.viewed_order = np.zeros((0, 0), dtype=np.int32)
+        self.viewed_sequence = np.zeros(0, dtype=np.int64)
+        self.nb_viewed = 0
         self.interest_points = []
         self.previous_interest_points = None
 
@@ -38,30 +46,64 @@ class Unit:
         self.xcoord = x
         self.ycoord = y
 
-
-
-    def compute_vision(self, current_map, mode="naive"):
+    def reset_memory(self, shape):
+        """
+        Clears the vision and the "memory" of previously seen tiles of the unit
+        @param self:
+        @param shape: shape of the matrix map representation
+        @return:
+        """
+        self.vision = np.zeros(shape, dtype=bool)
+        self.seen = np.zeros(0, dtype=np.int64)
+        self.vision_buffer = self.vision
+        self.previously_viewed = np.zeros(shape, dtype=bool)
+        self.viewed_order = np.zeros(shape, dtype=np.int32)
+        self.viewed_sequence = np.zeros(int(np.prod(shape)), dtype=np.int64)
+        self.nb_viewed = 0
+
+    def memorize(self, seen):
+        """
+        Adds tiles to the "memory" (the previously_viewed mask) of the unit, keeping track of the order in which they are first seen
+        @param self:
+        @param seen: flat indices of the seen tiles, in the order they are seen (duplicates allowed)
+        @return:
+        """
+        new = seen[~self.previously_viewed.flat[seen]]
+        if len(new) > 0:
+            _, first_seen = np.unique(new, return_index=True)
+            new = new[np.sort(first_seen)]
+            self.previously_viewed.flat[new] = True
+            self.viewed_order.flat[new] = self.nb_viewed + np.arange(len(new))
+            self.viewed_sequence[self.nb_viewed:self.nb_viewed + len(new)] = new
+            self.nb_viewed += len(new)
+
+    def compute_vision(self, current_map, mode="naive", visibility=None):
         """
-          Computes the list of tiles currently seen by the unit, set the "vision" attribute of the unit
+          Computes the tiles currently seen by the unit, set the "vision" mask of the unit
           @param self:
           @param current_map: matrix representation of the current state of the map
           @param mode: mode representing wether the vision is estimated using a "naive" method or a more clever and expensive one
+          @param visibility: optional VisibilityEngine of the map (built with the same mode), whose precomputed lines of sight replace the path searches
           @return:
           """
         vision = []
-        len_map = len(current_map)
-        if mode == "naive":
+        height, width = current_map.shape
+        if visibility is not None:
+            # The precomputed lines of sight are evaluated against the current map, yielding the same tiles in the same order
+            seen = visibility.seen_indices(self.xcoord, self.ycoord, current_map)
+
+        elif mode == "naive":
             already_checked = []
 
             # We process every tile across the map
-            for i in range(0, len_map):
-                for j in range(0, len_map):
+            for i in range(0, height):
+                for j in range(0, width):
                     if (i, j) not in already_checked:
                         clear = True
                         path = shortest_paths_naive((self.xcoord, self.ycoord), (i, j))
                         for p in path:  # We process the path (list of tile) from the unit, to (i,j)
                             if clear:  # If there is no block between the unit and this tile
-                                if current_map[p[0]][p[1]] == EMPTY or current_map[p[0]][p[1]] == AGENT:
+                                if current_map[p[0], p[1]] == EMPTY or current_map[p[0], p[1]] == AGENT:
                                     vision.append(p)
 
                                 else:  # That tile was not empty, it is thus blocking vision of further tiles down the path
@@ -70,29 +112,38 @@ class Unit:
                             already_checked.append(p)
 
             vision.append((self.xcoord, self.ycoord))
-
-            # We also add the tile to the "memory" (the previously_viewed set of tiles)
-            for v in vision:
-                if v not in self.previously_viewed:
-                    self.previously_viewed.append(v)
-
-            self.vision = vision
-
+            seen = np.ravel_multi_index(tuple(np.array(vision).T), current_map.shape)
 
         else:
             # We process every tile across the map
-            for i in range(0, len_map):
-                for j in range(0, len_map):
+            for i in range(0, height):
+                for j in range(0, width):
                     clear = True
-                    paths = shortest_paths((self.xcoord, self.ycoord), (i, j), len_map, 5)
+                    paths = shortest_paths((self.xcoord, self.ycoord), (i, j), (height, width), 5)
                     for path in paths:
                         for p in path:  # We process the path (list of tile) from the unit, to (i,j)
                             if clear:  # If there is no block between the unit and this tile
-                                if current_map[p[0]][p[1]] == EMPTY or current_map[p[0]][p[1]] == AGENT or \
-                                        current_map[p[0]][p[1]] == ENEMY:
+                                if current_map[p[0], p[1]] == EMPTY or current_map[p[0], p[1]] == AGENT or \
+                                        current_map[p[0], p[1]] == ENEMY:
                                     vision.append(p)
 
                                 else:  # That tile was not empty, it is thus blocking vision of further tiles down
                                     # the path
                                     clear = False
-            self.vision = vision
+            seen = np.ravel_multi_index(tuple(np.array(vision, dtype=int).reshape(-1, 2).T), current_map.shape)
+
+        if self.previously_viewed.shape != current_map.shape:
+            self.reset_memory(current_map.shape)
+
+        # Only the tiles which were seen before the move are cleared from the vision mask, unless the mask was replaced meanwhile
+        if self.vision is self.vision_buffer:
+            self.vision.flat[self.seen] = False
+        else:
+            self.vision = self.vision_buffer
+            self.vision.fill(False)
+        self.seen = seen
+        self.vision.flat[seen] = True
+
+        # We also add the tiles to the "memory" (the previously_viewed set of tiles)
+        if mode == "naive":
+            self.memorize(seen)
@@ -0,0 +1,361 @@
+import numpy as np
+
+from misc.utils import shortest_paths, shortest_paths_naive, map_shape, BoundedCache, EMPTY, AGENT, ENEMY
+
+# Lines of sight only depend on the size of the map and on the position of the unit, they are shared by every map layout
+# Their size grows with the number of tiles: on large maps, only the most recently used rays are kept
+_rays_cache = BoundedCache(max_bytes=128 * 2 ** 20)
+
+
+def naive_paths(xcoord, ycoord, rows, columns, width):
+    """
+    Function computing at once the paths of shortest_paths_naive from a specific position towards several tiles
+    A path is made of diagonal steps (the vertical neighbor, the horizontal neighbor, then the diagonal neighbor) followed by straight steps
+    @param xcoord: x coordinate of the unit
+    @param ycoord: y coordinate of the unit
+    @param rows: x coordinates of the end tiles
+    @param columns: y coordinates of the end tiles
+    @param width: number of columns of the map, used to compute flat tile indices
+    @return: a (nb_ends, max_length) array of flat tile indices (padded with -1), and the length of every path
+    """
+    dx, dy = np.asarray(rows, dtype=np.int32) - xcoord, np.asarray(columns, dtype=np.int32) - ycoord
+    sx, sy = np.sign(dx)[:, None], np.sign(dy)[:, None]
+    nb_diagonal = np.minimum(np.abs(dx), np.abs(dy))[:, None]
+    vertical = (np.abs(dx) > np.abs(dy))[:, None]
+    lengths = 3 * nb_diagonal[:, 0] + np.abs(np.abs(dx) - np.abs(dy))
+
+    entries = np.arange(max(int(lengths.max(initial=0)), 1), dtype=np.int32)[None, :]
+    step, side = entries // 3, entries % 3
+    straight = entries - 3 * nb_diagonal + 1
+    diagonal = entries < 3 * nb_diagonal
+    offset_x = sx * np.where(diagonal, step + (side != 1), nb_diagonal + straight * vertical)
+    offset_y = sy * np.where(diagonal, step + (side != 0), nb_diagonal + straight * ~vertical)
+    paths = np.where(entries < lengths[:, None], (xcoord + offset_x) * width + (ycoord + offset_y), -1)
+    return paths, lengths
+
+
+def compute_rays(xcoord, ycoord, len_map, mode="naive"):
+    """
+    Function computing the "rays" followed by Unit.compute_vision from a specific position: every path of tiles that is walked, in the order it is walked
+    A tile is seen if no tile blocking the vision comes before it on one of the rays
+    @param xcoord: x coordinate of the unit
+    @param ycoord: y coordinate of the unit
+    @param len_map: shape (height, width) of the matrix map representation, or its length if the map is square
+    @param mode: "naive" or "clever", same meaning as in Unit.compute_vision
+    @return: a (nb_rays, max_ray_length) integer array of flat tile indices, padded with height * width
+    """
+    height, width = map_shape(len_map)
+    key = (mode, height, width, xcoord, ycoord)
+    if key in _rays_cache:
+        return _rays_cache[key]
+
+    nb_tiles = height * width
+    rays = []
+    if mode == "naive":
+        # The paths towards the tiles of a row are computed at once, tiles already walked by a previous path are skipped
+        already_checked = np.zeros(nb_tiles, dtype=bool)
+        for i in range(0, height):
+            columns = np.flatnonzero(~already_checked[i * width:(i + 1) * width])
+            paths, lengths = naive_paths(xcoord, ycoord, np.full(len(columns), i), columns, width)
+            for k, j in enumerate(columns):
+                if not already_checked[i * width + j] and lengths[k] > 0:
+                    ray = paths[k, :lengths[k]]
+                    rays.append(ray)
+                    already_checked[ray] = True
+    else:
+        # In clever mode, a blocked path also hides the remaining paths towards the same tile: they form a single ray
+        for i in range(0, height):
+            for j in range(0, width):
+                paths = shortest_paths((xcoord, ycoord), (i, j), (height, width), 5)
+                ray = [p[0] * width + p[1] for path in paths for p in path]
+                if len(ray) > 0:
+                    rays.append(ray)
+
+    max_length = max(len(ray) for ray in rays) if len(rays) > 0 else 1
+    padded_rays = np.full((max(len(rays), 1), max_length), nb_tiles, dtype=np.int32)
+    for k, ray in enumerate(rays):
+        padded_rays[k, :len(ray)] = ray
+
+    _rays_cache[key] = padded_rays
+    return padded_rays
+
+
+class RayTree:
+    """
+    This class represents the prefix tree of the rays followed from a specific position: rays sharing their first tiles share their first nodes
+    Nodes are numbered in depth-first order, so that the descendants of a node are the nodes following it up to the end of its subtree
+    It contains: the tile, the end of the subtree and the position of the first ray entry of every node
+                 the nodes seen on the static layout of the map, and for every tile, the position of its first seen node
+                 the tiles seen on the static layout, in the order in which they are seen
+    """
+
+    def __init__(self, rays, layout_see_through, nb_tiles):
+        super(RayTree, self).__init__()
+
+        # Nodes are created depth by depth: two rays share a node if they share its tile and the node of their previous entry
+        # Nodes of a depth get consecutive identifiers, every node keeps the first ray going through it
+        nb_rays, ray_length = rays.shape
+        node_tiles, node_parents, node_first_rays, depth_starts = [], [], [], [0]
+        ray_indices = np.arange(nb_rays)
+        ray_nodes = np.full(nb_rays, -1, dtype=np.int64)
+        for entry in range(ray_length):
+            ongoing = rays[ray_indices, entry] < nb_tiles
+            ray_indices, ray_nodes = ray_indices[ongoing], ray_nodes[ongoing]
+            if len(ray_indices) == 0:
+                break
+            tiles = rays[ray_indices, entry].astype(np.int64)
+            keys, first, inverse = np.unique((ray_nodes + 1) * (nb_tiles + 1) + tiles, return_index=True, return_inverse=True)
+            node_tiles.append(tiles[first])
+            node_parents.append(ray_nodes[first])
+            node_first_rays.append(ray_indices[first])
+            ray_nodes = depth_starts[-1] + inverse.ravel()
+            depth_starts.append(depth_starts[-1] + len(keys))
+
+        tiles = np.concatenate(node_tiles) if len(node_tiles) > 0 else np.zeros(0, dtype=np.int64)
+        parents = np.concatenate(node_parents) if len(node_parents) > 0 else np.zeros(0, dtype=np.int64)
+        first_rays = np.concatenate(node_first_rays) if len(node_first_rays) > 0 else np.zeros(0, dtype=np.int64)
+        depths = np.repeat(np.arange(len(depth_starts) - 1), np.diff(depth_starts))
+        depth_slices = [slice(depth_starts[d], depth_starts[d + 1]) for d in range(len(depth_starts) - 1)]
+        self.nb_nodes = len(tiles)
+
+        # Depth-first numbering, the children of a node being ordered by their first ray (the order in which they are created along the rays)
+        # The subtree sizes are accumulated from the deepest nodes, and every node comes after its parent and the subtrees of its previous siblings
+        sizes = np.ones(self.nb_nodes, dtype=np.int64)
+        for depth in reversed(depth_slices[1:]):
+            np.add.at(sizes, parents[depth], sizes[depth])
+        siblings = np.lexsort((first_rays, parents))
+        before = np.cumsum(sizes[siblings]) - sizes[siblings]
+        first_sibling = np.ones(self.nb_nodes, dtype=bool)
+        first_sibling[1:] = parents[siblings][1:] != parents[siblings][:-1]
+        offsets = np.empty(self.nb_nodes, dtype=np.int64)
+        offsets[siblings] = before - before[np.maximum.accumulate(np.where(first_sibling, np.arange(self.nb_nodes), 0))]
+        number = np.empty(self.nb_nodes, dtype=np.int64)
+        for d, depth in enumerate(depth_slices):
+            number[depth] = offsets[depth] if d == 0 else number[parents[depth]] + 1 + offsets[depth]
+
+        # Nodes seen on the static layout: their tile and the tiles of their ancestors do not block the vision
+        seen = layout_see_through[tiles]
+        for depth in depth_slices[1:]:
+            seen[depth] &= seen[parents[depth]]
+
+        self.tiles = np.empty(self.nb_nodes, dtype=np.int64)
+        self.tiles[number] = tiles
+        self.subtree_ends = np.empty(self.nb_nodes, dtype=np.int64)
+        self.subtree_ends[number] = number + sizes
+        self.positions = np.empty(self.nb_nodes, dtype=np.int64)
+        self.positions[number] = first_rays * ray_length + depths
+        self.seen = np.zeros(self.nb_nodes + 1, dtype=bool)
+        self.seen[number] = seen
+        self.seen_nodes = np.flatnonzero(self.seen[:-1])
+
+        # First position of every tile among the seen nodes, and tiles seen on the static layout in the order in which they are seen
+        self.unseen_position = rays.size
+        seen_tiles = self.tiles[self.seen_nodes]
+        self.first_positions = np.full(nb_tiles, self.unseen_position, dtype=np.int64)
+        np.minimum.at(self.first_positions, seen_tiles, self.positions[self.seen_nodes])
+        self.static_order = np.argsort(self.first_positions, kind="stable")[:len(np.unique(seen_tiles))]
+
+        # Seen nodes of the tiles of static_order, one row per tile, padded with the extra (never seen) node
+        ranks = np.empty(nb_tiles, dtype=np.int64)
+        ranks[self.static_order] = np.arange(len(self.static_order))
+        node_ranks = ranks[seen_tiles]
+        by_rank = np.argsort(node_ranks, kind="stable")
+        counts = np.bincount(node_ranks, minlength=len(self.static_order))
+        columns = np.arange(len(by_rank)) - np.repeat(np.cumsum(counts) - counts, counts)
+        self.static_tile_nodes = np.full((len(self.static_order), counts.max(initial=0)), self.nb_nodes, dtype=np.int64)
+        self.static_tile_nodes[node_ranks[by_rank], columns] = self.seen_nodes[by_rank]
+        self.padded_positions = np.append(self.positions, self.unseen_position)
+
+
+class VisibilityEngine:
+    """
+    This class is a line-of-sight engine for a specific map layout
+    It precomputes, for every tile of the map, the tiles that can be seen from it (stored as packed bitsets, one row per tile)
+    Vision can then either be looked up in that table (static layout), or evaluated against the current map (dynamic blocking tiles)
+    The mode is either "naive" or "clever", with the same semantics as in Unit.compute_vision
+    In incremental mode (naive only), the vision on the current map is derived from the vision on the static layout: only the
+    tiles behind units, enemy vision or interest points (which block the vision but are not part of the layout) are re-evaluated
+    The prefix trees used by incremental evaluations are kept up to max_cache_bytes, the least recently used ones being dropped beyond
+    """
+
+    def __init__(self, layout, mode="naive", incremental=True, max_cache_bytes=2 ** 30):
+        super(VisibilityEngine, self).__init__()
+
+        self.layout = np.asarray(layout)
+        self.mode = mode
+        self.height, self.width = self.layout.shape
+        self.nb_tiles = self.height * self.width
+
+        # Tiles that do not block the vision, depending on the mode
+        if mode == "naive":
+            self.see_through = np.array([EMPTY, AGENT])
+        else:
+            self.see_through = np.array([EMPTY, AGENT, ENEMY])
+
+        # Table of visibility, one packed row per tile, computed lazily (or all at once with precompute)
+        self.table = np.zeros((self.nb_tiles, (self.nb_tiles + 7) // 8), dtype=np.uint8)
+        self.computed = np.zeros(self.nb_tiles, dtype=bool)
+        self.layout_see_through = self.see_through_mask(self.layout)
+
+        # Prefix trees of the rays of every tile, computed lazily for incremental evaluations
+        self.incremental = incremental and mode == "naive"
+        self.trees = BoundedCache(max_cache_bytes)
+        self.see_through_table = np.zeros(256, dtype=bool)
+        self.see_through_table[self.see_through] = True
+
+    def see_through_mask(self, current_map):
+        """
+        Computes which tiles do not block the vision, with an extra padding tile at the end
+        @param self:
+        @param current_map: matrix representation of the map
+        @return: a flat boolean array of size nb_tiles + 1
+        """
+        return np.append(np.isin(current_map, self.see_through).ravel(), True)
+
+    def visible_entries(self, xcoord, ycoord, see_through):
+        """
+        Evaluates the rays from a position against a set of tiles not blocking the vision
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @param see_through: flat boolean array, as returned by see_through_mask
+        @return: the flat indices of the seen tiles, in the order they are seen (with duplicates)
+        """
+        rays = compute_rays(xcoord, ycoord, self.layout.shape, self.mode)
+        visible = np.logical_and.accumulate(see_through[rays], axis=1)
+        seen = rays[visible]
+        seen = seen[seen < self.nb_tiles]
+        if self.mode == "naive":
+            seen = np.append(seen, xcoord * self.width + ycoord)
+        return seen
+
+    def row(self, xcoord, ycoord):
+        """
+        Retrieves the precomputed visibility of a tile on the static layout
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @return: a (height, width) boolean mask of the tiles seen from (xcoord, ycoord)
+        """
+        index = xcoord * self.width + ycoord
+        if not self.computed[index]:
+            seen = np.zeros(self.nb_tiles, dtype=bool)
+            seen[self.visible_entries(xcoord, ycoord, self.layout_see_through)] = True
+            self.table[index] = np.packbits(seen)
+            self.computed[index] = True
+        return np.unpackbits(self.table[index], count=self.nb_tiles).view(bool).reshape(self.height, self.width)
+
+    def precompute(self):
+        """
+        Fills the whole visibility table of the layout
+        @param self:
+        @return: the packed table, of shape (nb_tiles, ceil(nb_tiles / 8))
+        """
+        for i in range(0, self.height):
+            for j in range(0, self.width):
+                self.row(i, j)
+        return self.table
+
+    def rows(self, cells):
+        """
+        Retrieves the precomputed visibility of several tiles on the static layout at once, computing the missing rows first
+        @param self:
+        @param cells: flat indices of the tiles
+        @return: a (len(cells), nb_tiles) boolean array, one flat mask per tile
+        """
+        missing = cells[~self.computed[cells]]
+        if len(missing) > 0:
+            for cell in np.unique(missing):
+                self.row(*divmod(int(cell), self.width))
+        return np.unpackbits(self.table[cells], axis=1, count=self.nb_tiles).view(bool)
+
+    def load_rows(self, table, cells):
+        """
+        Fills rows of the visibility table from precomputed packed rows of the same layout (e.g. a table of the vision cache)
+        @param self:
+        @param table: packed table, of shape (nb_tiles, ceil(nb_tiles / 8))
+        @param cells: flat indices of the tiles whose rows are read from the table
+        @return:
+        """
+        self.table[cells] = table[cells]
+        self.computed[cells] = True
+
+    def ray_tree(self, xcoord, ycoord):
+        """
+        Retrieves the prefix tree of the rays from a position
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @return: a RayTree
+        """
+        index = xcoord * self.width + ycoord
+        if index not in self.trees:
+            tree = RayTree(compute_rays(xcoord, ycoord, self.layout.shape, self.mode), self.layout_see_through, self.nb_tiles)
+            tree.seen_rows, tree.seen_columns = np.divmod(tree.tiles[tree.seen_nodes], self.width)
+            self.trees[index] = tree
+        return self.trees[index]
+
+    def seen_indices_incremental(self, xcoord, ycoord, current_map):
+        """
+        Computes the tiles seen from a position, evaluated against the current map, starting from the vision on the static layout
+        Only the subtrees of rays hidden by tiles blocking the vision on the current map (and not on the layout) are re-evaluated
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @param current_map: current matrix representation of the map
+        @return: the flat indices of the seen tiles, without duplicates, in the order they are first seen
+        """
+        tree = self.ray_tree(xcoord, ycoord)
+        source = xcoord * self.width + ycoord
+
+        # Tiles seen on the layout which now block the vision
+        blocked = ~self.see_through_table[current_map[tree.seen_rows, tree.seen_columns]]
+        if not blocked.any():
+            return np.append(tree.static_order, source)
+
+        # Nodes in the subtrees of blocking nodes are hidden (difference array over the preorder numbering)
+        blocking_nodes = tree.seen_nodes[blocked]
+        delta = np.zeros(tree.nb_nodes + 1, dtype=np.int64)
+        np.add.at(delta, blocking_nodes, 1)
+        np.add.at(delta, tree.subtree_ends[blocking_nodes], -1)
+        visible = tree.seen & (np.cumsum(delta) == 0)
+        visible[-1] = False
+
+        # The tiles of hidden nodes are either not seen anymore, or first seen later, from another node
+        nodes = tree.static_tile_nodes
+        positions = np.where(visible[nodes], tree.padded_positions[nodes], tree.unseen_position).min(axis=1)
+        seen = tree.static_order[positions < tree.unseen_position]
+        seen = seen[np.argsort(positions[positions < tree.unseen_position], kind="stable")]
+        return np.append(seen, source)
+
+    def seen_indices(self, xcoord, ycoord, current_map):
+        """
+        Computes the tiles seen from a position, evaluated against the current map
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @param current_map: current matrix representation of the map
+        @return: the flat indices of the seen tiles, without duplicates, in the order they are first seen
+        """
+        if self.incremental:
+            return self.seen_indices_incremental(xcoord, ycoord, current_map)
+
+        seen = self.visible_entries(xcoord, ycoord, self.see_through_mask(current_map))
+        _, first_seen = np.unique(seen, return_index=True)
+        return seen[np.sort(first_seen)]
+
+    def vision_mask(self, xcoord, ycoord, current_map=None):
+        """
+        Computes the mask of the tiles seen from a position
+        @param self:
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @param current_map: current matrix representation of the map. If None, the vision is looked up in the table of the static layout
+        @return: a (height, width) boolean mask
+        """
+        if current_map is None:
+            return self.row(xcoord, ycoord)
+
+        mask = np.zeros(self.nb_tiles, dtype=bool)
+        mask[self.seen_indices(xcoord, ycoord, current_map)] = True
+        return mask.reshape(self.height, self.width)
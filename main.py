@@ -1,8 +1,5 @@
 import argparse
 
-from scripts.eval import evaluate
-from scripts.train import train
-
 if __name__ == '__main__':
     argParser = argparse.ArgumentParser()
     argParser.add_argument("-env", "--environment", type=str,
@@ -12,15 +9,20 @@ if __name__ == '__main__':
                            required=True, choices=["train", "eval"])
     argParser.add_argument("-pmodel", "--path_model", type=str, help="Filepath in which to save the model for training OR load the model for eval",
                            required=True)
-    argParser.add_argument("-pmap", "--path_map", type=str, help="Filepath in which to find the map", required=True)
+    argParser.add_argument("-pmap", "--path_map", type=str, help="Filepath in which to find the map, or directory of maps / map pack of maps of the same size "
+                                                                     "(a map being drawn at every round of gameplay)", required=True)
     argParser.add_argument("-ap", "--agent_placement", type=str, help="Type of placement for the agent: static, random",
                            choices=["static", "random"], default="static")
     argParser.add_argument("-ep", "--enemy_placement", type=str,
                            help="Type of placement for the enemy: static, moves, random",
                            choices=["static", "moves", "random"], default="static")
+    argParser.add_argument("-eb", "--enemy_behavior", type=str,
+                           help="Behavior of the enemy during a round: static, patrol (walks along the enemy positions of the map), "
+                                "chase (patrols, and heads for the last position where he saw the agent)",
+                           choices=["static", "patrol", "chase"], default="static")
     argParser.add_argument("-lg", "--logs", type=bool, help="Boolean indicating if logs are required, True or False",
                            choices=[True, False], default=False)
-    argParser.add_argument("-llr", "--learn_lr", type=str, help="Learning rate, default is 0.0001", default="0.0001")
+    argParser.add_argument("-llr", "--learn_lr", type=float, help="Learning rate, default is 0.0001", default=0.0001)
     argParser.add_argument("-lts", "--learn_timesteps", type=int,
                            help="Number of timestep to train for, default is 1000000", default=700000)
     argParser.add_argument("-lls", "--learn_learnstart", type=int,
@@ -28,11 +30,18 @@ if __name__ == '__main__':
     argParser.add_argument("-lef", "--learn_exploration", type=int,
                            help="Fraction of total timesteps for which randomness of action is applied", default=0.20)
     argParser.add_argument("-o", "--opti", type=bool,
-                           help="Defines if optimization is activated for training and evaluation. /!\ CAREFULL /!\ Available only for the original maps within the project",
+                           help="Defines if optimization is activated for training and evaluation: enemy visions are cached on disk (data/vision_cache) for any map, "
+                                "see scripts/precompute_visions.py to fill the cache for every enemy position beforehand",
                            default=False)
     argParser.add_argument("-mf", "--mode_vision", type=str,
                            help="For the field environment, defines if the vision is static or dynamic",
                            choices=["static", "dynamic"], default="dynamic")
+    argParser.add_argument("-us", "--upscale", type=int,
+                           help="For the field environment, number of pixels on each side of a tile in the image",
+                           default=3)
+    argParser.add_argument("-sr", "--spiral_radius", type=int,
+                           help="For the spiral environment, number of tiles seen on each side of the agent",
+                           default=4)
     argParser.add_argument("-meval", "--mode_eval", type=str,
                            help="Type of evaluation, either visual or metric-based",
                            choices=["visual", "metrics"], default="visual")
@@ -42,9 +51,23 @@ if __name__ == '__main__':
     argParser.add_argument("-v", "--verbose", type=bool,
                            help="Activate the verbose mode or not. Verbose prints each step of the model, non-verbose prints the last one",
                            default=False)
+    argParser.add_argument("-ne", "--n_envs", type=int,
+                           help="For training, number of environments, each one stepped in its own worker process",
+                           default=1)
+    argParser.add_argument("-be", "--batched_envs", type=int,
+                           help="For training, number of games stepped at once by the batched engine, 0 uses a single environment",
+                           default=0)
+    argParser.add_argument("-pt", "--profile_trace", type=str,
+                           help="Filepath in which to save a Chrome trace of the phases of the steps (single environment only), no profiling if empty",
+                           default="")
+    argParser.add_argument("-ps", "--profile_steps", type=int,
+                           help="Number of steps kept in the Chrome trace, from the first one", default=200)
     args = argParser.parse_args()
 
+    # Training and evaluation depend on stable baselines 3 (and torch), they are only imported once the arguments are parsed
     if args.action == "train":
+        from scripts.train import train
         train(args)
     else:
+        from scripts.eval import evaluate
         evaluate(args)
@@ -0,0 +1,264 @@
+import numpy as np
+
+from misc.utils import BLOCK, BoundedCache
+
+# Neighbors (top, bottom, left, right) in the order in which find_path_to_nearest and find_path_to_not_yet_seen check them
+NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def count_adjacent_blocks(layout, block=BLOCK):
+    """
+    Function counting, for every tile, the number of adjacent blocks (the map is shifted in the four directions)
+    @param layout: matrix representation of the map
+    @param block: type of tile counted
+    @return: a uint8 array of the shape of the map
+    """
+    layout = np.asarray(layout)
+    blocks = (layout == block).astype(np.uint8)
+    count = np.zeros(layout.shape, dtype=np.uint8)
+    count[1:, :] += blocks[:-1, :]
+    count[:-1, :] += blocks[1:, :]
+    count[:, 1:] += blocks[:, :-1]
+    count[:, :-1] += blocks[:, 1:]
+    return count
+
+
+class InterestPointEngine:
+    """
+    This class answers the searches made by HideSeekEnv.compute_interest_points, using structures computed once per map layout
+    It contains: the discovery order of the breadth-first searches of find_path_to_nearest and find_path_to_not_yet_seen, for every
+                 starting tile: blocks never move, so a search always checks the tiles in the same order until it meets a target
+                 the number of blocks adjacent to every tile, and the tiles adjacent to several blocks ("good places to hide")
+                 the hiding spots already seen by a unit, in the order in which they were first seen, extended as the unit sees new tiles
+                 the nearest block of every tile (a Euclidean distance transform of the blocks), along with its distance
+                 the free tiles next to every block where a unit prefers to hide, depending on the position of the enemy
+    Discovery orders are kept up to max_cache_bytes, the least recently used ones being dropped beyond
+    """
+
+    def __init__(self, layout, to_avoid=BLOCK, max_cache_bytes=2 ** 28):
+        super(InterestPointEngine, self).__init__()
+
+        self.layout = np.asarray(layout)
+        self.height, self.width = self.layout.shape
+        self.walkable = (self.layout != to_avoid)
+
+        # Discovery orders of the breadth-first searches, computed lazily for every starting tile
+        self.orders = BoundedCache(max_cache_bytes)
+
+        # Number of blocks adjacent to every tile, and sorted flat indices of the tiles adjacent to several blocks
+        self.adjacent_blocks = count_adjacent_blocks(self.layout, to_avoid)
+        self.hiding_spots = (self.adjacent_blocks > 1).ravel()
+        self.hiding_spot_indices = np.flatnonzero(self.hiding_spots)
+
+        # Nearest block and preferred tiles next to blocks, the blocks being listed in row-major order
+        self.blocks = np.argwhere(self.layout == to_avoid)
+        self.nearest_block_distance, self.nearest_blocks = self.compute_nearest_blocks()
+        self.preferred_tiles = self.compute_preferred_tiles()
+
+        # Hiding spots seen by the unit whose memory is being followed
+        self.viewed_sequence = None
+        self.nb_processed = 0
+        self.viewed_spots = np.zeros(0, dtype=np.int64)
+
+    def compute_nearest_blocks(self, max_distance=100):
+        """
+        Computes the nearest block of every tile, the first block (in row-major order) being kept among the nearest ones
+        Distances are computed like HideSeekEnv.look_for_nearest_block does, one row of tiles at a time
+        @param self:
+        @param max_distance: distance under which blocks are looked for
+        @return: a (height, width) array of distances (max_distance if there is no block nearer), and a (height, width, 2) array
+                 of block coordinates (-1 if there is no block nearer)
+        """
+        distances = np.full(self.layout.shape, max_distance, dtype=np.float64)
+        nearest_blocks = np.full(self.layout.shape + (2,), -1, dtype=np.int64)
+        if len(self.blocks) == 0:
+            return distances, nearest_blocks
+
+        columns = np.arange(self.width)
+        for row in range(self.height):
+            row_distances = np.sqrt((row - self.blocks[None, :, 0]) ** 2 + (columns[:, None] - self.blocks[None, :, 1]) ** 2)
+            nearest = np.argmin(row_distances, axis=1)
+            nearest_distances = row_distances[columns, nearest]
+            found = nearest_distances < max_distance
+            distances[row, found] = nearest_distances[found]
+            nearest_blocks[row, found] = self.blocks[nearest[found]]
+        return distances, nearest_blocks
+
+    def compute_preferred_tiles(self):
+        """
+        Computes, for every block and every position of the enemy relative to the unit, the two tiles next to the block where the unit
+        prefers to hide, in the order of HideSeekEnv.find_appropriate_tile_next_to_block: the tile on the side opposite to the enemy
+        along the axis where the enemy is the farthest first, then the tile on the side opposite to the enemy along the other axis
+        @param self:
+        @return: a (height * width, 8, 2) array of flat tile indices (-1 if the tile is out of the map), indexed by the block and by
+                 relative_position(): 4 * (enemy farther on the x axis) + 2 * (unit below the enemy) + (unit right of the enemy)
+        """
+        rows, columns = np.divmod(np.arange(self.height * self.width), self.width)
+
+        def tile(x, y, inside):
+            return np.where(inside, x * self.width + y, -1)
+
+        # The bounds on the tiles above and left of the block are not the same depending on the branch taken in the original function
+        below = tile(rows + 1, columns, rows + 1 < self.height)
+        right = tile(rows, columns + 1, columns + 1 < self.width)
+        above, above_strict = tile(rows - 1, columns, rows > 0), tile(rows - 1, columns, rows - 1 > 0)
+        left, left_strict = tile(rows, columns - 1, columns > 0), tile(rows, columns - 1, columns - 1 > 0)
+
+        preferred_tiles = np.full((self.height * self.width, 8, 2), -1, dtype=np.int64)
+        for position in range(8):
+            x_axis, below_enemy, right_of_enemy = position >> 2, (position >> 1) & 1, position & 1
+            if x_axis:
+                preferred_tiles[:, position, 0] = below if below_enemy else above
+                preferred_tiles[:, position, 1] = right if right_of_enemy else left_strict
+            else:
+                preferred_tiles[:, position, 0] = right if right_of_enemy else left
+                preferred_tiles[:, position, 1] = below if below_enemy else above_strict
+        return preferred_tiles
+
+    def relative_position(self, unit, enemy):
+        """
+        Computes the index of the position of the enemy relative to a unit, used to look up the preferred tiles next to blocks
+        @param self:
+        @param unit: Unit hiding
+        @param enemy: Unit seeking
+        @return: an integer between 0 and 7
+        """
+        x_axis = abs(unit.xcoord - enemy.xcoord) > abs(unit.ycoord - enemy.ycoord)
+        return 4 * x_axis + 2 * (unit.xcoord > enemy.xcoord) + (unit.ycoord > enemy.ycoord)
+
+    def nearest_block(self, xcoord, ycoord):
+        """
+        Retrieves the nearest block of a tile
+        @param self:
+        @param xcoord: x coordinate of the tile
+        @param ycoord: y coordinate of the tile
+        @return: the distance to the block and the pair of coordinates of the block, (None, None) if there is no block nearer than 100
+        """
+        nearest_x, nearest_y = self.nearest_blocks[xcoord, ycoord]
+        if nearest_x < 0:
+            return self.nearest_block_distance[xcoord, ycoord], (None, None)
+        return self.nearest_block_distance[xcoord, ycoord], (nearest_x, nearest_y)
+
+    def appropriate_tile_next_to_block(self, block, unit, enemy, current_map, type_tile):
+        """
+        Retrieves the first preferred tile next to a block which is of type type_tile, according to the position of the enemy
+        @param self:
+        @param block: pair of coordinates of the block
+        @param unit: Unit hiding
+        @param enemy: Unit seeking
+        @param current_map: current matrix map representation
+        @param type_tile: type of tile to look for
+        @return: the pair of coordinates of the tile, (0, 0) if no tile is appropriate
+        """
+        for tile in self.preferred_tiles[block[0] * self.width + block[1], self.relative_position(unit, enemy)]:
+            if tile >= 0:
+                x, y = divmod(int(tile), self.width)
+                if current_map[x, y] == type_tile:
+                    return x, y
+        return 0, 0
+
+    def discovery_order(self, xcoord, ycoord):
+        """
+        Computes the order in which the breadth-first search from a tile checks the other tiles for the first time
+        Tiles are processed in the order in which they are discovered, their neighbors being checked in the order top, bottom, left, right
+        The starting tile is checked too, when its first neighbor is processed
+        @param self:
+        @param xcoord: x coordinate of the starting tile
+        @param ycoord: y coordinate of the starting tile
+        @return: the rows and the columns of the checked tiles, in the order of their first check
+        """
+        if (xcoord, ycoord) in self.orders:
+            return self.orders[(xcoord, ycoord)]
+
+        checked = np.zeros(self.layout.shape, dtype=bool)
+        visited = np.zeros(self.layout.shape, dtype=bool)
+        visited[xcoord, ycoord] = True
+        queue = [(xcoord, ycoord)]
+        order = []
+        for i, j in queue:
+            for dx, dy in NEIGHBORS:
+                x, y = i + dx, j + dy
+                if 0 <= x < self.height and 0 <= y < self.width and self.walkable[x, y]:
+                    if not checked[x, y]:
+                        checked[x, y] = True
+                        order.append((x, y))
+                    if not visited[x, y]:
+                        visited[x, y] = True
+                        queue.append((x, y))
+
+        order = np.array(order, dtype=np.int64).reshape(-1, 2)
+        self.orders[(xcoord, ycoord)] = (order[:, 0], order[:, 1])
+        return self.orders[(xcoord, ycoord)]
+
+    def first_hit(self, rows, columns, hits):
+        """
+        Retrieves the first tile of a sequence which is a hit
+        @param self:
+        @param rows: rows of the tiles of the sequence
+        @param columns: columns of the tiles of the sequence
+        @param hits: boolean array, True for the tiles of the sequence which are hits
+        @return: the pair of coordinates of the first hit, or None if there is none
+        """
+        if not hits.any():
+            return None
+        first = np.argmax(hits)
+        return int(rows[first]), int(columns[first])
+
+    def first_target(self, xcoord, ycoord, targets):
+        """
+        Retrieves the first target tile met by the breadth-first search from a tile
+        @param self:
+        @param xcoord: x coordinate of the starting tile
+        @param ycoord: y coordinate of the starting tile
+        @param targets: boolean mask of the target tiles
+        @return: the pair of coordinates of the target, or None if the search meets no target
+        """
+        rows, columns = self.discovery_order(xcoord, ycoord)
+        return self.first_hit(rows, columns, targets[rows, columns])
+
+    def nearest_tile(self, xcoord, ycoord, current_map, type_tile):
+        """
+        Same as find_path_to_nearest: retrieves the tile of type type_tile which is met first by the search from a tile
+        @param self:
+        @param xcoord: x coordinate from which to start searching
+        @param ycoord: y coordinate from which to start searching
+        @param current_map: current matrix map representation
+        @param type_tile: type of tile to look for
+        @return: the pair of coordinates of the tile, or None if there is none
+        """
+        rows, columns = self.discovery_order(xcoord, ycoord)
+        return self.first_hit(rows, columns, current_map[rows, columns] == type_tile)
+
+    def nearest_not_yet_seen(self, xcoord, ycoord, previously_viewed):
+        """
+        Same as find_path_to_not_yet_seen: retrieves the tile not seen yet which is met first by the search from a tile
+        @param self:
+        @param xcoord: x coordinate from which to start searching
+        @param ycoord: y coordinate from which to start searching
+        @param previously_viewed: boolean mask of the tiles that the unit has already seen
+        @return: the pair of coordinates of the tile, or None if there is none
+        """
+        return self.first_target(xcoord, ycoord, ~previously_viewed)
+
+    def first_viewed_hiding_spot(self, unit, current_map, type_tile):
+        """
+        Retrieves the first hiding spot (tile adjacent to several blocks) of type type_tile, in the order in which the unit first saw them
+        The hiding spots seen by the unit are extended with the tiles seen since the last call, and cleared when the memory of the unit is reset
+        @param self:
+        @param unit: Unit whose memory is looked up
+        @param current_map: current matrix map representation
+        @param type_tile: type of tile to look for
+        @return: the pair of coordinates of the hiding spot, or None if there is none
+        """
+        if unit.viewed_sequence is not self.viewed_sequence:
+            self.viewed_sequence = unit.viewed_sequence
+            self.nb_processed = 0
+            self.viewed_spots = np.zeros(0, dtype=np.int64)
+
+        if unit.nb_viewed > self.nb_processed:
+            new = self.viewed_sequence[self.nb_processed:unit.nb_viewed]
+            self.viewed_spots = np.append(self.viewed_spots, new[self.hiding_spots[new]])
+            self.nb_processed = unit.nb_viewed
+
+        rows, columns = np.divmod(self.viewed_spots, self.width)
+        return self.first_hit(rows, columns, current_map[rows, columns] == type_tile)
@@ -0,0 +1,220 @@
+import numpy as np
+
+from misc.utils import BLOCK, BoundedCache
+
+# Moves (up, down, left, right) in the order in which ties between equally short paths are broken
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class PathTable:
+    """
+    This class stores all-pairs shortest paths of a map layout, whose blocks never change during a game
+    It contains: a distance matrix, distance[start, end] being the number of moves from start to end (-1 if unreachable)
+                 a next-hop table, next_hop[start, end] being the first tile to move to from start in order to reach end (-1 if none)
+    Both tables are indexed by flat tile indices (x * width + y) and are built with a breadth-first search from every free tile
+    Their size grows with the square of the number of tiles: on maps of more than max_eager_tiles tiles, the column of an end tile (the distances
+    and first moves of every start towards it) is only computed the first time a path towards that tile is looked up, and kept up to max_cache_bytes
+    When exact_ties is activated, ties between equally short paths are resolved while the next-hops are computed, like shortest_paths_expensive would
+    (its A* search explores tiles by increasing distance plus Manhattan heuristic, the first inserted tile winning ties): otherwise the first
+    candidate move in MOVES order is kept
+    """
+
+    def __init__(self, layout, to_avoid=BLOCK, exact_ties=True, max_eager_tiles=1024, max_cache_bytes=2 ** 28):
+        super(PathTable, self).__init__()
+
+        self.layout = np.asarray(layout)
+        self.height, self.width = self.layout.shape
+        self.nb_tiles = self.height * self.width
+        self.to_avoid = to_avoid
+        self.exact_ties = exact_ties
+        self.free = (self.layout != to_avoid)
+        self.distance_type = np.int16 if self.nb_tiles <= np.iinfo(np.int16).max else np.int32
+
+        # All-pairs tables if the map is small enough (or if max_eager_tiles is None), else columns computed lazily, keyed by end tile
+        self.eager = max_eager_tiles is None or self.nb_tiles <= max_eager_tiles
+        self.columns = BoundedCache(max_cache_bytes)
+        if self.eager:
+            self.distance = self.compute_distances(np.arange(self.nb_tiles))
+            # Tables are indexed by [start, end]
+            self.next_hop = self.compute_next_hops(self.distance, np.arange(self.nb_tiles)).T.copy()
+
+    def compute_distances(self, sources):
+        """
+        Runs a breadth-first search from several tiles at once, one frontier per source tile
+        @param self:
+        @param sources: flat indices of the source tiles
+        @return: a (len(sources), nb_tiles) distance matrix (-1 for unreachable tiles, and for every tile if the source is not free)
+        """
+        nb_sources = len(sources)
+        distance = np.full((nb_sources, self.height, self.width), -1, dtype=self.distance_type)
+        frontier = np.zeros((nb_sources, self.height, self.width), dtype=bool)
+        frontier.reshape(nb_sources, self.nb_tiles)[np.arange(nb_sources), sources] = self.free.ravel()[sources]
+        reached = frontier.copy()
+
+        step = 0
+        while frontier.any():
+            distance[frontier] = step
+            step += 1
+            next_frontier = np.zeros_like(frontier)
+            next_frontier[:, 1:, :] |= frontier[:, :-1, :]
+            next_frontier[:, :-1, :] |= frontier[:, 1:, :]
+            next_frontier[:, :, 1:] |= frontier[:, :, :-1]
+            next_frontier[:, :, :-1] |= frontier[:, :, 1:]
+            frontier = next_frontier & self.free & ~reached
+            reached |= frontier
+
+        return distance.reshape(nb_sources, self.nb_tiles)
+
+    def compute_next_hops(self, distance_to, ends):
+        """
+        Computes, for some end tiles and every start tile, the first move of a shortest path from the start to the end
+        @param self:
+        @param distance_to: (nb_ends, nb_tiles) distance matrix, distance_to[end, start] being the distance from start to end
+        @param ends: flat indices of the end tiles
+        @return: a (nb_ends, nb_tiles) int32 next-hop table
+        """
+        if self.exact_ties:
+            return self.compute_exact_next_hops(distance_to, ends)
+
+        nb_ends = len(distance_to)
+        distance_to = distance_to.reshape(nb_ends, self.height, self.width)
+        next_hop = np.full((nb_ends, self.height, self.width), -1, dtype=np.int32)
+        tiles = np.arange(self.nb_tiles).reshape(self.height, self.width)
+
+        for dx, dy in MOVES:
+            # Distance from the neighbor (x + dx, y + dy) of every tile (x, y) to every end
+            neighbor_distance = np.full_like(distance_to, -1)
+            neighbor_tiles = np.full_like(tiles, -1)
+            xs = slice(max(dx, 0), self.height + min(dx, 0))
+            ys = slice(max(dy, 0), self.width + min(dy, 0))
+            xd = slice(max(-dx, 0), self.height + min(-dx, 0))
+            yd = slice(max(-dy, 0), self.width + min(-dy, 0))
+            neighbor_distance[:, xd, yd] = distance_to[:, xs, ys]
+            neighbor_tiles[xd, yd] = tiles[xs, ys]
+
+            closer = (distance_to > 0) & (neighbor_distance == distance_to - 1) & (next_hop < 0)
+            next_hop[closer] = np.broadcast_to(neighbor_tiles, closer.shape)[closer]
+
+        return next_hop.reshape(nb_ends, self.nb_tiles)
+
+    def compute_exact_next_hops(self, distance_to, ends):
+        """
+        Computes the next-hop table picking, among equally short paths, the one found by the A* search of shortest_paths_expensive
+        Towards an end, the A* search pops tiles by increasing distance, and among them the tiles inserted first, i.e. reached from the tile popped
+        first, or from the same tile but further from the end (the Manhattan distance of a tile is one more or one less than the one of its neighbor)
+        Pairs (end, start) are thus ranked layer by layer, by increasing distance to the end: the next hop of a start is its best ranked neighbor
+        of the previous layer, the first one in MOVES order winning the remaining ties
+        @param self:
+        @param distance_to: (nb_ends, nb_tiles) distance matrix, distance_to[end, start] being the distance from start to end
+        @param ends: flat indices of the end tiles
+        @return: a (nb_ends, nb_tiles) int32 next-hop table
+        """
+        nb_ends = len(distance_to)
+        distance = distance_to.ravel()
+        next_hop = np.full(distance.shape, -1, dtype=np.int32)
+        # Rank of the pairs in the order of the A* search, within their layer (the end tiles are ranked 0)
+        rank = np.zeros(distance.shape, dtype=np.int64)
+        end_xs, end_ys = np.divmod(np.asarray(ends), self.width)
+
+        # Pairs sorted by distance, the pairs of a layer being contiguous
+        order = np.argsort(distance, kind="stable")
+        bounds = np.searchsorted(distance[order], np.arange(1, int(distance.max(initial=0)) + 2))
+        for layer in range(1, len(bounds)):
+            pairs = order[bounds[layer - 1]:bounds[layer]]
+            end_of_pairs, tiles = np.divmod(pairs, self.nb_tiles)
+            xs, ys = np.divmod(tiles, self.width)
+            manhattan = np.abs(xs - end_xs[end_of_pairs]) + np.abs(ys - end_ys[end_of_pairs])
+
+            best = np.full(len(pairs), -1, dtype=np.int64)
+            for dx, dy in MOVES:
+                neighbor_xs, neighbor_ys = xs + dx, ys + dy
+                inside = (neighbor_xs >= 0) & (neighbor_xs < self.height) & (neighbor_ys >= 0) & (neighbor_ys < self.width)
+                neighbor_tiles = np.where(inside, neighbor_xs * self.width + neighbor_ys, tiles)
+                neighbors = end_of_pairs * self.nb_tiles + neighbor_tiles
+                further = (np.abs(neighbor_xs - end_xs[end_of_pairs]) + np.abs(neighbor_ys - end_ys[end_of_pairs])) > manhattan
+                key = 2 * rank[neighbors] + further
+                better = inside & (distance[neighbors] == layer - 1) & (key > best)
+                best[better] = key[better]
+                next_hop[pairs[better]] = neighbor_tiles[better]
+
+            # Dense rank of the keys, per end tile
+            combined = end_of_pairs * (best.max() + 1) + best
+            unique, inverse = np.unique(combined, return_inverse=True)
+            rank[pairs] = inverse.ravel() - np.searchsorted(unique, end_of_pairs * (best.max() + 1))
+
+        return next_hop.reshape(nb_ends, self.nb_tiles)
+
+    def column(self, end_index):
+        """
+        Retrieves the distances and first moves of every start tile towards an end tile, computing them if needed
+        @param self:
+        @param end_index: flat index of the end tile
+        @return: the distance and next-hop arrays of the end tile, indexed by start tile (views on the tables if they are eager)
+        """
+        if self.eager:
+            return self.distance[:, end_index], self.next_hop[:, end_index]
+
+        if end_index not in self.columns:
+            # The distance matrix is symmetric: the distances from the end tile are the distances towards it
+            distance = self.compute_distances(np.array([end_index]))
+            next_hop = self.compute_next_hops(distance, np.array([end_index]))
+            self.columns[end_index] = (distance[0], next_hop[0])
+        return self.columns[end_index]
+
+    def path_distance(self, start, end):
+        """
+        Retrieves the number of moves of a shortest path between two tiles
+        @param self:
+        @param start: pair of coordinates from where to start the path
+        @param end: pair of coordinates where to end the path
+        @return: the number of moves, -1 if end cannot be reached from start
+        """
+        distance, _ = self.column(end[0] * self.width + end[1])
+        return int(distance[start[0] * self.width + start[1]])
+
+    def next_step(self, start, end):
+        """
+        Retrieves the first tile to move to in order to get closer to a tile
+        @param self:
+        @param start: pair of coordinates from where to start the path
+        @param end: pair of coordinates where to end the path
+        @return: a pair of coordinates, or None if end cannot be reached from start (or start == end)
+        """
+        _, next_hop = self.column(end[0] * self.width + end[1])
+        hop = next_hop[start[0] * self.width + start[1]]
+        if hop < 0:
+            return None
+        return divmod(int(hop), self.width)
+
+    def next_steps(self, starts, ends):
+        """
+        Retrieves the first tiles to move to for several pairs of tiles at once
+        The next-hop tables are gathered directly, the columns of the lazy tables being looked up once per distinct end tile
+        @param self:
+        @param starts: flat indices of the start tiles
+        @param ends: flat indices of the end tiles
+        @return: an array of the flat indices of the first tiles to move to (-1 if end cannot be reached from start, or start == end)
+        """
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if self.eager:
+            return self.next_hop[starts, ends].astype(np.int64)
+        hops = np.full(len(starts), -1, dtype=np.int64)
+        for end in np.unique(ends):
+            selected = ends == end
+            hops[selected] = self.column(int(end))[1][starts[selected]]
+        return hops
+
+    def path(self, start, end):
+        """
+        Retrieves a shortest path between two tiles, following the next-hop table
+        @param self:
+        @param start: pair of coordinates from where to start the path
+        @param end: pair of coordinates where to end the path
+        @return: a list of pairs of coordinates from start to end (both included), empty if end cannot be reached
+        """
+        if self.path_distance(start, end) < 0:
+            return []
+        path = [tuple(start)]
+        while path[-1] != tuple(end):
+            path.append(self.next_step(path[-1], end))
+        return path
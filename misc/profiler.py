@@ -0,0 +1,113 @@
+import json
+import os
+import time
+
+
+class StepProfiler:
+    """
+    This class records the time spent in the phases of the steps of an environment (movement, vision, interest points, rewards, observation)
+    Phases are methods of the environment, wrapped on the instance once profiling is enabled: a disabled environment runs unmodified
+    It contains: running aggregates of every phase (number of calls, total, mean and maximum durations in milliseconds)
+                 the events of a window of steps, which can be exported as a Chrome trace (chrome://tracing or https://ui.perfetto.dev)
+    """
+
+    def __init__(self, trace_start=0, trace_steps=0):
+        super(StepProfiler, self).__init__()
+
+        # Running aggregates of every phase
+        self.aggregates = {}
+
+        # Events of the steps trace_start to trace_start + trace_steps (excluded)
+        self.trace_start = trace_start
+        self.trace_end = trace_start + trace_steps
+        self.events = []
+        self.nb_steps = 0
+        self.origin = time.perf_counter()
+
+    def record(self, phase, start, end):
+        """
+        Adds a call of a phase to the aggregates, and to the trace if the current step is in the window
+        @param self:
+        @param phase: name of the phase
+        @param start: starting time of the call (time.perf_counter)
+        @param end: ending time of the call (time.perf_counter)
+        @return:
+        """
+        duration = (end - start) * 1000
+        if phase not in self.aggregates:
+            self.aggregates[phase] = {"calls": 0, "total_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+        aggregate = self.aggregates[phase]
+        aggregate["calls"] += 1
+        aggregate["total_ms"] += duration
+        aggregate["mean_ms"] = aggregate["total_ms"] / aggregate["calls"]
+        aggregate["max_ms"] = max(aggregate["max_ms"], duration)
+
+        if self.trace_start <= self.nb_steps < self.trace_end:
+            self.events.append({"name": phase, "cat": "env", "ph": "X", "pid": os.getpid(), "tid": 0,
+                                "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6, "args": {"step": self.nb_steps}})
+
+    def wrap(self, phase, function):
+        """
+        Wraps a function so that its calls are recorded as a phase
+        @param self:
+        @param phase: name of the phase
+        @param function: function (or bound method) to wrap
+        @return: the wrapped function
+        """
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(phase, start, time.perf_counter())
+        return timed
+
+    def wrap_step(self, step):
+        """
+        Wraps the step function of an environment: the whole step is recorded, and a copy of the aggregates is added to its info dictionary
+        @param self:
+        @param step: step function (bound method) of the environment
+        @return: the wrapped function
+        """
+        def timed_step(action):
+            start = time.perf_counter()
+            observation, reward, terminated, truncated, info = step(action)
+            self.record("step", start, time.perf_counter())
+            self.nb_steps += 1
+            # A copy of the aggregates is returned, users keep the info dictionaries returned to them
+            info["profile"] = {phase: dict(aggregate) for phase, aggregate in self.aggregates.items()}
+            return observation, reward, terminated, truncated, info
+        return timed_step
+
+    def reset(self):
+        """
+        Clears the aggregates and the trace
+        @param self:
+        @return:
+        """
+        self.aggregates.clear()
+        self.events = []
+        self.nb_steps = 0
+        self.origin = time.perf_counter()
+
+    def summary(self):
+        """
+        Formats the aggregates of every phase, the slowest phases first
+        @param self:
+        @return: a multi-line string
+        """
+        lines = [f"{'phase':20s} {'calls':>8s} {'total ms':>12s} {'mean ms':>10s} {'max ms':>10s}"]
+        for phase, aggregate in sorted(self.aggregates.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"{phase:20s} {aggregate['calls']:8d} {aggregate['total_ms']:12.2f} {aggregate['mean_ms']:10.4f} "
+                         f"{aggregate['max_ms']:10.4f}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path):
+        """
+        Writes the events of the window of steps as a Chrome trace-event JSON file
+        @param self:
+        @param path: path of the file
+        @return:
+        """
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
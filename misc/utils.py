@@ -1,8 +1,9 @@
-from data.opti_misc import map_v1_ennemy_vision_1, map_v4_ennemy_vision_3, map_v4_ennemy_vision_2, \
-    map_v4_ennemy_vision_1, map_v4_ennemy_vision_4, map_v3_ennemy_vision_4, map_v3_ennemy_vision_3, \
-    map_v3_ennemy_vision_2, map_v3_ennemy_vision_1, map_v2_ennemy_vision_4, map_v2_ennemy_vision_3, \
-    map_v2_ennemy_vision_2, map_v2_ennemy_vision_1, map_v1_ennemy_vision_4, map_v1_ennemy_vision_3, \
-    map_v1_ennemy_vision_2
+import heapq
+import itertools
+import math
+from collections import OrderedDict
+
+import numpy as np
 
 """
 This file contains functions that, while not specifically designed for the game of hide & seek, are used by the different environments.
@@ -24,55 +25,191 @@ ENEMY = 5
 ENEMY_vision = 6
 INTEREST_POINT = 7
 
+# Maximum number of nodes expanded by an A* search
+A_STAR_MAX_ITERATIONS = 10001
 
-def shortest_paths(start, end, len_map, nb_paths):
+
+def map_shape(len_map):
     """
-    Function that computes and retrieves a number of shortest path (in a matrix) from start to end
+    Function turning the size of a map into its shape
+    @param len_map: shape (height, width) of the matrix map representation, or its length if the map is square
+    @return: the pair (height, width)
+    """
+    if np.ndim(len_map) == 0:
+        return int(len_map), int(len_map)
+    height, width = len_map
+    return int(height), int(width)
+
+
+def nbytes(value):
+    """
+    Function estimating the memory used by a cached value: the numpy arrays it is made of (directly, in a tuple or as attributes),
+    and the values of the bounded caches it holds as attributes
+    @param value: numpy array, tuple or list of values, BoundedCache, or object
+    @return: a number of bytes
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, BoundedCache):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(nbytes(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sum(nbytes(item) for item in vars(value).values() if isinstance(item, (np.ndarray, BoundedCache)))
+    return 0
+
+
+class BoundedCache:
+    """
+    This class is a dictionary of cached values, whose least recently used entries are dropped once the values use more than max_bytes,
+    or once there are more than max_entries values (for values which keep growing once cached, whose size cannot be bounded)
+    It is used for the structures computed per position of a unit, whose total size grows with the square of the number of tiles of the map
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None):
+        super(BoundedCache, self).__init__()
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self.entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, key):
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def __setitem__(self, key, value):
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1]
+        size = nbytes(value)
+        self.entries[key] = (value, size)
+        self.nbytes += size
+        while len(self.entries) > 1 and ((self.max_bytes is not None and self.nbytes > self.max_bytes) or
+                                         (self.max_entries is not None and len(self.entries) > self.max_entries)):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.nbytes -= size
+
+
+def coords_to_mask(coords, shape):
+    """
+    Function turning a list of tiles into a boolean mask over the map
+    @param coords: list of pairs of coordinates
+    @param shape: shape of the matrix map representation
+    @return: a boolean numpy array of the given shape, True on the listed tiles
+    """
+    mask = np.zeros(shape, dtype=bool)
+    if len(coords) > 0:
+        coords = np.array(coords)
+        mask[coords[:, 0], coords[:, 1]] = True
+    return mask
+
+
+def a_star_paths(start, end, height, width, nb_paths, neighbors):
+    """
+    Function running an A* search (Manhattan heuristic) that keeps expanding nodes after reaching the goal, in order to retrieve several "shortest paths"
+    The fringe is a binary heap ordered by total cost, ties being broken by insertion order, and each fringe entry only stores a pointer to its parent
     @param start: pair of coordinates from where to start the path
     @param end: pair of coordinates where to end the path
-    @param len_map: length of the matrix that we search the path in
+    @param height: number of rows of the matrix that we search the path in
+    @param width: number of columns of the matrix that we search the path in
     @param nb_paths: number of desired "shortest paths" to return
+    @param neighbors: function taking a pair of coordinates and returning the list of reachable neighbor coordinates
     @return: a set of shortest paths (list of pairs of coordinates) from start to end
     """
-
-    # first, let's look for the beginning position, there is better but it works
     (i_start, j_start) = start
-    # and take the goal position (used in the heuristic)
     (i_end, j_end) = end
 
-    width = height = len_map
+    # Cost with which each tile has last been expanded, -1 if it never has
+    visited = [-1] * (height * width)
 
-    heuristic = lambda i, j: abs(i_end - i) + abs(j_end - j)
-    comp = lambda state: state[2] + state[3]  # get the total cost
-
-    # small variation for easier code, state is (coord_tuple, previous, path_cost, heuristic_cost)
-    fringe = [((i_start, j_start), list(), 0, heuristic(i_start, j_start))]
-    visited = {}  # empty set
+    # A fringe entry is (total_cost, insertion_counter, path_cost, node) where node is the linked list (coord_tuple, parent_node)
+    counter = 0
+    fringe = [(abs(i_end - i_start) + abs(j_end - j_start), counter, 0, ((i_start, j_start), None))]
 
     return_set = []
 
-    # maybe limit to prevent too long search
-    limit = 0
-    while True and limit <= 10000:
-        limit = limit + 1
+    # limit to prevent too long search
+    for _ in range(0, A_STAR_MAX_ITERATIONS):
+        if len(fringe) == 0:
+            break
 
         # get first state (least cost)
-        state = fringe.pop(0)
+        _, _, path_cost, node = heapq.heappop(fringe)
 
         # goal check
-        (i, j) = state[0]
+        (i, j) = node[0]
         if i == i_end and j == j_end:
-            path = [state[0]] + state[1]
+            path = []
+            path_node = node
+            while path_node is not None:
+                path.append(path_node[0])
+                path_node = path_node[1]
             path.reverse()
             return_set.append(path)
             if len(return_set) == nb_paths:
                 return return_set
 
         # set the cost (path is enough since the heuristic won't change)
-        visited[(i, j)] = state[2]
+        visited[i * width + j] = path_cost
+
+        # explore neighbors
+        next_cost = path_cost + 1
+        for n in neighbors(i, j):
+            if visited[n[0] * width + n[1]] >= next_cost:
+                continue
+            counter += 1
+            heapq.heappush(fringe, (next_cost + abs(i_end - n[0]) + abs(j_end - n[1]), counter, next_cost, (n, node)))
+
+    return return_set
 
-        # explore neighbor
-        neighbor = list()
+
+def shortest_paths(start, end, len_map, nb_paths):
+    """
+    Function that computes and retrieves a number of shortest path (in a matrix) from start to end
+    @param start: pair of coordinates from where to start the path
+    @param end: pair of coordinates where to end the path
+    @param len_map: shape (height, width) of the matrix that we search the path in, or its length if it is square
+    @param nb_paths: number of desired "shortest paths" to return
+    @return: a set of shortest paths (list of pairs of coordinates) from start to end
+    """
+    (i_start, j_start) = start
+    (i_end, j_end) = end
+    height, width = map_shape(len_map)
+
+    # Moves towards the goal keep the cost estimate of the search constant: the search first expands every sequence of such moves, in the order
+    # of the neighbors (vertical moves first), before any move away from the goal. The number of expansions before reaching the goal is the
+    # number of such sequences ending before it, and the paths found are the first sequences in the lexicographic order
+    nb_vertical, nb_horizontal = abs(i_end - i_start), abs(j_end - j_start)
+    nb_direct_paths = math.comb(nb_vertical + nb_horizontal, nb_vertical)
+    nb_expanded = math.comb(nb_vertical + nb_horizontal + 2, nb_vertical + 1) - 1 - nb_direct_paths
+    if nb_expanded >= A_STAR_MAX_ITERATIONS:
+        return []
+    nb_found = min(nb_paths, A_STAR_MAX_ITERATIONS - nb_expanded)
+    if nb_direct_paths >= nb_found:
+        di, dj = (1 if i_end > i_start else -1), (1 if j_end > j_start else -1)
+        paths = []
+        for vertical_moves in itertools.islice(itertools.combinations(range(nb_vertical + nb_horizontal), nb_vertical), nb_found):
+            i, j = i_start, j_start
+            path = [(i, j)]
+            vertical_moves = set(vertical_moves)
+            for move in range(nb_vertical + nb_horizontal):
+                if move in vertical_moves:
+                    i += di
+                else:
+                    j += dj
+                path.append((i, j))
+            paths.append(path)
+        return paths
+
+    # Only moves that do not get away from the goal are explored
+    def neighbors(i, j):
+        neighbor = []
         if i > 0 and i_end <= i:  # top
             neighbor.append((i - 1, j))
         if i + 1 < height and i_end >= i:
@@ -81,16 +218,9 @@ def shortest_paths(start, end, len_map, nb_paths):
             neighbor.append((i, j - 1))
         if j + 1 < width and j <= j_end:
             neighbor.append((i, j + 1))
+        return neighbor
 
-        for n in neighbor:
-            next_cost = state[2] + 1
-            if n in visited and visited[n] >= next_cost:
-                continue
-            fringe.append((n, [state[0]] + state[1], next_cost, heuristic(n[0], n[1])))
-
-        # resort the list (SHOULD use a priority queue here to avoid re-sorting all the time)
-        fringe.sort(key=comp)
-    return return_set
+    return a_star_paths(start, end, height, width, nb_paths, neighbors)
 
 
 def find_path_to_nearest(current_map, xcoord, ycoord, type_tile=1, tile_to_avoid=2):
@@ -105,27 +235,27 @@ def find_path_to_nearest(current_map, xcoord, ycoord, type_tile=1, tile_to_avoid
     """
     i, j = xcoord, ycoord
     list_tile = []
-    len_map = len(current_map)
+    height, width = current_map.shape
     already_visited = [(i, j)]
     while True:
-        if i > 0 and current_map[i-1][j] != tile_to_avoid:  # top
-            if current_map[i-1][j] == type_tile:
+        if i > 0 and current_map[i-1, j] != tile_to_avoid:  # top
+            if current_map[i-1, j] == type_tile:
                 return i - 1, j
             else:
                 if (i - 1, j) not in already_visited:
                     list_tile.append((i - 1, j))
                     already_visited.append((i - 1, j))
 
-        if i + 1 < len_map and current_map[i+1][j] != tile_to_avoid:
-            if current_map[i+1][j] == type_tile:
+        if i + 1 < height and current_map[i+1, j] != tile_to_avoid:
+            if current_map[i+1, j] == type_tile:
                 return i + 1, j
             else:
                 if (i + 1, j) not in already_visited:
                     list_tile.append((i + 1, j))
                     already_visited.append((i + 1, j))
 
-        if j > 0 and current_map[i][j-1] != tile_to_avoid:
-            if current_map[i][j-1] == type_tile:
+        if j > 0 and current_map[i, j-1] != tile_to_avoid:
+            if current_map[i, j-1] == type_tile:
                 return i, j - 1
             else:
                 if (i, j - 1) not in already_visited:
@@ -133,8 +263,8 @@ def find_path_to_nearest(current_map, xcoord, ycoord, type_tile=1, tile_to_avoid
                     already_visited.append((i, j - 1))
                 list_tile.append((i, j - 1))
 
-        if j + 1 < len_map and current_map[i][j+1] != tile_to_avoid:
-            if current_map[i][j+1] == type_tile:
+        if j + 1 < width and current_map[i, j+1] != tile_to_avoid:
+            if current_map[i, j+1] == type_tile:
                 return i, j + 1
             else:
                 if (i, j + 1) not in already_visited:
@@ -152,33 +282,33 @@ def find_path_to_not_yet_seen(current_map, xcoord, ycoord, agent_previously_seen
     @param current_map: Current matrix map representation
     @param xcoord: x coordinate from which to start searching
     @param ycoord: y coordinate from which to start searching
-    @param agent_previously_seen: list of tiles (pairs of coordinates) that the agent has already seen
+    @param agent_previously_seen: boolean mask of the tiles that the agent has already seen
     @param tile_to_avoid: type of tle to avoid during the search
     @return: a path (list of pairs of coordinates) to the nearest tile that the agent has not seen
     """
     i, j = xcoord, ycoord
     list_tile = []
-    len_map = len(current_map)
+    height, width = current_map.shape
     already_visited = [(i, j)]
     while True:
-        if i > 0 and current_map[i-1][j] != tile_to_avoid:  # top
-            if (i - 1, j) not in agent_previously_seen:
+        if i > 0 and current_map[i-1, j] != tile_to_avoid:  # top
+            if not agent_previously_seen[i - 1, j]:
                 return i - 1, j
             else:
                 if (i - 1, j) not in already_visited:
                     list_tile.append((i - 1, j))
                     already_visited.append((i - 1, j))
 
-        if i + 1 < len_map and current_map[i+1][j] != tile_to_avoid:
-            if (i + 1, j) not in agent_previously_seen:
+        if i + 1 < height and current_map[i+1, j] != tile_to_avoid:
+            if not agent_previously_seen[i + 1, j]:
                 return i + 1, j
             else:
                 if (i + 1, j) not in already_visited:
                     list_tile.append((i + 1, j))
                     already_visited.append((i + 1, j))
 
-        if j > 0 and current_map[i][j-1] != tile_to_avoid:
-            if (i, j - 1) not in agent_previously_seen:
+        if j > 0 and current_map[i, j-1] != tile_to_avoid:
+            if not agent_previously_seen[i, j - 1]:
                 return i, j - 1
             else:
                 if (i, j - 1) not in already_visited:
@@ -186,8 +316,8 @@ def find_path_to_not_yet_seen(current_map, xcoord, ycoord, agent_previously_seen
                     already_visited.append((i, j - 1))
                 list_tile.append((i, j - 1))
 
-        if j + 1 < len_map and current_map[i][j+1] != tile_to_avoid:
-            if (i, j + 1) not in agent_previously_seen:
+        if j + 1 < width and current_map[i, j+1] != tile_to_avoid:
+            if not agent_previously_seen[i, j + 1]:
                 return i, j + 1
             else:
                 if (i, j + 1) not in already_visited:
@@ -209,62 +339,24 @@ def shortest_paths_expensive(start, end, current_map, nb_paths, to_avoid=2):
     @param to_avoid: type of tile to avoid during the search
     @return: a set of shortest paths (list of pairs of coordinates) from start to end
     """
-    # first, let's look for the beginning position, there is better but it works
-    (i_start, j_start) = start
-    # and take the goal position (used in the heuristic)
-    (i_end, j_end) = end
-
-    width = height = len(current_map)
-
-    heuristic = lambda i, j: abs(i_end - i) + abs(j_end - j)
-    comp = lambda state: state[2] + state[3]  # get the total cost
-
-    # small variation for easier code, state is (coord_tuple, previous, path_cost, heuristic_cost)
-    fringe = [((i_start, j_start), list(), 0, heuristic(i_start, j_start))]
-    visited = {}  # empty set
-
-    return_set = []
-
-    # maybe limit to prevent too long search
-    limit = 0
-    while True and limit <= 10000:
-        limit = limit + 1
-
-        # get first state (least cost)
-        state = fringe.pop(0)
-
-        # goal check
-        (i, j) = state[0]
-        if i == i_end and j == j_end:
-            path = [state[0]] + state[1]
-            path.reverse()
-            return_set.append(path)
-            if len(return_set) == nb_paths:
-                return return_set
-
-        # set the cost (path is enough since the heuristic won't change)
-        visited[(i, j)] = state[2]
-
-        # explore neighbor
-        neighbor = list()
-        if i > 0 and current_map[i-1][j] != to_avoid:  # top
+    current_map = np.asarray(current_map)
+    height, width = current_map.shape
+    free = (current_map != to_avoid).tolist()
+
+    # Every move that does not go through a tile to avoid is explored
+    def neighbors(i, j):
+        neighbor = []
+        if i > 0 and free[i - 1][j]:  # top
             neighbor.append((i - 1, j))
-        if i + 1 < height and current_map[i+1][j] != to_avoid:
+        if i + 1 < height and free[i + 1][j]:
             neighbor.append((i + 1, j))
-        if j > 0 and current_map[i][j-1] != to_avoid:
+        if j > 0 and free[i][j - 1]:
             neighbor.append((i, j - 1))
-        if j + 1 < width and current_map[i][j+1] != to_avoid:
+        if j + 1 < width and free[i][j + 1]:
             neighbor.append((i, j + 1))
+        return neighbor
 
-        for n in neighbor:
-            next_cost = state[2] + 1
-            if n in visited and visited[n] >= next_cost:
-                continue
-            fringe.append((n, [state[0]] + state[1], next_cost, heuristic(n[0], n[1])))
-
-        # resort the list (SHOULD use a priority queue here to avoid re-sorting all the time)
-        fringe.sort(key=comp)
-    return return_set
+    return a_star_paths(start, end, height, width, nb_paths, neighbors)
 
 
 def shortest_paths_naive( start, end):
@@ -324,31 +416,3 @@ def shortest_paths_naive( start, end):
         i = i - 1
 
     return path_visited
-
-
-def compute_optimized_training_maps():
-    """
-    Function that loads pre-computed enemy vision for speed during training
-    @return: a set of pre-computed visions (list of coordinates)
-    """
-    optimized_maps = [[]]
-    optimized_maps[0].append(map_v1_ennemy_vision_1)
-    optimized_maps[0].append(map_v1_ennemy_vision_2)
-    optimized_maps[0].append(map_v1_ennemy_vision_3)
-    optimized_maps[0].append(map_v1_ennemy_vision_4)
-    optimized_maps.append([])
-    optimized_maps[1].append(map_v2_ennemy_vision_1)
-    optimized_maps[1].append(map_v2_ennemy_vision_2)
-    optimized_maps[1].append(map_v2_ennemy_vision_3)
-    optimized_maps[1].append(map_v2_ennemy_vision_4)
-    optimized_maps.append([])
-    optimized_maps[2].append(map_v3_ennemy_vision_1)
-    optimized_maps[2].append(map_v3_ennemy_vision_2)
-    optimized_maps[2].append(map_v3_ennemy_vision_3)
-    optimized_maps[2].append(map_v3_ennemy_vision_4)
-    optimized_maps.append([])
-    optimized_maps[3].append(map_v4_ennemy_vision_1)
-    optimized_maps[3].append(map_v4_ennemy_vision_2)
-    optimized_maps[3].append(map_v4_ennemy_vision_3)
-    optimized_maps[3].append(map_v4_ennemy_vision_4)
-    return optimized_maps
\ No newline at end of file
@@ -0,0 +1,178 @@
+import hashlib
+import os
+
+import numpy as np
+
+from misc.utils import EMPTY, BoundedCache
+
+# Default location of the cache, can be overridden with the HIDESEEK_VISION_CACHE environment variable
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "vision_cache")
+
+
+def layout_hash(layout):
+    """
+    Function computing a hash of the content of a map layout: two map files with the same matrix share the same hash
+    @param layout: matrix representation of the map
+    @return: a hexadecimal string
+    """
+    layout = np.ascontiguousarray(layout, dtype=np.int8)
+    digest = hashlib.sha1()
+    digest.update(str(layout.shape).encode())
+    digest.update(layout.tobytes())
+    return digest.hexdigest()
+
+
+class VisionCache:
+    """
+    This class is an on-disk cache of unit visions, used to skip the (expensive) clever vision computations during training
+    Visions are stored as packed rows, in one .npy file per map layout (identified by the hash of its content) and vision mode, with a row
+    per unit position whose last byte tells whether the row was computed: the file is memory-mapped, and a row is written the first time
+    the vision is requested, for any map
+    The visions from every free tile of a layout can also be stored at once, as a packed table (see scripts/precompute_visions.py):
+    they are then read from the table, and never computed during training, wherever the units are placed
+    """
+
+    # Maximal number of files of visions (tables and rows) kept open at once
+    OPEN_TABLES = 1024
+
+    # Memory kept for the visions already unpacked by this process
+    LOADED_BYTES = 2 ** 26
+
+    def __init__(self, directory=None):
+        super(VisionCache, self).__init__()
+
+        if directory is None:
+            directory = os.environ.get("HIDESEEK_VISION_CACHE", DEFAULT_CACHE_DIRECTORY)
+        self.directory = directory
+
+        # Visions already loaded by this process, keyed by (layout hash, mode, x, y), and tables and rows of visions keyed by (layout hash, mode)
+        # (the number of files kept open is bounded, every file being a memory mapping)
+        self.loaded = BoundedCache(self.LOADED_BYTES)
+        self.tables = BoundedCache(max_entries=self.OPEN_TABLES)
+        self.row_files = BoundedCache(max_entries=self.OPEN_TABLES)
+
+    def rows_path(self, key, mode):
+        """
+        Computes the file in which the visions of a layout computed on first use are stored
+        @param self:
+        @param key: hash of the map layout
+        @param mode: vision mode, "naive" or "clever"
+        @return: the path of the .npy file
+        """
+        return os.path.join(self.directory, key, f"{mode}_rows.npy")
+
+    def table_path(self, key, mode):
+        """
+        Computes the file in which the table of the visions from every free tile of a layout is stored
+        @param self:
+        @param key: hash of the map layout
+        @param mode: vision mode, "naive" or "clever"
+        @return: the path of the .npy file
+        """
+        return os.path.join(self.directory, key, f"{mode}_table.npy")
+
+    def has_table(self, layout, mode="clever"):
+        """
+        Checks whether the table of the visions of a layout is stored
+        @param self:
+        @param layout: matrix representation of the (static) map
+        @param mode: vision mode, "naive" or "clever"
+        @return: a boolean
+        """
+        return os.path.exists(self.table_path(layout_hash(layout), mode))
+
+    def store_table(self, layout, table, mode="clever"):
+        """
+        Stores the table of the visions from every free tile of a layout
+        @param self:
+        @param layout: matrix representation of the (static) map
+        @param table: (height * width, ceil(height * width / 8)) uint8 array, the packed vision from every tile (only the rows of the free tiles are read)
+        @param mode: vision mode, "naive" or "clever"
+        @return:
+        """
+        path = self.table_path(layout_hash(layout), mode)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(table, dtype=np.uint8))
+        os.replace(temporary_path, path)
+
+    def table(self, key, mode):
+        """
+        Retrieves the table of the visions of a layout, if it was precomputed
+        @param self:
+        @param key: hash of the map layout
+        @param mode: vision mode, "naive" or "clever"
+        @return: the memory-mapped packed table, or None
+        """
+        if (key, mode) in self.tables:
+            return self.tables[(key, mode)]
+        path = self.table_path(key, mode)
+        if not os.path.exists(path):
+            return None
+        self.tables[(key, mode)] = np.load(path, mmap_mode="r")
+        return self.tables[(key, mode)]
+
+    def rows(self, key, mode, shape):
+        """
+        Retrieves the rows of the visions of a layout computed on first use, creating the file if needed
+        @param self:
+        @param key: hash of the map layout
+        @param mode: vision mode, "naive" or "clever"
+        @param shape: shape of the map
+        @return: the memory-mapped (height * width, ceil(height * width / 8) + 1) uint8 array, the last column telling whether a row is computed
+        """
+        if (key, mode) in self.row_files:
+            return self.row_files[(key, mode)]
+        path = self.rows_path(key, mode)
+        if not os.path.exists(path):
+            nb_tiles = shape[0] * shape[1]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # The empty file is written under a temporary name, then linked: if another process created the file meanwhile, its rows are kept
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            np.lib.format.open_memmap(temporary_path, mode="w+", dtype=np.uint8, shape=(nb_tiles, (nb_tiles + 7) // 8 + 1)).flush()
+            try:
+                os.link(temporary_path, path)
+            except FileExistsError:
+                pass
+            os.remove(temporary_path)
+        self.row_files[(key, mode)] = np.lib.format.open_memmap(path, mode="r+")
+        return self.row_files[(key, mode)]
+
+    def vision(self, layout, xcoord, ycoord, compute_vision, mode="clever"):
+        """
+        Retrieves the vision of a unit from the cache, computing and storing it if needed
+        @param self:
+        @param layout: matrix representation of the (static) map
+        @param xcoord: x coordinate of the unit
+        @param ycoord: y coordinate of the unit
+        @param compute_vision: function called with (xcoord, ycoord) when the vision is not cached, returning a boolean mask
+        @param mode: vision mode, "naive" or "clever", part of the key of the vision
+        @return: a read-only boolean mask of the shape of the map
+        """
+        key = layout_hash(layout)
+        xcoord, ycoord = int(xcoord), int(ycoord)
+        if (key, mode, xcoord, ycoord) in self.loaded:
+            return self.loaded[(key, mode, xcoord, ycoord)]
+
+        # The vision from a free tile is read from the table of the layout, if it was precomputed (unpacking a row is cheap, it is not kept)
+        if layout[xcoord, ycoord] == EMPTY:
+            table = self.table(key, mode)
+            if table is not None:
+                mask = np.unpackbits(table[xcoord * layout.shape[1] + ycoord], count=layout.size).view(bool).reshape(layout.shape)
+                mask.setflags(write=False)
+                return mask
+
+        rows = self.rows(key, mode, layout.shape)
+        row = rows[xcoord * layout.shape[1] + ycoord]
+        if row[-1]:
+            mask = np.unpackbits(row[:-1], count=layout.size).view(bool).reshape(layout.shape)
+        else:
+            mask = np.ascontiguousarray(compute_vision(xcoord, ycoord), dtype=bool)
+            # The row is written before its flag: several training processes can fill the cache at once, and only read complete rows
+            row[:-1] = np.packbits(mask.ravel())
+            row[-1] = 1
+        mask.setflags(write=False)
+
+        self.loaded[(key, mode, xcoord, ycoord)] = mask
+        return mask
@@ -0,0 +1,421 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+"""
+This script benchmarks the environments and the geometry kernels they rely on, on every map
+It reports the steps/sec and resets/sec of every environment and placement mode, and latency percentiles of the kernels
+Results are compared with a baseline file: it fails (exit code 1) if a result regresses past the threshold, or if a fast path
+does not return the same results as the reference implementation (differential check)
+No baseline is committed, the measures depending on the machine: run the script with --save first on the target machine to record one,
+it otherwise stops with exit code 2 (MISSING_BASELINE) once the results are reported
+Usage: python -m scripts.bench_envs [--save] [--baseline data/bench_baseline.json] [--threshold 0.3] [--repeat 3] [--skip_diff]
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "data", "bench_baseline.json")
+
+# Exit code when there is no baseline to compare the results with
+MISSING_BASELINE = 2
+
+MAPS = ["data/map_v1", "data/map_v2", "data/map_v3", "data/map_v4"]
+
+# Placement modes (agent, enemy), as accepted by main.py
+PLACEMENTS = [("static", "static"), ("static", "moves"), ("static", "random"),
+              ("random", "static"), ("random", "moves"), ("random", "random")]
+
+PERCENTILES = [50, 90, 99]
+
+
+def environment_classes():
+    """
+    Imports the environment classes, keyed by the name used in main.py
+    @return: a dictionary of environment classes
+    """
+    from envs.custom_envs.coordFieldVision import CoordFieldVisionEnv
+    from envs.custom_envs.fullDirectionOnField import FullDirectionOnFieldEnv
+    from envs.custom_envs.fullFieldVision import FullFieldVisionEnv
+    from envs.custom_envs.spiralFieldVision import SpiralFieldVisionEnv
+    return {"spiral": SpiralFieldVisionEnv, "coord": CoordFieldVisionEnv, "field": FullFieldVisionEnv,
+            "direction": FullDirectionOnFieldEnv}
+
+
+def seed_everything(seed):
+    """
+    Seeds the random generators used by the environments to place the units
+    @param seed: integer seed
+    @return:
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def metric(value, unit, higher_is_better, gated=True):
+    """
+    Builds the record of a measure
+    @param value: measured value
+    @param unit: unit of the value
+    @param higher_is_better: True for throughputs, False for latencies
+    @param gated: True if a regression of this measure makes the benchmark fail
+    @return: a dictionary
+    """
+    return {"value": float(value), "unit": unit, "higher_is_better": higher_is_better, "gated": gated}
+
+
+def latency_metrics(name, function, arguments, repeat):
+    """
+    Times every call of a function, and builds the records of the latency percentiles of the calls
+    The calls are repeated several times, the lowest value of every percentile being kept
+    Only the median and the 90th percentile are gated (the tail is noisy)
+    @param name: name of the kernel
+    @param function: function to call
+    @param arguments: list of tuples of arguments, one call per tuple
+    @param repeat: number of repetitions of the calls
+    @return: a dictionary of records
+    """
+    values = np.full(len(PERCENTILES), np.inf)
+    for _ in range(repeat):
+        timings = []
+        for args in arguments:
+            start = time.perf_counter()
+            function(*args)
+            timings.append(time.perf_counter() - start)
+        values = np.minimum(values, np.percentile(np.array(timings) * 1000, PERCENTILES))
+    return {f"{name}/p{percentile}_ms": metric(value, "ms", False, gated=percentile < 99)
+            for percentile, value in zip(PERCENTILES, values)}
+
+
+def rollout(env, nb_steps, seed):
+    """
+    Plays random actions in an environment, resetting it at the end of every round
+    @param env: environment
+    @param nb_steps: number of steps
+    @param seed: seed of the actions and of the placements of the units
+    @return: the list of observations and rewards of the resets and steps
+    """
+    seed_everything(seed)
+    rng = np.random.default_rng(seed)
+    observation, _ = env.reset()
+    trajectory = [(np.array(observation), None)]
+    for _ in range(nb_steps):
+        observation, reward, terminated, truncated, _ = env.step(int(rng.integers(5)))
+        trajectory.append((np.array(observation), reward))
+        if terminated or truncated:
+            observation, _ = env.reset()
+            trajectory.append((np.array(observation), None))
+    return trajectory
+
+
+def bench_environments(args, metrics):
+    """
+    Measures the steps/sec and resets/sec of every environment, on every map and for every placement mode
+    Enemy visions are read from the vision cache: the measures are taken after a warm-up pass placing the units at the same positions
+    @param args: parsed arguments
+    @param metrics: dictionary of records, filled by the function
+    @return:
+    """
+    for env_name, env_class in environment_classes().items():
+        for map_file in args.maps:
+            for agent_placement, enemy_placement in PLACEMENTS:
+                env = env_class(map_file=os.path.join(ROOT, map_file), enemy_placement=enemy_placement,
+                                player_placement=agent_placement, opti=True)
+                rollout(env, args.steps, seed=0)
+
+                # The fastest of the repetitions is kept
+                resets_per_second = steps_per_second = 0
+                for _ in range(args.repeat):
+                    seed_everything(0)
+                    start = time.perf_counter()
+                    for _ in range(args.resets):
+                        env.reset()
+                    resets_per_second = max(resets_per_second, args.resets / (time.perf_counter() - start))
+
+                    start = time.perf_counter()
+                    rollout(env, args.steps, seed=0)
+                    steps_per_second = max(steps_per_second, args.steps / (time.perf_counter() - start))
+                env.close()
+
+                name = f"env/{env_name}/{os.path.basename(map_file)}/{agent_placement}-{enemy_placement}"
+                metrics[f"{name}/steps_per_s"] = metric(steps_per_second, "steps/s", True)
+                metrics[f"{name}/resets_per_s"] = metric(resets_per_second, "resets/s", True)
+                print(f"{name:50s} {steps_per_second:9.0f} steps/s {resets_per_second:9.0f} resets/s", flush=True)
+
+
+def sample_states(env, nb_states, seed):
+    """
+    Collects states of the game reached by random actions
+    @param env: environment
+    @param nb_states: number of states
+    @param seed: seed of the actions and of the placements of the units
+    @return: a list of (current map, agent position, memory of the agent) tuples
+    """
+    seed_everything(seed)
+    rng = np.random.default_rng(seed)
+    env.reset()
+    states = []
+    while len(states) < nb_states:
+        _, _, terminated, truncated, _ = env.step(int(rng.integers(5)))
+        states.append((np.array(env.playing_map.current_map), (env.agent.xcoord, env.agent.ycoord),
+                       env.agent.previously_viewed.copy()))
+        if terminated or truncated:
+            env.reset()
+    return states
+
+
+def bench_kernels(args, metrics):
+    """
+    Measures the latency of the geometry kernels and of the observation builders, on states reached by random actions
+    @param args: parsed arguments
+    @param metrics: dictionary of records, filled by the function
+    @return:
+    """
+    from envs.unit import Unit
+    from misc.utils import find_path_to_nearest, find_path_to_not_yet_seen, shortest_paths_expensive, EMPTY, BLOCK
+
+    env_classes = environment_classes()
+    for map_file in args.maps:
+        map_name = os.path.basename(map_file)
+        envs = {env_name: env_class(map_file=os.path.join(ROOT, map_file), opti=True)
+                for env_name, env_class in env_classes.items()}
+        base = envs["coord"]
+        states = sample_states(base, args.calls, seed=1)
+        unit = Unit()
+
+        def compute_vision(current_map, position, mode, visibility):
+            unit.set_coord(*position)
+            unit.compute_vision(current_map, mode, visibility)
+
+        naive = [(current_map, position, "naive", base.agent_visibility) for current_map, position, _ in states]
+        metrics.update(latency_metrics(f"kernel/compute_vision_naive/{map_name}", compute_vision, naive, args.repeat))
+
+        # The lines of sight of the clever mode are computed on the first call from a position, they are timed once warm
+        enemy_position = (base.enemy.xcoord, base.enemy.ycoord)
+        clever = [(current_map, enemy_position, "clever", base.enemy_visibility) for current_map, _, _ in states]
+        compute_vision(*clever[0])
+        metrics.update(latency_metrics(f"kernel/compute_vision_clever/{map_name}", compute_vision, clever, args.repeat))
+
+        nearest = [(current_map, x, y, EMPTY, BLOCK) for current_map, (x, y), _ in states]
+        metrics.update(latency_metrics(f"kernel/find_path_to_nearest/{map_name}", find_path_to_nearest, nearest, args.repeat))
+        not_yet_seen = [(current_map, x, y, viewed, BLOCK) for current_map, (x, y), viewed in states]
+        metrics.update(latency_metrics(f"kernel/find_path_to_not_yet_seen/{map_name}", find_path_to_not_yet_seen, not_yet_seen,
+                                       args.repeat))
+
+        rng = np.random.default_rng(2)
+        free = np.argwhere(base.playing_map.initial_map != BLOCK)
+        pairs = [(tuple(free[rng.integers(len(free))]), tuple(free[rng.integers(len(free))]), base.playing_map.initial_map, 5)
+                 for _ in range(max(args.calls // 10, 1))]
+        metrics.update(latency_metrics(f"kernel/shortest_paths_expensive/{map_name}", shortest_paths_expensive, pairs,
+                                       args.repeat))
+
+        # Observation builders, called on the state reached by each environment after a reset
+        builders = {"spiral": lambda env: env.find_blocks_near_me_spiral(),
+                    "coord": lambda env: env.path_towards_interest_point(),
+                    "field": lambda env: env.prepare_map_img_CNN(env.center_map_around_player()),
+                    "direction": lambda env: env.direction_towards_interest_point()}
+        for env_name, builder in builders.items():
+            seed_everything(1)
+            envs[env_name].reset()
+            metrics.update(latency_metrics(f"observation/{env_name}/{map_name}", builder, [(envs[env_name],)] * args.calls, args.repeat))
+
+        for name in sorted(key for key in metrics if key.endswith(f"{map_name}/p50_ms")):
+            print(f"{name:50s} {metrics[name]['value']:9.3f} ms (p50)", flush=True)
+
+
+def differential_check(args):
+    """
+    Checks that the fast paths return the same results as the reference implementations:
+    the precomputed visions, searches and shortest paths against the loops of Unit.compute_vision and misc.utils (the path table against
+    the A* search of shortest_paths_expensive, towards tiles drawn at random), on states reached by random actions, the environments with and without the vision cache, and the batched environment against the single environments
+    @param args: parsed arguments
+    @return: the list of the mismatches found
+    """
+    from envs.unit import Unit
+    from misc.utils import find_path_to_nearest, find_path_to_not_yet_seen, shortest_paths_expensive, EMPTY, BLOCK
+
+    failures = []
+    env_classes = environment_classes()
+    for map_file in args.maps:
+        map_name = os.path.basename(map_file)
+        env = env_classes["coord"](map_file=os.path.join(ROOT, map_file), opti=False)
+        engine = env.interest_point_engine
+        layout = env.playing_map.initial_map
+        free = np.argwhere(layout != BLOCK)
+        rng = np.random.default_rng(3)
+        for k, (current_map, (x, y), viewed) in enumerate(sample_states(env, args.diff_states, seed=3)):
+            fast, reference = Unit(), Unit()
+            fast.set_coord(x, y)
+            reference.set_coord(x, y)
+            fast.compute_vision(current_map, "naive", visibility=env.agent_visibility)
+            reference.compute_vision(current_map, "naive")
+            if not np.array_equal(fast.vision, reference.vision) or \
+                    not np.array_equal(fast.viewed_sequence[:fast.nb_viewed], reference.viewed_sequence[:reference.nb_viewed]):
+                failures.append(f"{map_name} state {k}: naive vision")
+            if engine.nearest_tile(x, y, current_map, EMPTY) != find_path_to_nearest(current_map, x, y, EMPTY, BLOCK):
+                failures.append(f"{map_name} state {k}: nearest empty tile")
+            if engine.nearest_not_yet_seen(x, y, viewed) != find_path_to_not_yet_seen(current_map, x, y, viewed, BLOCK):
+                failures.append(f"{map_name} state {k}: nearest tile not yet seen")
+
+            # The first move and the length of the path towards a tile, the A* search picking the same path among equally short ones
+            # (its number of iterations is bounded: it returns no path on some long detours, which are not compared)
+            end = tuple(int(coordinate) for coordinate in free[rng.integers(len(free))])
+            paths = shortest_paths_expensive((x, y), end, layout, 1, to_avoid=BLOCK)
+            reference_step = tuple(paths[0][1]) if len(paths) > 0 and len(paths[0]) > 1 else None
+            if len(paths) > 0 and (env.path_table.path_distance((x, y), end) != len(paths[0]) - 1 or
+                                   env.path_table.next_step((x, y), end) != reference_step):
+                failures.append(f"{map_name} state {k}: shortest path towards {end}")
+
+        # The clever vision of the enemy is expensive to compute with the reference loops, it is checked from its initial position
+        enemy_map = np.array(env.playing_map.initial_map)
+        x, y = env.playing_map.enemy_initial_position[0]
+        fast, reference = Unit(), Unit()
+        fast.set_coord(x, y)
+        reference.set_coord(x, y)
+        fast.compute_vision(enemy_map, "clever", visibility=env.enemy_visibility)
+        reference.compute_vision(enemy_map, "clever")
+        if not np.array_equal(fast.vision, reference.vision):
+            failures.append(f"{map_name}: clever vision")
+
+        for env_name, env_class in env_classes.items():
+            trajectories = [rollout(env_class(map_file=os.path.join(ROOT, map_file), enemy_placement="moves",
+                                              player_placement="random", opti=opti), args.diff_steps, seed=4)
+                            for opti in (False, True)]
+            if not all(np.array_equal(a[0], b[0]) and a[1] == b[1] for a, b in zip(*trajectories)):
+                failures.append(f"{map_name} {env_name}: vision cache")
+
+        failures += differential_check_batched(args, map_file)
+        print(f"differential check {map_name}: {'ok' if len(failures) == 0 else f'{len(failures)} mismatches so far'}", flush=True)
+    return failures
+
+
+def differential_check_batched(args, map_file, nb_games=4):
+    """
+    Checks that the batched environment returns the same observations and rewards as the single environments, from the same positions
+    @param args: parsed arguments
+    @param map_file: path of the map
+    @param nb_games: number of games stepped at once
+    @return: the list of the mismatches found
+    """
+    try:
+        from envs.batchedHideSeekEnv import BatchedHideSeekEnv
+    except ImportError:
+        print("stable_baselines3 is not installed, the batched environment is not checked")
+        return []
+
+    failures = []
+    map_name = os.path.basename(map_file)
+    for env_name, env_class in environment_classes().items():
+        seed_everything(5)
+        singles = [env_class(map_file=os.path.join(ROOT, map_file), enemy_placement="moves", player_placement="random", opti=False)
+                   for _ in range(nb_games)]
+        batch = BatchedHideSeekEnv(map_file=os.path.join(ROOT, map_file), n_envs=nb_games, env_type=env_name,
+                                   enemy_placement="moves", player_placement="random", seed=5)
+        batch.reset()
+
+        def restart(game):
+            observation, _ = singles[game].reset()
+            agent = np.array([[singles[game].agent.xcoord, singles[game].agent.ycoord]])
+            enemy = np.array([[singles[game].enemy.xcoord, singles[game].enemy.ycoord]])
+            return np.array_equal(observation, batch.start_games(np.array([game]), agent, enemy)[0])
+
+        same = all([restart(game) for game in range(nb_games)])
+        rng = np.random.default_rng(5)
+        for _ in range(args.diff_steps):
+            actions = rng.integers(5, size=nb_games)
+            observations, rewards, dones, infos = batch.step(actions)
+            for game in range(nb_games):
+                observation, reward, terminated, truncated, _ = singles[game].step(actions[game])
+                batch_observation = infos[game]["terminal_observation"] if dones[game] else observations[game]
+                same &= np.array_equal(observation, batch_observation) and reward == rewards[game]
+                same &= (terminated or truncated) == dones[game]
+                if dones[game]:
+                    same &= restart(game)
+        batch.close()
+        if not same:
+            failures.append(f"{map_name} {env_name}: batched environment")
+    return failures
+
+
+def compare_with_baseline(metrics, baseline, threshold, min_delta_ms):
+    """
+    Compares measures with a baseline
+    @param metrics: dictionary of records
+    @param baseline: dictionary of records of the baseline
+    @param threshold: relative regression above which a gated measure fails
+    @param min_delta_ms: absolute regression under which a latency does not fail (timer resolution and noise of tiny calls)
+    @return: the list of the regressions
+    """
+    regressions = []
+    for name, record in sorted(metrics.items()):
+        if name not in baseline or not record["gated"]:
+            continue
+        reference = baseline[name]["value"]
+        if record["higher_is_better"]:
+            regressed = record["value"] < reference * (1 - threshold)
+        else:
+            regressed = record["value"] > max(reference * (1 + threshold), reference + min_delta_ms)
+        if regressed:
+            regressions.append(f"{name}: {record['value']:.3f} {record['unit']} (baseline {reference:.3f})")
+    return regressions
+
+
+def bench_envs(args):
+    failures = []
+    metrics = {}
+    missing_baseline = False
+
+    if not args.skip_diff:
+        failures += differential_check(args)
+    if not args.skip_envs:
+        bench_environments(args, metrics)
+    if not args.skip_kernels:
+        bench_kernels(args, metrics)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": {"python": platform.python_version(), "platform": platform.platform(),
+                                   "processor": platform.processor(), "cpus": os.cpu_count()},
+                       "metrics": metrics}, f, indent=1, sort_keys=True)
+        print(f"Baseline saved at {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        failures += compare_with_baseline(metrics, baseline["metrics"], args.threshold, args.min_delta_ms)
+    else:
+        # Without a baseline nothing would be gated, the run fails instead of passing silently
+        missing_baseline = True
+
+    if failures:
+        print("\n".join(["FAILED:"] + failures))
+        sys.exit(1)
+    if missing_baseline:
+        print(f"NO BASELINE: nothing to compare with at {args.baseline}, run with --save first on this machine to record one")
+        sys.exit(MISSING_BASELINE)
+    print("OK")
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-b", "--baseline", type=str, help="Path of the baseline file", default=DEFAULT_BASELINE)
+    argParser.add_argument("-s", "--save", action="store_true", help="Saves the results as the new baseline instead of comparing them")
+    argParser.add_argument("-t", "--threshold", type=float, help="Relative regression above which a result fails, 0.3 by default",
+                           default=0.3)
+    argParser.add_argument("-md", "--min_delta_ms", type=float, help="Absolute latency regression (in ms) always tolerated, 0.05 by default",
+                           default=0.05)
+    argParser.add_argument("-r", "--repeat", type=int, help="Number of repetitions of every measure, the best one is kept", default=3)
+    argParser.add_argument("-m", "--maps", type=str, nargs="+", help="Maps to benchmark", default=MAPS)
+    argParser.add_argument("-st", "--steps", type=int, help="Number of steps measured per environment and placement", default=300)
+    argParser.add_argument("-rs", "--resets", type=int, help="Number of resets measured per environment and placement", default=50)
+    argParser.add_argument("-c", "--calls", type=int, help="Number of calls measured per kernel", default=200)
+    argParser.add_argument("-ds", "--diff_states", type=int, help="Number of states compared by the differential check", default=100)
+    argParser.add_argument("-dst", "--diff_steps", type=int, help="Number of steps compared by the differential check", default=100)
+    argParser.add_argument("--skip_diff", action="store_true", help="Skips the differential check")
+    argParser.add_argument("--skip_envs", action="store_true", help="Skips the environment measures")
+    argParser.add_argument("--skip_kernels", action="store_true", help="Skips the kernel measures")
+    bench_envs(argParser.parse_args())
@@ -0,0 +1,95 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from scripts.bench_envs import environment_classes, rollout
+from scripts.bench_scaling import ROOT, parse_shape, write_tiled_map
+
+"""
+This script measures how the cost of a step of the multi-unit environment grows with the number of units
+For every number of hiders (with a seeker for every two hiders), it reports the steps/sec, the cost of a step per hider,
+and the cost of stepping as many spiral environments (one hider against one seeker each) as there are hiders
+The units play random actions, on a map of the requested shape built by tiling a map of the data repository
+Usage: python -m scripts.bench_multi_units [--shape 32x32] [--hiders 1 4 16 64] [--behavior chase] [--steps 500]
+"""
+
+
+def multi_unit_rollout(env, nb_steps, seed):
+    """
+    Plays random actions for every hider of a multi-unit environment, resetting it at the end of every round
+    @param env: MultiUnitHideSeekEnv
+    @param nb_steps: number of steps
+    @param seed: seed of the actions and of the environment
+    @return:
+    """
+    rng = np.random.default_rng(seed)
+    env.reset(seed=seed)
+    for _ in range(nb_steps):
+        # Hiders rarely stop, so that the rounds keep most of their units
+        actions = rng.integers(4, size=env.n_hiders)
+        actions[rng.random(env.n_hiders) < 0.01] = 4
+        env.step({agent: int(actions[env.agent_ids[agent]]) for agent in env.agents})
+        if len(env.agents) == 0:
+            env.reset()
+
+
+def best_step_time(function, nb_steps, repeat):
+    """
+    Runs a rollout several times, and keeps the lowest duration of a step
+    @param function: function playing nb_steps steps
+    @param nb_steps: number of steps played by the function
+    @param repeat: number of repetitions
+    @return: the duration of a step, in seconds
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, (time.perf_counter() - start) / nb_steps)
+    return best
+
+
+def bench_multi_units(args):
+    from data.dataloader import Dataloader
+    from envs.multiUnitHideSeekEnv import MultiUnitHideSeekEnv
+
+    base = Dataloader().load_map_from_file(os.path.join(ROOT, args.base_map))
+    height, width = parse_shape(args.shape)
+    with tempfile.TemporaryDirectory() as directory:
+        map_file = write_tiled_map(base, height, width, directory)
+
+        # Reference: a single hider against a single seeker, in the spiral environment (same observation)
+        single_env = environment_classes()["spiral"](map_file=map_file, enemy_placement="moves", player_placement="random",
+                                                     enemy_behavior=args.behavior)
+        rollout(single_env, args.steps, seed=0)
+        single_step_time = best_step_time(lambda: rollout(single_env, args.steps, seed=0), args.steps, args.repeat)
+        print(f"spiral environment (1 hider, 1 seeker): {1 / single_step_time:.0f} steps/s\n", flush=True)
+
+        print(f"{'hiders':>6s} {'seekers':>7s} {'steps/s':>8s} {'ms/step':>8s} {'us/hider':>9s} {'single envs (ms)':>17s} {'speedup':>8s}",
+              flush=True)
+        for n_hiders in args.hiders:
+            n_seekers = max(1, n_hiders // 2)
+            env = MultiUnitHideSeekEnv(map_file=map_file, n_hiders=n_hiders, n_seekers=n_seekers, player_placement="random",
+                                       enemy_placement="moves", enemy_behavior=args.behavior, radius=4)
+
+            # The first rollout fills the visibility tables of the visited tiles, the measures are taken on the next ones
+            multi_unit_rollout(env, args.steps, seed=0)
+            step_time = best_step_time(lambda: multi_unit_rollout(env, args.steps, seed=0), args.steps, args.repeat)
+            env.close()
+            print(f"{n_hiders:6d} {n_seekers:7d} {1 / step_time:8.0f} {step_time * 1e3:8.3f} {step_time / n_hiders * 1e6:9.1f} "
+                  f"{single_step_time * n_hiders * 1e3:17.3f} {single_step_time * n_hiders / step_time:7.1f}x", flush=True)
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-sh", "--shape", type=str, help="Shape of the map (HEIGHTxWIDTH)", default="32x32")
+    argParser.add_argument("-bm", "--base_map", type=str, help="Map tiled to build the map", default="data/map_v1")
+    argParser.add_argument("-hd", "--hiders", type=int, nargs="+", help="Numbers of hiders", default=[1, 2, 4, 8, 16, 32, 64])
+    argParser.add_argument("-eb", "--behavior", type=str, help="Behavior of the seekers", choices=["static", "patrol", "chase"],
+                           default="chase")
+    argParser.add_argument("-st", "--steps", type=int, help="Number of steps measured per number of hiders", default=500)
+    argParser.add_argument("-r", "--repeat", type=int, help="Number of repetitions of the measure, the best one is kept", default=3)
+    bench_multi_units(argParser.parse_args())
@@ -0,0 +1,163 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from scripts.bench_envs import environment_classes, rollout, seed_everything
+
+"""
+This script measures how the cost of the environments grows with the size of the map
+Maps of every requested shape are built by tiling a map of the data repository, the units starting from the tile nearest to the center
+It reports, for every environment and map shape: the construction time of the environment, the cost of the first visit
+(first reset and first steps, when the lines of sight are computed) and the steps/sec once the caches are warm
+The batched environment ("batched", playing --batched_games games with the --batched_type observation) precomputes everything when it is built:
+its steps/sec count the steps of every game, and the shapes above BatchedHideSeekEnv.MAX_TILES tiles, which it refuses, are reported as skipped
+Usage: python -m scripts.bench_scaling [--shapes 12x12 64x64 40x90] [--envs spiral coord batched] [--steps 200]
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHAPES = ["12x12", "24x24", "32x32", "40x90", "64x64", "128x128"]
+
+
+def parse_shape(shape):
+    """
+    Parses a map shape written as HEIGHTxWIDTH
+    @param shape: string
+    @return: a (height, width) tuple
+    """
+    height, width = shape.lower().split("x")
+    return int(height), int(width)
+
+
+def write_tiled_map(base, height, width, directory):
+    """
+    Writes a map file of the given shape, tiling a base map
+    The starting positions of the units are the ones of the base map, moved to the copy of the base map nearest to the center
+    @param base: Maps object of the base map
+    @param height: number of rows of the map
+    @param width: number of columns of the map
+    @param directory: directory of the written file
+    @return: the path of the written file
+    """
+    base_height, base_width = base.initial_map.shape
+    if height < base_height or width < base_width:
+        raise ValueError(f"The map shape {height}x{width} is smaller than the base map ({base_height}x{base_width})")
+    tiles = np.tile(base.initial_map, (height // base_height + 1, width // base_width + 1))[:height, :width]
+
+    # We shift the starting positions to the copy of the base map nearest to the center, which fits entirely in the map
+    x_offset = min(height // 2 // base_height * base_height, height - base_height)
+    y_offset = min(width // 2 // base_width * base_width, width - base_width)
+
+    def positions(starting_positions):
+        return "|".join(f"{x + x_offset},{y + y_offset}" for x, y in starting_positions)
+
+    path = os.path.join(directory, f"tiled_{height}x{width}")
+    with open(path, "w") as f:
+        for row in tiles:
+            f.write(",".join(str(tile) for tile in row) + "\n")
+        f.write(f"A:{positions(base.agent_initial_position)}\n")
+        f.write(f"E:{positions(base.enemy_initial_position)}")
+    return path
+
+
+def batched_rollout(env, nb_steps, seed):
+    """
+    Plays random actions in every game of a batched environment, the finished games being reset by the environment
+    @param env: BatchedHideSeekEnv
+    @param nb_steps: number of steps of the batch
+    @param seed: seed of the actions and of the placements of the units
+    @return:
+    """
+    env.np_random = np.random.default_rng(seed)
+    rng = np.random.default_rng(seed)
+    env.reset()
+    for _ in range(nb_steps):
+        env.step(rng.integers(5, size=env.num_envs))
+
+
+def batched_max_tiles():
+    """
+    Retrieves the largest number of tiles of a map played by the batched environment
+    @return: an integer
+    """
+    from envs.batchedHideSeekEnv import BatchedHideSeekEnv
+    return BatchedHideSeekEnv.MAX_TILES
+
+
+def make_env(env_name, map_file, args):
+    """
+    Builds an environment to benchmark
+    @param env_name: name of the environment, one of the names of environment_classes() or "batched"
+    @param map_file: path of the map
+    @param args: parsed arguments
+    @return: the environment, its rollout function, and the number of games stepped at every step
+    """
+    if env_name == "batched":
+        from envs.batchedHideSeekEnv import BatchedHideSeekEnv
+        env = BatchedHideSeekEnv(map_file=map_file, n_envs=args.batched_games, env_type=args.batched_type,
+                                 enemy_placement=args.enemy_placement, player_placement=args.player_placement, seed=0)
+        return env, batched_rollout, args.batched_games
+    env = environment_classes()[env_name](map_file=map_file, enemy_placement=args.enemy_placement,
+                                          player_placement=args.player_placement, opti=True)
+    return env, rollout, 1
+
+
+def bench_scaling(args):
+    from data.dataloader import Dataloader
+
+    base = Dataloader().load_map_from_file(os.path.join(ROOT, args.base_map))
+    print(f"{'environment':10s} {'shape':>9s} {'area':>7s} {'init (s)':>9s} {'first reset (s)':>16s} "
+          f"{'first steps/s':>14s} {'steps/s':>9s}", flush=True)
+    with tempfile.TemporaryDirectory() as directory:
+        for env_name in args.envs:
+            for shape in args.shapes:
+                height, width = parse_shape(shape)
+                map_file = write_tiled_map(base, height, width, directory)
+
+                # The batched environment refuses maps whose precomputed structures would be too large
+                if env_name == "batched" and height * width > batched_max_tiles():
+                    print(f"{env_name:10s} {shape:>9s} {height * width:7d} skipped (more than {batched_max_tiles()} tiles)", flush=True)
+                    continue
+
+                start = time.perf_counter()
+                env, play, nb_games = make_env(env_name, map_file, args)
+                init_time = time.perf_counter() - start
+
+                seed_everything(0)
+                start = time.perf_counter()
+                env.reset()
+                first_reset_time = time.perf_counter() - start
+
+                # The first rollout computes the lines of sight of every visited position, the next ones read them from the caches
+                start = time.perf_counter()
+                play(env, args.steps, seed=0)
+                first_steps_per_second = args.steps * nb_games / (time.perf_counter() - start)
+
+                steps_per_second = 0
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    play(env, args.steps, seed=0)
+                    steps_per_second = max(steps_per_second, args.steps * nb_games / (time.perf_counter() - start))
+                env.close()
+
+                print(f"{env_name:10s} {shape:>9s} {height * width:7d} {init_time:9.2f} {first_reset_time:16.3f} "
+                      f"{first_steps_per_second:14.0f} {steps_per_second:9.0f}", flush=True)
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-sh", "--shapes", type=str, nargs="+", help="Shapes of the maps (HEIGHTxWIDTH)", default=SHAPES)
+    argParser.add_argument("-e", "--envs", type=str, nargs="+", help="Environments to benchmark",
+                           default=["spiral", "coord", "field", "direction", "batched"])
+    argParser.add_argument("-bm", "--base_map", type=str, help="Map tiled to build the larger maps", default="data/map_v1")
+    argParser.add_argument("-ep", "--enemy_placement", type=str, help="Placement of the enemy", default="static")
+    argParser.add_argument("-pp", "--player_placement", type=str, help="Placement of the agent", default="static")
+    argParser.add_argument("-st", "--steps", type=int, help="Number of steps measured per environment and map", default=200)
+    argParser.add_argument("-bg", "--batched_games", type=int, help="Number of games stepped at once by the batched environment", default=16)
+    argParser.add_argument("-bt", "--batched_type", type=str, help="Observation type of the batched environment", default="spiral",
+                           choices=["spiral", "coord", "field", "direction"])
+    argParser.add_argument("-r", "--repeat", type=int, help="Number of repetitions of the warm measure, the best one is kept", default=3)
+    bench_scaling(argParser.parse_args())
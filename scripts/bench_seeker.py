@@ -0,0 +1,85 @@
+import argparse
+import time
+
+import numpy as np
+
+from scripts.bench_envs import MAPS, environment_classes, rollout
+
+"""
+This script measures the cost of a moving enemy (patrolling or chasing the agent), whose vision is updated at every step
+It reports, for every environment and map, the steps/sec with a static, a patrolling and a chasing enemy, along with the ratio to the static enemy
+It also reports the cost of the vision of the enemy from a tile: looked up in the visibility table of the layout (what a moving enemy does at every step),
+or computed from the rays of the tile (what it would cost without the table)
+Usage: python -m scripts.bench_seeker [--maps data/map_v1 data/map_v2] [--envs spiral coord] [--steps 1000]
+"""
+
+
+def bench_vision_lookup(map_file):
+    """
+    Times the vision of the enemy from every free tile of a map, looked up in the visibility table and computed from the rays
+    @param map_file: path of the map
+    @return: the mean durations of a lookup and of a computation, in microseconds
+    """
+    from data.dataloader import Dataloader
+    from envs.visibility import VisibilityEngine
+    from misc.utils import EMPTY
+
+    layout = Dataloader().load_map_from_file(map_file).initial_map
+    engine = VisibilityEngine(layout, mode="clever")
+    tiles = [divmod(int(cell), engine.width) for cell in np.flatnonzero(layout == EMPTY)]
+
+    start = time.perf_counter()
+    for x, y in tiles:
+        engine.row(x, y)
+    compute_time = (time.perf_counter() - start) / len(tiles)
+
+    start = time.perf_counter()
+    for x, y in tiles:
+        engine.row(x, y)
+    lookup_time = (time.perf_counter() - start) / len(tiles)
+    return lookup_time * 1e6, compute_time * 1e6
+
+
+def bench_seeker(args):
+    from envs.hideSeekEnv import HideSeekEnv
+
+    print(f"{'map':14s} {'lookup (us)':>12s} {'computed (us)':>14s}", flush=True)
+    for map_file in args.maps:
+        lookup_time, compute_time = bench_vision_lookup(map_file)
+        print(f"{map_file:14s} {lookup_time:12.1f} {compute_time:14.1f}", flush=True)
+    print()
+
+    env_classes = environment_classes()
+    print(f"{'environment':10s} {'map':14s} {'behavior':>8s} {'steps/s':>9s} {'vs static':>10s}", flush=True)
+    for env_name in args.envs:
+        for map_file in args.maps:
+            static_steps_per_second = None
+            for behavior in HideSeekEnv.ENEMY_BEHAVIORS:
+                env = env_classes[env_name](map_file=map_file, enemy_placement=args.enemy_placement,
+                                            player_placement=args.player_placement, enemy_behavior=behavior)
+
+                # The first rollout fills the visibility table of the visited tiles, the measures are taken on the next ones
+                rollout(env, args.steps, seed=0)
+                steps_per_second = 0
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    rollout(env, args.steps, seed=0)
+                    steps_per_second = max(steps_per_second, args.steps / (time.perf_counter() - start))
+                env.close()
+
+                if static_steps_per_second is None:
+                    static_steps_per_second = steps_per_second
+                print(f"{env_name:10s} {map_file:14s} {behavior:>8s} {steps_per_second:9.0f} "
+                      f"{steps_per_second / static_steps_per_second:9.2f}x", flush=True)
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-m", "--maps", type=str, nargs="+", help="Maps to play on", default=MAPS)
+    argParser.add_argument("-e", "--envs", type=str, nargs="+", help="Environments to benchmark",
+                           default=["spiral", "coord", "field", "direction"])
+    argParser.add_argument("-ep", "--enemy_placement", type=str, help="Placement of the enemy", default="moves")
+    argParser.add_argument("-pp", "--player_placement", type=str, help="Placement of the agent", default="random")
+    argParser.add_argument("-st", "--steps", type=int, help="Number of steps measured per environment, map and behavior", default=1000)
+    argParser.add_argument("-r", "--repeat", type=int, help="Number of repetitions of the measure, the best one is kept", default=3)
+    bench_seeker(argParser.parse_args())
@@ -0,0 +1,73 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+"""
+This script benchmarks the startup time of the project: the command line interface and the import of every environment
+It fails (exit code 1) if a startup is slower than the allowed budget, or if a module loads heavy dependencies it does not need
+Usage: python scripts/bench_startup.py [--repeat 5] [--max_help 1.0] [--max_import 2.0]
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should only be loaded when training or evaluating a model
+HEAVY_MODULES = ["torch", "stable_baselines3"]
+
+# Modules that should start quickly, without loading heavy modules
+LIGHT_MODULES = ["main", "envs.hideSeekEnv", "envs.custom_envs.spiralFieldVision", "envs.custom_envs.coordFieldVision",
+                 "envs.custom_envs.fullFieldVision", "envs.custom_envs.fullDirectionOnField"]
+
+
+def time_command(command, repeat):
+    """
+    Runs a command several times in a fresh interpreter
+    @param command: list of arguments given to the python interpreter
+    @param repeat: number of runs
+    @return: the median wall time of the runs (in seconds) and the standard output of the last run
+    """
+    timings = []
+    output = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable] + command, cwd=ROOT, capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)} failed:\n{result.stderr}")
+        output = result.stdout
+    return statistics.median(timings), output
+
+
+def bench_startup(args):
+    failures = []
+
+    help_time, _ = time_command(["main.py", "--help"], args.repeat)
+    print(f"{'main.py --help':45s} {help_time * 1000:8.1f} ms")
+    if help_time > args.max_help:
+        failures.append(f"main.py --help took {help_time:.2f}s (budget {args.max_help:.2f}s)")
+
+    for module in LIGHT_MODULES:
+        code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES} if m in sys.modules))"
+        import_time, loaded = time_command(["-c", code], args.repeat)
+        loaded = loaded.strip()
+        print(f"{'import ' + module:45s} {import_time * 1000:8.1f} ms" + (f"  (loads {loaded})" if loaded else ""))
+        if import_time > args.max_import:
+            failures.append(f"import {module} took {import_time:.2f}s (budget {args.max_import:.2f}s)")
+        if loaded:
+            failures.append(f"import {module} loads {loaded}")
+
+    if failures:
+        print("\n".join(["FAILED:"] + failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-r", "--repeat", type=int, help="Number of runs of every measure, the median is kept", default=5)
+    argParser.add_argument("-mh", "--max_help", type=float, help="Time budget of main.py --help, in seconds", default=1.0)
+    argParser.add_argument("-mi", "--max_import", type=float, help="Time budget of the import of an environment, in seconds",
+                           default=2.0)
+    bench_startup(argParser.parse_args())
@@ -4,11 +4,6 @@ from stable_baselines3 import DQN
 from stable_baselines3.common.evaluation import evaluate_policy
 from gymnasium.utils.env_checker import check_env
 
-from envs.custom_envs.coordFieldVision import CoordFieldVisionEnv
-from envs.custom_envs.fullDirectionOnField import FullDirectionOnFieldEnv
-from envs.custom_envs.fullFieldVision import FullFieldVisionEnv
-from envs.custom_envs.spiralFieldVision import SpiralFieldVisionEnv
-
 
 def perform_evaluation(env_, policy, neval=10, deterministic=True, mode_eval="metrics", verbose=False):
     if mode_eval == "metrics":
@@ -45,30 +40,44 @@ def perform_evaluation(env_, policy, neval=10, deterministic=True, mode_eval="me
 def evaluate(args):
     env = None
     model = None
+    # Only the module of the selected environment is imported
     if args.environment == "spiral":
+        from envs.custom_envs.spiralFieldVision import SpiralFieldVisionEnv
         env = SpiralFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
                                    player_placement=args.agent_placement,
-                                   opti=args.opti)
+                                   opti=args.opti, enemy_behavior=args.enemy_behavior, radius=args.spiral_radius)
         check_env(env, warn=False)
         model = DQN.load(args.path_model, env)
     elif args.environment == "coord":
+        from envs.custom_envs.coordFieldVision import CoordFieldVisionEnv
         env = CoordFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
                                   player_placement=args.agent_placement,
-                                  opti=args.opti)
+                                  opti=args.opti, enemy_behavior=args.enemy_behavior)
         check_env(env, warn=False)
         model = DQN.load(args.path_model, env)
     elif args.environment == "field":
+        from envs.custom_envs.fullFieldVision import FullFieldVisionEnv
         env = FullFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
                                  player_placement=args.agent_placement,
-                                 opti=args.opti, mode_vision=args.mode_vision)
+                                 opti=args.opti, enemy_behavior=args.enemy_behavior, mode_vision=args.mode_vision, upscale=args.upscale)
         check_env(env, warn=False)
         model = DQN.load(args.path_model, env)
     elif args.environment == "direction":
+        from envs.custom_envs.fullDirectionOnField import FullDirectionOnFieldEnv
         env = FullDirectionOnFieldEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
                                       player_placement=args.agent_placement,
-                                      opti=args.opti)
+                                      opti=args.opti, enemy_behavior=args.enemy_behavior)
         check_env(env, warn=False)
         model = DQN.load(args.path_model, env)
 
+    # The phases of the steps are only timed if a trace is requested
+    if args.profile_trace:
+        env.enable_profiling(trace_steps=args.profile_steps)
+
     perform_evaluation(env_=env, policy=model, neval=args.nb_episode, mode_eval=args.mode_eval, deterministic=True,
              verbose=args.verbose)
+
+    if args.profile_trace:
+        print(env.profiler.summary())
+        env.profiler.export_chrome_trace(args.profile_trace)
+        print("Chrome trace saved at:", args.profile_trace)
@@ -0,0 +1,117 @@
+import argparse
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+
+"""
+This script precomputes the visions of the units from every free tile of some maps, across a pool of processes, and stores them in the vision cache
+With the optimisation activated (-o True), the environments then read the visions from the cache wherever the enemy is placed:
+random placements reset as cheaply as static ones
+Maps can be given as map files, directories of map files, or map packs
+Usage: python -m scripts.precompute_visions -m data/map_v1 data/generated.pack [--workers 4] [--mode clever] [--force]
+"""
+
+
+def load_layouts(paths):
+    """
+    Loads the layouts of maps, without duplicates
+    @param paths: list of map files, directories of map files and map packs
+    @return: a list of layouts
+    """
+    from data.dataloader import Dataloader
+    from data.map_pack import is_map_pack
+    from misc.vision_cache import layout_hash
+
+    dataloader = Dataloader()
+    layouts = {}
+    for path in paths:
+        if os.path.isdir(path):
+            path_layouts = [playing_map.initial_map for playing_map in dataloader.load_maps_from_directory(path)]
+        elif is_map_pack(path):
+            path_layouts = dataloader.load_map_pack(path).layouts
+        else:
+            path_layouts = [dataloader.load_map_from_file(path).initial_map]
+        for layout in path_layouts:
+            layouts.setdefault(layout_hash(layout), np.array(layout))
+    return list(layouts.values())
+
+
+# Line-of-sight engine of the last layout processed by a worker: the tasks of a layout are consecutive
+worker_engine = {}
+
+
+def compute_rows(task):
+    """
+    Computes the packed visions from some tiles of a layout, in a worker process
+    @param task: (index of the layout, layout, vision mode, flat indices of the tiles) tuple
+    @return: the index of the layout, the flat indices of the tiles and their packed visions
+    """
+    from envs.visibility import VisibilityEngine
+
+    index, layout, mode, cells = task
+    if worker_engine.get("key") != (index, mode):
+        worker_engine["key"] = (index, mode)
+        worker_engine["engine"] = VisibilityEngine(layout, mode=mode)
+    engine = worker_engine["engine"]
+    for cell in cells:
+        engine.row(*divmod(int(cell), engine.width))
+    return index, cells, engine.table[cells]
+
+
+def precompute_visions(args):
+    from misc.utils import EMPTY
+    from misc.vision_cache import VisionCache
+
+    cache = VisionCache(args.directory)
+    layouts = load_layouts(args.maps)
+    if not args.force:
+        layouts = [layout for layout in layouts if not cache.has_table(layout, args.mode)]
+    print(f"{len(layouts)} layouts to precompute in {cache.directory}", flush=True)
+
+    # Tasks are chunks of the free tiles of a layout, small enough to spread a single map across the processes
+    tasks = []
+    for index, layout in enumerate(layouts):
+        free = np.flatnonzero(layout == EMPTY)
+        tasks += [(index, layout, args.mode, free[start:start + args.tiles_per_task])
+                  for start in range(0, len(free), args.tiles_per_task)]
+    remaining = np.zeros(len(layouts), dtype=np.int64)
+    np.add.at(remaining, [task[0] for task in tasks], 1)
+    tables = {}
+
+    start = time.perf_counter()
+    pool = mp.Pool(args.workers) if args.workers != 0 else None
+    try:
+        results = pool.imap(compute_rows, tasks) if pool is not None else map(compute_rows, tasks)
+        nb_stored = 0
+        for index, cells, rows in results:
+            # Every layout is stored as soon as all its tiles are computed
+            if index not in tables:
+                nb_tiles = layouts[index].size
+                tables[index] = np.zeros((nb_tiles, (nb_tiles + 7) // 8), dtype=np.uint8)
+            tables[index][cells] = rows
+            remaining[index] -= 1
+            if remaining[index] == 0:
+                cache.store_table(layouts[index], tables.pop(index), args.mode)
+                nb_stored += 1
+                if nb_stored % 100 == 0:
+                    print(f"{nb_stored} / {len(layouts)} layouts ({time.perf_counter() - start:.1f}s)", flush=True)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    print(f"{len(layouts)} layouts precomputed in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("-m", "--maps", type=str, nargs="+", help="Map files, directories of map files or map packs", required=True)
+    argParser.add_argument("-w", "--workers", type=int, help="Number of processes, the number of CPUs by default (0 computes in this process)",
+                           default=None)
+    argParser.add_argument("-md", "--mode", type=str, help="Vision mode, clever (enemy) by default", choices=["clever", "naive"],
+                           default="clever")
+    argParser.add_argument("-d", "--directory", type=str, help="Directory of the vision cache, data/vision_cache by default", default=None)
+    argParser.add_argument("-t", "--tiles_per_task", type=int, help="Number of tiles computed per task sent to a process", default=32)
+    argParser.add_argument("-f", "--force", action="store_true", help="Recomputes the layouts whose visions are already stored")
+    precompute_visions(argParser.parse_args())
@@ -1,47 +1,95 @@
 import argparse
+from functools import partial
+
 from stable_baselines3 import DQN
 from stable_baselines3.common.logger import configure
 from gymnasium.utils.env_checker import check_env
 
-from envs.custom_envs.coordFieldVision import CoordFieldVisionEnv
-from envs.custom_envs.fullDirectionOnField import FullDirectionOnFieldEnv
-from envs.custom_envs.fullFieldVision import FullFieldVisionEnv
-from envs.custom_envs.spiralFieldVision import SpiralFieldVisionEnv
+from envs.sharedMemoryVecEnv import SharedMemoryVecEnv
+
+
+def make_env(env_class, n_envs=1, **env_kwargs):
+    """
+    Builds the environment used for training
+    @param env_class: class of the environment
+    @param n_envs: number of environments, each one being stepped in its own worker process if greater than 1
+    @param env_kwargs: arguments given to the constructor of the environment
+    @return: the environment, or a vectorized environment whose observations are shared with the workers
+    """
+    if n_envs > 1:
+        return SharedMemoryVecEnv([partial(env_class, **env_kwargs) for _ in range(n_envs)])
+
+    env = env_class(**env_kwargs)
+    check_env(env, warn=False)
+    return env
 
 
 def train(args):
-    model = None
-    if args.environment == "spiral":
-        env = SpiralFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
-                                   player_placement=args.agent_placement,
-                                   opti=args.opti)
-        check_env(env, warn=False)
-        model = DQN("MlpPolicy", env, buffer_size=1000000, verbose=1, learning_starts=args.learn_learnstart, train_freq=4,
-                    exploration_fraction=args.learn_exploration, learning_rate=args.learn_lr)
-    elif args.environment == "coord":
-        env = CoordFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
-                                  player_placement=args.agent_placement,
-                                  opti=args.opti)
-        check_env(env, warn=False)
-        model = DQN("MlpPolicy", env, buffer_size=1000000, verbose=1, learning_starts=args.learn_learnstart, train_freq=4,
-                    exploration_fraction=args.learn_exploration, learning_rate=args.learn_lr)
-    elif args.environment == "field":
+    # Only the module of the selected environment is imported
+    policy = "MlpPolicy"
+    policy_kwargs = None
+    if args.environment == "field":
+        policy = "CnnPolicy"
         policy_kwargs = dict(
             features_extractor_kwargs=dict(features_dim=5),
         )
-        env = FullFieldVisionEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
-                                 player_placement=args.agent_placement,
-                                 opti=args.opti, mode_vision=args.mode_vision)
-        check_env(env, warn=False)
-        model = DQN("CnnPolicy", env, buffer_size=1000000, verbose=1, learning_starts=args.learn_learnstart, train_freq=4,
-                    exploration_fraction=args.learn_exploration, learning_rate=args.learn_lr, policy_kwargs=policy_kwargs)
+
+    if args.batched_envs > 0:
+        from envs.batchedHideSeekEnv import BatchedHideSeekEnv
+        if args.enemy_behavior != "static":
+            raise ValueError("The batched engine only plays with a static enemy")
+        # All the games are stepped at once by the batched engine, which follows the same rules as the single environments
+        env = BatchedHideSeekEnv(map_file=args.path_map, n_envs=args.batched_envs, env_type=args.environment,
+                                 enemy_placement=args.enemy_placement, player_placement=args.agent_placement,
+                                 mode_vision=args.mode_vision, spiral_radius=args.spiral_radius,
+                                 upscale=args.upscale)
+    elif args.environment == "spiral":
+        from envs.custom_envs.spiralFieldVision import SpiralFieldVisionEnv
+        env = make_env(SpiralFieldVisionEnv, args.n_envs, map_file=args.path_map, enemy_placement=args.enemy_placement,
+                       player_placement=args.agent_placement,
+                       opti=args.opti, enemy_behavior=args.enemy_behavior, radius=args.spiral_radius)
+    elif args.environment == "coord":
+        from envs.custom_envs.coordFieldVision import CoordFieldVisionEnv
+        env = make_env(CoordFieldVisionEnv, args.n_envs, map_file=args.path_map, enemy_placement=args.enemy_placement,
+                       player_placement=args.agent_placement,
+                       opti=args.opti, enemy_behavior=args.enemy_behavior)
+    elif args.environment == "field":
+        from envs.custom_envs.fullFieldVision import FullFieldVisionEnv
+        env = make_env(FullFieldVisionEnv, args.n_envs, map_file=args.path_map, enemy_placement=args.enemy_placement,
+                       player_placement=args.agent_placement,
+                       opti=args.opti, enemy_behavior=args.enemy_behavior, mode_vision=args.mode_vision, upscale=args.upscale)
     elif args.environment == "direction":
-        env = FullDirectionOnFieldEnv(map_file=args.path_map, enemy_placement=args.enemy_placement,
-                                      player_placement=args.agent_placement,
-                                      opti=args.opti)
-        check_env(env, warn=False)
-        model = DQN("MlpPolicy", env, buffer_size=1000000, verbose=1, learning_starts=args.learn_learnstart, train_freq=4,
-                    exploration_fraction=args.learn_exploration, learning_rate=args.learn_lr)
+        from envs.custom_envs.fullDirectionOnField import FullDirectionOnFieldEnv
+        env = make_env(FullDirectionOnFieldEnv, args.n_envs, map_file=args.path_map, enemy_placement=args.enemy_placement,
+                       player_placement=args.agent_placement,
+                       opti=args.opti, enemy_behavior=args.enemy_behavior)
+
+    # The environment is closed whatever happens next: the workers and shared memory of a vectorized environment are released
+    try:
+        run_training(args, env, policy, policy_kwargs)
+    finally:
+        env.close()
+
+
+def run_training(args, env, policy, policy_kwargs):
+    """
+    Builds the model and trains it on an environment
+    @param args: parsed arguments
+    @param env: environment, closed by the caller
+    @param policy: name of the policy of the model
+    @param policy_kwargs: arguments of the policy, or None
+    @return:
+    """
+    model = DQN(policy, env, buffer_size=1000000, verbose=1, learning_starts=args.learn_learnstart, train_freq=4,
+                exploration_fraction=args.learn_exploration, learning_rate=args.learn_lr, policy_kwargs=policy_kwargs)
+
+    # The phases of the steps are only timed if a trace is requested, for a single environment
+    profiler = None
+    if args.profile_trace:
+        if args.batched_envs > 0 or args.n_envs > 1:
+            print("Profiling is only available with a single environment")
+        else:
+            profiler = env.enable_profiling(trace_steps=args.profile_steps)
 
     # Logger
     if args.logs:
@@ -55,3 +103,8 @@ def train(args):
     print("Training ends")
     print("Saving the model at:",args.path_model)
     model.save(args.path_model)
+
+    if profiler is not None:
+        print(profiler.summary())
+        profiler.export_chrome_trace(args.profile_trace)
+        print("Chrome trace saved at:", args.profile_trace)